@@ -0,0 +1,117 @@
+"""
+압축 파일 모듈 (Archive)
+
+.zip/.gz로 보관된 거래내역 파일을 임시 파일 없이 바로 읽을 수 있도록 멤버 목록과 스트림을 제공합니다.
+- .zip은 안의 CSV/Excel 멤버를 모두, .gz는 압축을 푼 파일 하나를 멤버로 취급
+- 멤버 크기는 압축을 푼 크기 (가져오기 방식 선택과 진행률 계산 기준)
+- 멤버는 압축을 풀면서 순차적으로 읽는 바이너리 파일 객체로 열림
+"""
+
+import gzip
+import os
+import struct
+import zipfile
+from typing import BinaryIO, List
+
+
+# 압축 파일 확장자
+ARCHIVE_EXTENSIONS = ('.zip', '.gz')
+
+# 압축 파일 안에서 가져올 멤버 확장자
+MEMBER_EXTENSIONS = ('.csv', '.xls', '.xlsx')
+
+
+def is_archive(file_path: str) -> bool:
+    """확장자로 압축 파일 여부를 판별"""
+    return os.path.splitext(file_path)[1].lower() in ARCHIVE_EXTENSIONS
+
+
+class ArchiveMember:
+    """압축 파일 안의 거래내역 파일 하나를 나타내는 클래스"""
+
+    def __init__(self, archive_path: str, name: str, size: int):
+        """
+        ArchiveMember 초기화
+
+        Args:
+            archive_path: 압축 파일 경로
+            name: 압축 파일 안의 멤버 이름 (.gz는 압축을 푼 파일 이름)
+            size: 압축을 푼 크기 (바이트)
+        """
+        self.archive_path = archive_path
+        self.name = name
+        self.size = size
+
+    @property
+    def extension(self) -> str:
+        """멤버 파일 확장자 (소문자)"""
+        return os.path.splitext(self.name)[1].lower()
+
+    @property
+    def source_name(self) -> str:
+        """거래내역 source_file에 기록할 이름 (압축 파일명/멤버 이름)"""
+        return f"{os.path.basename(self.archive_path)}/{self.name}"
+
+    def open(self) -> BinaryIO:
+        """
+        멤버를 압축을 풀면서 읽는 바이너리 파일 객체로 엶
+
+        tell()은 압축을 푼 기준 위치를 반환하므로 진행률 계산에 그대로 사용할 수 있습니다.
+        """
+        if self.archive_path.lower().endswith('.gz'):
+            return gzip.open(self.archive_path, 'rb')
+        archive = zipfile.ZipFile(self.archive_path)
+        try:
+            member = archive.open(self.name)
+        except BaseException:
+            archive.close()
+            raise
+        # 멤버 파일 객체가 닫히지 않은 동안에는 ZipFile을 닫아도 내부 파일 핸들이 유지됨
+        archive.close()
+        return member
+
+    def __repr__(self) -> str:
+        return f"ArchiveMember({self.source_name!r}, size={self.size})"
+
+
+def _gzip_size(file_path: str) -> int:
+    """gzip 끝 4바이트(ISIZE)에 기록된 압축을 푼 크기 (4GB 이상은 2^32로 나눈 나머지)"""
+    with open(file_path, 'rb') as f:
+        f.seek(-4, os.SEEK_END)
+        return struct.unpack('<I', f.read(4))[0]
+
+
+def list_members(file_path: str) -> List[ArchiveMember]:
+    """
+    압축 파일 안의 CSV/Excel 멤버 목록 (압축 파일 순서)
+
+    디렉터리, macOS 메타데이터(__MACOSX/, ._*), 지원하지 않는 확장자의 멤버는 제외합니다.
+
+    Args:
+        file_path: .zip 또는 .gz 파일 경로
+
+    Returns:
+        List[ArchiveMember]: 가져올 멤버 목록
+
+    Raises:
+        OSError: 파일을 읽을 수 없거나 올바른 압축 파일이 아닌 경우 (gzip.BadGzipFile 포함)
+        zipfile.BadZipFile: 올바른 zip 파일이 아닌 경우
+    """
+    if file_path.lower().endswith('.gz'):
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        with gzip.open(file_path, 'rb') as f:
+            # 헤더를 검사하여 gzip 파일이 아니면 여기서 BadGzipFile
+            f.read(1)
+        member = ArchiveMember(file_path, name, _gzip_size(file_path))
+        return [member] if member.extension in MEMBER_EXTENSIONS else []
+
+    with zipfile.ZipFile(file_path) as archive:
+        members = []
+        for info in archive.infolist():
+            base = os.path.basename(info.filename)
+            if info.is_dir() or info.filename.startswith('__MACOSX/') or base.startswith('._'):
+                continue
+            member = ArchiveMember(file_path, info.filename, info.file_size)
+            if member.extension in MEMBER_EXTENSIONS:
+                members.append(member)
+        return members
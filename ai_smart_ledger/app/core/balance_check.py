@@ -0,0 +1,197 @@
+"""
+잔액 연속성 검사 모듈 (Balance Continuity)
+
+잔액 컬럼으로 거래내역이 빠짐없이 이어지는지 검증합니다.
+- 직전 잔액 + 입금 - 출금 = 현재 잔액 인지 NumPy diff로 한 번에 비교 (파이썬 반복 없음)
+- 오름차순(과거 → 최신)과 내림차순(최신 → 과거) 내보내기 모두 지원, 방향은 자동 판별
+- 연속성이 끊긴 행을 정확히 표시하고 원인을 분류
+  (누락/금액 불일치: gap, 직전 행과 같은 행: duplicate, 거래일시 순서 역전: unsorted)
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .columnar import DATE_HEADER, TIME_HEADER, parse_amounts, parse_timestamps
+from .encoded_rows import column_values
+
+
+# 거래내역 정렬 방향
+ORDER_AUTO = 'auto'
+ORDER_ASCENDING = 'ascending'
+ORDER_DESCENDING = 'descending'
+ORDERS = (ORDER_AUTO, ORDER_ASCENDING, ORDER_DESCENDING)
+
+# 연속성이 끊긴 원인
+BREAK_GAP = 'gap'
+BREAK_DUPLICATE = 'duplicate'
+BREAK_UNSORTED = 'unsorted'
+
+# 결과에 상세 정보를 담을 최대 행 수 (전체 위치는 break_rows 배열로 제공)
+MAX_REPORTED_BREAKS = 100
+
+
+def _breaks(net: np.ndarray, balances: np.ndarray, descending: bool) -> np.ndarray:
+    """연속성이 끊긴 행 번호 배열 (비교 기준 직전 거래가 없는 첫 거래는 제외)"""
+    if len(balances) < 2:
+        return np.empty(0, dtype=np.int64)
+    if descending:
+        # 최신 거래가 위: balances[i] = balances[i + 1] + net[i]
+        return np.flatnonzero(balances[:-1] - balances[1:] != net[:-1])
+    # 과거 거래가 위: balances[i] = balances[i - 1] + net[i]
+    return np.flatnonzero(np.diff(balances) != net[1:]) + 1
+
+
+def check_balance(deposits: np.ndarray, withdrawals: np.ndarray, balances: np.ndarray,
+                  order: str = ORDER_AUTO, timestamps: Union[np.ndarray, Callable, None] = None,
+                  max_reported: int = MAX_REPORTED_BREAKS) -> Dict:
+    """
+    입금/출금/잔액 배열로 잔액 연속성을 검사
+
+    Args:
+        deposits: 입금 int64 배열
+        withdrawals: 출금 int64 배열
+        balances: 잔액 int64 배열
+        order: 정렬 방향 (ORDER_AUTO면 거래일시, 없으면 끊긴 행이 적은 방향으로 판별)
+        timestamps: 거래일시 배열 (datetime64 또는 epoch 초, 선택)
+            또는 행 번호 배열을 받아 그 행들의 거래일시 배열을 돌려주는 함수 (필요한 행만 변환)
+        max_reported: 상세 정보를 담을 최대 행 수
+
+    Returns:
+        dict: 검사 결과
+            - ok: 연속성이 끊긴 행이 없는지 여부
+            - order: 판별된 정렬 방향
+            - rows: 검사한 행 수
+            - break_count: 연속성이 끊긴 행 수
+            - break_rows: 끊긴 행 번호 int64 배열 (0부터, 데이터 행 기준)
+            - breaks: 앞쪽 max_reported개 행의 상세 정보
+              ({'row', 'previous_row', 'expected', 'actual', 'difference', 'kind'})
+
+    Raises:
+        ValueError: 지원하지 않는 정렬 방향이거나 배열 길이가 다른 경우
+    """
+    if order not in ORDERS:
+        raise ValueError(f"지원하지 않는 정렬 방향입니다: {order}")
+    deposits = np.asarray(deposits, dtype=np.int64)
+    withdrawals = np.asarray(withdrawals, dtype=np.int64)
+    balances = np.asarray(balances, dtype=np.int64)
+    if not len(deposits) == len(withdrawals) == len(balances):
+        raise ValueError("입금/출금/잔액 배열의 길이가 다릅니다")
+    if timestamps is None or callable(timestamps):
+        timestamps_at = timestamps
+    else:
+        epochs = _epochs(timestamps)
+        if len(epochs) != len(balances):
+            raise ValueError("거래일시 배열의 길이가 다릅니다")
+        timestamps_at = epochs.__getitem__
+
+    net = deposits - withdrawals
+    if order == ORDER_AUTO:
+        order = _detect_order(net, balances, timestamps_at)
+    descending = order == ORDER_DESCENDING
+    rows = _breaks(net, balances, descending)
+    previous = rows + 1 if descending else rows - 1
+
+    expected = balances[previous] + net[rows]
+    kinds = np.full(len(rows), BREAK_GAP, dtype=object)
+    duplicate = ((deposits[rows] == deposits[previous]) & (withdrawals[rows] == withdrawals[previous])
+                 & (balances[rows] == balances[previous]))
+    kinds[duplicate] = BREAK_DUPLICATE
+    if timestamps_at is not None and len(rows):
+        # 직전 거래보다 이른 거래일시 (둘 다 해석된 경우만)
+        ts, prev_ts = _epochs(timestamps_at(rows)), _epochs(timestamps_at(previous))
+        unsorted = (ts >= 0) & (prev_ts >= 0) & (ts < prev_ts) & ~duplicate
+        kinds[unsorted] = BREAK_UNSORTED
+
+    shown = slice(0, max_reported)
+    breaks = [
+        {'row': row, 'previous_row': prev, 'expected': exp, 'actual': act, 'difference': act - exp, 'kind': kind}
+        for row, prev, exp, act, kind in zip(rows[shown].tolist(), previous[shown].tolist(),
+                                             expected[shown].tolist(), balances[rows[shown]].tolist(),
+                                             kinds[shown].tolist())
+    ]
+    return {
+        'ok': len(rows) == 0,
+        'order': order,
+        'rows': len(balances),
+        'break_count': len(rows),
+        'break_rows': rows,
+        'breaks': breaks,
+    }
+
+
+def _epochs(timestamps: np.ndarray) -> np.ndarray:
+    """거래일시 배열을 epoch 초 int64 배열로 변환 (해석하지 못한 값은 -1)"""
+    timestamps = np.asarray(timestamps)
+    if timestamps.dtype.kind != 'M':
+        return timestamps.astype(np.int64)
+    epochs = timestamps.astype('datetime64[s]').astype(np.int64)
+    return np.where(np.isnat(timestamps), np.int64(-1), epochs)
+
+
+def _detect_order(net: np.ndarray, balances: np.ndarray, timestamps_at: Optional[Callable]) -> str:
+    """첫 행과 마지막 행의 거래일시 비교로 정렬 방향 판별, 판별할 수 없으면 끊긴 행이 적은 방향"""
+    if timestamps_at is not None and len(balances) >= 2:
+        first, last = _epochs(timestamps_at(np.array([0, len(balances) - 1]))).tolist()
+        if first >= 0 and last >= 0 and first != last:
+            return ORDER_ASCENDING if first < last else ORDER_DESCENDING
+    ascending = len(_breaks(net, balances, descending=False))
+    descending = len(_breaks(net, balances, descending=True))
+    return ORDER_DESCENDING if descending < ascending else ORDER_ASCENDING
+
+
+def check_columnar(columns: Dict, order: str = ORDER_AUTO) -> Optional[Dict]:
+    """
+    컬럼형 파싱 결과(to_columnar)의 잔액 연속성 검사
+
+    Returns:
+        Optional[Dict]: check_balance 결과 (입금/출금/잔액 컬럼이 모두 있어야 검사, 아니면 None)
+    """
+    amounts = columns['amounts']
+    if not all(h in amounts for h in ("입금", "출금", "잔액")):
+        return None
+    return check_balance(amounts["입금"], amounts["출금"], amounts["잔액"], order, columns['timestamps'])
+
+
+def check_rows(headers: List[str], rows: Sequence[List[str]], order: str = ORDER_AUTO) -> Optional[Dict]:
+    """
+    정규화된 행 목록(EncodedRows 포함)의 잔액 연속성 검사
+
+    Returns:
+        Optional[Dict]: check_balance 결과 (입금/출금/잔액 컬럼이 모두 있어야 검사, 아니면 None)
+    """
+    if not all(h in headers for h in ("입금", "출금", "잔액")):
+        return None
+
+    columns = {h: column_values(headers, rows, h)
+               for h in ("입금", "출금", "잔액", DATE_HEADER, TIME_HEADER) if h in headers}
+
+    def array(h: str, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        values = columns[h] if indices is None else [columns[h][i] for i in indices.tolist()]
+        return np.array(values, dtype=np.str_) if len(values) else np.empty(0, dtype=np.str_)
+
+    def timestamps_at(indices: np.ndarray) -> np.ndarray:
+        # 날짜 문자열 변환은 비싸므로 방향 판별과 끊긴 행 분류에 필요한 행만 변환
+        times = array(TIME_HEADER, indices) if TIME_HEADER in columns else np.full(len(indices), "", dtype=np.str_)
+        return parse_timestamps(array(DATE_HEADER, indices), times)
+
+    return check_balance(_amounts(columns["입금"]), _amounts(columns["출금"]), _amounts(columns["잔액"]),
+                         order, timestamps_at if DATE_HEADER in columns else None)
+
+
+def _amounts(values: Sequence[str]) -> np.ndarray:
+    """정규화된 금액 문자열 목록을 int64 배열로 변환 (정수 형식이 아닌 값이 있으면 parse_amounts)"""
+    try:
+        return np.fromiter(map(int, values), dtype=np.int64, count=len(values))
+    except ValueError:
+        return parse_amounts(np.array(values, dtype=np.str_))
+
+
+def describe(result: Dict, limit: int = 3) -> List[str]:
+    """검사 결과를 로그/상태 표시줄용 문장 목록으로 변환 (앞쪽 limit개 행)"""
+    labels = {BREAK_GAP: "누락 또는 금액 불일치", BREAK_DUPLICATE: "중복 행", BREAK_UNSORTED: "정렬 순서 역전"}
+    return [
+        f"{b['row'] + 1}번째 행: 잔액 {b['actual']:,}원 (예상 {b['expected']:,}원, 차이 {b['difference']:+,}원) "
+        f"- {labels[b['kind']]}"
+        for b in result['breaks'][:limit]
+    ]
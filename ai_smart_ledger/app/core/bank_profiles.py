@@ -0,0 +1,227 @@
+"""
+은행 프로필 모듈 (Bank Profiles)
+
+은행별 거래내역 양식을 프로필로 등록하고, 헤더 행으로 프로필을 자동 감지합니다.
+- 프로필: 은행 헤더 → 내부 표준 헤더 매핑 + 금액 컬럼 + 감지용 헤더 서명
+- 파일마다 한 번 컬럼별 변환 함수 목록(RowPlan)으로 컴파일
+- 행 반복에서는 미리 정해진 변환 함수만 적용 (셀마다 매핑/금액 여부를 다시 찾지 않음)
+- 새 은행 지원은 register_profile로 프로필을 추가하면 됨
+- 제목/계좌번호/조회기간 같은 머리말 줄이 있으면 앞부분 몇 행만 점수화하여 헤더 행을 찾음
+"""
+
+import hashlib
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+
+# 내부 표준 헤더
+STANDARD_HEADERS = ("날짜", "시간", "적요", "출금", "입금", "잔액", "거래처")
+
+# 쉼표 제거 및 빈 값 0 처리를 적용할 금액 컬럼
+AMOUNT_HEADERS = ("출금", "입금", "잔액")
+
+# 헤더 행을 찾을 때 검사하는 앞부분 행 수 (이후 행은 읽지 않음)
+HEADER_LOOKAHEAD = 30
+
+_strip = str.strip
+
+
+def clean_text(value: str) -> str:
+    """텍스트 셀 변환 (앞뒤 공백 제거)"""
+    return value.strip()
+
+
+def clean_amount(value: str) -> str:
+    """금액 셀 변환 (쉼표 제거, 빈 값 0 처리 - 공백은 RowPlan.apply에서 이미 제거됨)"""
+    return value.replace(",", "") or "0"
+
+
+class RowPlan:
+    """한 파일의 헤더에 맞춰 컴파일된 컬럼별 변환 계획 클래스"""
+
+    def __init__(self, profile_name: str, raw_headers: List[str], headers: List[str],
+                 transforms: List[Callable[[str], str]]):
+        """
+        RowPlan 초기화
+
+        Args:
+            profile_name: 적용된 은행 프로필 이름
+            raw_headers: 파일의 원본 헤더
+            headers: 내부 표준 헤더 (원본 헤더 순서)
+            transforms: 컬럼별 셀 변환 함수 (피클 가능하도록 모듈 수준 함수만 사용)
+        """
+        self.profile_name = profile_name
+        self.raw_headers = raw_headers
+        self.headers = headers
+        self.transforms = transforms
+        self.amount_flags = [t is clean_amount for t in transforms]
+        # 공백 제거는 모든 셀에 한 번에 적용하고, 추가 변환이 필요한 컬럼만 따로 보관
+        self._extra = [(idx, t) for idx, t in enumerate(transforms) if t is not clean_text]
+
+    def apply(self, row: Sequence[str]) -> List[str]:
+        """
+        원본 행에 컬럼별 변환 함수를 적용 (헤더보다 긴 행의 나머지 셀은 공백만 제거)
+
+        Args:
+            row: csv.reader 등이 반환한 원본 행
+        """
+        out = list(map(_strip, row))
+        size = len(out)
+        for idx, transform in self._extra:
+            if idx < size:
+                out[idx] = transform(out[idx])
+        return out
+
+
+class BankProfile:
+    """은행 거래내역 양식 프로필 클래스"""
+
+    def __init__(self, name: str, header_map: Dict[str, str], signature: Iterable[str] = (),
+                 amount_headers: Sequence[str] = AMOUNT_HEADERS):
+        """
+        BankProfile 초기화
+
+        Args:
+            name: 프로필 이름 (예: '신한은행')
+            header_map: 은행 헤더 → 내부 표준 헤더 매핑 (표준 헤더는 자동 포함)
+            signature: 이 양식을 식별하는 원본 헤더 목록
+            amount_headers: 금액 정제를 적용할 표준 헤더
+        """
+        self.name = name
+        self.header_map = {h: h for h in STANDARD_HEADERS}
+        self.header_map.update(header_map)
+        self.signature = frozenset(signature)
+        self.amount_headers = tuple(amount_headers)
+
+    def match_score(self, raw_headers: Iterable[str]) -> int:
+        """원본 헤더 중 서명에 포함된 헤더 수 (0이면 이 양식이 아님)"""
+        return len(self.signature.intersection(h.strip() for h in raw_headers))
+
+    def header_score(self, row: Iterable[str]) -> int:
+        """행의 셀 중 이 프로필이 아는 헤더(은행 헤더 또는 표준 헤더) 수"""
+        return len(self.header_map.keys() & {str(cell).strip() for cell in row})
+
+    def map_header(self, header: str) -> str:
+        """은행 헤더명을 내부 표준 헤더명으로 변환"""
+        header = header.strip()
+        return self.header_map.get(header, header)
+
+    def compile(self, raw_headers: List[str]) -> RowPlan:
+        """
+        파일의 원본 헤더로부터 컬럼별 변환 계획을 생성
+
+        Args:
+            raw_headers: 파일의 원본 헤더
+        """
+        headers = [self.map_header(h) for h in raw_headers]
+        transforms = [clean_amount if h in self.amount_headers else clean_text for h in headers]
+        return RowPlan(self.name, raw_headers, headers, transforms)
+
+
+# 서명이 맞는 프로필이 없을 때 사용하는 기본 프로필 (표준 헤더만 매핑)
+GENERIC_PROFILE = BankProfile("기본", {})
+
+_profiles: List[BankProfile] = []
+
+
+def register_profile(profile: BankProfile) -> BankProfile:
+    """
+    은행 프로필을 등록 (같은 이름이 있으면 교체)
+
+    Args:
+        profile: 등록할 프로필
+
+    Returns:
+        BankProfile: 등록된 프로필
+    """
+    _profiles[:] = [p for p in _profiles if p.name != profile.name]
+    _profiles.append(profile)
+    return profile
+
+
+def registered_profiles() -> List[BankProfile]:
+    """등록된 프로필 목록 (등록 순서)"""
+    return list(_profiles)
+
+
+def detect_profile(raw_headers: List[str]) -> BankProfile:
+    """
+    원본 헤더와 서명이 가장 많이 겹치는 프로필을 선택 (동점이면 먼저 등록된 프로필)
+
+    Args:
+        raw_headers: 파일의 원본 헤더
+
+    Returns:
+        BankProfile: 감지된 프로필 (없으면 GENERIC_PROFILE)
+    """
+    best: Optional[BankProfile] = None
+    best_score = 0
+    for profile in _profiles:
+        score = profile.match_score(raw_headers)
+        if score > best_score:
+            best, best_score = profile, score
+    return best or GENERIC_PROFILE
+
+
+def find_header_row(rows: Sequence[Sequence[str]]) -> int:
+    """
+    앞부분 행 중 알려진 헤더가 가장 많은 행을 헤더 행으로 선택 (동점이면 앞쪽 행)
+
+    알려진 헤더가 하나도 없으면 첫 번째 비어있지 않은 행을 헤더로 봅니다.
+
+    Args:
+        rows: 파일 앞부분 행 (최대 HEADER_LOOKAHEAD개)
+
+    Returns:
+        int: 헤더 행 인덱스 (rows 기준, 모든 행이 비어있으면 0)
+    """
+    profiles = [GENERIC_PROFILE] + _profiles
+    best_idx = None
+    best_score = 0
+    for idx, row in enumerate(rows):
+        score = max(profile.header_score(row) for profile in profiles)
+        if score > best_score:
+            best_idx, best_score = idx, score
+    if best_idx is not None:
+        return best_idx
+    return next((idx for idx, row in enumerate(rows) if any(str(cell).strip() for cell in row)), 0)
+
+
+def compile_plan(raw_headers: List[str]) -> RowPlan:
+    """헤더로 프로필을 감지하고 컬럼별 변환 계획으로 컴파일하는 편의 함수"""
+    return detect_profile(raw_headers).compile(raw_headers)
+
+
+def profiles_version() -> str:
+    """등록된 프로필 설정으로부터 계산한 버전 문자열 (파싱 캐시 무효화용)"""
+    spec = [(p.name, sorted(p.header_map.items()), sorted(p.signature), p.amount_headers)
+            for p in [GENERIC_PROFILE] + _profiles]
+    return hashlib.md5(repr(spec).encode('utf-8')).hexdigest()[:12]
+
+
+SHINHAN_PROFILE = register_profile(BankProfile(
+    "신한은행",
+    {
+        "거래일자": "날짜",
+        "거래시간": "시간",
+        "적요": "적요",
+        "출금(원)": "출금",
+        "입금(원)": "입금",
+        "잔액(원)": "잔액",
+        "거래점": "거래처",
+    },
+    signature=("거래일자", "거래시간", "출금(원)", "입금(원)", "잔액(원)", "거래점"),
+))
+
+KB_PROFILE = register_profile(BankProfile(
+    "KB국민은행",
+    {
+        "거래일시": "날짜",
+        "적요": "적요",
+        "보낸분/받는분": "내용",
+        "출금액(원)": "출금",
+        "입금액(원)": "입금",
+        "잔액(원)": "잔액",
+        "처리점": "거래처",
+    },
+    signature=("거래일시", "보낸분/받는분", "출금액(원)", "입금액(원)", "처리점"),
+))
@@ -0,0 +1,154 @@
+"""
+컬럼형 파싱 모듈 (Columnar Parse)
+
+정규화된 데이터 행을 NumPy 기반 컬럼형 결과로 변환합니다.
+- 입금/출금/잔액: int64 원 단위 배열
+- 날짜+시간: datetime64[s] 배열
+- 그 외 텍스트 컬럼(적요, 내용, 거래처 등): 사전 인코딩 (정수 코드 배열 + 고유값 목록)
+"""
+
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from .bank_profiles import AMOUNT_HEADERS
+from .timestamps import parse_timestamp_general
+
+
+DATE_HEADER = "날짜"
+TIME_HEADER = "시간"
+
+
+class DictionaryEncoder:
+    """텍스트 값을 정수 코드로 변환하는 사전 인코더"""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.values: List[str] = []
+        self.codes: List[np.ndarray] = []
+
+    def add(self, texts: np.ndarray) -> None:
+        """텍스트 배열을 인코딩하여 코드 배열에 추가"""
+        # 청크 내 고유값만 파이썬 사전으로 전역 코드에 대응시킴
+        uniques, inverse = np.unique(texts, return_inverse=True)
+        mapping = np.empty(len(uniques), dtype=np.int32)
+        for i, text in enumerate(uniques.tolist()):
+            code = self.index.get(text)
+            if code is None:
+                code = len(self.values)
+                self.index[text] = code
+                self.values.append(text)
+            mapping[i] = code
+        self.codes.append(mapping[inverse.reshape(-1)])
+
+    def finish(self) -> Dict:
+        """누적된 코드 배열과 고유값 목록을 반환"""
+        codes = np.concatenate(self.codes) if self.codes else np.empty(0, dtype=np.int32)
+        return {'codes': codes, 'values': self.values}
+
+
+def parse_amounts(values: np.ndarray) -> np.ndarray:
+    """
+    금액 문자열 배열을 int64 배열로 변환 (쉼표 제거, 빈 값 0 처리)
+
+    숫자로 변환할 수 없는 값은 0으로 처리합니다.
+    """
+    values = np.strings.strip(np.strings.replace(values, ",", ""))
+    values = np.where(values == "", "0", values)
+    try:
+        return values.astype(np.int64)
+    except ValueError:
+        amounts = np.zeros(len(values), dtype=np.int64)
+        for i, value in enumerate(values.tolist()):
+            try:
+                amounts[i] = int(float(value))
+            except ValueError:
+                amounts[i] = 0
+        return amounts
+
+
+def parse_timestamps(dates: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """
+    날짜/시간 문자열 배열을 datetime64[s] 배열로 변환
+
+    ISO 형식으로 바꿀 수 없는 값은 일반 변환(timestamps)을 시도하고, 그래도 안 되면 NaT로 처리합니다.
+    """
+    raw_dates, raw_times = dates, times
+    dates = np.strings.strip(dates)
+    dates = np.strings.replace(np.strings.replace(dates, ".", "-"), "/", "-")
+    times = np.strings.strip(times)
+    combined = np.where(times == "", dates, np.strings.add(np.strings.add(dates, "T"), times))
+    try:
+        return combined.astype('datetime64[s]')
+    except ValueError:
+        timestamps = np.empty(len(combined), dtype='datetime64[s]')
+        for i, value in enumerate(combined.tolist()):
+            try:
+                timestamps[i] = np.datetime64(value, 's')
+            except ValueError:
+                epoch = parse_timestamp_general(str(raw_dates[i]), str(raw_times[i]))
+                timestamps[i] = np.datetime64('NaT') if epoch is None else np.datetime64(epoch, 's')
+        return timestamps
+
+
+def to_columnar(headers: List[str], chunks: Iterable[List[List[str]]]) -> Dict:
+    """
+    원본 행 청크들을 컬럼 단위로 정제하여 컬럼형 결과로 변환
+
+    Args:
+        headers: 표준 헤더 목록 (예: ['날짜', '시간', '적요', '출금', ...])
+        chunks: 정제 전 데이터 행 리스트의 반복자 (CsvRowStream.iter_raw_chunks 등)
+
+    Returns:
+        dict: 컬럼형 결과
+            - headers: 표준 헤더 목록
+            - row_count: 데이터 행 수
+            - amounts: {'입금'|'출금'|'잔액': int64 배열}
+            - timestamps: datetime64[s] 배열 (날짜 컬럼이 없으면 None)
+            - text: {헤더: {'codes': int32 배열, 'values': 고유값 목록}}
+    """
+    column_count = len(headers)
+    amount_idx = {h: i for i, h in enumerate(headers) if h in AMOUNT_HEADERS}
+    date_idx = headers.index(DATE_HEADER) if DATE_HEADER in headers else None
+    time_idx = headers.index(TIME_HEADER) if TIME_HEADER in headers else None
+    skip = set(amount_idx.values()) | {date_idx, time_idx}
+    text_idx = {h: i for i, h in enumerate(headers) if i not in skip}
+
+    amount_parts: Dict[str, List[np.ndarray]] = {h: [] for h in amount_idx}
+    timestamp_parts: List[np.ndarray] = []
+    encoders = {h: DictionaryEncoder() for h in text_idx}
+    row_count = 0
+
+    for chunk in chunks:
+        # 컬럼 수가 부족한 행은 빈 값으로 채워 열 단위로 전치
+        columns = list(zip(*(row if len(row) >= column_count else row + [""] * (column_count - len(row))
+                             for row in chunk)))
+        if not columns:
+            continue
+        row_count += len(chunk)
+
+        for h, i in amount_idx.items():
+            amount_parts[h].append(parse_amounts(np.array(columns[i], dtype=np.str_)))
+        if date_idx is not None:
+            times = columns[time_idx] if time_idx is not None else [""] * len(chunk)
+            timestamp_parts.append(parse_timestamps(np.array(columns[date_idx], dtype=np.str_),
+                                                    np.array(times, dtype=np.str_)))
+        for h, i in text_idx.items():
+            encoders[h].add(np.strings.strip(np.array(columns[i], dtype=np.str_)))
+
+    amounts = {
+        h: np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+        for h, parts in amount_parts.items()
+    }
+    timestamps = None
+    if date_idx is not None:
+        timestamps = (np.concatenate(timestamp_parts) if timestamp_parts
+                      else np.empty(0, dtype='datetime64[s]'))
+
+    return {
+        'headers': headers,
+        'row_count': row_count,
+        'amounts': amounts,
+        'timestamps': timestamps,
+        'text': {h: encoder.finish() for h, encoder in encoders.items()},
+    }
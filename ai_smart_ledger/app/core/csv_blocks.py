@@ -0,0 +1,133 @@
+"""
+CSV 바이트 블록 단계 모듈 (CSV Blocks)
+
+가져오기 파이프라인(import_pipeline)의 CSV 읽기/디코딩/정규화 단계 함수를 제공합니다.
+- 따옴표 밖 줄바꿈 경계에 맞춘 바이트 블록 단위로 읽어 블록이 항상 완전한 레코드로 끝남
+- 디코딩에 실패하면 그 블록부터 대체 인코딩으로 전환
+- 헤더까지 읽힌 CsvRowStream의 인코딩/방언/변환 계획을 그대로 사용하므로 행 스트림과 결과가 같음
+"""
+
+import codecs
+import csv
+import io
+import mmap
+import os
+from typing import Iterator, List, Tuple
+
+from .csv_scan import iter_record_ends, skip_records
+from .csv_stream import CsvRowStream, dialect_params
+from .text_encoding import decode_with_fallback
+
+
+# 읽기 단계가 한 번에 읽는 바이트 수 (레코드 경계에 맞춰 잘라 넘김)
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+def read_record_blocks(file_path: str, start: int,
+                       block_size: int = READ_BLOCK_SIZE) -> Iterator[Tuple[bytes, int]]:
+    """
+    start 위치부터 따옴표 밖 줄바꿈 경계에 맞춘 바이트 블록을 차례로 반환 (읽기 단계)
+
+    블록 끝에 걸친 레코드는 다음 블록 앞에 붙이므로 모든 블록이 완전한 레코드로 끝납니다.
+
+    Args:
+        file_path: CSV 파일 경로
+        start: 첫 데이터 레코드 시작 오프셋
+        block_size: 한 번에 읽는 바이트 수
+
+    Yields:
+        Tuple[bytes, int]: (블록, 블록 끝의 파일 오프셋)
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        position = start
+        pending = b''
+        while True:
+            data = f.read(block_size)
+            if not data:
+                break
+            pending += data
+            cut = 0
+            for ends in iter_record_ends(pending):
+                if len(ends):
+                    cut = int(ends[-1])
+            if cut:
+                position += cut
+                yield pending[:cut], position
+                pending = pending[cut:]
+        if pending:
+            yield pending, position + len(pending)
+
+
+class CsvBlockStages:
+    """헤더까지 읽힌 CSV 스트림 설정으로 바이트 블록을 디코딩/정규화하는 단계 함수 모음"""
+
+    def __init__(self, stream: CsvRowStream):
+        """
+        CsvBlockStages 초기화
+
+        Args:
+            stream: open()이 완료된 경로 기반 CsvRowStream (인코딩/방언/헤더/변환 계획 사용)
+        """
+        self.stream = stream
+        # utf-8-sig의 BOM은 헤더 앞에만 있으므로 데이터 블록은 utf-8로 디코딩
+        self.encoding = 'utf-8' if codecs.lookup(stream.encoding).name == 'utf-8-sig' else stream.encoding
+        self.fmtparams = dialect_params(stream.dialect)
+        self.header_count = len(stream.raw_headers)
+        self.rows_read = 0
+
+    @staticmethod
+    def supports(stream: CsvRowStream) -> bool:
+        """바이트 블록 단계로 나눌 수 있는 스트림인지 (CsvRowStream.byte_countable, 아니면 행 스트림으로 읽음)"""
+        return isinstance(stream, CsvRowStream) and stream.byte_countable
+
+    def start_offset(self) -> int:
+        """
+        첫 데이터 레코드의 바이트 오프셋 (머리말 줄과 헤더 다음)
+
+        Raises:
+            ValueError: 파일의 레코드 수가 헤더 행 번호보다 적은 경우 (레코드 끝을 찾지 못함)
+        """
+        header_row = self.stream.header_row
+        with open(self.stream.file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("파일이 비어있습니다")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                # 헤더 행 시작 위치가 파일 끝이면 헤더까지의 레코드가 없음
+                if header_row > 1 and skip_records(buffer, header_row - 1) >= len(buffer):
+                    raise ValueError(f"헤더 행({header_row}행)까지의 레코드를 찾을 수 없습니다")
+                return skip_records(buffer, header_row)
+
+    def decode(self, item: Tuple[bytes, int]) -> Tuple[str, int, int]:
+        """
+        바이트 블록 디코딩 (실패하면 그 줄부터 대체 인코딩으로 전환하고 이후 블록에도 사용)
+
+        Returns:
+            Tuple[str, int, int]: (디코딩된 문자열, 블록 끝의 파일 오프셋, 블록 바이트 수)
+        """
+        block, position = item
+        text, self.encoding = decode_with_fallback(block, self.encoding)
+        return text, position, len(block)
+
+    def normalize(self, item: Tuple[str, int, int]) -> Tuple[List[List[str]], int]:
+        """
+        디코딩된 블록을 CSV 행으로 나누고 컬럼별 변환 계획 적용 (컬럼 수 불일치 행은 경고)
+
+        Returns:
+            Tuple[List[List[str]], int]: (정규화된 행 목록, 블록 끝의 파일 오프셋)
+        """
+        text, position, _ = item
+        apply = self.stream.plan.apply
+        header_count = self.header_count
+        stream = self.stream
+        rows = []
+        for row in csv.reader(io.StringIO(text, newline=''), **self.fmtparams):
+            self.rows_read += 1
+            if len(row) != header_count:
+                stream.malformed_rows += 1
+                if stream.malformed_rows <= 3:  # 처음 3개 오류만 로깅
+                    print(f"⚠️ {stream.header_row + self.rows_read}행: 컬럼 수 불일치 "
+                          f"(헤더: {header_count}, 데이터: {len(row)})")
+            rows.append(apply(row))
+        stream.rows_read = self.rows_read
+        return rows, position
@@ -0,0 +1,253 @@
+"""
+CSV 바이트 스캔 모듈 (CSV Byte Scan)
+
+디코딩 없이 원본 바이트에서 레코드 경계(따옴표 밖 줄바꿈)를 찾습니다.
+- NumPy로 블록 단위 벡터 스캔 (메모리 사용량은 블록 크기로 제한)
+- 따옴표 안의 줄바꿈은 레코드 경계로 보지 않음
+- 파싱 없이 레코드 수만 세는 빠른 행 수 계산 (메모리 맵)
+- 초대형 파일은 여러 구간 표본의 레코드당 바이트 수로 레코드 수를 추정
+- 모든 레코드의 필드 수가 같은지 따옴표 밖 구분자 수로 검사 (외부 파서 결과 검증용)
+- '"'와 '\\n' 바이트가 다른 문자의 일부로 나타나지 않는 인코딩에서만 사용
+"""
+
+import codecs
+import mmap
+import os
+from typing import Iterator, List
+
+import numpy as np
+
+
+QUOTE = 0x22
+NEWLINE = 0x0A
+
+# 한 번에 스캔할 바이트 수
+SCAN_BLOCK_SIZE = 8 * 1024 * 1024
+
+# 레코드 수 추정에 사용할 표본 구간 수와 구간당 바이트 수
+ESTIMATE_SAMPLE_COUNT = 8
+ESTIMATE_SAMPLE_SIZE = 256 * 1024
+
+# 바이트 스캔이 안전한 인코딩 (멀티바이트 문자의 후행 바이트에 '"', '\n'이 없음)
+BYTE_SCANNABLE_ENCODINGS = {
+    'utf-8', 'utf-8-sig', 'cp949', 'euc_kr', 'ascii', 'iso8859-1', 'cp1252',
+}
+
+
+def is_byte_scannable(encoding: str) -> bool:
+    """해당 인코딩의 원본 바이트에서 레코드 경계를 직접 찾을 수 있는지 여부"""
+    try:
+        return codecs.lookup(encoding).name in BYTE_SCANNABLE_ENCODINGS
+    except LookupError:
+        return False
+
+
+def iter_record_ends(buffer, start: int = 0, end: int = None,
+                     block_size: int = SCAN_BLOCK_SIZE) -> Iterator[np.ndarray]:
+    """
+    버퍼에서 레코드 종료 위치(줄바꿈 다음 오프셋)를 블록 단위 배열로 반환
+
+    start는 레코드 시작 위치(따옴표 밖)여야 합니다.
+
+    Args:
+        buffer: bytes, mmap 등 버퍼 프로토콜을 지원하는 객체
+        start: 스캔 시작 오프셋
+        end: 스캔 종료 오프셋 (기본값: 버퍼 끝)
+        block_size: 블록 크기 (바이트)
+
+    Yields:
+        np.ndarray: 블록 내 레코드 종료 오프셋 배열 (int64, 절대 위치)
+    """
+    if end is None:
+        end = len(buffer)
+    parity = 0
+    pos = start
+    while pos < end:
+        count = min(block_size, end - pos)
+        block = np.frombuffer(buffer, dtype=np.uint8, count=count, offset=pos)
+        quotes = np.flatnonzero(block == QUOTE)
+        newlines = np.flatnonzero(block == NEWLINE)
+        # 각 줄바꿈 앞의 따옴표 개수가 짝수이면 따옴표 밖
+        before = np.searchsorted(quotes, newlines) + parity
+        ends = newlines[(before & 1) == 0].astype(np.int64) + (pos + 1)
+        parity = (parity + len(quotes)) & 1
+        pos += count
+        yield ends
+
+
+def count_records(buffer, start: int = 0, end: int = None,
+                  block_size: int = SCAN_BLOCK_SIZE) -> int:
+    """
+    버퍼의 레코드 수를 셈 (마지막 줄에 줄바꿈이 없어도 한 레코드로 계산)
+
+    csv.reader와 같이 빈 줄도 한 레코드로 셉니다.
+
+    Args:
+        buffer: 스캔할 버퍼
+        start: 스캔 시작 오프셋 (레코드 시작 위치)
+        end: 스캔 종료 오프셋 (기본값: 버퍼 끝)
+        block_size: 블록 크기 (바이트)
+    """
+    if end is None:
+        end = len(buffer)
+    count = 0
+    last_end = start
+    for ends in iter_record_ends(buffer, start, end, block_size):
+        if len(ends):
+            count += len(ends)
+            last_end = int(ends[-1])
+    return count + (last_end < end)
+
+
+def count_file_records(file_path: str, estimate: bool = False) -> int:
+    """
+    파일을 메모리 맵으로 열어 헤더를 포함한 전체 레코드 수를 셈
+
+    Args:
+        file_path: 파일 경로 (is_byte_scannable 인코딩이어야 함)
+        estimate: True이면 전체를 스캔하지 않고 표본 구간으로 추정 (estimate_records)
+    """
+    if os.path.getsize(file_path) == 0:
+        return 0
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if estimate:
+            return estimate_records(buffer)
+        return count_records(buffer)
+
+
+def estimate_records(buffer, start: int = 0, samples: int = ESTIMATE_SAMPLE_COUNT,
+                     sample_size: int = ESTIMATE_SAMPLE_SIZE) -> int:
+    """
+    앞/중간/끝 표본 구간의 레코드당 평균 바이트 수로 start 이후 레코드 수를 추정
+
+    표본 구간 전체보다 작은 범위는 정확히 셉니다.
+    중간 구간은 첫 줄바꿈 다음을 레코드 시작으로 간주하므로, 여러 줄 셀이 많은 파일에서는 오차가 커질 수 있습니다.
+
+    Args:
+        buffer: 스캔할 버퍼 (find 메서드 지원: bytes, mmap)
+        start: 첫 레코드 시작 오프셋
+        samples: 표본 구간 수
+        sample_size: 구간당 바이트 수
+    """
+    end = len(buffer)
+    span = end - start
+    if span <= samples * sample_size:
+        return count_records(buffer, start, end)
+
+    last = end - sample_size
+    sampled_bytes = 0
+    sampled_records = 0
+    for i in range(samples):
+        pos = start + (last - start) * i // (samples - 1)
+        if pos > start:
+            pos = buffer.find(b'\n', pos, pos + sample_size) + 1
+            if pos == 0:
+                continue
+        stop = min(pos + sample_size, end)
+        last_end = pos
+        for ends in iter_record_ends(buffer, pos, stop):
+            if len(ends):
+                sampled_records += len(ends)
+                last_end = int(ends[-1])
+        # 구간의 마지막 레코드 끝까지를 표본 바이트로 사용
+        sampled_bytes += last_end - pos
+
+    if sampled_records == 0:
+        # 표본 안에 레코드 경계가 없을 만큼 긴 레코드 → 정확히 셈
+        return count_records(buffer, start, end)
+    return max(1, round(span * sampled_records / sampled_bytes))
+
+
+def skip_records(buffer, records: int, block_size: int = SCAN_BLOCK_SIZE) -> int:
+    """
+    버퍼 앞에서 records개 레코드를 건너뛴 위치 (머리말 줄 + 헤더 다음 = 첫 데이터 행의 시작)
+
+    Args:
+        buffer: 스캔할 버퍼
+        records: 건너뛸 레코드 수
+
+    Returns:
+        int: 오프셋 (레코드가 부족하면 버퍼 길이)
+    """
+    if records <= 0:
+        return 0
+    remaining = records
+    for ends in iter_record_ends(buffer, 0, len(buffer), block_size):
+        if len(ends) >= remaining:
+            return int(ends[remaining - 1])
+        remaining -= len(ends)
+    return len(buffer)
+
+
+def find_record_boundaries(buffer, targets: List[int], start: int = 0,
+                           block_size: int = SCAN_BLOCK_SIZE) -> List[int]:
+    """
+    각 목표 오프셋 이후의 첫 레코드 시작 위치를 한 번의 스캔으로 찾음
+
+    Args:
+        buffer: 스캔할 버퍼
+        targets: 오름차순 목표 오프셋 목록
+        start: 스캔 시작 오프셋 (레코드 시작 위치)
+
+    Returns:
+        List[int]: 목표별 레코드 시작 오프셋 (경계가 없으면 버퍼 길이)
+    """
+    total = len(buffer)
+    boundaries = []
+    remaining = list(targets)
+    for ends in iter_record_ends(buffer, start, total, block_size):
+        while remaining and len(ends):
+            idx = np.searchsorted(ends, remaining[0])
+            if idx >= len(ends):
+                break
+            boundaries.append(int(ends[idx]))
+            remaining.pop(0)
+        if not remaining:
+            break
+    boundaries.extend(total for _ in remaining)
+    return boundaries
+
+
+def records_have_fields(buffer, fields: int, start: int = 0, delimiter: str = ',',
+                        block_size: int = SCAN_BLOCK_SIZE) -> bool:
+    """
+    start 이후 모든 레코드의 필드 수가 fields인지 검사 (빈 줄도 필드 1개인 레코드로 봄)
+
+    따옴표 밖 구분자를 레코드별로 세므로 csv.reader와 같은 기준입니다.
+    구분자는 멀티바이트 문자의 후행 바이트에 나타나지 않는 ASCII 기호여야 합니다.
+
+    Args:
+        buffer: 스캔할 버퍼
+        fields: 기대하는 레코드당 필드 수
+        start: 스캔 시작 오프셋 (레코드 시작 위치)
+        delimiter: 필드 구분자 (한 글자)
+        block_size: 블록 크기 (바이트)
+
+    Returns:
+        bool: 모든 레코드의 필드 수가 같고 따옴표가 닫혀 있으면 True
+    """
+    separator = ord(delimiter)
+    end = len(buffer)
+    parity = 0
+    carry = 0  # 블록 경계에 걸친 레코드의 앞 블록 구분자 수
+    last_end = start
+    pos = start
+    while pos < end:
+        count = min(block_size, end - pos)
+        block = np.frombuffer(buffer, dtype=np.uint8, count=count, offset=pos)
+        quotes = np.flatnonzero(block == QUOTE)
+        newlines = np.flatnonzero(block == NEWLINE)
+        separators = np.flatnonzero(block == separator)
+        newlines = newlines[((np.searchsorted(quotes, newlines) + parity) & 1) == 0]
+        separators = separators[((np.searchsorted(quotes, separators) + parity) & 1) == 0]
+        # 구분자마다 앞선 줄바꿈 수가 곧 블록 내 레코드 번호
+        per_record = np.bincount(np.searchsorted(newlines, separators), minlength=len(newlines) + 1)
+        per_record[0] += carry
+        if (per_record[:-1] != fields - 1).any():
+            return False
+        carry = int(per_record[-1])
+        if len(newlines):
+            last_end = pos + int(newlines[-1]) + 1
+        parity = (parity + len(quotes)) & 1
+        pos += count
+    return parity == 0 and (last_end == end or carry == fields - 1)
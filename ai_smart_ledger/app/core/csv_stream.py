@@ -0,0 +1,286 @@
+"""
+CSV 행 스트리밍 모듈 (CSV Row Stream)
+
+CSV 파일을 한 번 열어 정규화된 데이터 행을 순차적으로 내보냅니다.
+- 인코딩(text_encoding)/CSV 방언 감지
+- 은행 프로필 감지 및 컬럼별 변환 계획 적용 (bank_profiles)
+- 머리말 줄이 있는 파일은 앞부분 HEADER_LOOKAHEAD개 레코드 안에서 헤더 행을 찾음
+- 행 단위 또는 고정 크기 청크 단위 반복 (메모리 사용량 일정)
+- 파싱 없이 바이트 스캔으로 전체 행 수 계산 또는 추정 (미리보기용)
+- 압축 파일 멤버처럼 경로로 열 수 없는 입력은 opener가 연 바이너리 스트림(또는 이미 디코딩된 텍스트)에서 읽음
+"""
+
+import csv
+import io
+from itertools import chain, islice
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional
+
+from .bank_profiles import HEADER_LOOKAHEAD, RowPlan, compile_plan, find_header_row
+from .csv_scan import count_file_records, is_byte_scannable
+from .text_encoding import DecodedLineReader, detect_encoding, detect_stream_encoding
+
+
+# iter_chunks 기본 청크 크기 (행 수)
+DEFAULT_CHUNK_SIZE = 5000
+
+# 이 크기를 넘는 파일의 미리보기는 전체 행 수를 표본 구간으로 추정
+EXACT_COUNT_LIMIT = 256 * 1024 * 1024
+
+# CSV 방언 감지에 사용할 앞부분 문자 수
+SNIFF_SIZE = 1024
+
+
+def dialect_params(dialect) -> Dict:
+    """csv 방언을 프로세스 간 전달 가능한 포맷 파라미터 딕셔너리로 변환"""
+    return {
+        'delimiter': dialect.delimiter,
+        'quotechar': dialect.quotechar,
+        'escapechar': dialect.escapechar,
+        'doublequote': dialect.doublequote,
+        'skipinitialspace': dialect.skipinitialspace,
+        'quoting': dialect.quoting,
+    }
+
+
+class CsvRowStream:
+    """CSV 파일을 정규화된 행 단위로 읽어오는 스트림 클래스"""
+
+    def __init__(self, file_path: str, file_hash: Optional[str] = None,
+                 opener: Optional[Callable[[], BinaryIO]] = None):
+        """
+        CsvRowStream 초기화
+
+        Args:
+            file_path: CSV 파일 경로 (opener가 주어지면 로그 표시용 이름)
+            file_hash: 파일 내용 해시 (주어지면 인코딩 감지 결과를 캐시)
+            opener: 입력을 바이너리 파일 객체로 여는 함수 (압축 파일 멤버 등, 기본값: file_path를 엶)
+                텍스트 파일 객체(io.StringIO 등)를 반환하면 인코딩 감지 없이 그대로 파싱
+        """
+        self.file_path = file_path
+        self.file_hash = file_hash
+        self.opener = opener
+        self.encoding = 'utf-8'
+        self.dialect = csv.excel
+        self.raw_headers: List[str] = []
+        self.headers: List[str] = []
+        self.amount_flags: List[bool] = []
+        self.plan: Optional[RowPlan] = None
+        self.header_row = 1
+        self.rows_read = 0
+        self.malformed_rows = 0
+        self._countable = False
+        self._binary = False
+        self._file = None
+        self._lines = None
+        self._reader = None
+
+    def open(self) -> 'CsvRowStream':
+        """
+        파일을 열고 인코딩/방언 감지 후 헤더 행까지 읽음
+
+        앞부분 HEADER_LOOKAHEAD개 레코드만 읽어 헤더 행을 고르고, 그 뒤 레코드는 데이터로 이어서 반환합니다.
+
+        Returns:
+            CsvRowStream: 자기 자신 (체이닝용)
+
+        Raises:
+            ValueError: 파일에 헤더 행이 없는 경우
+            UnicodeDecodeError: 감지된 인코딩으로 헤더를 읽을 수 없는 경우
+        """
+        if self.opener is not None:
+            self._file = self.opener()
+        else:
+            self.encoding = detect_encoding(self.file_path, self.file_hash)
+            if is_byte_scannable(self.encoding):
+                # 바이트를 직접 블록 디코딩 (실패 시 그 줄부터 대체 인코딩으로 전환)
+                self._file = open(self.file_path, 'rb')
+            else:
+                self._file = open(self.file_path, 'r', encoding=self.encoding, newline='')
+        try:
+            if self.opener is not None and not isinstance(self._file, io.TextIOBase):
+                # 임의 위치로 이동할 수 없는 스트림은 앞부분 표본으로만 인코딩 감지
+                self.encoding = detect_stream_encoding(self._file)
+                if not is_byte_scannable(self.encoding):
+                    self._file = io.TextIOWrapper(self._file, encoding=self.encoding, newline='')
+            self._binary = not isinstance(self._file, io.TextIOBase)
+
+            # CSV 방언 자동 감지 시도
+            sample = ''
+            try:
+                sample = self._file.read(SNIFF_SIZE * 4)
+                if isinstance(sample, bytes):
+                    sample = sample.decode(self.encoding, errors='replace')
+                self.dialect = csv.Sniffer().sniff(sample[:SNIFF_SIZE])
+            except Exception:
+                # 감지 실패 시 기본 설정 사용
+                self.dialect = csv.excel
+            finally:
+                self._file.seek(0)
+
+            # 바이트 스캔 행 수 계산은 '"' 따옴표와 '\n' 줄바꿈을 쓰는 디스크 파일에서만 사용
+            self._countable = (
+                self._binary
+                and self.opener is None
+                and self.dialect.quotechar == '"'
+                and ('\n' in sample or '\r' not in sample)
+            )
+
+            if self._binary:
+                self._lines = DecodedLineReader(self._file, self.encoding)
+            else:
+                self._lines = self._file
+            reader = csv.reader(self._lines, self.dialect)
+            lookahead = list(islice(reader, HEADER_LOOKAHEAD))
+            if not lookahead:
+                raise ValueError("파일이 비어있습니다")
+            header_idx = find_header_row(lookahead)
+            self.header_row = header_idx + 1
+            self.raw_headers = lookahead[header_idx]
+            # 미리 읽은 레코드 중 헤더 다음 레코드부터 데이터로 반환
+            self._reader = chain(lookahead[header_idx + 1:], reader)
+        except BaseException:
+            self.close()
+            raise
+
+        self.plan = compile_plan(self.raw_headers)
+        self.headers = self.plan.headers
+        self.amount_flags = self.plan.amount_flags
+        if self.header_row > 1:
+            print(f"📋 머리말 {self.header_row - 1}줄을 건너뛰고 {self.header_row}행을 헤더로 사용")
+        print(f"📋 헤더 발견 ({self.plan.profile_name}): {self.raw_headers} → {self.headers}")
+        return self
+
+    def __iter__(self) -> Iterator[List[str]]:
+        """헤더 다음 행부터 정규화된 데이터 행을 하나씩 반환"""
+        if self._reader is None:
+            self.open()
+
+        header_count = len(self.raw_headers)
+        apply = self.plan.apply
+
+        for row_num, row in enumerate(self._reader, start=self.header_row + 1):  # 헤더 다음부터 시작
+            self.rows_read += 1
+
+            # 행 품질 검증 (경고만 하고 계속 진행)
+            if len(row) != header_count:
+                self.malformed_rows += 1
+                if self.malformed_rows <= 3:  # 처음 3개 오류만 로깅
+                    print(f"⚠️ {row_num}행: 컬럼 수 불일치 (헤더: {header_count}, 데이터: {len(row)})")
+
+            yield apply(row)
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[List[str]]]:
+        """
+        정규화된 데이터 행을 고정 크기 청크(행 리스트) 단위로 반환
+
+        Args:
+            chunk_size: 청크당 최대 행 수
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+
+        chunk = []
+        for row in self:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def iter_raw_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[List[str]]]:
+        """
+        정제 전 원본 행을 고정 크기 청크 단위로 반환
+
+        셀 단위 정제 대신 컬럼 단위로 한꺼번에 정제하는 소비자(컬럼형 변환 등)용입니다.
+
+        Args:
+            chunk_size: 청크당 최대 행 수
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+        if self._reader is None:
+            self.open()
+
+        header_count = len(self.raw_headers)
+        while True:
+            chunk = list(islice(self._reader, chunk_size))
+            if not chunk:
+                return
+            first_row_num = self.rows_read + self.header_row + 1  # 헤더 다음부터 시작
+            self.rows_read += len(chunk)
+            for offset, row in enumerate(chunk):
+                if len(row) != header_count:
+                    self.malformed_rows += 1
+                    if self.malformed_rows <= 3:  # 처음 3개 오류만 로깅
+                        print(f"⚠️ {first_row_num + offset}행: 컬럼 수 불일치 (헤더: {header_count}, 데이터: {len(row)})")
+            yield chunk
+
+    def count_rows(self) -> int:
+        """
+        전체 데이터 행 수 (헤더 제외)
+
+        바이트 스캔이 가능한 인코딩이면 파일을 파싱하지 않고 따옴표 밖 줄바꿈 수로 계산하고,
+        그렇지 않으면 남은 행을 끝까지 읽어 셉니다 (이 경우 이후 반복할 행이 남지 않음).
+        """
+        if self._reader is None:
+            self.open()
+        if self._countable:
+            return max(0, count_file_records(self.file_path) - self.header_row)
+        for _ in self._reader:
+            self.rows_read += 1
+        return self.rows_read
+
+    def estimate_rows(self) -> Optional[int]:
+        """
+        파일 여러 구간의 행당 평균 바이트 수로 추정한 데이터 행 수 (헤더 제외)
+
+        Returns:
+            Optional[int]: 추정 행 수 (바이트 스캔이 불가능한 파일이면 None)
+        """
+        if self._reader is None:
+            self.open()
+        if not self._countable:
+            return None
+        return max(0, count_file_records(self.file_path, estimate=True) - self.header_row)
+
+    @property
+    def byte_countable(self) -> bool:
+        """
+        따옴표 밖 줄바꿈의 바이트 스캔으로 레코드 경계를 찾을 수 있는 스트림인지
+
+        경로로 연 디스크 파일이고, 바이트 스캔 가능한 인코딩, '"' 따옴표, '\n' 줄바꿈을 써야 합니다
+        ('\r'만 쓰는 파일은 바이트 스캔으로 레코드 끝을 찾을 수 없음). open() 전에는 False입니다.
+        """
+        return self._countable
+
+    @property
+    def bytes_consumed(self) -> int:
+        """지금까지 파일에서 읽은 바이트 수 (진행률 표시용, 읽기 버퍼만큼 앞설 수 있음)"""
+        if self._file is None:
+            return 0
+        if not self._binary and not hasattr(self._file, 'buffer'):
+            # 이미 디코딩된 텍스트 입력은 읽은 문자 위치
+            return self._file.tell()
+        raw = self._file if self._binary else self._file.buffer
+        return raw.tell()
+
+    def close(self) -> None:
+        """열려 있는 파일을 닫음"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'CsvRowStream':
+        if self._reader is None:
+            self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def open_csv_stream(file_path: str, file_hash: Optional[str] = None,
+                    opener: Optional[Callable[[], BinaryIO]] = None) -> CsvRowStream:
+    """CsvRowStream을 생성하고 헤더까지 읽은 상태로 반환하는 편의 함수"""
+    return CsvRowStream(file_path, file_hash, opener).open()
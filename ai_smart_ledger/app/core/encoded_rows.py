@@ -0,0 +1,224 @@
+"""
+사전 인코딩 행 모듈 (Encoded Rows)
+
+전체 파싱 결과의 데이터 행을 컬럼별로 보관하고, 반복이 많은 텍스트 컬럼은 사전 인코딩합니다.
+- 적요/내용/거래처 등 텍스트 컬럼: 정수 코드 배열(array 'I') + 고유값 목록
+- 같은 값의 셀은 고유값 목록의 문자열 객체 하나를 공유 (행마다 별도 문자열을 유지하지 않음)
+- 행 목록(list of list)처럼 길이/인덱스/슬라이스/반복/비교를 지원하므로 기존 사용처는 그대로 동작
+- 컬럼 수가 헤더와 다른 행도 원래 셀 그대로 복원
+- 가맹점별 집계는 문자열 대신 코드 배열에 대한 정수 연산 (value_counts)
+"""
+
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .bank_profiles import AMOUNT_HEADERS
+
+
+# 사전 인코딩하지 않는 컬럼 (금액과 날짜/시간은 값이 대부분 달라 인코딩 이득이 없음)
+PLAIN_HEADERS = AMOUNT_HEADERS + ("날짜", "시간")
+
+
+def text_headers(headers: List[str]) -> List[str]:
+    """사전 인코딩할 텍스트 컬럼 헤더 목록 (금액/날짜/시간 제외)"""
+    return [h for h in headers if h not in PLAIN_HEADERS]
+
+
+def column_values(headers: List[str], rows: Sequence, header: str) -> Sequence[str]:
+    """
+    행 목록(EncodedRows 포함)에서 컬럼 하나의 값 목록을 꺼냄
+
+    EncodedRows는 보관 중인 컬럼을 그대로 반환하고, 행 목록은 셀이 모자란 행을 빈 값으로 채워 모읍니다.
+    """
+    if isinstance(rows, EncodedRows):
+        return rows.column(header)
+    idx = headers.index(header)
+    return [row[idx] if idx < len(row) else "" for row in rows]
+
+
+class EncodedColumn:
+    """문자열 컬럼을 정수 코드 배열과 고유값 목록으로 보관하는 클래스"""
+
+    def __init__(self):
+        self.codes = array('I')
+        self._index: Dict[str, int] = {}
+        self._values: Optional[List[str]] = []
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray, values: List[str]) -> 'EncodedColumn':
+        """이미 인코딩된 코드 배열과 고유값 목록으로 컬럼을 만듦 (여러 결과의 컬럼 병합용)"""
+        column = cls()
+        column.codes.frombytes(np.ascontiguousarray(codes, dtype=np.uint32).tobytes())
+        column._values = list(values)
+        column._index = {value: code for code, value in enumerate(column._values)}
+        return column
+
+    @property
+    def values(self) -> List[str]:
+        """코드 순서의 고유값 목록 (코드 i의 값은 values[i])"""
+        if self._values is None:
+            self._values = list(self._index)
+        return self._values
+
+    def extend(self, texts: Iterable[str]) -> None:
+        """문자열들을 인코딩하여 코드 배열에 추가 (처음 나온 값에 다음 코드 부여)"""
+        index = self._index
+        self.codes.extend(index.setdefault(text, len(index)) for text in texts)
+        if self._values is not None and len(self._values) != len(index):
+            self._values = None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> str:
+        return self.values[self.codes[i]]
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self.values.__getitem__, self.codes)
+
+    def __getstate__(self) -> Dict:
+        # 값 → 코드 사전은 고유값 목록으로 다시 만들 수 있으므로 저장하지 않음
+        return {'codes': self.codes, 'values': self.values}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.codes = state['codes']
+        self._values = state['values']
+        self._index = {value: code for code, value in enumerate(self._values)}
+
+
+class EncodedRows(Sequence):
+    """텍스트 컬럼을 사전 인코딩하여 보관하는 데이터 행 목록 클래스"""
+
+    def __init__(self, headers: List[str], encoded: Optional[Iterable[str]] = None):
+        """
+        EncodedRows 초기화
+
+        Args:
+            headers: 표준 헤더 목록
+            encoded: 사전 인코딩할 헤더 (기본값: text_headers(headers))
+        """
+        self.headers = list(headers)
+        encoded = set(text_headers(self.headers) if encoded is None else encoded)
+        self._columns: List[Union[EncodedColumn, List[str]]] = [
+            EncodedColumn() if h in encoded else [] for h in self.headers
+        ]
+        self._count = 0
+        # 컬럼 수가 헤더와 다른 행: 행 번호 → 원래 셀 수, 헤더보다 많은 셀
+        self._lengths: Dict[int, int] = {}
+        self._extra: Dict[int, List[str]] = {}
+
+    @classmethod
+    def from_columns(cls, headers: List[str], columns: List[Union[EncodedColumn, List[str]]]) -> 'EncodedRows':
+        """
+        컬럼들로 EncodedRows를 만듦 (모든 컬럼의 길이가 같아야 함)
+
+        Raises:
+            ValueError: 헤더와 컬럼 수가 다르거나 컬럼 길이가 다른 경우
+        """
+        if len(headers) != len(columns) or len({len(c) for c in columns}) > 1:
+            raise ValueError("헤더와 컬럼 수 또는 컬럼 길이가 맞지 않습니다")
+        rows = cls(headers, encoded=())
+        rows._columns = list(columns)
+        rows._count = len(columns[0]) if columns else 0
+        return rows
+
+    @classmethod
+    def from_chunks(cls, headers: List[str], chunks: Iterable[List[List[str]]]) -> 'EncodedRows':
+        """행 청크들(iter_chunks 결과 등)로 EncodedRows를 만듦"""
+        rows = cls(headers)
+        for chunk in chunks:
+            rows.extend(chunk)
+        return rows
+
+    def extend(self, rows: List[List[str]]) -> None:
+        """
+        데이터 행들을 컬럼별로 나누어 추가
+
+        Args:
+            rows: 정규화된 데이터 행 목록
+        """
+        width = len(self._columns)
+        if any(len(row) != width for row in rows):
+            rows = [self._fit(self._count + offset, row, width) for offset, row in enumerate(rows)]
+        for column, cells in zip(self._columns, zip(*rows)):
+            column.extend(cells)
+        self._count += len(rows)
+
+    def _fit(self, row_num: int, row: List[str], width: int) -> List[str]:
+        """헤더와 컬럼 수가 다른 행을 헤더 길이에 맞추고 원래 모양을 기록"""
+        if len(row) == width:
+            return row
+        self._lengths[row_num] = len(row)
+        if len(row) > width:
+            self._extra[row_num] = row[width:]
+            return row[:width]
+        return row + [''] * (width - len(row))
+
+    def _restore(self, row_num: int, row: List[str]) -> List[str]:
+        length = self._lengths.get(row_num)
+        if length is None:
+            return row
+        return row[:length] + self._extra.get(row_num, [])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("행 번호가 범위를 벗어났습니다")
+        return self._restore(index, [column[index] for column in self._columns])
+
+    def __iter__(self) -> Iterator[List[str]]:
+        cells = zip(*(iter(column) for column in self._columns))
+        if not self._lengths:
+            return map(list, cells)
+        return (self._restore(i, list(row)) for i, row in enumerate(cells))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (EncodedRows, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"EncodedRows({len(self)}행, 인코딩 컬럼 {self.encoded_headers})"
+
+    @property
+    def encoded_headers(self) -> List[str]:
+        """사전 인코딩된 컬럼 헤더 목록"""
+        return [h for h, c in zip(self.headers, self._columns) if isinstance(c, EncodedColumn)]
+
+    def column(self, header: str) -> Union[EncodedColumn, List[str]]:
+        """
+        컬럼 하나를 반환 (사전 인코딩된 컬럼이면 EncodedColumn)
+
+        Raises:
+            KeyError: 헤더가 없는 경우
+        """
+        if header not in self.headers:
+            raise KeyError(header)
+        return self._columns[self.headers.index(header)]
+
+    def value_counts(self, header: str) -> Dict[str, int]:
+        """
+        컬럼 값별 행 수 (가맹점별 거래 건수 등)
+
+        사전 인코딩된 컬럼은 문자열 비교 없이 코드 배열의 bincount로 계산합니다.
+        """
+        column = self.column(header)
+        if not isinstance(column, EncodedColumn):
+            counts: Dict[str, int] = {}
+            for value in column:
+                counts[value] = counts.get(value, 0) + 1
+            return counts
+        codes = np.frombuffer(column.codes, dtype=np.uint32) if len(column.codes) else np.empty(0, np.uint32)
+        totals = np.bincount(codes, minlength=len(column.values))
+        return dict(zip(column.values, totals.tolist()))
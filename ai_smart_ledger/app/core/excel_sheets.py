@@ -0,0 +1,152 @@
+"""
+다중 시트 Excel 모듈 (Excel Sheets)
+
+계좌별/월별로 시트가 나뉜 통합 문서의 모든 시트를 읽어 하나의 결과로 병합합니다.
+- 시트마다 별도 프로세스에서 ExcelRowStream으로 파싱
+  (전체 시간 ≈ 가장 큰 시트의 시간, Qt 스레드가 떠 있는 프로세스를 fork하지 않도록 spawn으로 시작)
+- 시트별 헤더를 표준 헤더 기준으로 합친 공통 헤더로 정렬
+- 각 행에 출처 시트 이름 컬럼을 추가
+- 거래일시(epoch 초) 오름차순으로 병합 (시트별 정렬 후 heapq.merge)
+"""
+
+import heapq
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from openpyxl import load_workbook
+
+from .encoded_rows import EncodedRows
+from .excel_stream import ExcelRowStream
+from .timestamps import epoch_column
+
+
+# 병합 결과에 추가하는 출처 시트 컬럼 이름
+SHEET_HEADER = "시트"
+
+
+def list_sheets(file_path: str) -> List[str]:
+    """통합 문서의 시트 이름 목록 (시트 내용은 읽지 않음)"""
+    workbook = load_workbook(filename=file_path, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def parse_sheet(args: Tuple[str, str]) -> Dict:
+    """
+    시트 하나를 스트리밍으로 파싱 (워커 프로세스에서 실행)
+
+    Args:
+        args: (파일 경로, 시트 이름)
+
+    Returns:
+        dict: 시트 파싱 결과
+            - sheet: 시트 이름
+            - headers: 표준 헤더 목록
+            - data: 정규화된 데이터 행 목록
+            - malformed_rows: 컬럼 수 불일치 행 수
+            - error: 오류 메시지 (빈 시트 등, 실패 시)
+    """
+    file_path, sheet_name = args
+    result = {'sheet': sheet_name, 'headers': [], 'data': [], 'malformed_rows': 0, 'error': None}
+    try:
+        with ExcelRowStream(file_path, sheet_name) as stream:
+            result['headers'] = stream.headers
+            # 작업 프로세스에서 돌려받는 결과도 사전 인코딩된 형태로 전달 (피클 크기 감소)
+            result['data'] = EncodedRows.from_chunks(stream.headers, stream.iter_chunks())
+            result['malformed_rows'] = stream.malformed_rows
+    except ValueError as e:
+        result['error'] = str(e)
+    return result
+
+
+def merge_headers(sheet_headers: List[List[str]], tag_header: str = SHEET_HEADER) -> List[str]:
+    """시트별 헤더를 처음 나온 순서대로 합친 공통 헤더 (빈 헤더 제외, 마지막에 출처 컬럼 tag_header)"""
+    merged: Dict[str, None] = {}
+    for headers in sheet_headers:
+        for header in headers:
+            if header and header != tag_header:
+                merged.setdefault(header, None)
+    return list(merged) + [tag_header]
+
+
+def _ordered_rows(sheet: Dict, headers: List[str]) -> List[Tuple[int, int, List[str]]]:
+    """시트의 행을 공통 헤더 순서로 옮기고 (정렬 키, 원래 순서, 행) 목록으로 거래일시 순 정렬"""
+    positions = [headers.index(h) if h in headers else None for h in sheet['headers']]
+    width = len(headers)
+    sheet_col = width - 1
+    epochs = epoch_column(sheet['headers'], sheet['data'])
+
+    keyed = []
+    for order, (row, epoch) in enumerate(zip(sheet['data'], epochs)):
+        out = [''] * width
+        for value, pos in zip(row, positions):
+            if pos is not None:
+                out[pos] = value
+        out[sheet_col] = sheet['sheet']
+        # 거래일시를 해석할 수 없는 행은 시트 끝에 원래 순서대로 둠
+        keyed.append((epoch if epoch is not None else float('inf'), order, out))
+    keyed.sort(key=lambda item: (item[0], item[1]))
+    return keyed
+
+
+def merge_sheet_results(sheets: List[Dict]) -> Tuple[List[str], List[List[str]]]:
+    """
+    시트별 파싱 결과를 공통 헤더와 거래일시 오름차순 행 목록으로 병합
+
+    같은 시각의 행은 시트 순서, 시트 안에서는 원래 순서를 유지합니다.
+
+    Args:
+        sheets: parse_sheet 결과 목록 (시트 순서)
+
+    Returns:
+        Tuple[List[str], List[List[str]]]: (공통 헤더, 병합된 행 목록)
+    """
+    headers = merge_headers([s['headers'] for s in sheets])
+    ordered = [_ordered_rows(sheet, headers) for sheet in sheets]
+    merged = heapq.merge(*ordered, key=lambda item: item[0])
+    return headers, [row for _, _, row in merged]
+
+
+def parse_workbook(file_path: str, workers: Optional[int] = None) -> Dict:
+    """
+    통합 문서의 모든 시트를 병렬로 파싱하여 하나의 결과로 병합
+
+    Args:
+        file_path: Excel 파일 경로 (XLSX)
+        workers: 프로세스 수 (기본값: min(시트 수, CPU 수), 1이면 현재 프로세스에서 순차 파싱)
+
+    Returns:
+        dict: parse_excel_all과 같은 형식의 결과 + sheets (시트별 행 수, 건너뛴 시트는 오류 메시지)
+    """
+    sheet_names = list_sheets(file_path)
+    workers = min(workers or os.cpu_count() or 1, len(sheet_names))
+    tasks = [(file_path, name) for name in sheet_names]
+
+    if workers <= 1:
+        sheets = [parse_sheet(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            # map은 제출 순서대로 결과를 반환하므로 시트 순서가 유지됨
+            sheets = list(executor.map(parse_sheet, tasks))
+        print(f"⚡ {len(sheet_names)}개 시트를 {workers}개 프로세스로 병렬 파싱")
+
+    parsed = [s for s in sheets if s['error'] is None]
+    for sheet in sheets:
+        if sheet['error'] is not None:
+            print(f"⚠️ '{sheet['sheet']}' 시트를 건너뜁니다: {sheet['error']}")
+    if not parsed:
+        raise ValueError("파일이 비어있습니다")
+
+    headers, merged = merge_sheet_results(parsed)
+    rows = EncodedRows.from_chunks(headers, [merged])
+    return {
+        'headers': headers,
+        'data': rows,
+        'total_rows': len(rows),
+        'malformed_rows': sum(s['malformed_rows'] for s in parsed),
+        'sheets': {s['sheet']: (len(s['data']) if s['error'] is None else s['error']) for s in sheets},
+    }
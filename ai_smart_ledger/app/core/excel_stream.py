@@ -0,0 +1,239 @@
+"""
+Excel 행 스트리밍 모듈 (Excel Row Stream)
+
+openpyxl 읽기 전용 모드로 시트를 한 행씩 읽어 정규화된 데이터 행을 내보냅니다.
+- 시트 전체를 리스트로 만들지 않음 (행 수 제한 없음, 메모리 사용량 일정)
+- CSV와 같은 은행 프로필 감지 및 컬럼별 변환 계획 적용
+- 제목/조회기간 같은 머리말 행이 있으면 앞부분 행만 점수화하여 헤더 행을 찾음
+- 날짜/시간/숫자 셀은 str() 대신 타입에 맞게 직접 변환
+- 압축 파일 멤버는 opener로 읽은 내용을 메모리에서 엶 (XLSX 자체가 압축 형식이라 크기가 작음)
+"""
+
+import datetime
+import io
+import os
+from itertools import chain, islice
+from typing import BinaryIO, Callable, Iterator, List, Optional
+
+from openpyxl import load_workbook
+
+from .bank_profiles import HEADER_LOOKAHEAD, RowPlan, compile_plan, find_header_row
+from .csv_stream import DEFAULT_CHUNK_SIZE
+
+
+def cell_to_text(value) -> str:
+    """
+    openpyxl 셀 값을 CSV 셀과 같은 형태의 문자열로 변환
+
+    - None → ''
+    - 자정 datetime/date → 'YYYY-MM-DD', 그 외 datetime → 'YYYY-MM-DD HH:MM:SS'
+    - time → 'HH:MM:SS'
+    - 정수값 float(예: 1500.0) → '1500'
+    """
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    if isinstance(value, datetime.datetime):
+        if value.time() == datetime.time(0, 0):
+            return value.strftime('%Y-%m-%d')
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, datetime.time):
+        return value.strftime('%H:%M:%S')
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class ExcelRowStream:
+    """Excel 시트를 정규화된 행 단위로 읽어오는 스트림 클래스"""
+
+    def __init__(self, file_path: str, sheet_name: Optional[str] = None,
+                 opener: Optional[Callable[[], BinaryIO]] = None):
+        """
+        ExcelRowStream 초기화
+
+        Args:
+            file_path: Excel 파일 경로 (XLSX, opener가 주어지면 로그 표시용 이름)
+            sheet_name: 읽을 시트 이름 (기본값: 활성 시트)
+            opener: 입력을 바이너리 파일 객체로 여는 함수 (압축 파일 멤버 등, 기본값: file_path를 엶)
+        """
+        self.file_path = file_path
+        self.sheet_name = sheet_name
+        self.sheet_title: Optional[str] = None
+        self.opener = opener
+        self.size = 0
+        self.raw_headers: List[str] = []
+        self.headers: List[str] = []
+        self.amount_flags: List[bool] = []
+        self.plan: Optional[RowPlan] = None
+        self.header_row = 0
+        self.rows_read = 0
+        self.malformed_rows = 0
+        self._workbook = None
+        self._rows = None
+        self._row_num = 0
+        self._max_row = 0
+
+    def open(self) -> 'ExcelRowStream':
+        """
+        통합 문서를 읽기 전용으로 열고 헤더 행까지 읽음
+
+        앞부분 HEADER_LOOKAHEAD개의 비어있지 않은 행 중 알려진 헤더가 가장 많은 행을 헤더로 사용합니다.
+
+        Returns:
+            ExcelRowStream: 자기 자신 (체이닝용)
+
+        Raises:
+            ValueError: 시트가 비어있거나 헤더 행이 없는 경우
+        """
+        source = self.file_path
+        if self.opener is not None:
+            # openpyxl은 임의 위치 읽기가 필요하므로 순차 스트림인 멤버 내용을 메모리로 읽음
+            with self.opener() as member:
+                source = io.BytesIO(member.read())
+            self.size = source.getbuffer().nbytes
+        else:
+            self.size = os.path.getsize(self.file_path)
+        self._workbook = load_workbook(filename=source, read_only=True, data_only=True)
+        try:
+            worksheet = self._workbook[self.sheet_name] if self.sheet_name else self._workbook.active
+            self.sheet_title = worksheet.title
+            self._max_row = worksheet.max_row or 0
+            rows = enumerate(worksheet.iter_rows(values_only=True), start=1)
+            non_empty = (item for item in rows if any(cell is not None for cell in item[1]))
+            lookahead = list(islice(non_empty, HEADER_LOOKAHEAD))
+            if not lookahead:
+                raise ValueError("파일이 비어있습니다")
+
+            header_idx = find_header_row([[cell_to_text(cell) for cell in row] for _, row in lookahead])
+            self.header_row, header = lookahead[header_idx]
+            self.raw_headers = [cell_to_text(cell) for cell in header]
+            # 미리 읽은 행 중 헤더 다음 행부터 데이터로 반환
+            self._rows = chain(lookahead[header_idx + 1:], rows)
+
+            if all(not h.strip() for h in self.raw_headers):
+                raise ValueError("유효한 헤더가 없습니다. 첫 번째 행이 비어있습니다.")
+        except BaseException:
+            self.close()
+            raise
+
+        self.plan = compile_plan(self.raw_headers)
+        self.headers = self.plan.headers
+        self.amount_flags = self.plan.amount_flags
+        if header_idx > 0:
+            print(f"📋 머리말 {header_idx}줄을 건너뛰고 {self.header_row}행을 헤더로 사용")
+        print(f"📋 헤더 발견 ({self.plan.profile_name}): {self.raw_headers} → {self.headers}")
+        return self
+
+    def __iter__(self) -> Iterator[List[str]]:
+        """헤더 다음 행부터 정규화된 데이터 행을 하나씩 반환 (빈 행은 건너뜀)"""
+        if self._rows is None:
+            self.open()
+        apply = self.plan.apply
+        for cells in self._iter_cells():
+            yield apply(cells)
+
+    def _iter_cells(self) -> Iterator[List[str]]:
+        """헤더 다음 행부터 셀을 문자열로 바꾼 정제 전 행을 하나씩 반환 (빈 행은 건너뜀)"""
+        if self._rows is None:
+            self.open()
+
+        header_count = len(self.raw_headers)
+
+        for row_num, row in self._rows:
+            self._row_num = row_num
+            if not any(cell is not None for cell in row):
+                continue
+            # 읽기 전용 모드에서는 뒤쪽 빈 셀이 채워지므로 헤더 길이를 넘는 빈 셀은 제거
+            cells = [cell_to_text(cell) for cell in row]
+            while len(cells) > header_count and cells[-1] == '':
+                cells.pop()
+            self.rows_read += 1
+
+            # 행 품질 검증 (경고만 하고 계속 진행)
+            if len(cells) != header_count:
+                self.malformed_rows += 1
+                if self.malformed_rows <= 3:  # 처음 3개 오류만 로깅
+                    print(f"⚠️ {row_num}행: 컬럼 수 불일치 (헤더: {header_count}, 데이터: {len(cells)})")
+
+            yield cells
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[List[str]]]:
+        """
+        정규화된 데이터 행을 고정 크기 청크(행 리스트) 단위로 반환
+
+        Args:
+            chunk_size: 청크당 최대 행 수
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+
+        chunk = []
+        for row in self:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def iter_raw_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[List[str]]]:
+        """
+        정제 전 행(셀을 문자열로만 바꾼 행)을 고정 크기 청크 단위로 반환
+
+        Args:
+            chunk_size: 청크당 최대 행 수
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+
+        cells = self._iter_cells()
+        while True:
+            chunk = list(islice(cells, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def estimate_rows(self) -> int:
+        """
+        시트 크기 정보(마지막 행 번호)로 추정한 데이터 행 수 (헤더 제외, 빈 행도 포함되므로 실제보다 클 수 있음)
+        """
+        if self._rows is None:
+            self.open()
+        return max(self.rows_read, self._max_row - self.header_row)
+
+    @property
+    def bytes_consumed(self) -> int:
+        """
+        지금까지 읽은 분량을 파일 크기 기준 바이트로 환산한 값 (진행률 표시용)
+
+        압축된 XLSX는 실제 읽은 바이트를 알 수 없으므로 시트 행 위치 비율로 추정합니다.
+        """
+        if not self._max_row:
+            return 0
+        return self.size * min(self._row_num, self._max_row) // self._max_row
+
+    def close(self) -> None:
+        """열려 있는 통합 문서를 닫음"""
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+
+    def __enter__(self) -> 'ExcelRowStream':
+        if self._rows is None:
+            self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def open_excel_stream(file_path: str, sheet_name: Optional[str] = None,
+                      opener: Optional[Callable[[], BinaryIO]] = None) -> ExcelRowStream:
+    """ExcelRowStream을 생성하고 헤더까지 읽은 상태로 반환하는 편의 함수"""
+    return ExcelRowStream(file_path, sheet_name, opener).open()
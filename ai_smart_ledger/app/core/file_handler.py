@@ -7,25 +7,49 @@ Created: 2025-05-25
 PRD 2.1 파일 입력 기능 구현
 - CSV/Excel 파일 선택
 - 파일 크기 및 형식 검증
+- 파일 크기에 따른 가져오기 방식 선택 (메모리 / 스트리밍)
+- .zip/.gz 압축 파일은 압축을 풀지 않고 안의 CSV/Excel 멤버를 확인 (압축을 푼 크기 기준)
 """
 
 import os
-from typing import Optional, Tuple
+import zipfile
+from typing import List, Optional, Tuple
 from PySide6.QtWidgets import QFileDialog, QMessageBox, QWidget
 
+from .archive import is_archive, list_members
+
 
 class FileHandler:
     """파일 처리를 담당하는 클래스"""
     
     # 지원하는 파일 확장자
-    SUPPORTED_EXTENSIONS = ['.csv', '.xls', '.xlsx']
+    SUPPORTED_EXTENSIONS = ['.csv', '.xls', '.xlsx', '.zip', '.gz']
     
-    # 최대 파일 크기 (50MB)
+    # 메모리에 전체를 올려 파싱할 최대 파일 크기 (50MB), 초과 시 스트리밍 모드로 가져옴
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB in bytes
     
+    # 가져오기 방식
+    IMPORT_MODE_MEMORY = 'memory'
+    IMPORT_MODE_STREAMING = 'streaming'
+    
     def __init__(self):
         """초기화"""
-        pass
+        # 마지막으로 검증한 파일의 가져오기 방식
+        self.import_mode = self.IMPORT_MODE_MEMORY
+    
+    def select_import_mode(self, file_size: int) -> str:
+        """
+        파일 크기에 맞는 가져오기 방식을 반환합니다.
+        
+        Args:
+            file_size: 파일 크기 (바이트)
+            
+        Returns:
+            str: MAX_FILE_SIZE 이하면 IMPORT_MODE_MEMORY, 초과하면 IMPORT_MODE_STREAMING
+        """
+        if file_size > self.MAX_FILE_SIZE:
+            return self.IMPORT_MODE_STREAMING
+        return self.IMPORT_MODE_MEMORY
     
     def select_file(self, parent: Optional[QWidget] = None) -> Optional[str]:
         """
@@ -39,7 +63,8 @@ class FileHandler:
         """
         try:
             # 파일 필터 설정
-            file_filter = "거래내역 파일 (*.csv *.xls *.xlsx);;CSV 파일 (*.csv);;Excel 파일 (*.xls *.xlsx);;모든 파일 (*.*)"
+            file_filter = ("거래내역 파일 (*.csv *.xls *.xlsx *.zip *.gz);;CSV 파일 (*.csv);;"
+                           "Excel 파일 (*.xls *.xlsx);;압축 파일 (*.zip *.gz);;모든 파일 (*.*)")
             
             # 파일 선택 대화상자 열기
             file_path, _ = QFileDialog.getOpenFileName(
@@ -67,7 +92,25 @@ class FileHandler:
                     f"파일 선택 중 오류가 발생했습니다:\n{str(e)}"
                 )
             return None
-    
+
+    def select_files(self, parent: Optional[QWidget] = None) -> List[str]:
+        """
+        파일 선택 대화상자에서 여러 계좌/여러 달의 CSV/Excel 파일을 한 번에 선택합니다.
+
+        Args:
+            parent: 부모 위젯 (선택적)
+
+        Returns:
+            선택된 파일 경로 목록 (취소 시 빈 목록)
+        """
+        file_filter = "거래내역 파일 (*.csv *.xlsx);;CSV 파일 (*.csv);;Excel 파일 (*.xlsx)"
+        file_paths, _ = QFileDialog.getOpenFileNames(parent, "여러 거래내역 파일 불러오기", "", file_filter)
+        if not file_paths:
+            print("📂 파일 선택이 취소되었습니다.")
+            return []
+        print(f"📂 파일 {len(file_paths)}개 선택됨")
+        return list(file_paths)
+
     def validate_file(self, file_path: str, parent: Optional[QWidget] = None) -> Tuple[bool, str]:
         """
         선택된 파일의 유효성을 검증합니다.
@@ -93,22 +136,26 @@ class FileHandler:
                 self._show_error_message(parent, "파일 형식 오류", error_msg)
                 return False, error_msg
             
-            # 3. 파일 크기 확인
-            file_size = os.path.getsize(file_path)
-            if file_size > self.MAX_FILE_SIZE:
-                size_mb = file_size / (1024 * 1024)
-                max_mb = self.MAX_FILE_SIZE / (1024 * 1024)
-                error_msg = f"파일 크기가 너무 큽니다.\n현재 크기: {size_mb:.1f}MB\n최대 허용 크기: {max_mb}MB"
-                self._show_error_message(parent, "파일 크기 오류", error_msg)
-                return False, error_msg
-            
-            # 4. 파일 읽기 권한 확인
+            # 3. 파일 읽기 권한 확인
             if not os.access(file_path, os.R_OK):
                 error_msg = "파일을 읽을 수 있는 권한이 없습니다."
                 self._show_error_message(parent, "파일 권한 오류", error_msg)
                 return False, error_msg
             
+            # 4. 압축 파일은 안의 CSV/Excel 멤버와 압축을 푼 크기로 검증
+            if is_archive(file_path):
+                return self._validate_archive(file_path, parent)
+            
+            # 5. 파일 크기에 따른 가져오기 방식 선택 (크기 제한 없음)
+            file_size = os.path.getsize(file_path)
+            self.import_mode = self.select_import_mode(file_size)
+            
             print(f"✅ 파일 검증 완료: {file_path}")
+            if self.import_mode == self.IMPORT_MODE_STREAMING:
+                size_mb = file_size / (1024 * 1024)
+                max_mb = self.MAX_FILE_SIZE / (1024 * 1024)
+                print(f"📦 대용량 파일 ({size_mb:.1f}MB > {max_mb:.0f}MB): 스트리밍 모드로 가져옵니다")
+                return True, f"파일이 유효합니다. (대용량 파일 {size_mb:.1f}MB: 스트리밍 모드로 가져옵니다)"
             return True, "파일이 유효합니다."
             
         except Exception as e:
@@ -116,6 +163,38 @@ class FileHandler:
             self._show_error_message(parent, "검증 오류", error_msg)
             return False, error_msg
     
+    def _validate_archive(self, file_path: str, parent: Optional[QWidget] = None) -> Tuple[bool, str]:
+        """
+        압축 파일 안에 가져올 CSV/Excel 멤버가 있는지 확인합니다.
+        
+        화면 미리보기(메모리 모드)는 디스크의 파일 경로를 파싱하므로
+        압축 파일은 크기와 관계없이 멤버를 압축을 풀면서 읽는 스트리밍 모드로 가져옵니다.
+        
+        Args:
+            file_path: 압축 파일 경로
+            parent: 부모 위젯 (오류 메시지 표시용)
+            
+        Returns:
+            Tuple[bool, str]: (유효성 여부, 오류 메시지)
+        """
+        try:
+            members = list_members(file_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            error_msg = f"압축 파일을 읽을 수 없습니다: {e}"
+            self._show_error_message(parent, "압축 파일 오류", error_msg)
+            return False, error_msg
+        
+        if not members:
+            error_msg = "압축 파일 안에 CSV/Excel 파일이 없습니다."
+            self._show_error_message(parent, "압축 파일 오류", error_msg)
+            return False, error_msg
+        
+        self.import_mode = self.IMPORT_MODE_STREAMING
+        size_mb = sum(member.size for member in members) / (1024 * 1024)
+        print(f"✅ 파일 검증 완료: {file_path}")
+        print(f"🗜️ 압축 파일 멤버 {len(members)}개 (압축 해제 {size_mb:.1f}MB): 스트리밍 모드로 가져옵니다")
+        return True, f"파일이 유효합니다. (압축 파일 멤버 {len(members)}개, 압축 해제 {size_mb:.1f}MB: 스트리밍 모드로 가져옵니다)"
+    
     def _show_error_message(self, parent: Optional[QWidget], title: str, message: str):
         """오류 메시지를 표시합니다."""
         print(f"❌ {title}: {message}")
@@ -138,13 +217,28 @@ class FileHandler:
             file_name = os.path.basename(file_path)
             file_ext = os.path.splitext(file_path)[1].lower()
             
+            if is_archive(file_path):
+                # 압축 파일은 압축을 푼 크기 합계를 함께 보고하고 항상 스트리밍 모드로 가져옴
+                uncompressed = sum(member.size for member in list_members(file_path))
+                return {
+                    'path': file_path,
+                    'name': file_name,
+                    'extension': file_ext,
+                    'size_bytes': file_size,
+                    'size_mb': file_size / (1024 * 1024),
+                    'uncompressed_bytes': uncompressed,
+                    'is_valid': True,
+                    'import_mode': self.IMPORT_MODE_STREAMING
+                }
+            
             return {
                 'path': file_path,
                 'name': file_name,
                 'extension': file_ext,
                 'size_bytes': file_size,
                 'size_mb': file_size / (1024 * 1024),
-                'is_valid': file_ext in self.SUPPORTED_EXTENSIONS and file_size <= self.MAX_FILE_SIZE
+                'is_valid': file_ext in self.SUPPORTED_EXTENSIONS,
+                'import_mode': self.select_import_mode(file_size)
             }
         except Exception as e:
             print(f"❌ 파일 정보 가져오기 실패: {e}")
@@ -0,0 +1,34 @@
+"""
+파일 해시 모듈 (File Hash)
+
+파일 내용의 MD5 해시를 계산합니다.
+- 진행 상태 일관성 검증과 파싱 캐시 키에 같은 해시를 사용
+- 고정 크기 블록 단위로 읽어 메모리 사용량 일정
+"""
+
+import hashlib
+
+
+# 해시 계산 시 한 번에 읽을 바이트 수
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def compute_file_hash(file_path: str, block_size: int = HASH_BLOCK_SIZE) -> str:
+    """
+    파일 내용의 MD5 해시값을 계산
+
+    Args:
+        file_path: 해시를 계산할 파일 경로
+        block_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        str: MD5 해시값 (16진수 문자열)
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+    """
+    hash_md5 = hashlib.md5()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(block_size), b""):
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
@@ -5,35 +5,55 @@ Author: leehansol
 Created: 2025-05-25
 """
 
-import csv
 import os
-from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from openpyxl import load_workbook
-from openpyxl.utils.exceptions import InvalidFileException
-import chardet
+from typing import Iterator, Dict, Optional
 
+from .balance_check import check_columnar, check_rows, describe as describe_balance
+from .columnar import to_columnar
+from .csv_stream import DEFAULT_CHUNK_SIZE, CsvRowStream, open_csv_stream
+from .encoded_rows import EncodedRows
+from .excel_sheets import parse_workbook
+from .excel_stream import ExcelRowStream
+# 미리보기 편의 함수는 기존 import 경로(file_parser)로도 사용할 수 있도록 다시 내보냄
+from .file_preview import FilePreview, parse_csv_file, parse_excel_file, print_csv_file, print_excel_file
+from .lazy_csv import LazyCsvFile, open_lazy_csv
+from .pandas_backend import BACKEND_PANDAS, BACKEND_PYTHON, check_backend, read_csv_stream, read_excel_stream
+from .parallel_parser import parse_stream_parallel
 
-class FileParser:
-    """CSV 및 Excel 파일 파싱을 담당하는 클래스"""
+class FileParser(FilePreview):
+    """CSV 및 Excel 파일 파싱을 담당하는 클래스 (미리보기는 FilePreview에서 상속)"""
+    
+    # 전체 파싱(parse_csv_all, parse_excel_all)의 기본 백엔드 (BACKEND_PYTHON 또는 BACKEND_PANDAS)
+    backend = BACKEND_PYTHON
     
     @staticmethod
-    def parse_csv_preview(file_path: str, max_rows: int = 5) -> Dict:
+    def parse_csv_all(file_path: str, file_hash: Optional[str] = None, backend: Optional[str] = None) -> Dict:
         """
-        CSV 파일의 첫 N행을 파싱하여 미리보기 데이터 반환
+        CSV 파일 전체를 파싱하여 모든 데이터 행을 반환
         (신한은행 등 실제 은행 양식 헤더 자동 매핑 지원)
         
         Args:
             file_path: CSV 파일 경로
-            max_rows: 추출할 최대 행 수 (헤더 제외)
+            file_hash: 파일 내용 해시 (주어지면 인코딩 감지 결과를 재사용)
+            backend: 파싱 백엔드 (기본값: FileParser.backend, BACKEND_PANDAS면 pandas.read_csv로 읽음)
+            
+        결과의 balance_check에는 잔액 연속성 검사 결과(balance_check.check_rows)가 담깁니다.
+        백엔드와 관계없이 결과는 같습니다.
+        """
+        return FileParser._parse_csv(file_path, file_hash=file_hash, backend=backend)
+    
+    @staticmethod
+    def parse_excel_all(file_path: str, backend: Optional[str] = None) -> Dict:
+        """
+        Excel 파일 전체를 스트리밍 방식으로 파싱하여 모든 데이터 행을 반환
+        (CSV와 같은 은행 양식 헤더 자동 매핑 및 금액 정제 적용, 행 수 제한 없음)
+        
+        Args:
+            file_path: Excel 파일 경로 (XLSX)
+            backend: 파싱 백엔드 (기본값: FileParser.backend, BACKEND_PANDAS면 pandas.read_excel로 읽음)
             
         Returns:
-            dict: 파싱 결과 정보
-                - success: 파싱 성공 여부
-                - headers: 헤더 행 리스트
-                - data: 데이터 행 리스트
-                - total_rows: 총 데이터 행 수 (헤더 제외)
-                - error: 오류 메시지 (실패 시)
+            dict: parse_csv_all과 동일한 형식의 파싱 결과
         """
         result = {
             'success': False,
@@ -43,333 +63,214 @@ class FileParser:
             'error': None
         }
         
-        # [추가] 은행 헤더 → 내부 표준 헤더 매핑
-        HEADER_MAP = {
-            "거래일자": "날짜",
-            "거래시간": "시간",
-            "적요": "적요",
-            "출금(원)": "출금",
-            "입금(원)": "입금",
-            "잔액(원)": "잔액",
-            "거래점": "거래처",
-            # 기존 표준 헤더도 그대로 허용
-            "날짜": "날짜",
-            "시간": "시간",
-            "출금": "출금",
-            "입금": "입금",
-            "잔액": "잔액",
-            "거래처": "거래처",
-        }
-        
         try:
+            backend = check_backend(FileParser.backend if backend is None else backend)
+            
             # 파일 존재 확인
             if not os.path.exists(file_path):
                 result['error'] = f"파일이 존재하지 않습니다: {file_path}"
                 return result
             
-            # 파일 크기 확인 (빈 파일 체크)
+            # 파일 크기 확인
             if os.path.getsize(file_path) == 0:
                 result['error'] = "파일이 비어있습니다"
                 return result
             
-            # 인코딩 감지 시도
-            encoding = 'utf-8'
-            try:
-                with open(file_path, 'rb') as f:
-                    raw_data = f.read(1024)
-                    if raw_data:
-                        detected = chardet.detect(raw_data)
-                        if detected['encoding'] and detected['confidence'] > 0.7:
-                            encoding = detected['encoding']
-            except:
-                # 인코딩 감지 실패 시 UTF-8 사용
-                pass
+            with ExcelRowStream(file_path) as stream:
+                result['headers'] = stream.headers
+                if backend == BACKEND_PANDAS:
+                    data_rows = read_excel_stream(stream)
+                else:
+                    data_rows = EncodedRows.from_chunks(stream.headers, stream.iter_chunks())
+            
+            result['data'] = data_rows
+            result['total_rows'] = stream.rows_read
+            result['success'] = True
+            
+            # 품질 경고
+            if stream.malformed_rows > 0:
+                print(f"⚠️ 주의: {stream.malformed_rows}개 행에서 컬럼 수 불일치가 발견되었습니다.")
+            
+            print(f"📊 전체 데이터 행 {len(data_rows)}개 추출 (전체 {stream.rows_read}개 중)")
+            FileParser._report_balance(result, check_rows(result['headers'], data_rows))
             
-            # CSV 파일 읽기
-            try:
-                with open(file_path, 'r', encoding=encoding, newline='') as csvfile:
-                    # CSV 방언 자동 감지 시도
-                    try:
-                        sample = csvfile.read(1024)
-                        csvfile.seek(0)
-                        sniffer = csv.Sniffer()
-                        dialect = sniffer.sniff(sample)
-                    except:
-                        # 감지 실패 시 기본 설정 사용
-                        dialect = csv.excel
-                    
-                    # CSV 리더 생성
-                    reader = csv.reader(csvfile, dialect)
-                    
-                    # 헤더 행 읽기
-                    try:
-                        headers = next(reader)
-                        # [수정] 헤더 매핑 적용
-                        mapped_headers = [HEADER_MAP.get(h.strip(), h.strip()) for h in headers]
-                        result['headers'] = mapped_headers
-                        print(f"📋 헤더 발견: {headers} → {mapped_headers}")
-                    except StopIteration:
-                        result['error'] = "파일이 비어있습니다"
-                        return result
-                    
-                    # 데이터 행 읽기 (최대 max_rows개)
-                    data_rows = []
-                    total_count = 0
-                    malformed_rows = 0
-                    
-                    for row_num, row in enumerate(reader, start=2):  # 헤더 다음부터 시작
-                        total_count += 1
-                        
-                        # 행 품질 검증
-                        if len(row) != len(headers):
-                            malformed_rows += 1
-                            # 경고는 하지만 계속 진행
-                            if malformed_rows <= 3:  # 처음 3개 오류만 로깅
-                                print(f"⚠️ {row_num}행: 컬럼 수 불일치 (헤더: {len(headers)}, 데이터: {len(row)})")
-                        
-                        # [수정] 데이터 매핑 및 정제
-                        mapped_row = []
-                        for idx, cell in enumerate(row):
-                            h = headers[idx].strip() if idx < len(headers) else f"col{idx}"
-                            std_h = HEADER_MAP.get(h, h)
-                            val = cell.strip()
-                            # 금액/잔액 컬럼은 쉼표 제거, 빈 값 0 처리
-                            if std_h in ("출금", "입금", "잔액"):
-                                val = val.replace(",", "")
-                                if val == "":
-                                    val = "0"
-                            mapped_row.append(val)
-                        
-                        if len(data_rows) < max_rows:
-                            data_rows.append(mapped_row)
-                    
-                    result['data'] = data_rows
-                    result['total_rows'] = total_count
-                    result['success'] = True
-                    
-                    # 품질 경고
-                    if malformed_rows > 0:
-                        print(f"⚠️ 주의: {malformed_rows}개 행에서 컬럼 수 불일치가 발견되었습니다.")
-                    
-                    print(f"📊 데이터 행 {len(data_rows)}개 추출 (전체 {total_count}개 중)")
-                    
-            except UnicodeDecodeError as e:
-                # UTF-8로 실패한 경우 다른 인코딩 시도
-                fallback_encodings = ['cp949', 'euc-kr', 'latin-1']
-                for fallback_encoding in fallback_encodings:
-                    try:
-                        with open(file_path, 'r', encoding=fallback_encoding, newline='') as csvfile:
-                            # 간단한 테스트 읽기
-                            csvfile.read(100)
-                            result['error'] = f"인코딩 오류: 파일이 {encoding} 형식이 아닙니다. {fallback_encoding} 인코딩을 시도해보세요."
-                            return result
-                    except:
-                        continue
-                result['error'] = f"인코딩 오류: {e}. 파일이 UTF-8 형식이 아니며 자동 감지에 실패했습니다."
-                
-        except csv.Error as e:
-            result['error'] = f"CSV 형식 오류: {e}. 파일이 올바른 CSV 형식이 아닙니다."
-        except PermissionError:
-            result['error'] = "파일 접근 권한이 없습니다."
         except Exception as e:
-            result['error'] = f"파일 읽기 오류: {e}"
+            result['error'] = FileParser._excel_error_message(e)
         
         return result
     
     @staticmethod
-    def parse_excel_preview(file_path: str, max_rows: int = 5) -> Dict:
+    def parse_excel_all_sheets(file_path: str, workers: Optional[int] = None) -> Dict:
         """
-        Excel 파일의 첫 N행을 파싱하여 미리보기 데이터 반환
+        Excel 통합 문서의 모든 시트를 병렬로 파싱하여 거래일시 순으로 병합
+        (계좌별/월별로 시트가 나뉜 은행 양식용)
+        
+        시트별 헤더를 합친 공통 헤더 끝에 출처 시트 컬럼('시트')이 추가됩니다.
         
         Args:
-            file_path: Excel 파일 경로 (XLS, XLSX)
-            max_rows: 추출할 최대 행 수 (헤더 제외)
+            file_path: Excel 파일 경로 (XLSX)
+            workers: 프로세스 수 (기본값: min(시트 수, CPU 수))
             
         Returns:
-            dict: 파싱 결과 정보
-                - success: 파싱 성공 여부
-                - headers: 헤더 행 리스트
-                - data: 데이터 행 리스트
-                - total_rows: 총 데이터 행 수 (헤더 제외)
-                - error: 오류 메시지 (실패 시)
+            dict: parse_excel_all과 동일한 형식의 파싱 결과 + sheets (시트별 행 수)
         """
         result = {
             'success': False,
             'headers': [],
             'data': [],
             'total_rows': 0,
+            'sheets': {},
             'error': None
         }
         
         try:
-            # 파일 존재 확인
             if not os.path.exists(file_path):
                 result['error'] = f"파일이 존재하지 않습니다: {file_path}"
                 return result
             
-            # 파일 크기 확인
-            if os.path.getsize(file_path) == 0:
-                result['error'] = "파일이 비어있습니다"
-                return result
-            
-            # Excel 파일 읽기
-            try:
-                workbook = load_workbook(filename=file_path, read_only=True, data_only=True)
-            except InvalidFileException as e:
-                result['error'] = f"Excel 파일 형식 오류: {e}. 올바른 Excel 파일이 아닙니다."
-                return result
-            except PermissionError:
-                result['error'] = "파일 접근 권한이 없습니다."
-                return result
-            
-            # 첫 번째 시트 선택
-            worksheet = workbook.active
-            
-            # 워크시트가 비어있는지 확인
-            if worksheet.max_row is None or worksheet.max_row == 0:
-                workbook.close()
-                result['error'] = "파일이 비어있습니다"
-                return result
-            
-            # 모든 행을 리스트로 변환
-            rows = list(worksheet.iter_rows(values_only=True))
-            workbook.close()
-            
-            # 빈 행들 제거
-            non_empty_rows = []
-            for row in rows:
-                # 모든 셀이 None이 아닌 행만 포함
-                if any(cell is not None for cell in row):
-                    # None 값들을 빈 문자열로 변환하고, 숫자를 문자열로 변환
-                    converted_row = []
-                    for cell in row:
-                        if cell is None:
-                            converted_row.append('')
-                        else:
-                            converted_row.append(str(cell))
-                    non_empty_rows.append(converted_row)
-            
-            if not non_empty_rows:
-                result['error'] = "파일이 비어있습니다"
-                return result
-            
-            # 헤더 행 추출 (첫 번째 행)
-            headers = non_empty_rows[0]
-            
-            # 헤더 유효성 검증
-            if not headers or all(not str(h).strip() for h in headers):
-                result['error'] = "유효한 헤더가 없습니다. 첫 번째 행이 비어있습니다."
-                return result
-            
-            result['headers'] = headers
-            print(f"📋 헤더 발견: {headers}")
-            
-            # 데이터 행 추출 (헤더 이후 행들)
-            data_rows = non_empty_rows[1:]
-            total_count = len(data_rows)
-            
-            # 데이터 품질 검증
-            malformed_rows = 0
-            for row_num, row in enumerate(data_rows, start=2):
-                if len(row) != len(headers):
-                    malformed_rows += 1
-                    if malformed_rows <= 3:  # 처음 3개 오류만 로깅
-                        print(f"⚠️ {row_num}행: 컬럼 수 불일치 (헤더: {len(headers)}, 데이터: {len(row)})")
-            
-            # 요청된 수만큼만 반환
-            preview_data = data_rows[:max_rows]
-            
-            result['data'] = preview_data
-            result['total_rows'] = total_count
+            merged = parse_workbook(file_path, workers)
+            result['headers'] = merged['headers']
+            result['data'] = merged['data']
+            result['total_rows'] = merged['total_rows']
+            result['sheets'] = merged['sheets']
             result['success'] = True
             
-            # 품질 경고
-            if malformed_rows > 0:
-                print(f"⚠️ 주의: {malformed_rows}개 행에서 컬럼 수 불일치가 발견되었습니다.")
+            if merged['malformed_rows'] > 0:
+                print(f"⚠️ 주의: {merged['malformed_rows']}개 행에서 컬럼 수 불일치가 발견되었습니다.")
+            print(f"📊 {len(merged['sheets'])}개 시트에서 전체 데이터 행 {merged['total_rows']}개 추출")
             
-            print(f"📊 데이터 행 {len(preview_data)}개 추출 (전체 {total_count}개 중)")
-                
         except Exception as e:
-            result['error'] = f"Excel 파일 읽기 오류: {e}"
+            result['error'] = FileParser._excel_error_message(e)
         
         return result
     
     @staticmethod
-    def print_csv_preview(parse_result: Dict) -> None:
+    def open_csv_stream(file_path: str) -> CsvRowStream:
         """
-        파싱 결과를 콘솔에 예쁘게 출력
+        CSV 파일을 스트리밍 방식으로 열어 반환 (헤더까지 읽은 상태)
+        
+        전체 행을 메모리에 올리지 않고 정규화된 행을 순차적으로 읽을 때 사용합니다.
         
         Args:
-            parse_result: parse_csv_preview 함수의 반환값
+            file_path: CSV 파일 경로
+            
+        Returns:
+            CsvRowStream: headers 속성과 행/청크 반복을 제공하는 스트림
         """
-        if not parse_result['success']:
-            print(f"❌ CSV 파싱 실패: {parse_result['error']}")
-            return
+        return open_csv_stream(file_path)
+    
+    @staticmethod
+    def open_csv_lazy(file_path: str) -> LazyCsvFile:
+        """
+        CSV 파일을 메모리 맵으로 열고 행 오프셋 인덱스만 만들어 반환
         
-        headers = parse_result['headers']
-        data = parse_result['data']
-        total_rows = parse_result['total_rows']
+        행은 인덱스/슬라이스로 접근할 때만 디코딩되므로, 수백 MB 파일도
+        행 수에 비례하는 메모리로 바로 열어 필요한 구간만 볼 수 있습니다.
+        (라이브러리 API: 앱의 파일 열기 흐름은 ParseSession을 사용하며,
+        benchmarks/bench_lazy.py처럼 큰 파일의 일부 구간만 볼 때 사용)
+
+        Args:
+            file_path: CSV 파일 경로
+            
+        Returns:
+            LazyCsvFile: len(), [i], [start:stop] 접근을 제공하는 파일 객체
+        """
+        return open_lazy_csv(file_path)
+    
+    @staticmethod
+    def iter_csv_rows(file_path: str, chunk_size: Optional[int] = None) -> Iterator:
+        """
+        CSV 파일의 정규화된 데이터 행을 순차적으로 반환하는 제너레이터
         
-        print("\n" + "="*60)
-        print("📄 CSV 파일 미리보기")
-        print("="*60)
+        Args:
+            file_path: CSV 파일 경로
+            chunk_size: 지정 시 행 대신 chunk_size개 행의 리스트 단위로 반환
+            
+        Yields:
+            List[str] 또는 List[List[str]]: 데이터 행 또는 행 청크
+        """
+        with open_csv_stream(file_path) as stream:
+            if chunk_size:
+                yield from stream.iter_chunks(chunk_size)
+            else:
+                yield from stream
+    
+    @staticmethod
+    def parse_csv_parallel(file_path: str, workers: Optional[int] = None) -> Dict:
+        """
+        대용량 CSV 파일을 바이트 구간으로 나눠 여러 프로세스에서 파싱
         
-        # 헤더 출력
-        print(f"📋 헤더 ({len(headers)}개 컬럼):")
-        for i, header in enumerate(headers, 1):
-            print(f"  {i}. {header}")
+        결과 형식과 행 순서는 parse_csv_all과 동일합니다.
+        작은 파일은 자동으로 단일 프로세스 경로를 사용합니다.
         
-        print(f"\n📊 데이터 미리보기 (첫 {len(data)}행 / 전체 {total_rows}행):")
+        Args:
+            file_path: CSV 파일 경로
+            workers: 프로세스 수 (기본값: CPU 수)
+        """
+        result = {
+            'success': False,
+            'headers': [],
+            'data': [],
+            'total_rows': 0,
+            'error': None
+        }
         
-        if not data:
-            print("  (데이터 없음)")
-        else:
-            # 각 데이터 행 출력
-            for i, row in enumerate(data, 1):
-                print(f"\n  📝 {i}행:")
-                for j, (header, value) in enumerate(zip(headers, row)):
-                    print(f"    {header}: {value}")
+        def consume(stream: CsvRowStream) -> None:
+            data_rows = parse_stream_parallel(stream, workers)
+            result['data'] = data_rows
+            result['total_rows'] = stream.rows_read
+            print(f"📊 전체 데이터 행 {len(data_rows)}개 추출 (전체 {stream.rows_read}개 중)")
+            FileParser._report_balance(result, check_rows(stream.headers, data_rows))
         
-        print("="*60 + "\n")
+        return FileParser._run_csv(file_path, result, consume)
     
     @staticmethod
-    def get_file_summary(file_path: str) -> Dict:
+    def parse_csv_columnar(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict:
         """
-        CSV 파일의 기본 정보 반환 (전체 스캔)
+        CSV 파일 전체를 컬럼형(NumPy 배열) 결과로 파싱
+        
+        행 리스트를 만들지 않고 청크 단위로 바로 배열로 변환하므로
+        금액 집계, 이체 매칭 등 벡터 연산에 적합합니다.
         
         Args:
             file_path: CSV 파일 경로
+            chunk_size: 한 번에 변환할 행 수
             
         Returns:
-            dict: 파일 요약 정보
+            dict: 파싱 결과 정보
+                - success: 파싱 성공 여부
+                - headers: 표준 헤더 리스트
+                - columns: to_columnar 결과 (amounts, timestamps, text)
+                - total_rows: 총 데이터 행 수 (헤더 제외)
+                - balance_check: 잔액 연속성 검사 결과 (입금/출금/잔액 컬럼이 없으면 None)
+                - error: 오류 메시지 (실패 시)
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
-                reader = csv.reader(csvfile)
-                
-                # 헤더 읽기
-                headers = next(reader)
-                
-                # 전체 행 수 계산
-                row_count = sum(1 for row in reader)
-                
-                return {
-                    'success': True,
-                    'column_count': len(headers),
-                    'row_count': row_count,
-                    'headers': headers
-                }
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e)
-            }
+        result = {
+            'success': False,
+            'headers': [],
+            'columns': None,
+            'total_rows': 0,
+            'error': None
+        }
+        
+        def consume(stream: CsvRowStream) -> None:
+            columns = to_columnar(stream.headers, stream.iter_raw_chunks(chunk_size))
+            result['columns'] = columns
+            result['total_rows'] = columns['row_count']
+            print(f"📊 컬럼형 데이터 {columns['row_count']}행 변환 완료")
+            FileParser._report_balance(result, check_columnar(columns))
+        
+        return FileParser._run_csv(file_path, result, consume)
     
     @staticmethod
-    def parse_csv_all(file_path: str) -> Dict:
+    def _parse_csv(file_path: str, file_hash: Optional[str] = None, backend: Optional[str] = None) -> Dict:
         """
-        CSV 파일 전체를 파싱하여 모든 데이터 행을 반환
-        (신한은행 등 실제 은행 양식 헤더 자동 매핑 지원)
+        CSV 스트림을 끝까지 읽어 전체 파싱 결과 딕셔너리를 구성
+        
+        Args:
+            file_path: CSV 파일 경로
+            file_hash: 파일 내용 해시 (인코딩 감지 캐시 키)
+            backend: 파싱 백엔드 (기본값: FileParser.backend)
         """
         result = {
             'success': False,
@@ -378,120 +279,27 @@ class FileParser:
             'total_rows': 0,
             'error': None
         }
-        HEADER_MAP = {
-            "거래일자": "날짜",
-            "거래시간": "시간",
-            "적요": "적요",
-            "출금(원)": "출금",
-            "입금(원)": "입금",
-            "잔액(원)": "잔액",
-            "거래점": "거래처",
-            "날짜": "날짜",
-            "시간": "시간",
-            "출금": "출금",
-            "입금": "입금",
-            "잔액": "잔액",
-            "거래처": "거래처",
-        }
-        try:
-            if not os.path.exists(file_path):
-                result['error'] = f"파일이 존재하지 않습니다: {file_path}"
-                return result
-            if os.path.getsize(file_path) == 0:
-                result['error'] = "파일이 비어있습니다"
-                return result
-            encoding = 'utf-8'
-            try:
-                with open(file_path, 'rb') as f:
-                    raw_data = f.read(1024)
-                    if raw_data:
-                        detected = chardet.detect(raw_data)
-                        if detected['encoding'] and detected['confidence'] > 0.7:
-                            encoding = detected['encoding']
-            except:
-                pass
-            try:
-                with open(file_path, 'r', encoding=encoding, newline='') as csvfile:
-                    try:
-                        sample = csvfile.read(1024)
-                        csvfile.seek(0)
-                        sniffer = csv.Sniffer()
-                        dialect = sniffer.sniff(sample)
-                    except:
-                        dialect = csv.excel
-                    reader = csv.reader(csvfile, dialect)
-                    try:
-                        headers = next(reader)
-                        mapped_headers = [HEADER_MAP.get(h.strip(), h.strip()) for h in headers]
-                        result['headers'] = mapped_headers
-                        print(f"📋 헤더 발견: {headers} → {mapped_headers}")
-                    except StopIteration:
-                        result['error'] = "파일이 비어있습니다"
-                        return result
-                    data_rows = []
-                    total_count = 0
-                    malformed_rows = 0
-                    for row_num, row in enumerate(reader, start=2):
-                        total_count += 1
-                        if len(row) != len(headers):
-                            malformed_rows += 1
-                            if malformed_rows <= 3:
-                                print(f"⚠️ {row_num}행: 컬럼 수 불일치 (헤더: {len(headers)}, 데이터: {len(row)})")
-                        mapped_row = []
-                        for idx, cell in enumerate(row):
-                            h = headers[idx].strip() if idx < len(headers) else f"col{idx}"
-                            std_h = HEADER_MAP.get(h, h)
-                            val = cell.strip()
-                            if std_h in ("출금", "입금", "잔액"):
-                                val = val.replace(",", "")
-                                if val == "":
-                                    val = "0"
-                            mapped_row.append(val)
-                        data_rows.append(mapped_row)
-                    result['data'] = data_rows
-                    result['total_rows'] = total_count
-                    result['success'] = True
-                    if malformed_rows > 0:
-                        print(f"⚠️ 주의: {malformed_rows}개 행에서 컬럼 수 불일치가 발견되었습니다.")
-                    print(f"📊 전체 데이터 행 {len(data_rows)}개 추출 (전체 {total_count}개 중)")
-            except UnicodeDecodeError as e:
-                fallback_encodings = ['cp949', 'euc-kr', 'latin-1']
-                for fallback_encoding in fallback_encodings:
-                    try:
-                        with open(file_path, 'r', encoding=fallback_encoding, newline='') as csvfile:
-                            csvfile.read(100)
-                            result['error'] = f"인코딩 오류: 파일이 {encoding} 형식이 아닙니다. {fallback_encoding} 인코딩을 시도해보세요."
-                            return result
-                    except:
-                        continue
-                result['error'] = f"인코딩 오류: {e}. 파일이 UTF-8 형식이 아니며 자동 감지에 실패했습니다."
-        except csv.Error as e:
-            result['error'] = f"CSV 형식 오류: {e}. 파일이 올바른 CSV 형식이 아닙니다."
-        except PermissionError:
-            result['error'] = "파일 접근 권한이 없습니다."
-        except Exception as e:
-            result['error'] = f"파일 읽기 오류: {e}"
-        return result
-
-
-# 편의 함수들
-def parse_csv_file(file_path: str, max_rows: int = 5) -> Dict:
-    """FileParser.parse_csv_preview의 편의 함수"""
-    return FileParser.parse_csv_preview(file_path, max_rows)
-
-
-def parse_excel_file(file_path: str, max_rows: int = 5) -> Dict:
-    """FileParser.parse_excel_preview의 편의 함수"""
-    return FileParser.parse_excel_preview(file_path, max_rows)
-
-
-def print_csv_file(file_path: str, max_rows: int = 5) -> None:
-    """CSV 파일을 파싱하고 바로 콘솔에 출력하는 편의 함수"""
-    result = FileParser.parse_csv_preview(file_path, max_rows)
-    FileParser.print_csv_preview(result)
-
-
-def print_excel_file(file_path: str, max_rows: int = 5) -> None:
-    """Excel 파일을 파싱하고 바로 콘솔에 출력하는 편의 함수"""
-    result = FileParser.parse_excel_preview(file_path, max_rows)
-    FileParser.print_csv_preview(result) 
\ No newline at end of file
+        
+        def consume(stream: CsvRowStream) -> None:
+            # 전체 결과는 반복이 많은 텍스트 컬럼을 사전 인코딩하여 보관
+            if check_backend(FileParser.backend if backend is None else backend) == BACKEND_PANDAS:
+                data_rows = read_csv_stream(stream)
+            else:
+                data_rows = EncodedRows.from_chunks(stream.headers, stream.iter_chunks())
+            result['data'] = data_rows
+            result['total_rows'] = stream.rows_read
+            print(f"📊 전체 데이터 행 {len(data_rows)}개 추출 (전체 {stream.rows_read}개 중)")
+            FileParser._report_balance(result, check_rows(stream.headers, data_rows))
+        
+        return FileParser._run_csv(file_path, result, consume, file_hash)
+    
+    @staticmethod
+    def _report_balance(result: Dict, check: Optional[Dict]) -> None:
+        """잔액 연속성 검사 결과를 파싱 결과에 담고 끊긴 행을 경고 (입금/출금/잔액 컬럼이 없으면 None)"""
+        result['balance_check'] = check
+        if check is None or check['ok']:
+            return
+        print(f"⚠️ 주의: {check['break_count']}개 행에서 잔액 연속성이 끊겼습니다 (누락/중복/정렬 오류 가능).")
+        for line in describe_balance(check):
+            print(f"   - {line}")
+    
@@ -0,0 +1,298 @@
+"""
+파일 미리보기 모듈 (File Preview)
+
+파일 전체를 읽지 않고 미리보기와 요약 정보를 만듭니다.
+- CSV/Excel 파일의 첫 N행과 전체 행 수 (큰 파일은 추정값)
+- 미리보기 콘솔 출력, CSV 파일 요약
+- CSV 스트림을 열고 오류를 결과 딕셔너리에 기록하는 공통 실행 함수 (전체 파싱도 사용)
+"""
+
+import csv
+import os
+from itertools import islice
+from typing import Callable, Dict, Optional
+
+from openpyxl.utils.exceptions import InvalidFileException
+
+from .csv_stream import EXACT_COUNT_LIMIT, CsvRowStream
+from .excel_stream import ExcelRowStream
+from .text_encoding import FALLBACK_ENCODINGS
+
+
+class FilePreview:
+    """CSV 및 Excel 파일 미리보기를 담당하는 클래스 (FileParser의 기반 클래스)"""
+    
+    @staticmethod
+    def parse_csv_preview(file_path: str, max_rows: int = 5) -> Dict:
+        """
+        CSV 파일의 첫 N행을 파싱하여 미리보기 데이터 반환
+        (신한은행 등 실제 은행 양식 헤더 자동 매핑 지원)
+        
+        N행을 읽으면 디코딩을 멈추고, 전체 행 수는 바이트 스캔으로 셉니다.
+        EXACT_COUNT_LIMIT보다 큰 파일은 표본 구간으로 추정한 값을 반환합니다.
+        
+        Args:
+            file_path: CSV 파일 경로
+            max_rows: 추출할 최대 행 수 (헤더 제외)
+            
+        Returns:
+            dict: 파싱 결과 정보
+                - success: 파싱 성공 여부
+                - headers: 헤더 행 리스트
+                - data: 데이터 행 리스트
+                - total_rows: 총 데이터 행 수 (헤더 제외)
+                - total_rows_estimated: total_rows가 추정값인지 여부
+                - error: 오류 메시지 (실패 시)
+        """
+        result = {
+            'success': False,
+            'headers': [],
+            'data': [],
+            'total_rows': 0,
+            'error': None
+        }
+        
+        def consume(stream: CsvRowStream) -> None:
+            # 필요한 행만 파싱하고 전체 행 수는 바이트 스캔으로 계산 (초대형 파일은 추정)
+            data_rows = list(islice(stream, max_rows))
+            total_rows = None
+            if os.path.getsize(file_path) > EXACT_COUNT_LIMIT:
+                total_rows = stream.estimate_rows()
+            estimated = total_rows is not None
+            if not estimated:
+                total_rows = stream.count_rows()
+            result['data'] = data_rows
+            result['total_rows'] = total_rows
+            result['total_rows_estimated'] = estimated
+            approx = "약 " if estimated else ""
+            print(f"📊 데이터 행 {len(data_rows)}개 추출 (전체 {approx}{total_rows}개 중)")
+        
+        return FilePreview._run_csv(file_path, result, consume)
+    
+    @staticmethod
+    def parse_excel_preview(file_path: str, max_rows: int = 5) -> Dict:
+        """
+        Excel 파일의 첫 N행을 파싱하여 미리보기 데이터 반환
+        
+        ExcelRowStream으로 헤더 행과 첫 N행만 읽고, 전체 행 수는 시트 크기 정보로 추정합니다
+        (N행 안에 시트가 끝나면 정확한 값).
+        
+        Args:
+            file_path: Excel 파일 경로 (XLS, XLSX)
+            max_rows: 추출할 최대 행 수 (헤더 제외)
+            
+        Returns:
+            dict: 파싱 결과 정보
+                - success: 파싱 성공 여부
+                - headers: 헤더 행 리스트 (원본 헤더)
+                - data: 데이터 행 리스트
+                - total_rows: 총 데이터 행 수 (헤더 제외)
+                - total_rows_estimated: total_rows가 추정값인지 여부
+                - error: 오류 메시지 (실패 시)
+        """
+        result = {
+            'success': False,
+            'headers': [],
+            'data': [],
+            'total_rows': 0,
+            'error': None
+        }
+        
+        try:
+            # 파일 존재 확인
+            if not os.path.exists(file_path):
+                result['error'] = f"파일이 존재하지 않습니다: {file_path}"
+                return result
+            
+            # 파일 크기 확인
+            if os.path.getsize(file_path) == 0:
+                result['error'] = "파일이 비어있습니다"
+                return result
+            
+            with ExcelRowStream(file_path) as stream:
+                headers = stream.raw_headers
+                chunks = stream.iter_raw_chunks(max_rows + 1)
+                # 한 행 더 읽어 시트가 N행 안에 끝났는지 확인
+                rows = next(chunks, [])
+                estimated = len(rows) > max_rows
+                total_count = stream.estimate_rows() if estimated else len(rows)
+            
+            preview_data = rows[:max_rows]
+            result['headers'] = headers
+            result['data'] = preview_data
+            result['total_rows'] = total_count
+            result['total_rows_estimated'] = estimated
+            result['success'] = True
+            
+            # 품질 경고
+            if stream.malformed_rows > 0:
+                print(f"⚠️ 주의: {stream.malformed_rows}개 행에서 컬럼 수 불일치가 발견되었습니다.")
+            
+            approx = "약 " if estimated else ""
+            print(f"📊 데이터 행 {len(preview_data)}개 추출 (전체 {approx}{total_count}개 중)")
+                
+        except Exception as e:
+            result['error'] = FilePreview._excel_error_message(e)
+        
+        return result
+    
+    @staticmethod
+    def print_csv_preview(parse_result: Dict) -> None:
+        """
+        파싱 결과를 콘솔에 예쁘게 출력
+        
+        Args:
+            parse_result: parse_csv_preview 함수의 반환값
+        """
+        if not parse_result['success']:
+            print(f"❌ CSV 파싱 실패: {parse_result['error']}")
+            return
+        
+        headers = parse_result['headers']
+        data = parse_result['data']
+        total_rows = parse_result['total_rows']
+        
+        print("\n" + "="*60)
+        print("📄 CSV 파일 미리보기")
+        print("="*60)
+        
+        # 헤더 출력
+        print(f"📋 헤더 ({len(headers)}개 컬럼):")
+        for i, header in enumerate(headers, 1):
+            print(f"  {i}. {header}")
+        
+        approx = "약 " if parse_result.get('total_rows_estimated') else ""
+        print(f"\n📊 데이터 미리보기 (첫 {len(data)}행 / 전체 {approx}{total_rows}행):")
+        
+        if not data:
+            print("  (데이터 없음)")
+        else:
+            # 각 데이터 행 출력
+            for i, row in enumerate(data, 1):
+                print(f"\n  📝 {i}행:")
+                for j, (header, value) in enumerate(zip(headers, row)):
+                    print(f"    {header}: {value}")
+        
+        print("="*60 + "\n")
+    
+    @staticmethod
+    def get_file_summary(file_path: str) -> Dict:
+        """
+        CSV 파일의 기본 정보 반환
+        
+        인코딩을 감지한 뒤 행은 파싱하지 않고 바이트 스캔으로 셉니다 (cp949 등 지원).
+        
+        Args:
+            file_path: CSV 파일 경로
+            
+        Returns:
+            dict: 파일 요약 정보
+        """
+        try:
+            with CsvRowStream(file_path) as stream:
+                headers = stream.raw_headers
+                row_count = stream.count_rows()
+            
+            return {
+                'success': True,
+                'column_count': len(headers),
+                'row_count': row_count,
+                'headers': headers
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    @staticmethod
+    def _run_csv(file_path: str, result: Dict, consume: Callable[[CsvRowStream], None],
+                 file_hash: Optional[str] = None) -> Dict:
+        """
+        CSV 스트림을 열어 consume 함수로 처리하고 오류를 결과 딕셔너리에 기록
+        
+        Args:
+            file_path: CSV 파일 경로
+            result: 채워 넣을 결과 딕셔너리 (success/headers/error 키 포함)
+            consume: 헤더까지 읽힌 스트림을 받아 데이터 행을 처리하는 함수
+            file_hash: 파일 내용 해시 (인코딩 감지 캐시 키)
+        """
+        encoding = 'utf-8'
+        try:
+            # 파일 존재 확인
+            if not os.path.exists(file_path):
+                result['error'] = f"파일이 존재하지 않습니다: {file_path}"
+                return result
+            
+            # 파일 크기 확인 (빈 파일 체크)
+            if os.path.getsize(file_path) == 0:
+                result['error'] = "파일이 비어있습니다"
+                return result
+            
+            stream = CsvRowStream(file_path, file_hash)
+            try:
+                stream.open()
+                encoding = stream.encoding
+                result['headers'] = stream.headers
+                consume(stream)
+            finally:
+                stream.close()
+            
+            result['success'] = True
+            
+            # 품질 경고
+            if stream.malformed_rows > 0:
+                print(f"⚠️ 주의: {stream.malformed_rows}개 행에서 컬럼 수 불일치가 발견되었습니다.")
+            
+        except UnicodeDecodeError as e:
+            result['error'] = FilePreview._encoding_error_message(encoding, e)
+        except ValueError as e:
+            result['error'] = str(e)
+        except csv.Error as e:
+            result['error'] = f"CSV 형식 오류: {e}. 파일이 올바른 CSV 형식이 아닙니다."
+        except PermissionError:
+            result['error'] = "파일 접근 권한이 없습니다."
+        except Exception as e:
+            result['error'] = f"파일 읽기 오류: {e}"
+        
+        return result
+    
+    @staticmethod
+    def _encoding_error_message(encoding: str, error: UnicodeDecodeError) -> str:
+        """감지된 인코딩과 모든 대체 인코딩으로 디코딩에 실패했을 때의 오류 메시지 생성"""
+        tried = ', '.join(dict.fromkeys((encoding,) + FALLBACK_ENCODINGS))
+        return f"인코딩 오류: {error}. 파일을 해석할 수 있는 인코딩을 찾지 못했습니다 (시도: {tried})."
+    
+    @staticmethod
+    def _excel_error_message(error: Exception) -> str:
+        """Excel 파일 읽기 중 발생한 예외를 사용자용 오류 메시지로 변환"""
+        if isinstance(error, InvalidFileException):
+            return f"Excel 파일 형식 오류: {error}. 올바른 Excel 파일이 아닙니다."
+        if isinstance(error, PermissionError):
+            return "파일 접근 권한이 없습니다."
+        if isinstance(error, ValueError):
+            return str(error)
+        return f"Excel 파일 읽기 오류: {error}"
+
+
+# 편의 함수들
+def parse_csv_file(file_path: str, max_rows: int = 5) -> Dict:
+    """FilePreview.parse_csv_preview의 편의 함수"""
+    return FilePreview.parse_csv_preview(file_path, max_rows)
+
+
+def parse_excel_file(file_path: str, max_rows: int = 5) -> Dict:
+    """FilePreview.parse_excel_preview의 편의 함수"""
+    return FilePreview.parse_excel_preview(file_path, max_rows)
+
+
+def print_csv_file(file_path: str, max_rows: int = 5) -> None:
+    """CSV 파일을 파싱하고 바로 콘솔에 출력하는 편의 함수"""
+    result = FilePreview.parse_csv_preview(file_path, max_rows)
+    FilePreview.print_csv_preview(result)
+
+
+def print_excel_file(file_path: str, max_rows: int = 5) -> None:
+    """Excel 파일을 파싱하고 바로 콘솔에 출력하는 편의 함수"""
+    result = FilePreview.parse_excel_preview(file_path, max_rows)
+    FilePreview.print_csv_preview(result) 
@@ -0,0 +1,270 @@
+"""
+감시 폴더 자동 가져오기 모듈 (Folder Watcher)
+
+거래내역을 내려받는 폴더를 감시하여 새로 생기거나 바뀐 파일을 백그라운드에서 가져옵니다.
+- 변경 감지 방식: 주기적 폴링(QTimer) 또는 inotify 기반 QFileSystemWatcher (설정으로 선택)
+- 파일 크기/수정 시각이 바뀐 파일만 확인하고, 방금 수정된 파일은 내려받기가 끝날 때까지 대기
+- 같은 내용(MD5 해시)의 파일은 imported_files 테이블로 확인하여 다시 가져오지 않음
+- 감시 폴더의 계좌가 설정되어 있으면 증분 가져오기로 이전 파일과 겹치는 기간을 건너뜀 (incremental_import)
+- 가져오기는 작업 스레드에서 TransactionImporter로 실행하고, 결과는 시그널로만 알림 (UI를 막지 않음)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from ..db.crud import is_file_imported, record_imported_file
+from .archive import is_archive
+from .file_hash import compute_file_hash
+from .incremental_import import import_incremental
+from .transaction_importer import TransactionImporter
+
+
+# 변경 감지 방식
+WATCH_MODE_POLLING = 'polling'
+WATCH_MODE_INOTIFY = 'inotify'
+WATCH_MODES = (WATCH_MODE_POLLING, WATCH_MODE_INOTIFY)
+
+# 폴링 방식의 기본 확인 주기 (초)
+DEFAULT_POLL_INTERVAL = 30
+
+# 마지막 수정 후 이 시간(초)이 지나야 내려받기가 끝난 파일로 간주
+SETTLE_SECONDS = 2.0
+
+# 자동으로 가져올 파일 확장자
+WATCH_EXTENSIONS = ('.csv', '.xls', '.xlsx', '.zip', '.gz')
+
+# 가져오기 결과 상태
+STATUS_IMPORTED = 'imported'
+STATUS_SKIPPED = 'skipped'
+STATUS_FAILED = 'failed'
+
+
+class FolderScanner:
+    """감시 폴더에서 새로 생기거나 바뀐 거래내역 파일을 찾는 클래스"""
+
+    def __init__(self, folder: str, settle_seconds: float = SETTLE_SECONDS):
+        """
+        FolderScanner 초기화
+
+        Args:
+            folder: 감시할 폴더 경로
+            settle_seconds: 마지막 수정 후 대기할 시간 (초)
+        """
+        self.folder = folder
+        self.settle_seconds = settle_seconds
+        # 마지막 확인에서 발견한 거래내역 파일 목록
+        self.files: List[str] = []
+        # 경로 → 마지막으로 가져오기 대상으로 확인한 (크기, 수정 시각 ns)
+        self._seen: Dict[str, Tuple[int, int]] = {}
+
+    def scan(self, now: Optional[float] = None) -> Tuple[List[str], List[str]]:
+        """
+        폴더를 한 번 확인하여 가져올 파일과 아직 쓰는 중인 파일을 구분
+
+        준비된 파일은 확인한 것으로 기록하므로 내용이 다시 바뀌기 전까지 반환되지 않습니다.
+
+        Args:
+            now: 현재 시각 (epoch 초, 기본값: time.time())
+
+        Returns:
+            Tuple[List[str], List[str]]: (가져올 파일 목록, 수정 직후라 다음 확인으로 미룬 파일 목록)
+        """
+        now = time.time() if now is None else now
+        ready: List[str] = []
+        pending: List[str] = []
+        seen: Dict[str, Tuple[int, int]] = {}
+
+        self.files = []
+        with os.scandir(self.folder) as entries:
+            files = sorted((e for e in entries if e.is_file()), key=lambda e: e.name)
+        for entry in files:
+            if entry.name.startswith('.') or os.path.splitext(entry.name)[1].lower() not in WATCH_EXTENSIONS:
+                continue
+            self.files.append(entry.path)
+            stat = entry.stat()
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self._seen.get(entry.path) == signature:
+                seen[entry.path] = signature
+            elif now - stat.st_mtime < self.settle_seconds:
+                # 아직 내려받는 중일 수 있으므로 이전 기록을 유지하고 다음 확인으로 미룸
+                pending.append(entry.path)
+                if entry.path in self._seen:
+                    seen[entry.path] = self._seen[entry.path]
+            else:
+                ready.append(entry.path)
+                seen[entry.path] = signature
+
+        # 삭제된 파일은 기록에서 제거
+        self._seen = seen
+        return ready, pending
+
+
+def ingest_file(file_path: str, conn, account_id: Optional[str] = None) -> Dict:
+    """
+    파일 하나를 내용 해시로 중복 확인한 뒤 transactions 테이블로 가져옴
+
+    Args:
+        file_path: 가져올 파일 경로
+        conn: 사용할 데이터베이스 연결 (작업 스레드 전용 연결)
+        account_id: 거래내역에 기록할 계좌 식별자 (주어지면 압축 파일이 아닌 파일은 증분 가져오기)
+
+    Returns:
+        dict: 처리 결과
+            - path: 파일 경로
+            - status: STATUS_IMPORTED / STATUS_SKIPPED(이미 가져온 내용) / STATUS_FAILED
+            - inserted: 삽입된 행 수
+            - error: 오류 메시지 (실패 시)
+    """
+    result = {'path': file_path, 'status': STATUS_FAILED, 'inserted': 0, 'error': None}
+    try:
+        file_hash = compute_file_hash(file_path)
+        file_size = os.path.getsize(file_path)
+    except OSError as e:
+        result['error'] = f"파일 읽기 오류: {e}"
+        return result
+
+    if is_file_imported(file_hash, conn):
+        result['status'] = STATUS_SKIPPED
+        return result
+
+    if account_id and not is_archive(file_path):
+        # 계좌를 알면 같은 계좌의 이전 파일과 겹치는 기간은 건너뛰고 새 거래만 가져옴
+        imported = import_incremental(file_path, account_id, conn=conn)
+    else:
+        imported = TransactionImporter(account_id, conn=conn).import_file(file_path)
+    if not imported['success']:
+        result['error'] = imported['error']
+        return result
+
+    record_imported_file(file_hash, file_path, file_size, imported['inserted'], conn)
+    result['status'] = STATUS_IMPORTED
+    result['inserted'] = imported['inserted']
+    return result
+
+
+class FolderWatcher(QObject):
+    """감시 폴더의 새 거래내역 파일을 백그라운드에서 가져오는 클래스"""
+
+    # 파일 하나를 처리할 때마다 ingest_file 결과와 함께 발생 (작업 스레드에서 발생, 대기열 연결로 전달)
+    file_processed = Signal(dict)
+    # 폴더 확인이 끝나면 (미룬 파일 목록, 현재 폴더의 파일 목록)과 함께 발생
+    scan_finished = Signal(list, list)
+
+    def __init__(self, folder: str, db_path: str, mode: str = WATCH_MODE_POLLING,
+                 interval: int = DEFAULT_POLL_INTERVAL, account_id: Optional[str] = None,
+                 parent: Optional[QObject] = None):
+        """
+        FolderWatcher 초기화
+
+        Args:
+            folder: 감시할 폴더 경로
+            db_path: 가져온 거래내역을 저장할 SQLite 파일 경로 (작업 스레드에서 따로 연결)
+            mode: 변경 감지 방식 (WATCH_MODE_POLLING / WATCH_MODE_INOTIFY)
+            interval: 폴링 주기 (초, 폴링 방식에서만 사용)
+            account_id: 감시 폴더 파일의 계좌 식별자 (주어지면 증분 가져오기, 없으면 파일 전체 가져오기)
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        if mode not in WATCH_MODES:
+            raise ValueError(f"지원하지 않는 감시 방식입니다: {mode}")
+        if interval <= 0:
+            raise ValueError("interval은 1 이상이어야 합니다")
+        self.folder = folder
+        self.db_path = str(db_path)
+        self.mode = mode
+        self.interval = interval
+        self.account_id = account_id or None
+        self.scanner = FolderScanner(folder)
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.trigger)
+        self._fs_watcher: Optional[QFileSystemWatcher] = None
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._rescan = False
+        self._running = False
+        self.scan_finished.connect(self._on_scan_finished)
+
+    def start(self) -> None:
+        """감시를 시작하고 폴더에 이미 있는 파일을 한 번 확인"""
+        self._running = True
+        if self.mode == WATCH_MODE_INOTIFY:
+            self._fs_watcher = QFileSystemWatcher([self.folder], self)
+            self._fs_watcher.directoryChanged.connect(self.trigger)
+            self._fs_watcher.fileChanged.connect(self.trigger)
+        else:
+            self._timer.start(self.interval * 1000)
+        print(f"👀 감시 폴더 시작 ({self.mode}): {self.folder}")
+        self.trigger()
+
+    def stop(self) -> None:
+        """감시를 멈추고 진행 중인 가져오기가 끝날 때까지 대기"""
+        self._running = False
+        self._timer.stop()
+        if self._fs_watcher is not None:
+            self._fs_watcher.deleteLater()
+            self._fs_watcher = None
+        with self._lock:
+            worker = self._worker
+            self._rescan = False
+        if worker is not None:
+            worker.join()
+        print(f"👀 감시 폴더 종료: {self.folder}")
+
+    def trigger(self, *_) -> None:
+        """작업 스레드에서 폴더 확인을 시작 (이미 확인 중이면 끝난 뒤 한 번 더 확인)"""
+        if not self._running:
+            return
+        with self._lock:
+            if self._worker is not None:
+                self._rescan = True
+                return
+            self._worker = threading.Thread(target=self._run, name="folder-watcher", daemon=True)
+            self._worker.start()
+
+    def run_once(self) -> List[Dict]:
+        """
+        폴더를 한 번 확인하고 준비된 파일을 가져옴 (호출한 스레드에서 실행)
+
+        Returns:
+            List[Dict]: 파일별 ingest_file 결과
+        """
+        ready, pending = self.scanner.scan()
+        results = []
+        if ready:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                for path in ready:
+                    result = ingest_file(path, conn, self.account_id)
+                    results.append(result)
+                    self.file_processed.emit(result)
+            finally:
+                conn.close()
+        self.scan_finished.emit(pending, list(self.scanner.files))
+        return results
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"❌ 감시 폴더 확인 중 오류 발생: {e}")
+            with self._lock:
+                if not self._rescan:
+                    self._worker = None
+                    return
+                self._rescan = False
+
+    def _on_scan_finished(self, pending: List[str], files: List[str]) -> None:
+        """미룬 파일이 있으면 대기 시간 뒤 다시 확인하고, inotify 방식이면 파일 내용 변경도 감시"""
+        if pending:
+            QTimer.singleShot(int(SETTLE_SECONDS * 1000) + 100, self.trigger)
+        if self._fs_watcher is not None:
+            watched = set(self._fs_watcher.files())
+            new_files = [path for path in files if path not in watched]
+            if new_files:
+                self._fs_watcher.addPaths(new_files)
@@ -0,0 +1,287 @@
+"""
+가져오기 파이프라인 모듈 (Import Pipeline)
+
+거래내역 가져오기를 크기가 제한된 큐로 연결된 단계들로 나누어 단계마다 별도 스레드에서 실행합니다.
+- 읽기 → 디코딩 → 정규화 → 지문 계산 → 일괄 삽입(중복 확인 포함)
+- 큐마다 최대 QUEUE_DEPTH개 항목만 보관: 뒤 단계가 느리면 앞 단계가 기다림 (역압, 메모리 사용량 일정)
+- 마지막 단계(삽입)는 호출한 스레드에서 실행 (SQLite 연결과 UI 콜백은 만든 스레드에서만 사용)
+- 단계별 처리량과 작업/입력 대기/출력 대기 시간을 기록하여 병목 단계를 보고
+- 한 단계에서 오류가 나면 모든 단계를 멈추고 마지막 단계에서 같은 예외를 다시 발생
+- CSV의 바이트 블록 읽기/디코딩/정규화 단계 함수는 csv_blocks 모듈에 있음
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+
+# 단계 사이 큐의 최대 항목 수
+QUEUE_DEPTH = 4
+
+# 큐 대기 중 취소 여부를 확인하는 간격 (초)
+POLL_INTERVAL = 0.1
+
+# 처리량 단위
+UNIT_BYTES = 'bytes'
+UNIT_ROWS = 'rows'
+
+_END = object()
+
+
+class StageStats:
+    """파이프라인 단계 하나의 처리량 기록 클래스"""
+
+    def __init__(self, name: str, unit: str = UNIT_ROWS):
+        """
+        StageStats 초기화
+
+        Args:
+            name: 단계 이름
+            unit: 처리량 단위 (UNIT_ROWS 또는 UNIT_BYTES)
+        """
+        self.name = name
+        self.unit = unit
+        self.items = 0
+        self.processed = 0
+        self.busy = 0.0
+        self.starved = 0.0
+        self.blocked = 0.0
+
+    @property
+    def per_sec(self) -> float:
+        """작업 시간 기준 초당 처리량 (입력/출력 대기 시간 제외)"""
+        return self.processed / self.busy if self.busy > 0 else float(self.processed)
+
+    def as_dict(self) -> Dict:
+        """
+        결과 딕셔너리용 변환
+
+        Returns:
+            dict: stage, unit, items, processed, busy(작업 초), starved(입력 대기 초),
+                blocked(출력 대기 초), per_sec
+        """
+        return {
+            'stage': self.name,
+            'unit': self.unit,
+            'items': self.items,
+            'processed': self.processed,
+            'busy': self.busy,
+            'starved': self.starved,
+            'blocked': self.blocked,
+            'per_sec': self.per_sec,
+        }
+
+    def describe(self) -> str:
+        """로그용 한 줄 요약"""
+        if self.unit == UNIT_BYTES:
+            rate = f"{self.processed / (1024 * 1024):,.1f}MB, {self.per_sec / (1024 * 1024):,.1f}MB/초"
+        else:
+            rate = f"{self.processed:,}행, {self.per_sec:,.0f}행/초"
+        return (f"{self.name}: {rate} (작업 {self.busy:.2f}초, 입력 대기 {self.starved:.2f}초, "
+                f"출력 대기 {self.blocked:.2f}초)")
+
+
+def merge_stage_dicts(runs: Iterable[List[Dict]]) -> List[Dict]:
+    """
+    여러 번 실행한 파이프라인의 단계별 처리량(StageStats.as_dict 목록)을 단계 이름별로 합침
+
+    Returns:
+        list: 처음 나온 순서의 단계별 합계 (StageStats.as_dict 형식)
+    """
+    merged: Dict[str, StageStats] = {}
+    for stages in runs:
+        for stage in stages:
+            total = merged.setdefault(stage['stage'], StageStats(stage['stage'], stage['unit']))
+            total.items += stage['items']
+            total.processed += stage['processed']
+            total.busy += stage['busy']
+            total.starved += stage['starved']
+            total.blocked += stage['blocked']
+    return [total.as_dict() for total in merged.values()]
+
+
+class ImportPipeline:
+    """크기가 제한된 큐로 연결된 단계들을 스레드로 실행하는 파이프라인 클래스"""
+
+    def __init__(self, depth: int = QUEUE_DEPTH):
+        """
+        ImportPipeline 초기화
+
+        Args:
+            depth: 단계 사이 큐의 최대 항목 수
+        """
+        if depth <= 0:
+            raise ValueError("depth는 1 이상이어야 합니다")
+        self.depth = depth
+        self.stats: List[StageStats] = []
+        self._source: Optional[Iterable] = None
+        self._stages: List[Callable[[Any], Any]] = []
+        self._measures: List[Callable[[Any], int]] = []
+        self._cancel = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    def source(self, name: str, items: Iterable, measure: Callable[[Any], int],
+               unit: str = UNIT_ROWS) -> 'ImportPipeline':
+        """
+        첫 단계 설정 (items를 반복하는 작업이 이 단계의 작업 시간)
+
+        Args:
+            name: 단계 이름
+            items: 항목을 만들어 내는 반복 가능 객체
+            measure: 항목 하나의 처리량(행 수 또는 바이트 수)을 돌려주는 함수
+            unit: 처리량 단위
+        """
+        self._source = items
+        self._add(name, measure, unit)
+        return self
+
+    def stage(self, name: str, func: Callable[[Any], Any], measure: Callable[[Any], int],
+              unit: str = UNIT_ROWS) -> 'ImportPipeline':
+        """
+        중간 단계 추가 (앞 단계 항목마다 func를 호출하고 결과를 다음 단계로 넘김)
+
+        Args:
+            name: 단계 이름
+            func: 항목 변환 함수 (단계 스레드에서 순서대로 호출되므로 상태를 가져도 됨)
+            measure: 변환 결과 하나의 처리량을 돌려주는 함수
+            unit: 처리량 단위
+        """
+        self._stages.append(func)
+        self._add(name, measure, unit)
+        return self
+
+    def _add(self, name: str, measure: Callable[[Any], int], unit: str) -> None:
+        self.stats.append(StageStats(name, unit))
+        self._measures.append(measure)
+
+    def run(self, sink_name: str, measure: Callable[[Any], int], unit: str = UNIT_ROWS) -> Iterator:
+        """
+        단계 스레드들을 시작하고 마지막 단계의 결과를 호출한 스레드에서 순서대로 반환 (한 번만 실행 가능)
+
+        반환된 반복자를 소비하는 작업이 마지막 단계(sink_name)이며, 그 작업 시간도 기록됩니다.
+        반복이 끝나거나 중단되면 모든 단계 스레드를 멈추고 기다립니다.
+
+        Args:
+            sink_name: 마지막 단계 이름
+            measure: 항목 하나에 대해 마지막 단계가 처리하는 양을 돌려주는 함수
+            unit: 처리량 단위
+
+        Raises:
+            Exception: 앞 단계에서 발생한 예외 (반복 중 다시 발생)
+        """
+        if self._source is None:
+            raise ValueError("첫 단계(source)가 설정되지 않았습니다")
+        sink = StageStats(sink_name, unit)
+        self.stats.append(sink)
+
+        queues = [queue.Queue(self.depth) for _ in range(len(self._stages) + 1)]
+        threads = [threading.Thread(target=self._produce, args=(queues[0],), daemon=True)]
+        for idx, func in enumerate(self._stages):
+            threads.append(threading.Thread(target=self._transform, args=(idx + 1, func, queues[idx], queues[idx + 1]),
+                                            daemon=True))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = self._get(queues[-1], sink)
+                if self._error is not None:
+                    raise self._error
+                if item is _END or item is None:
+                    return
+                start = time.perf_counter()
+                yield item
+                sink.busy += time.perf_counter() - start
+                sink.items += 1
+                sink.processed += measure(item)
+        finally:
+            self._cancel.set()
+            for thread in threads:
+                thread.join()
+
+    def bottleneck(self) -> Optional[StageStats]:
+        """작업 시간이 가장 긴 단계 (실행 전이면 None)"""
+        return max(self.stats, key=lambda s: s.busy) if self.stats else None
+
+    def report(self) -> None:
+        """단계별 처리량과 병목 단계를 출력"""
+        slowest = self.bottleneck()
+        for stats in self.stats:
+            mark = " ⬅ 병목" if stats is slowest else ""
+            print(f"   - {stats.describe()}{mark}")
+
+    def _produce(self, out: queue.Queue) -> None:
+        """첫 단계 스레드: source를 반복하여 항목을 큐에 넣음"""
+        stats, measure = self.stats[0], self._measures[0]
+        try:
+            items = iter(self._source)
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    break
+                finally:
+                    stats.busy += time.perf_counter() - start
+                stats.items += 1
+                stats.processed += measure(item)
+                if not self._put(out, item, stats):
+                    return
+            self._put(out, _END, stats)
+        except BaseException as e:
+            self._fail(e)
+
+    def _transform(self, idx: int, func: Callable[[Any], Any], inbox: queue.Queue, out: queue.Queue) -> None:
+        """중간 단계 스레드: 앞 큐의 항목을 변환하여 다음 큐에 넣음"""
+        stats, measure = self.stats[idx], self._measures[idx]
+        try:
+            while True:
+                item = self._get(inbox, stats)
+                if item is None:
+                    return
+                if item is _END:
+                    self._put(out, _END, stats)
+                    return
+                start = time.perf_counter()
+                result = func(item)
+                stats.busy += time.perf_counter() - start
+                stats.items += 1
+                stats.processed += measure(result)
+                if not self._put(out, result, stats):
+                    return
+        except BaseException as e:
+            self._fail(e)
+
+    def _fail(self, error: BaseException) -> None:
+        """처음 발생한 오류를 기록하고 모든 단계를 취소 (마지막 단계가 기록된 오류를 다시 발생)"""
+        if self._error is None:
+            self._error = error
+        self._cancel.set()
+
+    def _put(self, out: queue.Queue, item, stats: StageStats) -> bool:
+        """큐에 자리가 날 때까지 기다려 항목을 넣음 (취소되면 False)"""
+        start = time.perf_counter()
+        try:
+            while not self._cancel.is_set():
+                try:
+                    out.put(item, timeout=POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            stats.blocked += time.perf_counter() - start
+
+    def _get(self, inbox: queue.Queue, stats: StageStats):
+        """큐에 항목이 들어올 때까지 기다려 꺼냄 (취소되면 None)"""
+        start = time.perf_counter()
+        try:
+            while True:
+                try:
+                    return inbox.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    if self._cancel.is_set():
+                        return None
+        finally:
+            stats.starved += time.perf_counter() - start
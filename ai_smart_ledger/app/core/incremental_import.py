@@ -0,0 +1,120 @@
+"""
+증분 가져오기 모듈 (Incremental Import)
+
+같은 계좌의 거래내역을 매달 다시 내려받으면 이전에 가져온 기간과 새 거래가 함께 들어 있습니다.
+계좌/출처별로 마지막으로 가져온 위치와 겹치는 구간의 지문을 import_checkpoints 테이블에 기억해 두고,
+다음 파일에서는 새 거래만 파싱/삽입합니다 (시간이 파일 전체가 아니라 새 거래 수에 비례).
+- 행 지문: 정규화된 행 전체(거래일시/금액/잔액/내용)의 BLAKE2b 해시, 가장 최신 거래 TAIL_WINDOW건을 기억
+- 내림차순(최신 거래가 위) 파일: 위에서부터 읽다가 기억한 구간을 만나면 읽기를 멈춤
+- 오름차순 CSV가 이전 파일 뒤에 이어 쓴 형태면 (마지막 위치 직전 바이트 해시 일치) 마지막 위치부터만 파싱
+- 다시 내려받은 오름차순 CSV는 레코드 경계만 바이트 스캔하고 파일 끝에서부터 기억한 구간이 나올 때까지만 파싱
+- 그 밖의 오름차순 파일(Excel 등)은 끝까지 읽되 기억한 구간 뒤의 행만 삽입
+- 기억한 구간을 찾지 못하면 마지막 거래일시 이후의 연속된 최신 거래만 가져오고 경고
+정렬 방향은 지난 기록이 아니라 파일마다 거래일시가 다른 첫 두 행으로 판별합니다 (거래일시가 하나뿐이면 'unknown').
+새 거래를 고르는 방식들은 incremental_select 모듈에 있습니다.
+"""
+
+import itertools
+import json
+import os
+from typing import Dict, Optional
+
+from ..db.crud import get_import_checkpoint, save_import_checkpoint
+from .balance_check import ORDER_ASCENDING
+from .csv_stream import CsvRowStream
+from .incremental_select import RowClock, select_appended_rows, select_rows, select_tail_rows, tail_digest
+# 결과의 mode 값과 설정 상수는 기존 import 경로(incremental_import)로도 사용할 수 있도록 다시 내보냄
+from .incremental_select import (MODE_AFTER_LAST, MODE_BYTE_OFFSET, MODE_FULL, MODE_OVERLAP, ORDER_UNKNOWN,
+                                 TAIL_WINDOW)
+from .transaction_importer import DEFAULT_BATCH_SIZE, TransactionImporter, open_statement_stream
+
+
+def _result(error: Optional[str], source: Optional[str]) -> Dict:
+    """삽입한 행이 없는 결과 (error가 없으면 성공)"""
+    return {
+        'success': error is None,
+        'inserted': 0,
+        'skipped': 0,
+        'duplicates': 0,
+        'elapsed': 0.0,
+        'rows_per_sec': 0.0,
+        'error': error,
+        'mode': None,
+        'parsed_rows': 0,
+        'source': source,
+    }
+
+
+def import_incremental(file_path: str, account_id: str, source: Optional[str] = None, conn=None,
+                       batch_size: int = DEFAULT_BATCH_SIZE) -> Dict:
+    """
+    이전에 가져온 거래내역을 이어서 내려받은 파일에서 새 거래만 transactions 테이블로 가져옴
+
+    Args:
+        file_path: 거래내역 파일 경로 (CSV/Excel)
+        account_id: 계좌 식별자 (가져오기 위치를 계좌별로 기억하므로 필수)
+        source: 내보내기 출처 (기본값: 감지된 은행 프로필 이름)
+        conn: 사용할 데이터베이스 연결 (기본값: 전역 연결)
+        batch_size: executemany 한 번에 넘길 레코드 수
+
+    Returns:
+        dict: TransactionImporter.import_file과 같은 형식의 결과
+            + mode: 새 거래를 고른 방식 (MODE_FULL / MODE_OVERLAP / MODE_BYTE_OFFSET / MODE_AFTER_LAST)
+            + parsed_rows: 파싱한 데이터 행 수
+            + source: 가져오기 위치를 기억한 출처
+    """
+    if not account_id:
+        return _result("증분 가져오기에는 계좌 식별자가 필요합니다", source)
+    try:
+        stream = open_statement_stream(file_path)
+    except Exception as e:
+        return _result(f"파일 읽기 오류: {e}", source)
+
+    with stream:
+        source = source or stream.plan.profile_name
+        headers = stream.headers
+        clock = RowClock(headers)
+        try:
+            checkpoint = get_import_checkpoint(account_id, source, conn)
+            rows = iter(stream)
+            order, peeked = clock.peek_order(rows)
+            selected = None
+            if checkpoint is not None and order == ORDER_ASCENDING:
+                selected = (select_appended_rows(file_path, stream, checkpoint)
+                            or select_tail_rows(file_path, stream, checkpoint))
+            if selected is None:
+                selected = select_rows(itertools.chain(peeked, rows), order, checkpoint, clock)
+        except Exception as e:
+            return _result(f"파일 읽기 오류: {e}", source)
+        first_row_num = stream.header_row + 1 + selected['first_index']
+
+    rows = selected['rows']
+    if rows:
+        chunks = (rows[i:i + batch_size] for i in range(0, len(rows), batch_size))
+        result = TransactionImporter(account_id, batch_size, conn).import_rows(
+            headers, chunks, os.path.basename(file_path), first_row_num)
+        if not result['success']:
+            return dict(result, mode=selected['mode'], parsed_rows=selected['parsed_rows'], source=source)
+    else:
+        result = _result(None, source)
+
+    previous = checkpoint or {'last_epoch': None, 'imported_rows': 0}
+    newest_epoch = clock.epoch(selected['newest_row']) if selected['newest_row'] is not None else None
+    appendable = (selected['order'] == ORDER_ASCENDING and selected['file_rows'] is not None
+                  and isinstance(stream, CsvRowStream) and stream.opener is None)
+    offset = os.path.getsize(file_path) if appendable else None
+    save_import_checkpoint({
+        'account_id': account_id,
+        'source': source,
+        'file_order': selected['order'],
+        'last_epoch': newest_epoch if newest_epoch is not None else previous['last_epoch'],
+        'tail_window': json.dumps(selected['newest']),
+        'byte_offset': offset,
+        'offset_digest': tail_digest(file_path, offset) if appendable else None,
+        'file_rows': selected['file_rows'],
+        'imported_rows': previous['imported_rows'] + result['inserted'],
+    }, conn)
+
+    print(f"🧾 증분 가져오기 ({selected['mode']}): {selected['parsed_rows']:,}행 파싱, "
+          f"새 거래 {result['inserted']:,}건 저장 [{account_id} / {source}]")
+    return dict(result, mode=selected['mode'], parsed_rows=selected['parsed_rows'], source=source)
@@ -0,0 +1,265 @@
+"""
+증분 가져오기 행 선택 모듈 (Incremental Select)
+
+증분 가져오기(incremental_import)에서 지난 기록(import_checkpoints)과 비교해 파일의 새 거래를 고르는 방식들을 제공합니다.
+- select_rows: 파일 순서대로 읽으며 기억한 구간을 찾음 (내림차순은 구간을 만나면 멈춤, 못 찾으면 마지막 거래일시 이후)
+- select_appended_rows: 이전 파일 뒤에 이어 쓴 오름차순 CSV는 마지막 위치부터만 파싱
+- select_tail_rows: 다시 내려받은 오름차순 CSV는 파일 끝에서부터 기억한 구간이 나올 때까지만 파싱
+모든 방식은 같은 형식의 결과(새 행, 첫 새 행 번호, 정렬 방향, 방식, 다음 기록에 쓸 최신 구간)를 반환합니다.
+"""
+
+import codecs
+import csv
+import hashlib
+import io
+import json
+import mmap
+import os
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .balance_check import ORDER_ASCENDING, ORDER_DESCENDING
+from .csv_scan import iter_record_ends, skip_records
+from .csv_stream import CsvRowStream
+from .text_encoding import decode_with_fallback
+from .timestamps import parse_timestamp_general
+
+
+# 다음 파일과 겹치는 구간으로 기억할 최신 거래 수
+TAIL_WINDOW = 16
+
+# 이어 쓴 파일인지 확인할 때 비교하는 마지막 위치 직전 바이트 수
+OFFSET_DIGEST_BYTES = 4096
+
+# 오름차순 파일 끝에서부터 기억한 구간을 찾을 때 처음 파싱하는 행 수 (찾지 못하면 두 배씩 늘림)
+TAIL_SCAN_ROWS = 256
+
+# 거래일시가 하나뿐이라 정렬 방향을 판별할 수 없는 파일 (겹치는 구간은 오름차순처럼 찾음)
+ORDER_UNKNOWN = 'unknown'
+
+# 새 거래를 고른 방식
+MODE_FULL = 'full'                # 기록이 없어 파일 전체를 가져옴
+MODE_OVERLAP = 'overlap'          # 기억한 구간 이후의 행만 가져옴
+MODE_BYTE_OFFSET = 'byte_offset'  # 이어 쓴 부분만 파싱해서 가져옴
+MODE_AFTER_LAST = 'after_last'    # 구간을 찾지 못해 마지막 거래일시 이후만 가져옴
+
+
+def row_fingerprint(row: Sequence[str]) -> str:
+    """정규화된 행의 지문 (같은 거래는 파일이 달라도 같은 값)"""
+    return hashlib.blake2b("\x1f".join(row).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def tail_digest(file_path: str, offset: int) -> Optional[str]:
+    """파일의 offset 직전 OFFSET_DIGEST_BYTES 바이트 해시 (파일이 offset보다 짧으면 None)"""
+    start = max(0, offset - OFFSET_DIGEST_BYTES)
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(offset - start)
+    if len(data) != offset - start:
+        return None
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class RowClock:
+    """표준 헤더 위치를 기억해 행의 거래일시를 epoch 초로 변환 (해석할 수 없으면 None)"""
+
+    def __init__(self, headers: List[str]):
+        self.date_idx = headers.index("날짜") if "날짜" in headers else None
+        self.time_idx = headers.index("시간") if "시간" in headers else None
+
+    def epoch(self, row: List[str]) -> Optional[int]:
+        if self.date_idx is None or self.date_idx >= len(row):
+            return None
+        time_text = row[self.time_idx] if self.time_idx is not None and self.time_idx < len(row) else ""
+        return parse_timestamp_general(row[self.date_idx], time_text)
+
+    def peek_order(self, rows: Iterator[List[str]]) -> Tuple[str, List[List[str]]]:
+        """
+        거래일시가 다른 첫 두 행이 나올 때까지 읽어 파일 정렬 방향 판별
+
+        Returns:
+            tuple: (정렬 방향, 판별하느라 읽은 행 목록), 끝까지 거래일시가 하나뿐이면 ORDER_UNKNOWN
+        """
+        peeked = []
+        first = None
+        for row in rows:
+            peeked.append(row)
+            epoch = self.epoch(row)
+            if epoch is None or epoch == first:
+                continue
+            if first is not None:
+                return (ORDER_DESCENDING if epoch < first else ORDER_ASCENDING), peeked
+            first = epoch
+        return ORDER_UNKNOWN, peeked
+
+
+def select_rows(rows: Iterable[List[str]], order: str, checkpoint: Optional[Dict], clock: RowClock) -> Dict:
+    """
+    파일 순서의 데이터 행에서 새 거래를 고름 (order는 이 파일의 정렬 방향)
+
+    Returns:
+        dict: rows(파일 순서의 새 행), first_index(첫 새 행의 데이터 행 번호, 0부터), order, mode,
+            parsed_rows(파싱한 행 수), file_rows(파일 전체 행 수, 끝까지 읽지 않았으면 None),
+            newest(파일에서 가장 최신인 거래 TAIL_WINDOW건의 지문, 과거 → 최신), newest_row(가장 최신 행)
+    """
+    window = json.loads(checkpoint['tail_window']) if checkpoint is not None else []
+    if not window:
+        # 기록이 없거나 지난번 파일에 거래가 없었으면 파일 전체가 새 거래
+        rows = list(rows)
+        chrono = rows[::-1] if order == ORDER_DESCENDING else rows
+        return {'rows': rows, 'first_index': 0, 'order': order, 'mode': MODE_FULL, 'parsed_rows': len(rows),
+                'file_rows': len(rows), 'newest': [row_fingerprint(r) for r in chrono[-TAIL_WINDOW:]],
+                'newest_row': chrono[-1] if chrono else None}
+
+    descending = order == ORDER_DESCENDING
+    # 파일 안에서 겹치는 구간이 나타나는 순서 (기억한 구간은 과거 → 최신이므로 내림차순 파일에서는 뒤집힘)
+    target = window[::-1] if descending else window
+    recent = deque(maxlen=len(target))
+    buffer: List[List[str]] = []
+    count = 0
+    matched_at = None
+    for row in rows:
+        count += 1
+        buffer.append(row)
+        recent.append(row_fingerprint(row))
+        if target and recent[-1] == target[-1] and list(recent) == target:
+            if descending:
+                # 구간 앞의 행이 모두 새 거래이므로 나머지는 읽지 않음
+                matched_at = count - len(target)
+                break
+            # 오름차순은 구간 뒤의 행만 남김 (같은 구간이 다시 나오면 마지막 위치 기준)
+            matched_at = count
+            buffer = []
+
+    if matched_at is not None:
+        if descending:
+            rows = buffer[:matched_at]
+            chrono_newest = [row_fingerprint(r) for r in buffer[:TAIL_WINDOW][::-1]]
+            return {'rows': rows, 'first_index': 0, 'order': order, 'mode': MODE_OVERLAP, 'parsed_rows': count,
+                    'file_rows': None, 'newest': chrono_newest, 'newest_row': buffer[0]}
+        newest = (window + [row_fingerprint(r) for r in buffer[-TAIL_WINDOW:]])[-TAIL_WINDOW:]
+        return {'rows': buffer, 'first_index': matched_at, 'order': order, 'mode': MODE_OVERLAP,
+                'parsed_rows': count, 'file_rows': count, 'newest': newest,
+                'newest_row': buffer[-1] if buffer else None}
+
+    # 겹치는 구간이 없으면 최신 쪽 끝에서 마지막 거래일시 이후(같은 시각은 기억한 지문에 없는 행)만 연속으로 가져옴
+    known = set(window)
+    last_epoch = checkpoint['last_epoch']
+
+    def is_new(row: List[str]) -> bool:
+        epoch = clock.epoch(row)
+        if last_epoch is None or epoch is None:
+            return False
+        return epoch > last_epoch or (epoch == last_epoch and row_fingerprint(row) not in known)
+
+    chrono = buffer[::-1] if descending else buffer
+    new_count = 0
+    for row in reversed(chrono):
+        if not is_new(row):
+            break
+        new_count += 1
+    if descending:
+        rows, first_index = buffer[:new_count], 0
+    else:
+        rows, first_index = buffer[len(buffer) - new_count:], len(buffer) - new_count
+    print(f"⚠️ 이전에 가져온 구간을 찾지 못해 마지막 거래일시 이후의 거래 {new_count}건만 가져옵니다")
+    return {'rows': rows, 'first_index': first_index, 'order': order, 'mode': MODE_AFTER_LAST,
+            'parsed_rows': count, 'file_rows': count,
+            'newest': [row_fingerprint(r) for r in chrono[-TAIL_WINDOW:]],
+            'newest_row': chrono[-1] if chrono else None}
+
+
+def select_appended_rows(file_path: str, stream: CsvRowStream, checkpoint: Dict) -> Optional[Dict]:
+    """
+    오름차순 CSV가 이전에 가져온 파일 뒤에 이어 쓴 형태면 마지막 위치부터만 파싱
+
+    Returns:
+        Optional[Dict]: _select_rows와 같은 형식 (이어 쓴 파일이 아니면 None)
+    """
+    offset = checkpoint['byte_offset']
+    if (not isinstance(stream, CsvRowStream) or stream.opener is not None
+            or checkpoint['file_order'] != ORDER_ASCENDING or not offset or checkpoint['file_rows'] is None
+            or os.path.getsize(file_path) < offset or tail_digest(file_path, offset) != checkpoint['offset_digest']):
+        return None
+
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+    text, _ = decode_with_fallback(data, stream.encoding)
+    apply = stream.plan.apply
+    # 이전 파일이 줄바꿈 없이 끝났으면 이어 쓴 부분이 빈 줄로 시작하므로 빈 레코드는 건너뜀
+    rows = [apply(record) for record in csv.reader(io.StringIO(text, newline=''), stream.dialect) if record]
+    window = json.loads(checkpoint['tail_window'])
+    return {'rows': rows, 'first_index': checkpoint['file_rows'], 'order': ORDER_ASCENDING,
+            'mode': MODE_BYTE_OFFSET, 'parsed_rows': len(rows), 'file_rows': checkpoint['file_rows'] + len(rows),
+            'newest': (window + [row_fingerprint(r) for r in rows[-TAIL_WINDOW:]])[-TAIL_WINDOW:],
+            'newest_row': rows[-1] if rows else None}
+
+
+def _record_bounds(buffer, start: int) -> np.ndarray:
+    """start 이후 레코드들의 시작 오프셋 배열 (마지막 원소는 마지막 레코드의 끝 오프셋)"""
+    ends = list(iter_record_ends(buffer, start))
+    bounds = np.concatenate([np.array([start], dtype=np.int64)] + ends)
+    if bounds[-1] < len(buffer):
+        # 줄바꿈 없이 끝난 마지막 레코드
+        bounds = np.append(bounds, len(buffer))
+    return bounds
+
+
+def _find_last_window(fingerprints: List[str], window: List[str]) -> Optional[int]:
+    """fingerprints에서 window가 마지막으로 나타나는 구간 바로 다음 위치 (없으면 None)"""
+    size = len(window)
+    for end in range(len(fingerprints), size - 1, -1):
+        if fingerprints[end - 1] == window[-1] and fingerprints[end - size:end] == window:
+            return end
+    return None
+
+
+def select_tail_rows(file_path: str, stream: CsvRowStream, checkpoint: Dict) -> Optional[Dict]:
+    """
+    다시 내려받은 오름차순 CSV에서 파일 끝부터 기억한 구간이 나올 때까지만 파싱하여 새 거래를 고름
+
+    레코드 경계는 따옴표 밖 줄바꿈의 바이트 스캔으로 찾으므로, 행 파싱/지문 계산은 새 거래와 겹치는 구간에만 적용됩니다.
+    첫 시도는 지난 파일보다 늘어난 행 수(모르면 TAIL_SCAN_ROWS)만큼 읽고, 구간이 없으면 두 배씩 앞으로 넓힙니다.
+
+    Returns:
+        Optional[Dict]: _select_rows와 같은 형식 (바이트 스캔할 수 없는 파일이거나 구간을 찾지 못하면 None)
+    """
+    window = json.loads(checkpoint['tail_window'])
+    if (not window or not isinstance(stream, CsvRowStream) or not stream.byte_countable
+            or os.path.getsize(file_path) == 0):
+        return None
+
+    # utf-8-sig의 BOM은 헤더 앞에만 있으므로 데이터 구간은 utf-8로 디코딩
+    encoding = 'utf-8' if codecs.lookup(stream.encoding).name == 'utf-8-sig' else stream.encoding
+    apply = stream.plan.apply
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        bounds = _record_bounds(buffer, skip_records(buffer, stream.header_row))
+        total = len(bounds) - 1
+        grown = total - checkpoint['file_rows'] + TAIL_WINDOW if checkpoint['file_rows'] is not None else 0
+        count = min(total, grown if grown > TAIL_WINDOW else TAIL_SCAN_ROWS)
+        rows: List[List[str]] = []
+        fingerprints: List[str] = []
+        while True:
+            first, last = total - count, total - len(rows)
+            text, encoding = decode_with_fallback(buffer[int(bounds[first]):int(bounds[last])], encoding)
+            parsed = [apply(record) for record in csv.reader(io.StringIO(text, newline=''), stream.dialect)]
+            if len(parsed) != last - first:
+                # 바이트 스캔과 CSV 파서의 레코드 구분이 다르면 ('\r' 줄바꿈 섞임 등) 처음부터 읽음
+                return None
+            rows = parsed + rows
+            fingerprints = [row_fingerprint(row) for row in parsed] + fingerprints
+            matched_at = _find_last_window(fingerprints, window)
+            if matched_at is not None:
+                break
+            if first == 0:
+                return None
+            count = min(total, count * 2)
+
+    new_rows = rows[matched_at:]
+    return {'rows': new_rows, 'first_index': first + matched_at, 'order': ORDER_ASCENDING, 'mode': MODE_OVERLAP,
+            'parsed_rows': len(rows), 'file_rows': total,
+            'newest': (window + fingerprints[matched_at:][-TAIL_WINDOW:])[-TAIL_WINDOW:],
+            'newest_row': new_rows[-1] if new_rows else None}
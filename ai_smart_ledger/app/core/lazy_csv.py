@@ -0,0 +1,161 @@
+"""
+지연 로딩 CSV 모듈 (Lazy CSV)
+
+대용량 CSV 파일을 메모리 맵으로 열고 레코드 시작 오프셋 배열만 만들어 둔 뒤,
+요청된 행만 그때그때 디코딩합니다.
+- 따옴표를 고려한 한 번의 바이트 스캔으로 오프셋 인덱스 생성 (csv_scan)
+- 메모리 사용량은 데이터 크기가 아닌 행 수에 비례 (행당 int64 하나)
+- 인덱스/슬라이스 접근 시 CSV와 같은 헤더 매핑 및 금액 정제 적용
+"""
+
+import codecs
+import csv
+import io
+import mmap
+from typing import List, Optional, Union
+
+import numpy as np
+
+from .csv_scan import iter_record_ends, is_byte_scannable
+from .bank_profiles import RowPlan
+from .csv_stream import CsvRowStream, dialect_params
+from .text_encoding import decode_with_fallback
+
+
+class LazyCsvFile:
+    """레코드 오프셋 인덱스로 행을 지연 디코딩하는 CSV 파일 클래스"""
+
+    def __init__(self, file_path: str):
+        """
+        LazyCsvFile 초기화 (open() 호출 전에는 인덱스가 없음)
+
+        Args:
+            file_path: CSV 파일 경로
+        """
+        self.file_path = file_path
+        self.encoding = 'utf-8'
+        self.headers: List[str] = []
+        self.raw_headers: List[str] = []
+        self.amount_flags: List[bool] = []
+        self.plan: Optional[RowPlan] = None
+        self.header_row = 1
+        self.offsets = np.empty(0, dtype=np.int64)
+        self._fmtparams = {}
+        self._file = None
+        self._mmap = None
+
+    def open(self) -> 'LazyCsvFile':
+        """
+        인코딩/방언/헤더를 감지하고 파일을 메모리 맵으로 열어 오프셋 인덱스를 생성
+
+        Returns:
+            LazyCsvFile: 자기 자신 (체이닝용)
+
+        Raises:
+            ValueError: 파일이 비어있거나 바이트 인덱싱이 불가능한 인코딩/줄바꿈/따옴표인 경우
+        """
+        # 감지 로직은 스트리밍 파서와 공유 (헤더만 읽고 닫음)
+        with CsvRowStream(self.file_path) as stream:
+            self.raw_headers = stream.raw_headers
+            self.headers = stream.headers
+            self.amount_flags = stream.amount_flags
+            self.plan = stream.plan
+            self.header_row = stream.header_row
+            self._fmtparams = dialect_params(stream.dialect)
+            encoding = stream.encoding
+            countable = stream.byte_countable
+
+        if not is_byte_scannable(encoding):
+            raise ValueError(f"지연 로딩을 지원하지 않는 인코딩입니다: {encoding}")
+        if not countable:
+            # '\r'만 쓰는 줄바꿈이나 '"'가 아닌 따옴표는 바이트 스캔으로 레코드 경계를 찾을 수 없음
+            raise ValueError("지연 로딩을 지원하지 않는 CSV 형식입니다 (줄바꿈/따옴표)")
+        # utf-8-sig의 BOM은 헤더에만 있으므로 데이터 행은 utf-8로 디코딩
+        self.encoding = 'utf-8' if codecs.lookup(encoding).name == 'utf-8-sig' else encoding
+
+        self._file = open(self.file_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.offsets = self._build_offsets(self._mmap, self.header_row)
+        except BaseException:
+            self.close()
+            raise
+
+        print(f"🗂️ 행 오프셋 인덱스 생성: {len(self)}행 ({self.offsets.nbytes:,} bytes)")
+        return self
+
+    @staticmethod
+    def _build_offsets(buffer, header_row: int = 1) -> np.ndarray:
+        """헤더 다음부터 각 레코드의 시작 오프셋과 마지막 레코드의 끝 오프셋 배열을 생성"""
+        size = len(buffer)
+        ends = np.concatenate(list(iter_record_ends(buffer)) or [np.empty(0, dtype=np.int64)])
+        # 마지막 줄에 줄바꿈이 없으면 파일 끝을 레코드 끝으로 추가
+        if len(ends) == 0 or ends[-1] != size:
+            ends = np.append(ends, np.int64(size))
+        # ends[header_row - 1]은 헤더 레코드의 끝 = 첫 데이터 행의 시작 (앞은 머리말 줄)
+        return ends[header_row - 1:].astype(np.int64)
+
+    def __len__(self) -> int:
+        """데이터 행 수 (헤더 제외)"""
+        return max(0, len(self.offsets) - 1)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[List[str], List[List[str]]]:
+        """
+        행 번호(0부터, 헤더 제외) 또는 슬라이스로 정규화된 데이터 행을 반환
+
+        슬라이스는 연속된 바이트 구간을 한 번에 디코딩하므로 화면 단위 조회에 적합합니다.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self.rows(start, stop)
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("행 번호가 범위를 벗어났습니다")
+        rows = self.rows(index, index + 1)
+        return rows[0] if rows else []
+
+    def rows(self, start: int, stop: int) -> List[List[str]]:
+        """
+        [start, stop) 범위의 데이터 행을 디코딩하여 반환
+
+        Args:
+            start: 시작 행 번호 (0부터, 헤더 제외)
+            stop: 끝 행 번호 (미포함)
+        """
+        if self._mmap is None:
+            raise ValueError("파일이 열려 있지 않습니다")
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+
+        raw = self._mmap[int(self.offsets[start]):int(self.offsets[stop])]
+        text, _ = decode_with_fallback(raw, self.encoding)
+        reader = csv.reader(io.StringIO(text, newline=''), **self._fmtparams)
+        apply = self.plan.apply
+        return [apply(row) for row in reader]
+
+    def close(self) -> None:
+        """메모리 맵과 파일을 닫음"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'LazyCsvFile':
+        if self._mmap is None:
+            self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def open_lazy_csv(file_path: str) -> LazyCsvFile:
+    """LazyCsvFile을 생성하고 오프셋 인덱스까지 만든 상태로 반환하는 편의 함수"""
+    return LazyCsvFile(file_path).open()
@@ -0,0 +1,335 @@
+"""
+다중 파일 가져오기 모듈 (Multi-File Import)
+
+여러 계좌/여러 달의 거래내역 파일을 한 번에 읽어 거래일시 순 하나의 타임라인으로 합칩니다.
+- 파일 읽기와 인코딩 디코딩은 스레드 풀에서 실행 (디스크 대기 중첩),
+  스트리밍 기준(FileHandler.MAX_FILE_SIZE)보다 큰 파일은 메모리로 읽지 않고 정규화 프로세스가 파일에서 직접 스트리밍
+- 헤더 매핑/금액 정제/사전 인코딩/거래일시 정렬 순서 계산은 프로세스 풀에서 파일별로 실행
+  (전체 시간 ≈ 가장 큰 파일의 시간, Qt 스레드가 떠 있는 프로세스를 fork하지 않도록 spawn으로 시작)
+- 파일별로 정렬된 구간을 k-way 병합(정렬된 구간의 안정 정렬)하고 계좌 컬럼 추가
+- 병합은 행 대신 컬럼 단위로 모아 EncodedRows로 반환하며, 파일별 잔액 연속성 검사 결과도 함께 반환
+- MultiFileLoader는 위 과정을 작업 스레드에서 실행하고 결과를 시그널로 알림 (UI를 막지 않음)
+"""
+
+import io
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from openpyxl.utils.exceptions import InvalidFileException
+from PySide6.QtCore import QObject, Signal
+
+from .balance_check import check_rows
+from .columnar import DATE_HEADER, TIME_HEADER, parse_timestamps
+from .csv_stream import CsvRowStream
+from .encoded_rows import PLAIN_HEADERS, EncodedColumn, EncodedRows, column_values
+from .excel_sheets import merge_headers
+from .excel_stream import ExcelRowStream
+from .file_handler import FileHandler
+from .text_encoding import decode_with_fallback, detect_encoding
+
+
+# 병합 결과에 추가하는 계좌 컬럼 이름
+ACCOUNT_HEADER = "계좌"
+
+# 파일 읽기/디코딩 스레드 수
+READ_THREADS = 4
+
+# 한 번에 가져올 수 있는 파일 확장자
+MULTI_IMPORT_EXTENSIONS = ('.csv', '.xlsx')
+
+
+def read_statement(file_path: str) -> Dict:
+    """
+    거래내역 파일을 메모리로 읽고 CSV는 문자열로 디코딩 (스레드 풀 단계)
+
+    스트리밍 기준보다 큰 파일은 읽지 않고 정규화 단계가 파일에서 직접 스트리밍하도록 payload를 비워 둡니다.
+
+    Args:
+        file_path: 거래내역 파일 경로
+
+    Returns:
+        dict: 읽기 결과
+            - path: 파일 경로
+            - kind: 'csv' 또는 'excel'
+            - payload: 디코딩된 문자열 (CSV), 파일 바이트 (Excel) 또는 None (스트리밍)
+            - encoding: 디코딩에 사용한 인코딩 (Excel/스트리밍은 None)
+
+    Raises:
+        ValueError: 지원하지 않는 파일 형식인 경우
+        OSError: 파일을 읽을 수 없는 경우
+        UnicodeDecodeError: 어떤 대체 인코딩으로도 디코딩할 수 없는 경우
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in MULTI_IMPORT_EXTENSIONS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {ext}")
+    kind = 'csv' if ext == '.csv' else 'excel'
+    handler = FileHandler()
+    if handler.select_import_mode(os.path.getsize(file_path)) == handler.IMPORT_MODE_STREAMING:
+        return {'path': file_path, 'kind': kind, 'payload': None, 'encoding': None}
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if kind == 'excel':
+        return {'path': file_path, 'kind': kind, 'payload': data, 'encoding': None}
+    text, encoding = decode_with_fallback(data, detect_encoding(file_path))
+    return {'path': file_path, 'kind': 'csv', 'payload': text, 'encoding': encoding}
+
+
+def normalize_statement(task: Dict) -> Dict:
+    """
+    읽어 둔 거래내역을 정규화하고 거래일시 오름차순 정렬 순서를 계산 (프로세스 풀 단계)
+
+    Args:
+        task: read_statement 결과 + account_id (None이면 감지된 은행 프로필 이름)
+
+    Returns:
+        dict: 파일별 정규화 결과
+            - path, account_id: 파일 경로와 계좌 식별자
+            - headers: 표준 헤더 목록
+            - data: 원본 순서의 EncodedRows
+            - order: 거래일시 오름차순 행 번호 배열 (같은 시각은 원본 순서)
+            - keys: 정렬 키 (sort_keys, order 순서로 정렬된 값)
+            - malformed_rows: 컬럼 수 불일치 행 수
+            - balance_check: 원본 순서의 잔액 연속성 검사 결과
+            - error: 오류 메시지 (실패 시)
+    """
+    result = {'path': task['path'], 'account_id': task.get('account_id'), 'headers': [], 'data': [],
+              'order': np.empty(0, dtype=np.int64), 'keys': np.empty(0, dtype=np.int64),
+              'malformed_rows': 0, 'balance_check': None, 'error': None}
+    name = os.path.basename(task['path'])
+    payload = task['payload']
+    try:
+        if payload is None:
+            stream = (CsvRowStream if task['kind'] == 'csv' else ExcelRowStream)(task['path'])
+        elif task['kind'] == 'csv':
+            stream = CsvRowStream(name, opener=lambda: io.StringIO(payload, newline=''))
+        else:
+            stream = ExcelRowStream(name, opener=lambda: io.BytesIO(payload))
+        with stream:
+            headers = stream.headers
+            data = EncodedRows.from_chunks(headers, stream.iter_chunks())
+            if result['account_id'] is None:
+                result['account_id'] = stream.plan.profile_name
+            result['malformed_rows'] = stream.malformed_rows
+    except (OSError, ValueError, UnicodeDecodeError, InvalidFileException, zipfile.BadZipFile) as e:
+        result['error'] = str(e)
+        return result
+
+    result['headers'] = headers
+    result['data'] = data
+    result['balance_check'] = check_rows(headers, data)
+    keys = sort_keys(headers, data)
+    # 안정 정렬이므로 같은 시각의 행은 원래 순서 유지 (내림차순 내보내기는 뒤집힌 순서로 정렬됨)
+    result['order'] = np.argsort(keys, kind='stable')
+    result['keys'] = keys[result['order']]
+    return result
+
+
+def sort_keys(headers: List[str], rows: Sequence[List[str]]) -> np.ndarray:
+    """
+    행별 거래일시 정렬 키 (epoch 초 int64 배열, 컬럼 단위 벡터 변환)
+
+    거래일시를 해석할 수 없는 행은 int64 최댓값으로 파일 끝에 둡니다.
+    """
+    if DATE_HEADER not in headers:
+        return np.zeros(len(rows), dtype=np.int64)
+
+    def column(header: str) -> np.ndarray:
+        if header not in headers or not len(rows):
+            return np.full(len(rows), "", dtype=np.str_)
+        return np.array(column_values(headers, rows, header), dtype=np.str_)
+
+    timestamps = parse_timestamps(column(DATE_HEADER), column(TIME_HEADER))
+    keys = timestamps.astype(np.int64)
+    keys[np.isnat(timestamps)] = np.iinfo(np.int64).max
+    return keys
+
+
+def _merge_column(statements: List[Dict], header: str, order: np.ndarray) -> Union[EncodedColumn, List[str]]:
+    """파일별 컬럼을 이어 붙여 병합 순서로 모음 (헤더가 없는 파일은 빈 값)"""
+    parts = [s['data'].column(header) if header in s['headers'] else None for s in statements]
+    if header in PLAIN_HEADERS:
+        values = np.empty(len(order), dtype=object)
+        start = 0
+        for s, part in zip(statements, parts):
+            values[start:start + len(s['data'])] = part if part is not None else ""
+            start += len(s['data'])
+        return values[order].tolist()
+
+    # 파일마다 다른 코드 표를 하나의 코드 표로 바꾼 뒤 코드 배열만 NumPy로 모음
+    index: Dict[str, int] = {}
+    codes = []
+    for s, part in zip(statements, parts):
+        if part is None:
+            codes.append(np.full(len(s['data']), index.setdefault("", len(index)), dtype=np.uint32))
+            continue
+        remap = np.array([index.setdefault(v, len(index)) for v in part.values], dtype=np.uint32)
+        codes.append(remap[np.frombuffer(part.codes, dtype=np.uint32)] if len(part) else np.empty(0, dtype=np.uint32))
+    return EncodedColumn.from_codes(np.concatenate(codes)[order], list(index))
+
+
+def merge_statements(statements: List[Dict]) -> EncodedRows:
+    """
+    파일별로 정렬된 결과를 거래일시 순으로 k-way 병합
+
+    파일별 정렬 키를 파일 순서대로 이어 붙여 안정 정렬(timsort)하면 이미 정렬된 k개 구간을
+    병합하는 것과 같으므로, 파이썬 힙 대신 NumPy로 병합 순서를 한 번에 계산합니다.
+    같은 시각의 행은 파일 순서, 파일 안에서는 정렬된 순서를 유지합니다.
+    행을 만들지 않고 컬럼 단위로 모으며, 텍스트 컬럼은 파일별 코드 표만 합칩니다.
+
+    Args:
+        statements: normalize_statement 결과 목록 (파일 순서, 실패한 파일 제외)
+
+    Returns:
+        EncodedRows: 공통 헤더(마지막 컬럼: 계좌)의 병합 결과
+    """
+    headers = merge_headers([s['headers'] for s in statements], ACCOUNT_HEADER)
+    offsets = np.cumsum([0] + [len(s['data']) for s in statements[:-1]])
+    runs = np.concatenate([s['order'] + offset for s, offset in zip(statements, offsets)])
+    order = runs[np.argsort(np.concatenate([s['keys'] for s in statements]), kind='stable')]
+
+    columns = [_merge_column(statements, h, order) for h in headers[:-1]]
+    accounts = list(dict.fromkeys(s['account_id'] for s in statements))
+    account_codes = np.concatenate([np.full(len(s['data']), accounts.index(s['account_id']), dtype=np.uint32)
+                                    for s in statements])
+    columns.append(EncodedColumn.from_codes(account_codes[order], accounts))
+    return EncodedRows.from_columns(headers, columns)
+
+
+def load_statements(file_paths: List[str], account_ids: Optional[Dict[str, str]] = None,
+                    workers: Optional[int] = None,
+                    progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """
+    여러 거래내역 파일을 동시에 읽어 하나의 타임라인으로 병합
+
+    파일 읽기가 끝나는 대로 정규화 작업을 제출하므로 읽기와 정규화가 겹쳐서 실행됩니다.
+
+    Args:
+        file_paths: 거래내역 파일 경로 목록
+        account_ids: 파일 경로 → 계좌 식별자 (없는 파일은 감지된 은행 프로필 이름)
+        workers: 정규화 프로세스 수 (기본값: min(파일 수, CPU 수), 1이면 현재 프로세스에서 실행)
+        progress: 파일 하나의 정규화가 끝날 때마다 (완료 파일 수, 전체 파일 수)로 호출
+
+    Returns:
+        dict: parse_csv_all과 같은 형식의 결과 (headers 마지막 컬럼: 계좌)
+            - files: 파일 경로 → 행 수 (실패한 파일은 오류 메시지)
+            - accounts: 병합된 계좌 식별자 목록 (파일 순서)
+            - balance_checks: 파일 경로 → 잔액 연속성 검사 결과
+    """
+    result = {
+        'success': False,
+        'headers': [],
+        'data': [],
+        'total_rows': 0,
+        'files': {},
+        'accounts': [],
+        'balance_checks': {},
+        'error': None
+    }
+    if not file_paths:
+        result['error'] = "가져올 파일이 없습니다"
+        return result
+
+    file_paths = list(dict.fromkeys(file_paths))
+    account_ids = account_ids or {}
+    workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    total = len(file_paths)
+    statements: Dict[str, Dict] = {}
+
+    def finish(statement: Dict) -> None:
+        statements[statement['path']] = statement
+        if progress:
+            progress(len(statements), total)
+
+    pool = (ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            if workers > 1 else None)
+    try:
+        with ThreadPoolExecutor(max_workers=min(READ_THREADS, total)) as readers:
+            reads = {readers.submit(read_statement, path): path for path in file_paths}
+            pending = []
+            for future in as_completed(reads):
+                path = reads[future]
+                try:
+                    task = dict(future.result(), account_id=account_ids.get(path))
+                except (OSError, ValueError, UnicodeDecodeError) as e:
+                    finish({'path': path, 'error': f"파일 읽기 오류: {e}"})
+                    continue
+                if pool is None:
+                    finish(normalize_statement(task))
+                else:
+                    pending.append(pool.submit(normalize_statement, task))
+            for future in as_completed(pending):
+                finish(future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    if pool is not None:
+        print(f"⚡ {total}개 파일을 {workers}개 프로세스로 병렬 정규화")
+
+    ordered = [statements[path] for path in file_paths]
+    parsed = [s for s in ordered if s['error'] is None]
+    for statement in ordered:
+        if statement['error'] is not None:
+            print(f"⚠️ '{os.path.basename(statement['path'])}' 파일을 건너뜁니다: {statement['error']}")
+    result['files'] = {s['path']: (len(s['data']) if s['error'] is None else s['error']) for s in ordered}
+    if not parsed:
+        result['error'] = "가져올 수 있는 거래내역 파일이 없습니다"
+        return result
+
+    data = merge_statements(parsed)
+    result['headers'] = data.headers
+    result['data'] = data
+    result['total_rows'] = len(data)
+    result['accounts'] = list(dict.fromkeys(s['account_id'] for s in parsed))
+    result['balance_checks'] = {s['path']: s['balance_check'] for s in parsed}
+    result['success'] = True
+    print(f"📊 {len(parsed)}개 파일, {len(result['accounts'])}개 계좌의 거래 {len(data)}건을 거래일시 순으로 병합")
+    return result
+
+
+class MultiFileLoader(QObject):
+    """load_statements를 작업 스레드에서 실행하는 클래스"""
+
+    # 파일 하나의 정규화가 끝날 때마다 (완료 파일 수, 전체 파일 수)와 함께 발생
+    progress = Signal(int, int)
+    # 병합이 끝나면 load_statements 결과와 함께 발생 (작업 스레드에서 발생, 대기열 연결로 전달)
+    finished = Signal(object)
+
+    def __init__(self, file_paths: List[str], account_ids: Optional[Dict[str, str]] = None,
+                 workers: Optional[int] = None, parent: Optional[QObject] = None):
+        """
+        MultiFileLoader 초기화
+
+        Args:
+            file_paths: 거래내역 파일 경로 목록
+            account_ids: 파일 경로 → 계좌 식별자
+            workers: 정규화 프로세스 수
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.file_paths = list(file_paths)
+        self.account_ids = account_ids
+        self.workers = workers
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """작업 스레드에서 가져오기를 시작"""
+        self._worker = threading.Thread(target=self._run, name="multi-file-loader", daemon=True)
+        self._worker.start()
+
+    def wait(self) -> None:
+        """진행 중인 가져오기가 끝날 때까지 대기"""
+        if self._worker is not None:
+            self._worker.join()
+
+    def _run(self) -> None:
+        try:
+            result = load_statements(self.file_paths, self.account_ids, self.workers, self.progress.emit)
+        except Exception as e:
+            print(f"❌ 여러 파일 가져오기 중 오류 발생: {e}")
+            result = {'success': False, 'headers': [], 'data': [], 'total_rows': 0, 'error': str(e)}
+        self.finished.emit(result)
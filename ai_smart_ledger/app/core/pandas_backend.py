@@ -0,0 +1,209 @@
+"""
+pandas 파싱 백엔드 모듈 (Pandas Backend)
+
+전체 파싱의 행 읽기를 셀 단위 파이썬 반복 대신 pandas로 처리합니다.
+- CSV: pandas.read_csv C 엔진으로 헤더 다음 바이트 위치부터 읽기 (모든 컬럼 문자열 dtype 지정)
+- Excel: pandas.read_excel로 헤더 다음 행부터 읽고 셀 값은 cell_to_text와 같은 형태로 변환
+- 헤더 행 탐색/인코딩/방언 감지/은행 헤더 매핑은 기존 스트림(CsvRowStream, ExcelRowStream) 결과를 그대로 사용
+- 공백 제거, 금액 컬럼의 천 단위 쉼표 제거/빈 값 0 처리는 컬럼별 고유값에만 적용 (RowPlan.apply와 같은 결과)
+- 텍스트 컬럼은 pandas.factorize 코드로 바로 사전 인코딩 (EncodedRows)
+- 컬럼 수가 헤더와 다른 행, 디코딩 실패 등 결과가 달라질 수 있는 입력은 기존 파이썬 경로로 읽음
+- pandas는 선택 의존성 (설치되지 않았으면 BACKEND_PANDAS를 선택할 수 없음)
+"""
+
+import codecs
+import csv
+import mmap
+import os
+from typing import List, Sequence
+
+import numpy as np
+
+from .bank_profiles import RowPlan, clean_text
+from .csv_scan import records_have_fields, skip_records
+from .csv_stream import CsvRowStream
+from .encoded_rows import EncodedColumn, EncodedRows, text_headers
+from .excel_stream import ExcelRowStream, cell_to_text
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas 미설치 환경
+    pd = None
+
+
+# 파싱 백엔드
+BACKEND_PYTHON = 'python'
+BACKEND_PANDAS = 'pandas'
+BACKENDS = (BACKEND_PYTHON, BACKEND_PANDAS)
+
+
+class _Unsupported(Exception):
+    """pandas 경로로는 파이썬 경로와 같은 결과를 보장할 수 없는 입력 (사유 메시지 포함)"""
+
+
+def pandas_available() -> bool:
+    """pandas 백엔드를 사용할 수 있는지 여부"""
+    return pd is not None
+
+
+def check_backend(backend: str) -> str:
+    """
+    파싱 백엔드 이름을 검증
+
+    Returns:
+        str: 검증된 백엔드 이름
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드이거나 pandas가 설치되어 있지 않은 경우
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 파싱 백엔드입니다: {backend} (사용 가능: {', '.join(BACKENDS)})")
+    if backend == BACKEND_PANDAS and not pandas_available():
+        raise ValueError("pandas가 설치되어 있지 않아 pandas 백엔드를 사용할 수 없습니다")
+    return backend
+
+
+def read_csv_stream(stream: CsvRowStream) -> EncodedRows:
+    """
+    헤더까지 읽힌 CSV 스트림의 데이터 행을 pandas.read_csv로 읽어 정규화
+
+    따옴표 밖 구분자 수로 모든 행의 컬럼 수가 헤더와 같은지 먼저 확인하고,
+    그렇지 않거나 pandas로 읽을 수 없는 입력이면 스트림을 그대로 읽습니다 (결과는 항상 파이썬 경로와 동일).
+    스트림의 rows_read, malformed_rows도 결과에 맞게 갱신합니다.
+
+    Args:
+        stream: open()이 완료된 경로 기반 CsvRowStream
+
+    Returns:
+        EncodedRows: 정규화된 데이터 행
+    """
+    try:
+        frame = _read_csv_frame(stream)
+    except (_Unsupported, UnicodeDecodeError) as e:
+        print(f"ℹ️ pandas 백엔드 대신 기본 파서로 읽습니다: {e}")
+        return EncodedRows.from_chunks(stream.headers, stream.iter_chunks())
+
+    data_rows = _encode_frame(stream.plan, frame)
+    stream.rows_read = len(data_rows)
+    return data_rows
+
+
+def read_excel_stream(stream: ExcelRowStream) -> EncodedRows:
+    """
+    헤더까지 읽힌 Excel 스트림의 데이터 행을 pandas.read_excel로 읽어 정규화
+
+    빈 행은 건너뛰고, 헤더 범위 밖에 값이 있는 행이나 오류 셀(#N/A 등)이 있으면 스트림을 그대로 읽습니다.
+    스트림의 rows_read, malformed_rows도 결과에 맞게 갱신합니다.
+
+    Args:
+        stream: open()이 완료된 경로 기반 ExcelRowStream
+
+    Returns:
+        EncodedRows: 정규화된 데이터 행
+    """
+    try:
+        frame = _read_excel_frame(stream)
+    except _Unsupported as e:
+        print(f"ℹ️ pandas 백엔드 대신 기본 파서로 읽습니다: {e}")
+        return EncodedRows.from_chunks(stream.headers, stream.iter_chunks())
+
+    data_rows = _encode_frame(stream.plan, frame)
+    stream.rows_read = len(data_rows)
+    return data_rows
+
+
+def _read_csv_frame(stream: CsvRowStream) -> 'pd.DataFrame':
+    """헤더 다음 레코드부터 모든 컬럼을 문자열로 읽은 DataFrame (컬럼 이름은 0부터의 위치)"""
+    dialect = stream.dialect
+    delimiter = dialect.delimiter
+    if not stream.byte_countable:
+        raise _Unsupported(f"바이트 위치로 읽을 수 없는 입력 ({stream.encoding}, 줄바꿈/따옴표)")
+    if (dialect.escapechar or dialect.quoting != csv.QUOTE_MINIMAL
+            or not delimiter.isascii() or delimiter.isalnum()):
+        raise _Unsupported("지원하지 않는 CSV 방언")
+
+    header_count = len(stream.raw_headers)
+    with open(stream.file_path, 'rb') as f:
+        if os.path.getsize(stream.file_path) == 0:
+            raise _Unsupported("빈 파일")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start = skip_records(buffer, stream.header_row)
+            if start < len(buffer) and not records_have_fields(buffer, header_count, start, delimiter):
+                raise _Unsupported("컬럼 수가 헤더와 다른 행이 있음")
+            size = len(buffer)
+
+        if start >= size:
+            return pd.DataFrame({idx: pd.Series([], dtype=object) for idx in range(header_count)})
+        f.seek(start)
+        # utf-8-sig의 BOM은 헤더 앞에만 있으므로 데이터 구간은 utf-8로 디코딩
+        encoding = 'utf-8' if codecs.lookup(stream.encoding).name == 'utf-8-sig' else stream.encoding
+        return pd.read_csv(
+            f,
+            encoding=encoding,
+            header=None,
+            names=range(header_count),
+            index_col=False,
+            dtype=object,
+            na_filter=False,
+            skip_blank_lines=False,
+            engine='c',
+            sep=delimiter,
+            quotechar=dialect.quotechar,
+            doublequote=dialect.doublequote,
+            skipinitialspace=dialect.skipinitialspace,
+        )
+
+
+def _read_excel_frame(stream: ExcelRowStream) -> 'pd.DataFrame':
+    """헤더 다음 행부터 셀 값을 CSV 셀과 같은 문자열로 변환한 DataFrame (빈 행 제외)"""
+    if stream.opener is not None:
+        raise _Unsupported("경로로 열 수 없는 입력")
+
+    header_count = len(stream.raw_headers)
+    # 빈 셀은 '', 오류 셀은 NaN (na_filter=False이므로 NaN은 오류 셀에서만 생김)
+    frame = pd.read_excel(stream.file_path, sheet_name=stream.sheet_title, header=None,
+                          skiprows=stream.header_row, dtype=object, na_filter=False, engine='openpyxl')
+    frame = frame[(frame != '').any(axis=1)] if len(frame.columns) else frame
+
+    columns = {}
+    for idx in range(max(header_count, len(frame.columns))):
+        values = frame[idx].tolist() if idx in frame.columns else [''] * len(frame)
+        if idx >= header_count:
+            if any(value != '' for value in values):
+                raise _Unsupported("헤더 범위 밖에 값이 있는 행이 있음")
+            continue
+        if not all(type(value) is str for value in values):
+            if any(value != value for value in values):
+                raise _Unsupported("오류 셀이 있음")
+            values = [cell_to_text(value) for value in values]
+        columns[idx] = pd.Series(values, dtype=object)
+    return pd.DataFrame(columns)
+
+
+def _encode_frame(plan: RowPlan, frame: 'pd.DataFrame') -> EncodedRows:
+    """
+    문자열 DataFrame에 컬럼별 변환 계획을 적용하여 EncodedRows로 변환
+
+    컬럼마다 pandas.factorize로 고유값을 찾은 뒤 고유값에만 공백 제거/금액 정제를 적용하므로,
+    셀 단위 파이썬 호출 수가 행 수가 아니라 고유값 수에 비례합니다.
+    텍스트 컬럼은 factorize 코드를 그대로 사전 인코딩 코드로 사용합니다.
+    """
+    encoded = set(text_headers(plan.headers))
+    columns: List[Sequence[str]] = []
+    for idx, (header, transform) in enumerate(zip(plan.headers, plan.transforms)):
+        codes, uniques = pd.factorize(frame[idx])
+        if transform is clean_text:
+            cleaned = [value.strip() for value in uniques]
+        else:
+            cleaned = [transform(value.strip()) for value in uniques]
+
+        if header not in encoded:
+            columns.append(np.array(cleaned, dtype=object)[codes].tolist() if len(codes) else [])
+            continue
+        values = list(dict.fromkeys(cleaned))
+        if len(values) != len(cleaned):
+            # 공백 제거 후 같아진 고유값은 하나의 코드로 합침
+            index = {value: code for code, value in enumerate(values)}
+            codes = np.array([index[value] for value in cleaned], dtype=np.int64)[codes]
+        columns.append(EncodedColumn.from_codes(codes, values))
+    return EncodedRows.from_columns(plan.headers, columns)
@@ -0,0 +1,121 @@
+"""
+병렬 CSV 파싱 모듈 (Parallel CSV Parse)
+
+대용량 CSV 파일을 레코드 경계 기준 바이트 구간으로 나눠 여러 프로세스에서 파싱합니다.
+- 따옴표를 고려한 레코드 경계 탐색 (csv_scan)
+- 구간별 결과를 원래 순서대로 병합하여 원본 행 번호 유지
+- 작은 파일이나 바이트 스캔이 불가능한 인코딩은 단일 프로세스 경로 사용
+- 병합 결과는 텍스트 컬럼을 사전 인코딩한 EncodedRows로 반환
+"""
+
+import codecs
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .csv_scan import find_record_boundaries, skip_records
+from .csv_stream import CsvRowStream, dialect_params
+from .encoded_rows import EncodedRows
+from .text_encoding import decode_with_fallback
+
+
+# 이 크기 미만의 파일은 단일 프로세스로 파싱
+PARALLEL_MIN_SIZE = 8 * 1024 * 1024
+
+# 워커당 나눌 구간 수 (구간 크기 편차 완화)
+CHUNKS_PER_WORKER = 4
+
+
+def split_byte_ranges(file_path: str, chunk_count: int, header_row: int = 1) -> List[Tuple[int, int]]:
+    """
+    헤더 다음부터 파일 끝까지를 레코드 경계에 맞춘 바이트 구간으로 분할
+
+    Args:
+        file_path: CSV 파일 경로
+        chunk_count: 목표 구간 수
+        header_row: 헤더 레코드 번호 (1부터, 머리말 줄이 있으면 그만큼 큼)
+
+    Returns:
+        List[Tuple[int, int]]: (시작, 끝) 바이트 오프셋 목록
+    """
+    file_size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # 첫 번째 경계 = 헤더 레코드의 끝
+        data_start = skip_records(mm, header_row)
+        step = max(1, (file_size - data_start) // chunk_count)
+        targets = [data_start + step * i for i in range(1, chunk_count)]
+        boundaries = find_record_boundaries(mm, targets, start=data_start)
+
+    edges = [data_start] + boundaries + [file_size]
+    return [(s, e) for s, e in zip(edges, edges[1:]) if e > s]
+
+
+def parse_byte_range(args: Tuple) -> Tuple[List[List[str]], List[int]]:
+    """
+    바이트 구간 하나를 디코딩하고 정규화 (워커 프로세스에서 실행)
+
+    Args:
+        args: (파일 경로, 시작, 끝, 인코딩, 포맷 파라미터, 컬럼별 변환 계획)
+
+    Returns:
+        Tuple: (정규화된 행 목록, 컬럼 수가 맞지 않는 행의 구간 내 인덱스 목록)
+    """
+    file_path, start, end, encoding, fmtparams, plan = args
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        text, _ = decode_with_fallback(f.read(end - start), encoding)
+
+    header_count = len(plan.raw_headers)
+    apply = plan.apply
+    rows = []
+    malformed = []
+    for idx, row in enumerate(csv.reader(io.StringIO(text, newline=''), **fmtparams)):
+        if len(row) != header_count:
+            malformed.append(idx)
+        rows.append(apply(row))
+    return rows, malformed
+
+
+def parse_stream_parallel(stream: CsvRowStream, workers: Optional[int] = None) -> EncodedRows:
+    """
+    헤더까지 읽힌 스트림의 설정(인코딩/방언/헤더)으로 데이터 행을 병렬 파싱
+
+    파일이 작거나 바이트 스캔으로 레코드 경계를 찾을 수 없으면 (CsvRowStream.byte_countable) 스트림을 그대로 읽습니다.
+    스트림의 rows_read, malformed_rows도 병합 결과로 갱신합니다.
+
+    Args:
+        stream: open()이 완료된 CsvRowStream
+        workers: 프로세스 수 (기본값: CPU 수)
+
+    Returns:
+        EncodedRows: 원본 순서대로 병합된 정규화 행 목록
+    """
+    workers = workers or os.cpu_count() or 1
+    file_size = os.path.getsize(stream.file_path)
+    if workers <= 1 or file_size < PARALLEL_MIN_SIZE or not stream.byte_countable:
+        return EncodedRows.from_chunks(stream.headers, stream.iter_chunks())
+
+    ranges = split_byte_ranges(stream.file_path, workers * CHUNKS_PER_WORKER, stream.header_row)
+    # utf-8-sig의 BOM은 헤더 구간에만 있으므로 데이터 구간은 utf-8로 디코딩
+    encoding = 'utf-8' if codecs.lookup(stream.encoding).name == 'utf-8-sig' else stream.encoding
+    fmtparams = dialect_params(stream.dialect)
+    tasks = [(stream.file_path, s, e, encoding, fmtparams, stream.plan) for s, e in ranges]
+
+    data_rows = EncodedRows(stream.headers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map은 제출 순서대로 결과를 반환하므로 원본 행 순서가 유지됨
+        for rows, malformed in executor.map(parse_byte_range, tasks):
+            first_row_num = len(data_rows) + stream.header_row + 1  # 헤더 다음부터 시작
+            for idx in malformed:
+                stream.malformed_rows += 1
+                if stream.malformed_rows <= 3:  # 처음 3개 오류만 로깅
+                    print(f"⚠️ {first_row_num + idx}행: 컬럼 수 불일치 "
+                          f"(헤더: {len(stream.raw_headers)}, 데이터: {len(rows[idx])})")
+            data_rows.extend(rows)
+
+    stream.rows_read = len(data_rows)
+    print(f"⚡ {len(ranges)}개 구간을 {workers}개 프로세스로 병렬 파싱")
+    return data_rows
@@ -0,0 +1,158 @@
+"""
+파싱 캐시 모듈 (Parse Cache)
+
+같은 거래내역 파일을 다시 열 때 디코딩/정규화를 건너뛰도록 파싱 결과를 디스크에 보관합니다.
+- 파일 내용 해시(calculate_file_hash와 동일한 MD5)를 키로 사용
+- 결과는 pickle + zlib 압축 바이너리로 저장 (SQLite DB 옆 parse_cache 폴더)
+- 전체 크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- 파서 버전이나 은행 프로필 설정이 바뀌면 기존 항목은 자동으로 무효화
+"""
+
+import os
+import pickle
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+
+from .bank_profiles import profiles_version
+
+
+# 파싱 결과 형식이 바뀌면 올려서 기존 캐시를 무효화
+PARSER_VERSION = 4
+
+# 캐시 폴더 전체 크기 상한 (바이트)
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+CACHE_SUFFIX = ".bin"
+CACHE_MAGIC = b"ASLPC1"
+
+
+def cache_version() -> str:
+    """캐시 항목 이름에 포함되는 버전 키 (파서 버전 + 프로필 버전)"""
+    return f"p{PARSER_VERSION}-{profiles_version()}"
+
+
+class ParseCache:
+    """파일 내용 해시를 키로 하는 디스크 기반 파싱 결과 캐시 클래스"""
+
+    def __init__(self, cache_dir, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        ParseCache 초기화 (폴더는 첫 저장 시 생성)
+
+        Args:
+            cache_dir: 캐시 파일을 저장할 폴더 경로
+            max_bytes: 캐시 폴더 전체 크기 상한 (바이트)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.version = cache_version()
+
+    def _entry_path(self, file_hash: str, file_type: str) -> Path:
+        return self.cache_dir / f"{file_hash}-{file_type.lower()}-{self.version}{CACHE_SUFFIX}"
+
+    def get(self, file_hash: str, file_type: str) -> Optional[Dict]:
+        """
+        캐시된 파싱 결과를 반환 (없거나 손상된 경우 None)
+
+        Args:
+            file_hash: 파일 내용 해시
+            file_type: 파일 종류 ('CSV', 'Excel')
+        """
+        path = self._entry_path(file_hash, file_type)
+        try:
+            with open(path, 'rb') as f:
+                magic = f.read(len(CACHE_MAGIC))
+                payload = f.read()
+            if magic != CACHE_MAGIC:
+                raise ValueError("캐시 형식이 올바르지 않습니다")
+            result = pickle.loads(zlib.decompress(payload))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ 손상된 파싱 캐시 삭제: {path.name} ({e})")
+            self._remove(path)
+            return None
+
+        # LRU 기준 시각 갱신
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, file_hash: str, file_type: str, result: Dict) -> bool:
+        """
+        성공한 파싱 결과를 캐시에 저장하고 크기 상한에 맞춰 오래된 항목을 정리
+
+        Args:
+            file_hash: 파일 내용 해시
+            file_type: 파일 종류 ('CSV', 'Excel')
+            result: 파싱 결과 딕셔너리
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if not file_hash or not result.get('success'):
+            return False
+
+        path = self._entry_path(file_hash, file_type)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL), 1)
+            if len(payload) > self.max_bytes:
+                return False
+            with open(tmp_path, 'wb') as f:
+                f.write(CACHE_MAGIC)
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ 파싱 캐시 저장 실패: {e}")
+            self._remove(tmp_path)
+            return False
+
+        self._evict(keep=path)
+        return True
+
+    def clear(self) -> None:
+        """캐시 항목을 모두 삭제"""
+        for path in self._entries():
+            self._remove(path)
+
+    def total_size(self) -> int:
+        """현재 캐시 폴더의 전체 항목 크기 (바이트)"""
+        return sum(path.stat().st_size for path in self._entries())
+
+    def _entries(self):
+        if not self.cache_dir.is_dir():
+            return []
+        return list(self.cache_dir.glob(f"*{CACHE_SUFFIX}"))
+
+    def _evict(self, keep: Path) -> None:
+        """버전이 다른 항목을 지우고, 크기 상한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        entries = []
+        for path in self._entries():
+            if not path.name.endswith(f"-{self.version}{CACHE_SUFFIX}"):
+                self._remove(path)
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,130 @@
+"""
+파싱 세션 모듈 (Parse Session)
+
+파일을 한 번만 읽어 미리보기와 전체 데이터를 함께 제공합니다.
+- 파일 확장자에 따른 CSV/Excel 파서 선택
+- 인코딩/방언 감지와 파일 읽기를 한 번만 수행
+- 미리보기는 전체 데이터의 첫 N행으로 구성
+- 시트가 여러 개인 XLSX 통합 문서는 모든 시트를 거래일시 순으로 병합
+- 파싱 캐시가 주어지면 같은 내용의 파일은 다시 파싱하지 않음
+"""
+
+import os
+from typing import Dict, Optional
+
+from .file_hash import compute_file_hash
+from .excel_sheets import list_sheets
+from .file_parser import FileParser
+from .parse_cache import ParseCache
+
+
+class ParseSession:
+    """파일 하나에 대한 단일 패스 파싱 세션 클래스"""
+
+    # 확장자 → 파일 종류
+    FILE_TYPES = {
+        '.csv': 'CSV',
+        '.xls': 'Excel',
+        '.xlsx': 'Excel',
+    }
+
+    def __init__(self, file_path: str, preview_rows: int = 5, parser: Optional[FileParser] = None,
+                 cache: Optional[ParseCache] = None):
+        """
+        ParseSession 초기화
+
+        Args:
+            file_path: 파싱할 파일 경로 (CSV 또는 Excel)
+            preview_rows: 미리보기에 담을 데이터 행 수
+            parser: 사용할 파서 인스턴스 (기본값: FileParser)
+            cache: 파싱 결과 캐시 (기본값: 캐시 사용 안 함)
+        """
+        self.file_path = file_path
+        self.preview_rows = preview_rows
+        self.parser = parser if parser is not None else FileParser()
+        self.cache = cache
+        self.file_hash: Optional[str] = None
+        self.from_cache = False
+        self.file_ext = os.path.splitext(file_path)[1].lower()
+        self.file_type = self.FILE_TYPES.get(self.file_ext)
+        self.result: Optional[Dict] = None
+        self.preview: Optional[Dict] = None
+
+    def run(self) -> Dict:
+        """
+        파일 전체를 한 번 파싱하고 같은 결과에서 미리보기를 만듦
+
+        Returns:
+            dict: 전체 파싱 결과 (parse_csv_all과 동일한 형식)
+        """
+        if self.file_type is not None and self.cache is not None:
+            result = self._load_cached()
+        elif self.file_type is not None:
+            result = self._parse()
+        else:
+            result = {
+                'success': False,
+                'headers': [],
+                'data': [],
+                'total_rows': 0,
+                'error': f"지원하지 않는 파일 형식: {self.file_ext}"
+            }
+
+        self.result = result
+        self.preview = self.build_preview(result, self.preview_rows)
+        return result
+
+    def _parse(self) -> Dict:
+        """파일 종류에 맞는 파서로 전체 데이터를 파싱"""
+        if self.file_type == 'CSV':
+            if self.file_hash:
+                # 이미 계산한 해시로 인코딩 감지 결과를 재사용
+                return self.parser.parse_csv_all(self.file_path, file_hash=self.file_hash)
+            return self.parser.parse_csv_all(self.file_path)
+        if self._sheet_count() > 1:
+            return self.parser.parse_excel_all_sheets(self.file_path)
+        return self.parser.parse_excel_all(self.file_path)
+
+    def _sheet_count(self) -> int:
+        """XLSX 통합 문서의 시트 수 (XLS이거나 읽을 수 없으면 0 → 활성 시트만 파싱)"""
+        if self.file_ext != '.xlsx':
+            return 0
+        try:
+            return len(list_sheets(self.file_path))
+        except Exception:
+            # 손상된 파일 등은 parse_excel_all이 오류 결과를 만들도록 넘김
+            return 0
+
+    def _load_cached(self) -> Dict:
+        """캐시에 같은 내용의 파싱 결과가 있으면 사용하고, 없으면 파싱 후 저장"""
+        try:
+            self.file_hash = compute_file_hash(self.file_path)
+        except OSError:
+            # 해시를 계산할 수 없으면 파서가 오류 결과를 만들도록 그대로 진행
+            return self._parse()
+
+        cached = self.cache.get(self.file_hash, self.file_type)
+        if cached is not None:
+            self.from_cache = True
+            print(f"⚡ 파싱 캐시 사용: {cached['total_rows']}개 행 (파싱 생략)")
+            return cached
+
+        result = self._parse()
+        self.cache.put(self.file_hash, self.file_type, result)
+        return result
+
+    @staticmethod
+    def build_preview(result: Dict, preview_rows: int) -> Dict:
+        """
+        전체 파싱 결과에서 미리보기용 결과를 구성
+
+        Args:
+            result: 전체 파싱 결과
+            preview_rows: 미리보기 행 수
+
+        Returns:
+            dict: parse_csv_preview와 동일한 형식의 미리보기 결과
+        """
+        preview = dict(result)
+        preview['data'] = result.get('data', [])[:preview_rows]
+        return preview
@@ -0,0 +1,264 @@
+"""
+텍스트 인코딩 모듈 (Text Encoding)
+
+CSV 파일의 인코딩을 한 번만 감지하고, 디코딩 도중 실패하면 실패 지점부터 대체 인코딩으로 이어서 디코딩합니다.
+- BOM 검사 (utf-8-sig, utf-16)
+- 파일 앞/중간/끝 여러 구간을 표본으로 후보 인코딩을 엄격하게 검증
+- 감지 결과는 파일 내용 해시별로 메모리에 캐시
+- 줄 단위 경계에서 대체 인코딩으로 전환하므로 파일을 처음부터 다시 읽지 않음
+"""
+
+import codecs
+import io
+import os
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
+
+import chardet
+
+
+# BOM → 인코딩 (긴 BOM부터 검사)
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# 표본 구간으로 검증할 후보 인코딩 (순서대로 시도)
+CANDIDATE_ENCODINGS = ('utf-8', 'cp949')
+
+# 디코딩 실패 시 전환할 대체 인코딩 순서
+FALLBACK_ENCODINGS = ('utf-8', 'cp949')
+
+# chardet 결과 중 상위 호환 인코딩으로 바꿔 쓸 것 (euc-kr 확장 한글은 cp949에만 있음)
+ENCODING_UPGRADES = {
+    'euc_kr': 'cp949',
+    'ascii': 'utf-8',
+}
+
+# 표본 구간 수와 구간당 바이트 수
+SAMPLE_COUNT = 5
+SAMPLE_SIZE = 64 * 1024
+
+# 한 번에 디코딩할 바이트 수 (줄바꿈 경계에 맞춰 자름)
+DECODE_BLOCK_SIZE = 64 * 1024
+
+# 파일 해시별 감지 결과 캐시 크기
+DETECTION_CACHE_SIZE = 256
+
+_detection_cache: 'OrderedDict[str, str]' = OrderedDict()
+
+
+def normalize_encoding(encoding: str) -> str:
+    """codecs 표준 이름으로 바꾸고 상위 호환 인코딩이 있으면 그것으로 변환"""
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return encoding
+    return ENCODING_UPGRADES.get(name, name)
+
+
+def detect_bom(head: bytes) -> Optional[str]:
+    """파일 앞부분의 BOM으로 인코딩을 판별 (BOM이 없으면 None)"""
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
+
+def read_samples(file_path: str, count: int = SAMPLE_COUNT, size: int = SAMPLE_SIZE) -> List[bytes]:
+    """
+    파일 앞/중간/끝에서 줄바꿈 경계에 맞춘 표본 구간을 읽음
+
+    Args:
+        file_path: 파일 경로
+        count: 표본 구간 수
+        size: 구간당 바이트 수
+
+    Returns:
+        List[bytes]: 비ASCII 바이트가 포함된 표본 목록
+    """
+    file_size = os.path.getsize(file_path)
+    if file_size <= size * count:
+        starts = [0]
+        size = file_size
+    else:
+        last = file_size - size
+        starts = [last * i // (count - 1) for i in range(count)]
+
+    samples = []
+    with open(file_path, 'rb') as f:
+        for start in starts:
+            f.seek(start)
+            data = f.read(size)
+            # 중간 구간은 첫 줄바꿈 다음부터, 파일 끝이 아니면 마지막 줄바꿈까지만 사용
+            if start > 0:
+                data = data[data.find(b'\n') + 1:]
+            if start + size < file_size:
+                data = data[:data.rfind(b'\n') + 1]
+            if data and not data.isascii():
+                samples.append(data)
+    return samples
+
+
+def _decodes(samples: List[bytes], encoding: str) -> bool:
+    try:
+        for data in samples:
+            data.decode(encoding)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_encoding(file_path: str, file_hash: Optional[str] = None) -> str:
+    """
+    BOM과 여러 표본 구간을 검사하여 파일 인코딩을 한 번에 결정
+
+    Args:
+        file_path: CSV 파일 경로
+        file_hash: 파일 내용 해시 (주어지면 감지 결과를 캐시)
+
+    Returns:
+        str: 감지된 인코딩 (감지 실패 시 'utf-8')
+    """
+    if file_hash and file_hash in _detection_cache:
+        _detection_cache.move_to_end(file_hash)
+        return _detection_cache[file_hash]
+
+    encoding = 'utf-8'
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(4)
+        encoding = detect_bom(head) or _detect_from_samples(read_samples(file_path))
+    except OSError:
+        # 읽을 수 없는 파일은 이후 단계에서 오류 처리
+        return encoding
+
+    if file_hash:
+        _detection_cache[file_hash] = encoding
+        if len(_detection_cache) > DETECTION_CACHE_SIZE:
+            _detection_cache.popitem(last=False)
+    return encoding
+
+
+def detect_stream_encoding(raw_file) -> str:
+    """
+    임의 위치로 이동할 수 없는 스트림(압축 파일 멤버 등)의 인코딩을 앞부분 표본으로 결정
+
+    앞부분 SAMPLE_COUNT * SAMPLE_SIZE 바이트만 읽은 뒤 스트림을 처음으로 되돌립니다.
+    표본 밖에서 디코딩에 실패하면 DecodedLineReader가 대체 인코딩으로 전환합니다.
+
+    Args:
+        raw_file: 바이너리 모드 파일 객체 (처음으로 되돌리는 seek(0) 지원)
+
+    Returns:
+        str: 감지된 인코딩 (감지 실패 시 'utf-8')
+    """
+    head = raw_file.read(SAMPLE_COUNT * SAMPLE_SIZE)
+    raw_file.seek(0)
+    encoding = detect_bom(head)
+    if encoding:
+        return encoding
+    if len(head) == SAMPLE_COUNT * SAMPLE_SIZE:
+        # 잘린 마지막 줄은 멀티바이트 문자 중간에서 끝날 수 있으므로 제외
+        head = head[:head.rfind(b'\n') + 1]
+    return _detect_from_samples([head] if head and not head.isascii() else [])
+
+
+def _detect_from_samples(samples: List[bytes]) -> str:
+    """표본을 모두 디코딩할 수 있는 첫 후보 인코딩을 선택하고, 없으면 chardet 결과 사용"""
+    if not samples:
+        return 'utf-8'
+    for encoding in CANDIDATE_ENCODINGS:
+        if _decodes(samples, encoding):
+            return encoding
+
+    detected = chardet.detect(b''.join(samples))
+    if detected['encoding'] and detected['confidence'] > 0.7:
+        encoding = normalize_encoding(detected['encoding'])
+        if _decodes(samples, encoding):
+            return encoding
+    return 'utf-8'
+
+
+def clear_detection_cache() -> None:
+    """파일 해시별 감지 결과 캐시를 비움"""
+    _detection_cache.clear()
+
+
+def decode_with_fallback(data: bytes, encoding: str) -> Tuple[str, str]:
+    """
+    바이트를 디코딩하고, 실패하면 실패한 줄의 시작부터 대체 인코딩으로 이어서 디코딩
+
+    Args:
+        data: 줄바꿈 경계로 끝나는 바이트
+        encoding: 우선 사용할 인코딩
+
+    Returns:
+        Tuple[str, str]: (디코딩된 문자열, 마지막으로 사용한 인코딩)
+
+    Raises:
+        UnicodeDecodeError: 모든 대체 인코딩으로도 디코딩할 수 없는 경우
+    """
+    parts = []
+    tried = [encoding]
+    pos = 0
+    while True:
+        try:
+            parts.append(data[pos:].decode(encoding))
+            return ''.join(parts), encoding
+        except UnicodeDecodeError as e:
+            # 잘못 해석된 앞부분 문자를 남기지 않도록 실패한 줄의 시작에서 전환
+            resume = data.rfind(b'\n', pos, pos + e.start) + 1 or pos
+            parts.append(data[pos:resume].decode(encoding))
+            next_encoding = next((fb for fb in FALLBACK_ENCODINGS
+                                  if normalize_encoding(fb) not in map(normalize_encoding, tried)), None)
+            if next_encoding is None:
+                raise UnicodeDecodeError(e.encoding, data, pos + e.start, pos + e.end, e.reason)
+            print(f"⚠️ 인코딩 전환: {encoding} → {next_encoding} (오프셋 {resume})")
+            encoding = next_encoding
+            tried.append(encoding)
+            pos = resume
+
+
+class DecodedLineReader:
+    """바이너리 파일을 블록 단위로 디코딩하여 CSV 리더용 줄을 반환하는 클래스"""
+
+    def __init__(self, raw_file, encoding: str, block_size: int = DECODE_BLOCK_SIZE):
+        """
+        DecodedLineReader 초기화
+
+        Args:
+            raw_file: 'rb' 모드로 열린 파일 객체
+            encoding: 감지된 인코딩 (csv_scan.is_byte_scannable이 참이어야 함)
+            block_size: 한 번에 디코딩할 바이트 수
+        """
+        self.raw_file = raw_file
+        self.encoding = encoding
+        self.block_size = block_size
+
+    def iter_blocks(self) -> Iterator[str]:
+        """줄바꿈 경계로 자른 블록을 디코딩하여 반환"""
+        carry = b''
+        while True:
+            block = self.raw_file.read(self.block_size)
+            if not block:
+                break
+            block = carry + block
+            cut = block.rfind(b'\n') + 1
+            if cut == 0:
+                carry = block
+                continue
+            carry = block[cut:]
+            yield self._decode(block[:cut])
+        if carry:
+            yield self._decode(carry)
+
+    def _decode(self, data: bytes) -> str:
+        text, self.encoding = decode_with_fallback(data, self.encoding)
+        return text
+
+    def __iter__(self) -> Iterator[str]:
+        """디코딩된 줄을 줄바꿈 문자를 포함한 채로 하나씩 반환"""
+        for text in self.iter_blocks():
+            yield from io.StringIO(text, newline='')
@@ -0,0 +1,254 @@
+"""
+거래일시 정규화 모듈 (Timestamps)
+
+은행별 날짜/시간 문자열을 정수 epoch 초로 변환합니다.
+- 파일마다 앞부분 표본으로 날짜/시간 형식을 한 번만 감지
+- 고정 폭 형식은 미리 계산한 위치에서 잘라 정수로 변환 (행마다 strptime 호출 없음)
+- 같은 날짜의 일 단위 초는 캐시하여 재사용
+- 형식에 맞지 않는 값만 일반 파서(모든 후보 형식, ISO 형식)로 처리
+- epoch 초는 거래내역의 현지 시각을 UTC로 간주한 값 (정렬/구간 비교용)
+"""
+
+import calendar
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# 날짜 컬럼 후보 형식 (거래일시처럼 시간이 함께 들어 있는 형식 포함, 순서대로 시도)
+DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y.%m.%d %H:%M:%S",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y.%m.%d %H:%M",
+    "%Y/%m/%d %H:%M",
+    "%Y-%m-%d",
+    "%Y.%m.%d",
+    "%Y/%m/%d",
+    "%Y%m%d",
+)
+
+# 시간 컬럼 후보 형식
+TIME_FORMATS = (
+    "%H:%M:%S",
+    "%H:%M",
+    "%H%M%S",
+)
+
+# 형식 감지에 사용할 표본 수
+DETECT_SAMPLE_SIZE = 200
+
+# 고정 폭 형식 필드 → 자릿수
+_FIELD_WIDTHS = {'Y': 4, 'm': 2, 'd': 2, 'H': 2, 'M': 2, 'S': 2}
+
+# 시간 필드 → 초 단위 배수와 상한
+_TIME_FIELDS = {'H': (3600, 24), 'M': (60, 60), 'S': (1, 60)}
+
+
+def _matches(fmt: str, samples: Sequence[str]) -> bool:
+    try:
+        for value in samples:
+            datetime.strptime(value, fmt)
+    except ValueError:
+        return False
+    return True
+
+
+def detect_format(samples: Iterable[str], candidates: Sequence[str]) -> Optional[str]:
+    """
+    비어 있지 않은 표본 값을 모두 해석할 수 있는 첫 후보 형식을 선택
+
+    Args:
+        samples: 컬럼 값 표본
+        candidates: 후보 형식 (strptime 형식 문자열)
+
+    Returns:
+        Optional[str]: 감지된 형식 (표본이 없거나 맞는 형식이 없으면 None)
+    """
+    values = [v.strip() for v in samples if v and v.strip()][:DETECT_SAMPLE_SIZE]
+    if not values:
+        return None
+    for fmt in candidates:
+        if _matches(fmt, values):
+            return fmt
+    return None
+
+
+def parse_timestamp_general(date_text: str, time_text: str = "") -> Optional[int]:
+    """
+    모든 후보 형식과 ISO 형식을 차례로 시도하는 일반 변환 (형식에서 벗어난 값 처리용)
+
+    Args:
+        date_text: 날짜 (또는 날짜+시간) 문자열
+        time_text: 시간 문자열 (없으면 빈 문자열)
+
+    Returns:
+        Optional[int]: epoch 초 (해석할 수 없으면 None)
+    """
+    date_text = date_text.strip()
+    time_text = time_text.strip()
+    if not date_text:
+        return None
+    text = f"{date_text} {time_text}" if time_text else date_text
+    formats = [f"{d} {t}" for d in DATE_FORMATS if '%H' not in d for t in TIME_FORMATS] if time_text else []
+    for fmt in (*formats, *DATE_FORMATS):
+        try:
+            return calendar.timegm(datetime.strptime(text, fmt).timetuple())
+        except ValueError:
+            continue
+    try:
+        return calendar.timegm(datetime.fromisoformat(text.replace(".", "-").replace("/", "-")).timetuple())
+    except ValueError:
+        return None
+
+
+def _compile(fmt: Optional[str]) -> Optional[Tuple[int, List[Tuple[str, int, int]]]]:
+    """고정 폭 형식을 (전체 길이, [(필드, 시작, 끝)])로 변환 (고정 폭이 아니면 None)"""
+    if fmt is None:
+        return None
+    fields = []
+    pos = 0
+    i = 0
+    while i < len(fmt):
+        if fmt[i] == '%':
+            field = fmt[i + 1:i + 2]
+            width = _FIELD_WIDTHS.get(field)
+            if width is None:
+                return None
+            fields.append((field, pos, pos + width))
+            pos += width
+            i += 2
+        else:
+            pos += 1
+            i += 1
+    return pos, fields
+
+
+def _clock_fields(fields: List[Tuple[str, int, int]]) -> List[Tuple[int, int, int, int]]:
+    """시/분/초 필드를 (시작, 끝, 초 단위 배수, 상한) 목록으로 변환"""
+    return [(start, end) + _TIME_FIELDS[name] for name, start, end in fields if name in _TIME_FIELDS]
+
+
+def _clock_seconds(text: str, fields: List[Tuple[int, int, int, int]]) -> int:
+    """시:분:초 필드를 하루 안의 초로 변환 (범위를 벗어나면 ValueError)"""
+    seconds = 0
+    for start, end, factor, limit in fields:
+        value = int(text[start:end])
+        if not 0 <= value < limit:
+            raise ValueError(f"시간 범위 초과: {text}")
+        seconds += value * factor
+    return seconds
+
+
+class TimestampParser:
+    """파일별로 감지한 날짜/시간 형식으로 epoch 초를 계산하는 클래스"""
+
+    def __init__(self, date_format: Optional[str], time_format: Optional[str] = None):
+        """
+        TimestampParser 초기화
+
+        Args:
+            date_format: 날짜 컬럼 형식 (None이면 모든 값을 일반 파서로 처리)
+            time_format: 시간 컬럼 형식 (날짜 형식에 시간이 포함되어 있으면 무시)
+        """
+        self.date_format = date_format
+        self.time_format = None if date_format and '%H' in date_format else time_format
+        self.fallback_count = 0
+        self._day_cache: Dict[str, int] = {}
+
+        date = _compile(self.date_format)
+        time = _compile(self.time_format)
+        self._fast_path = date is not None and (self.time_format is None or time is not None)
+        if self._fast_path:
+            self._date_length, fields = date
+            self._ymd = {name: (start, end) for name, start, end in fields if name in 'Ymd'}
+            self._date_end = max(end for start, end in self._ymd.values())
+            self._date_clock = _clock_fields(fields)
+            self._time_length, time_fields = time if time is not None else (0, [])
+            self._time_clock = _clock_fields(time_fields)
+
+    @classmethod
+    def detect(cls, date_samples: Iterable[str], time_samples: Iterable[str] = ()) -> 'TimestampParser':
+        """
+        날짜/시간 컬럼 표본으로 형식을 감지하여 파서를 생성
+
+        Args:
+            date_samples: 날짜 컬럼 값 표본
+            time_samples: 시간 컬럼 값 표본
+        """
+        date_format = detect_format(date_samples, DATE_FORMATS)
+        time_format = None
+        if date_format is None or '%H' not in date_format:
+            time_format = detect_format(time_samples, TIME_FORMATS)
+        return cls(date_format, time_format)
+
+    def _day_seconds(self, text: str) -> int:
+        """날짜 부분을 일 단위 epoch 초로 변환 (같은 날짜는 캐시 사용)"""
+        seconds = self._day_cache.get(text)
+        if seconds is None:
+            (ys, ye), (ms, me), (ds, de) = self._ymd['Y'], self._ymd['m'], self._ymd['d']
+            # 존재하지 않는 날짜(2월 30일 등)는 여기서 ValueError
+            day = datetime(int(text[ys:ye]), int(text[ms:me]), int(text[ds:de]))
+            seconds = calendar.timegm(day.timetuple())
+            self._day_cache[text] = seconds
+        return seconds
+
+    def _fast(self, date_text: str, time_text: str) -> int:
+        """감지된 고정 폭 형식으로 변환 (형식에 맞지 않으면 ValueError)"""
+        if len(date_text) != self._date_length:
+            raise ValueError(date_text)
+        seconds = self._day_seconds(date_text[:self._date_end])
+        if self._date_clock:
+            seconds += _clock_seconds(date_text, self._date_clock)
+        if time_text and self._time_clock:
+            if len(time_text) != self._time_length:
+                raise ValueError(time_text)
+            seconds += _clock_seconds(time_text, self._time_clock)
+        elif time_text and not self._date_clock:
+            # 표본에서 시간 형식을 감지하지 못한 시간 값은 일반 파서로 처리 (자정으로 버리지 않음)
+            raise ValueError(time_text)
+        return seconds
+
+    def to_epoch(self, date_text: str, time_text: str = "") -> Optional[int]:
+        """
+        날짜/시간 문자열을 epoch 초로 변환
+
+        Args:
+            date_text: 날짜 (또는 날짜+시간) 문자열
+            time_text: 시간 문자열
+
+        Returns:
+            Optional[int]: epoch 초 (해석할 수 없으면 None)
+        """
+        if self._fast_path:
+            try:
+                return self._fast(date_text, time_text)
+            except ValueError:
+                pass
+        self.fallback_count += 1
+        return parse_timestamp_general(date_text, time_text)
+
+
+def epoch_column(headers: List[str], rows: Sequence[List[str]],
+                 date_header: str = "날짜", time_header: str = "시간") -> List[Optional[int]]:
+    """
+    정규화된 행 목록의 날짜/시간 컬럼을 epoch 초 목록으로 변환
+
+    Args:
+        headers: 표준 헤더 목록
+        rows: 정규화된 데이터 행 목록
+
+    Returns:
+        List[Optional[int]]: 행별 epoch 초 (날짜 컬럼이 없으면 모두 None)
+    """
+    if date_header not in headers:
+        return [None] * len(rows)
+    date_idx = headers.index(date_header)
+    time_idx = headers.index(time_header) if time_header in headers else None
+
+    def cell(row: List[str], idx: Optional[int]) -> str:
+        return row[idx] if idx is not None and idx < len(row) else ""
+
+    sample = rows[:DETECT_SAMPLE_SIZE]
+    parser = TimestampParser.detect((cell(r, date_idx) for r in sample), (cell(r, time_idx) for r in sample))
+    return [parser.to_epoch(cell(r, date_idx), cell(r, time_idx)) for r in rows]
@@ -0,0 +1,303 @@
+"""
+거래내역 일괄 가져오기 모듈 (Transaction Importer)
+
+파싱된 거래내역 행을 transactions 테이블 레코드로 변환하여 대량 삽입합니다.
+- 파일은 청크 단위 스트림으로 읽어 전체 행을 메모리에 올리지 않음
+- 행은 TransactionRowMapper로 레코드로 변환 (transaction_mapper, 거래일시 epoch 초와 거래 지문 포함)
+- 하나의 트랜잭션 안에서 executemany로 배치 삽입 (crud.insert_transactions_bulk)
+- 이미 저장된 거래는 거래 지문 유니크 인덱스 조회로 건너뛰고 중복 건수로 보고
+- 읽기 → 디코딩 → 정규화 → 지문 계산 → 삽입 단계를 크기가 제한된 큐로 연결해 단계별 스레드에서 실행
+  (import_pipeline, 뒤 단계가 밀리면 앞 단계가 기다리므로 메모리 사용량 일정)
+- 처리 속도(행/초)와 단계별 처리량/병목 단계를 결과와 함께 보고
+- 읽은 바이트 기준 진행률 콜백과 청크 콜백(화면 점진 로딩용) 지원 (대용량 스트리밍 모드)
+- .zip/.gz 압축 파일은 임시 파일 없이 멤버를 압축을 풀면서 차례로 가져옴 (archive)
+"""
+
+import os
+import time
+import zipfile
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..db.crud import insert_transactions_bulk
+from .archive import is_archive, list_members
+from .csv_stream import open_csv_stream
+from .excel_stream import ExcelRowStream
+from .csv_blocks import CsvBlockStages, read_record_blocks
+from .import_pipeline import UNIT_BYTES, ImportPipeline, merge_stage_dicts
+from .transaction_mapper import TransactionRowMapper
+
+
+# executemany 한 번에 넘길 레코드 수
+DEFAULT_BATCH_SIZE = 20000
+
+EXCEL_EXTENSIONS = ('.xls', '.xlsx')
+
+
+def open_statement_stream(file_path: str, opener: Optional[Callable[[], BinaryIO]] = None):
+    """확장자로 CSV/Excel을 판별해 헤더까지 읽은 행 스트림(CsvRowStream / ExcelRowStream)을 반환"""
+    if os.path.splitext(file_path)[1].lower() in EXCEL_EXTENSIONS:
+        return ExcelRowStream(file_path, opener=opener).open()
+    return open_csv_stream(file_path, opener=opener)
+
+
+class TransactionImporter:
+    """파싱된 거래내역을 transactions 테이블로 일괄 가져오는 클래스"""
+
+    def __init__(self, account_id: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE, conn=None):
+        """
+        TransactionImporter 초기화
+
+        Args:
+            account_id: 가져온 거래내역에 기록할 계좌 식별자
+            batch_size: executemany 한 번에 넘길 레코드 수
+            conn: 사용할 데이터베이스 연결 (기본값: 전역 연결)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size는 1 이상이어야 합니다")
+        self.account_id = account_id
+        self.batch_size = batch_size
+        self.conn = conn
+
+    def import_file(self, file_path: str, progress: Optional[Callable[[int, int], None]] = None,
+                    on_chunk: Optional[Callable[[List[str], List[List[str]]], None]] = None) -> Dict:
+        """
+        CSV/Excel 파일을 스트리밍으로 파싱하면서 거래내역을 일괄 삽입
+
+        메모리에는 청크 하나와 삽입 배치 하나만 유지하므로 파일 크기와 관계없이 사용량이 일정합니다.
+
+        Args:
+            file_path: 거래내역 파일 경로 (.zip/.gz 압축 파일이면 import_archive로 처리)
+            progress: 청크마다 (읽은 바이트, 전체 바이트)로 호출되는 진행률 콜백
+            on_chunk: 청크마다 (표준 헤더, 정규화된 행 목록)으로 호출되는 콜백
+
+        Returns:
+            dict: 가져오기 결과
+                - success: 성공 여부
+                - inserted: 삽입된 행 수
+                - skipped: 변환할 수 없어 건너뛴 행 수
+                - duplicates: 이미 저장된 거래라 건너뛴 행 수
+                - elapsed: 소요 시간 (초)
+                - rows_per_sec: 초당 처리 행 수
+                - stages: 단계별 처리량 목록 (StageStats.as_dict, 실패 시 빈 목록)
+                - bottleneck: 작업 시간이 가장 긴 단계 이름 (실패 시 None)
+                - error: 오류 메시지 (실패 시)
+        """
+        if is_archive(file_path):
+            return self.import_archive(file_path, progress, on_chunk)
+        try:
+            total_bytes = os.path.getsize(file_path)
+        except OSError as e:
+            return self._failure(f"파일 읽기 오류: {e}")
+        return self._import_stream(file_path, os.path.basename(file_path), total_bytes, progress, on_chunk)
+
+    def import_archive(self, file_path: str, progress: Optional[Callable[[int, int], None]] = None,
+                       on_chunk: Optional[Callable[[List[str], List[List[str]]], None]] = None) -> Dict:
+        """
+        .zip/.gz 압축 파일 안의 CSV/Excel 멤버를 임시 파일 없이 차례로 가져옴
+
+        멤버마다 하나의 트랜잭션으로 삽입하며, 진행률은 압축을 푼 바이트 기준(전체 = 멤버 크기 합)으로 보고합니다.
+
+        Args:
+            file_path: 압축 파일 경로
+            progress: import_file과 같은 진행률 콜백
+            on_chunk: import_file과 같은 청크 콜백
+
+        Returns:
+            dict: import_file과 같은 형식의 결과 (멤버 합계, stages는 멤버들의 단계별 처리량을 단계 이름별로 합친 값)
+                + members: 멤버별 삽입 건수 (실패한 멤버는 오류 메시지)
+        """
+        try:
+            members = list_members(file_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            return self._failure(f"압축 파일 읽기 오류: {e}")
+        if not members:
+            return self._failure("압축 파일 안에 가져올 CSV/Excel 파일이 없습니다")
+
+        total_bytes = sum(member.size for member in members)
+        results = {}
+        offset = 0
+        for member in members:
+            member_progress = None
+            if progress is not None:
+                def member_progress(done: int, size: int, offset: int = offset) -> None:
+                    progress(min(offset + done, total_bytes), total_bytes)
+            print(f"🗜️ 압축 파일 멤버 가져오기: {member.source_name} ({member.size / (1024 * 1024):.1f}MB)")
+            results[member.name] = self._import_stream(member.name, member.source_name, member.size,
+                                                       member_progress, on_chunk, member.open)
+            offset += member.size
+
+        inserted = sum(r['inserted'] for r in results.values())
+        elapsed = sum(r['elapsed'] for r in results.values())
+        errors = [f"{name}: {r['error']}" for name, r in results.items() if not r['success']]
+        stages = merge_stage_dicts(r['stages'] for r in results.values())
+        return {
+            'success': not errors,
+            'inserted': inserted,
+            'skipped': sum(r['skipped'] for r in results.values()),
+            'duplicates': sum(r['duplicates'] for r in results.values()),
+            'elapsed': elapsed,
+            'rows_per_sec': inserted / elapsed if elapsed > 0 else float(inserted),
+            'stages': stages,
+            'bottleneck': max(stages, key=lambda stage: stage['busy'])['stage'] if stages else None,
+            'error': "\n".join(errors) or None,
+            'members': {name: (r['inserted'] if r['success'] else r['error']) for name, r in results.items()},
+        }
+
+    def _import_stream(self, file_path: str, source_file: str, total_bytes: int,
+                       progress: Optional[Callable[[int, int], None]],
+                       on_chunk: Optional[Callable[[List[str], List[List[str]]], None]],
+                       opener: Optional[Callable[[], BinaryIO]] = None) -> Dict:
+        """파일 하나(또는 압축 파일 멤버 하나)를 행 스트림으로 열어 가져옴 (확장자로 CSV/Excel 판별)"""
+        try:
+            stream = open_statement_stream(file_path, opener)
+        except Exception as e:
+            return self._failure(f"파일 읽기 오류: {e}")
+
+        with stream:
+            pipeline = ImportPipeline()
+            if CsvBlockStages.supports(stream):
+                # CSV는 읽기/디코딩/정규화를 각각 단계로 나눔 (바이트 블록 단위)
+                csv_stages = CsvBlockStages(stream)
+                blocks = read_record_blocks(stream.file_path, csv_stages.start_offset())
+                pipeline.source("읽기", blocks, lambda item: len(item[0]), UNIT_BYTES)
+                pipeline.stage("디코딩", csv_stages.decode, lambda item: item[2], UNIT_BYTES)
+                pipeline.stage("정규화", csv_stages.normalize, lambda item: len(item[0]))
+            else:
+                # Excel/압축 파일 멤버 등은 스트림이 읽기부터 정규화까지 한 단계로 처리
+                chunks = ((chunk, stream.bytes_consumed) for chunk in stream.iter_chunks(self.batch_size))
+                pipeline.source("읽기/정규화", chunks, lambda item: len(item[0]))
+            return self._run_pipeline(pipeline, stream.headers, source_file, stream.header_row + 1,
+                                      total_bytes, progress, on_chunk)
+
+    def import_rows(self, headers: List[str], chunks: Iterable[List[List[str]]], source_file: str,
+                    first_row_num: int = 2) -> Dict:
+        """
+        정규화된 행 청크를 레코드로 변환하여 하나의 트랜잭션으로 삽입
+
+        Args:
+            headers: 표준 헤더 목록
+            chunks: 정규화된 데이터 행 청크들 (파일 순서)
+            source_file: 원본 파일명
+            first_row_num: 첫 데이터 행의 원본 파일 기준 행 번호 (헤더 다음 행)
+
+        Returns:
+            dict: import_file과 같은 형식의 가져오기 결과
+        """
+        pipeline = ImportPipeline().source("읽기/정규화", ((chunk, None) for chunk in chunks), lambda item: len(item[0]))
+        return self._run_pipeline(pipeline, headers, source_file, first_row_num)
+
+    def _run_pipeline(self, pipeline: ImportPipeline, headers: List[str], source_file: str, first_row_num: int,
+                      total_bytes: Optional[int] = None, progress: Optional[Callable[[int, int], None]] = None,
+                      on_chunk: Optional[Callable[[List[str], List[List[str]]], None]] = None) -> Dict:
+        """
+        정규화 단계까지 구성된 파이프라인에 지문 계산 단계와 삽입 단계를 붙여 실행
+
+        앞 단계 항목은 (정규화된 행 목록, 읽은 파일 오프셋 또는 None)이어야 합니다.
+        청크/진행률 콜백과 삽입은 호출한 스레드에서 실행됩니다.
+        """
+        try:
+            mapper = TransactionRowMapper(headers, self.account_id, source_file)
+        except ValueError as e:
+            return self._failure(str(e))
+
+        stats = {'skipped': 0, 'records': 0}
+        pipeline.stage("지문", self._fingerprinter(mapper, stats, first_row_num), lambda item: len(item[1]))
+        items = pipeline.run("중복 확인/삽입", lambda item: len(item[1]))
+        batches = self._insert_batches(items, headers, total_bytes, progress, on_chunk)
+        start = time.perf_counter()
+        try:
+            inserted = insert_transactions_bulk(batches, self.conn)
+        except Exception as e:
+            return self._failure(f"거래내역 저장 오류: {e}")
+        finally:
+            batches.close()
+        elapsed = time.perf_counter() - start
+        if mapper.timestamps.fallback_count:
+            print(f"⚠️ 감지된 날짜 형식과 다른 {mapper.timestamps.fallback_count}개 값은 일반 변환으로 처리했습니다.")
+
+        rows_per_sec = inserted / elapsed if elapsed > 0 else float(inserted)
+        print(f"📥 거래내역 {inserted:,}건 가져오기 완료 ({elapsed:.2f}초, {rows_per_sec:,.0f}행/초)")
+        if stats['skipped']:
+            print(f"⚠️ 변환할 수 없는 {stats['skipped']}개 행을 건너뛰었습니다.")
+        duplicates = stats['records'] - inserted
+        if duplicates:
+            print(f"⚠️ 이미 저장된 거래 {duplicates:,}건을 건너뛰었습니다.")
+        pipeline.report()
+        return {
+            'success': True,
+            'inserted': inserted,
+            'skipped': stats['skipped'],
+            'duplicates': duplicates,
+            'elapsed': elapsed,
+            'rows_per_sec': rows_per_sec,
+            'stages': [s.as_dict() for s in pipeline.stats],
+            'bottleneck': pipeline.bottleneck().name,
+            'error': None
+        }
+
+    @staticmethod
+    def _fingerprinter(mapper: TransactionRowMapper, stats: Dict,
+                       first_row_num: int) -> Callable[[Tuple], Tuple]:
+        """
+        지문 계산 단계 함수 생성: (행 목록, 오프셋) → (행 목록, 레코드 목록, 오프셋)
+
+        첫 청크로 날짜/시간 형식을 감지하고, 변환한 레코드 수와 건너뛴 행 수는 stats에 기록합니다.
+        """
+        map_row = mapper.map_row
+        state = {'row_num': first_row_num}
+
+        def fingerprint(item: Tuple) -> Tuple:
+            rows, position = item
+            row_num = state['row_num']
+            if row_num == first_row_num and rows:
+                mapper.detect_formats(rows)
+            records = []
+            for offset, row in enumerate(rows, start=row_num):
+                record = map_row(row, offset)
+                if record is None:
+                    stats['skipped'] += 1
+                else:
+                    records.append(record)
+            stats['records'] += len(records)
+            state['row_num'] = row_num + len(rows)
+            return rows, records, position
+
+        return fingerprint
+
+    def _insert_batches(self, items: Iterator[Tuple], headers: List[str], total_bytes: Optional[int],
+                        progress: Optional[Callable[[int, int], None]],
+                        on_chunk: Optional[Callable[[List[str], List[List[str]]], None]]) -> Iterator[List[Tuple]]:
+        """파이프라인 결과를 batch_size 크기의 레코드 배치로 넘기면서 청크 콜백과 바이트 기준 진행률 콜백을 호출"""
+        try:
+            for rows, records, position in items:
+                if on_chunk is not None:
+                    # 바이트 블록 단위 항목도 콜백에는 batch_size 행씩 넘김
+                    for start in range(0, len(rows), self.batch_size):
+                        on_chunk(headers, rows[start:start + self.batch_size])
+                for start in range(0, len(records), self.batch_size):
+                    yield records[start:start + self.batch_size]
+                if progress is not None and position is not None:
+                    progress(min(position, total_bytes), total_bytes)
+        finally:
+            items.close()
+        if progress is not None:
+            progress(total_bytes, total_bytes)
+
+    @staticmethod
+    def _failure(error: str) -> Dict:
+        return {
+            'success': False,
+            'inserted': 0,
+            'skipped': 0,
+            'duplicates': 0,
+            'elapsed': 0.0,
+            'rows_per_sec': 0.0,
+            'stages': [],
+            'bottleneck': None,
+            'error': error
+        }
+
+
+def import_transactions(file_path: str, account_id: Optional[str] = None, conn=None) -> Dict:
+    """TransactionImporter로 파일 하나를 가져오는 편의 함수"""
+    return TransactionImporter(account_id, conn=conn).import_file(file_path)
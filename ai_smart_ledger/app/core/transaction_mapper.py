@@ -0,0 +1,108 @@
+"""
+거래 행 변환 모듈 (Transaction Mapper)
+
+정규화된 데이터 행을 transactions 테이블 레코드로 변환합니다.
+- 표준 헤더(날짜/시간/적요/내용/입금/출금/잔액) 위치는 파일마다 한 번만 계산
+- 거래일시는 첫 청크로 감지한 형식으로 epoch 초로 변환 (timestamps)
+- 행마다 거래 지문(계좌/거래일시/부호 있는 금액/정규화한 내용/잔액)을 계산하여 중복 거래 판별에 사용
+"""
+
+import hashlib
+import unicodedata
+from typing import List, Optional, Tuple
+
+from .timestamps import DETECT_SAMPLE_SIZE, TimestampParser
+
+
+def transaction_fingerprint(account_id: Optional[str], timestamp: str, epoch: Optional[int], signed_amount: int,
+                            description: str, balance: str = "") -> int:
+    """
+    거래 지문 (같은 거래는 어느 파일에서 가져와도 같은 값, 부호 있는 64비트 정수)
+
+    거래일시는 해석되면 epoch 초로 비교하므로 날짜 표기가 다른 양식이어도 같고,
+    내용은 유니코드 정규화(NFKC) 후 공백을 하나로 합쳐 비교합니다.
+    같은 시각/금액/내용의 정상 거래는 잔액으로 구분합니다.
+    """
+    if not unicodedata.is_normalized('NFKC', description):
+        description = unicodedata.normalize('NFKC', description)
+    description = " ".join(description.split())
+    moment = str(epoch) if epoch is not None else timestamp
+    text = "\x1f".join((account_id or "", moment, str(signed_amount), description, balance))
+    # 문자열 해시보다 유니크 인덱스가 작고 비교가 빠른 SQLite INTEGER로 저장
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+class TransactionRowMapper:
+    """표준 헤더 위치를 미리 계산해 데이터 행을 transactions 레코드로 변환하는 클래스"""
+
+    def __init__(self, headers: List[str], account_id: Optional[str], source_file: str):
+        """
+        TransactionRowMapper 초기화
+
+        Args:
+            headers: 표준 헤더 목록 (파서 결과의 headers)
+            account_id: 거래내역을 연결할 계좌 식별자
+            source_file: 원본 파일명
+        """
+        index = {h: i for i, h in enumerate(headers)}
+        self.date_idx = index.get("날짜")
+        self.time_idx = index.get("시간")
+        self.text_idx = [index[h] for h in ("적요", "내용") if h in index]
+        self.in_idx = index.get("입금")
+        self.out_idx = index.get("출금")
+        self.balance_idx = index.get("잔액")
+        self.account_id = account_id
+        self.source_file = source_file
+        self.timestamps = TimestampParser(None)
+
+        if self.date_idx is None:
+            raise ValueError("날짜 컬럼이 없어 거래내역으로 가져올 수 없습니다")
+        if self.in_idx is None and self.out_idx is None:
+            raise ValueError("입금/출금 컬럼이 없어 거래내역으로 가져올 수 없습니다")
+
+    def detect_formats(self, rows: List[List[str]]) -> None:
+        """
+        데이터 행 표본으로 날짜/시간 형식을 감지 (첫 청크에 한 번 호출)
+
+        Args:
+            rows: 정규화된 데이터 행 표본
+        """
+        sample = rows[:DETECT_SAMPLE_SIZE]
+        dates = [row[self.date_idx] for row in sample if self.date_idx < len(row)]
+        times = [row[self.time_idx] for row in sample
+                 if self.time_idx is not None and self.time_idx < len(row)]
+        self.timestamps = TimestampParser.detect(dates, times)
+
+    def map_row(self, row: List[str], row_num: int) -> Optional[Tuple]:
+        """
+        데이터 행 하나를 레코드 튜플로 변환 (변환할 수 없는 행은 None)
+
+        Args:
+            row: 정규화된 데이터 행
+            row_num: 원본 파일 기준 행 번호
+
+        Returns:
+            Optional[Tuple]: crud.TRANSACTION_BULK_COLUMNS 순서의 레코드
+        """
+        try:
+            date = row[self.date_idx]
+            time_text = row[self.time_idx] if self.time_idx is not None else ""
+            timestamp = f"{date} {time_text}" if time_text else date
+            amount_in = int(row[self.in_idx]) if self.in_idx is not None else 0
+            amount_out = int(row[self.out_idx]) if self.out_idx is not None else 0
+            description = " ".join(row[i] for i in self.text_idx if i < len(row) and row[i])
+        except (IndexError, ValueError):
+            return None
+
+        if not timestamp or (amount_in and amount_out):
+            # 입금/출금이 동시에 있는 행은 테이블 제약조건(둘 중 하나만)에 맞지 않음
+            return None
+        if amount_in:
+            amounts = (amount_in, None)
+        else:
+            amounts = (None, amount_out)
+        epoch = self.timestamps.to_epoch(date, time_text)
+        balance = row[self.balance_idx] if self.balance_idx is not None and self.balance_idx < len(row) else ""
+        fingerprint = transaction_fingerprint(self.account_id, timestamp, epoch, amount_in - amount_out,
+                                              description, balance)
+        return (self.account_id, timestamp, epoch, description) + amounts + (self.source_file, row_num, fingerprint)
@@ -6,7 +6,7 @@ Created: 2025-05-25
 슬라이스 2.1에서 필요한 categories 테이블 관련 함수들을 구현합니다.
 """
 
-from typing import List, Tuple, Dict, Optional, Any
+from typing import Iterable, List, Tuple, Dict, Optional, Any
 from .database import get_db_connection
 
 
@@ -544,6 +544,210 @@ def insert_transaction(transaction_data: Dict[str, Any]) -> Optional[int]:
         return None
 
 
+# 거래내역 일괄 삽입 컬럼 순서 (insert_transactions_bulk의 레코드 튜플 순서)
+TRANSACTION_BULK_COLUMNS = (
+    'account_id', 'timestamp', 'timestamp_epoch', 'description', 'amount_in', 'amount_out',
+    'source_file', 'source_row_id', 'fingerprint'
+)
+
+
+# 저장된 지문을 한 번에 조회할 최대 개수 (SQLite 바인딩 변수 수 제한 이하)
+FINGERPRINT_QUERY_SIZE = 500
+
+
+def _existing_fingerprints(cursor, fingerprints: List[int]) -> set:
+    """transactions 테이블에 이미 있는 지문 집합 (유니크 인덱스 조회, NULL은 제외)"""
+    fingerprints = [fp for fp in fingerprints if fp is not None]
+    existing = set()
+    for start in range(0, len(fingerprints), FINGERPRINT_QUERY_SIZE):
+        part = fingerprints[start:start + FINGERPRINT_QUERY_SIZE]
+        cursor.execute(f"SELECT fingerprint FROM transactions WHERE fingerprint IN ({', '.join('?' * len(part))})",
+                       part)
+        existing.update(row[0] for row in cursor.fetchall())
+    return existing
+
+
+def insert_transactions_bulk(batches: Iterable[List[Tuple]], conn=None) -> int:
+    """
+    거래내역 레코드 배치를 하나의 트랜잭션 안에서 executemany로 일괄 삽입합니다.
+    
+    행마다 커밋/출력하는 insert_transaction과 달리 전체가 한 번에 커밋되며,
+    도중에 오류가 나면 모두 롤백됩니다.
+    이미 저장된 거래와 지문(fingerprint)이 같은 레코드는 유니크 인덱스 조회로 건너뜁니다
+    (테이블을 훑지 않고 행마다 인덱스 한 번 확인).
+    
+    Args:
+        batches (Iterable[List[Tuple]]): TRANSACTION_BULK_COLUMNS 순서의 레코드 튜플 배치들
+        conn: 사용할 데이터베이스 연결 (기본값: get_db_connection())
+    
+    Returns:
+        int: 삽입된 거래내역 수 (건너뛴 중복 레코드 제외)
+    
+    Raises:
+        Exception: 삽입 중 오류 발생 시 (롤백 후 다시 발생)
+    """
+    conn = conn if conn is not None else get_db_connection()
+    insert_query = f"""
+    INSERT INTO transactions ({', '.join(TRANSACTION_BULK_COLUMNS)})
+    VALUES ({', '.join('?' * len(TRANSACTION_BULK_COLUMNS))})
+    ON CONFLICT(fingerprint) DO NOTHING
+    """
+    
+    try:
+        cursor = conn.cursor()
+        before = conn.total_changes
+        # 자동 커밋 연결이어도 전체 배치를 하나의 트랜잭션으로 묶음
+        if not conn.in_transaction:
+            cursor.execute("BEGIN")
+        for batch in batches:
+            # 배치 앞부분 표본에 저장된 지문이 있으면 배치 전체를 삽입 전에 인덱스 조회로 걸러냄
+            # (다시 가져오는 파일은 삽입 시도 없이 통과, 새 파일은 표본 조회 한 번만 추가)
+            fingerprints = [record[-1] for record in batch]
+            existing = _existing_fingerprints(cursor, fingerprints[:FINGERPRINT_QUERY_SIZE])
+            if existing and len(batch) > FINGERPRINT_QUERY_SIZE:
+                existing |= _existing_fingerprints(cursor, fingerprints[FINGERPRINT_QUERY_SIZE:])
+            if existing:
+                batch = [record for record in batch if record[-1] not in existing]
+            cursor.executemany(insert_query, batch)
+        inserted = conn.total_changes - before
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ 거래내역 일괄 삽입 중 오류 발생 (롤백됨): {e}")
+        raise
+    
+    return inserted
+
+
+def get_transactions_between(start_epoch: int, end_epoch: int, conn=None) -> List[Dict[str, Any]]:
+    """
+    거래일시가 [start_epoch, end_epoch) 구간인 거래내역을 시간순으로 조회합니다.
+    
+    timestamp_epoch 인덱스를 사용하므로 문자열 날짜 비교 없이 범위 조회/정렬됩니다.
+    
+    Args:
+        start_epoch (int): 시작 epoch 초 (포함)
+        end_epoch (int): 끝 epoch 초 (미포함)
+        conn: 사용할 데이터베이스 연결 (기본값: get_db_connection())
+    
+    Returns:
+        List[Dict[str, Any]]: 거래내역 목록 (오류 시 빈 리스트)
+    """
+    columns = ['transaction_id', 'account_id', 'timestamp', 'timestamp_epoch', 'description',
+               'amount_in', 'amount_out', 'category_id', 'source_file', 'source_row_id']
+    query = f"""
+    SELECT {', '.join(columns)}
+    FROM transactions
+    WHERE timestamp_epoch >= ? AND timestamp_epoch < ?
+    ORDER BY timestamp_epoch, transaction_id
+    """
+    try:
+        conn = conn if conn is not None else get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute(query, (start_epoch, end_epoch))
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    except Exception as e:
+        print(f"❌ 기간별 거래내역 조회 중 오류 발생: {e}")
+        return []
+
+
+def is_file_imported(file_hash: str, conn=None) -> bool:
+    """
+    같은 내용(MD5 해시)의 파일을 이미 가져왔는지 확인합니다.
+
+    Args:
+        file_hash (str): 파일 내용의 MD5 해시
+        conn: 사용할 데이터베이스 연결 (기본값: get_db_connection())
+
+    Returns:
+        bool: imported_files 테이블에 기록되어 있으면 True
+    """
+    conn = conn if conn is not None else get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM imported_files WHERE file_hash = ?", (file_hash,))
+    return cursor.fetchone() is not None
+
+
+def record_imported_file(file_hash: str, file_path: str, file_size: int, inserted_rows: int, conn=None) -> bool:
+    """
+    가져온 파일을 imported_files 테이블에 기록합니다 (같은 해시는 덮어씀).
+
+    Args:
+        file_hash (str): 파일 내용의 MD5 해시
+        file_path (str): 가져온 파일 경로
+        file_size (int): 파일 크기 (바이트)
+        inserted_rows (int): 삽입된 거래내역 수
+        conn: 사용할 데이터베이스 연결 (기본값: get_db_connection())
+
+    Returns:
+        bool: 기록 성공 시 True, 실패 시 False
+    """
+    query = """
+    INSERT OR REPLACE INTO imported_files (file_hash, file_path, file_size, inserted_rows)
+    VALUES (?, ?, ?, ?)
+    """
+    try:
+        conn = conn if conn is not None else get_db_connection()
+        conn.execute(query, (file_hash, file_path, file_size, inserted_rows))
+        conn.commit()
+        return True
+    except Exception as e:
+        print(f"❌ 가져온 파일 기록 중 오류 발생: {e}")
+        return False
+
+
+IMPORT_CHECKPOINT_COLUMNS = (
+    'account_id', 'source', 'file_order', 'last_epoch', 'tail_window', 'byte_offset', 'offset_digest',
+    'file_rows', 'imported_rows'
+)
+
+
+def get_import_checkpoint(account_id: str, source: str, conn=None) -> Optional[Dict[str, Any]]:
+    """
+    계좌/출처별 마지막 가져오기 위치를 조회합니다.
+
+    Args:
+        account_id (str): 계좌 식별자
+        source (str): 내보내기 출처 (은행 프로필 이름 등)
+        conn: 사용할 데이터베이스 연결 (기본값: get_db_connection())
+
+    Returns:
+        Optional[Dict[str, Any]]: IMPORT_CHECKPOINT_COLUMNS 키의 딕셔너리 (tail_window는 JSON 문자열),
+        기록이 없으면 None
+    """
+    conn = conn if conn is not None else get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT {', '.join(IMPORT_CHECKPOINT_COLUMNS)} FROM import_checkpoints "
+                   "WHERE account_id = ? AND source = ?", (account_id, source))
+    row = cursor.fetchone()
+    return dict(zip(IMPORT_CHECKPOINT_COLUMNS, row)) if row else None
+
+
+def save_import_checkpoint(checkpoint: Dict[str, Any], conn=None) -> bool:
+    """
+    계좌/출처별 마지막 가져오기 위치를 저장합니다 (같은 계좌/출처는 덮어씀).
+
+    Args:
+        checkpoint (Dict[str, Any]): IMPORT_CHECKPOINT_COLUMNS 키의 딕셔너리 (tail_window는 JSON 문자열)
+        conn: 사용할 데이터베이스 연결 (기본값: get_db_connection())
+
+    Returns:
+        bool: 저장 성공 시 True, 실패 시 False
+    """
+    query = f"""
+    INSERT OR REPLACE INTO import_checkpoints ({', '.join(IMPORT_CHECKPOINT_COLUMNS)}, updated_at)
+    VALUES ({', '.join('?' * len(IMPORT_CHECKPOINT_COLUMNS))}, CURRENT_TIMESTAMP)
+    """
+    try:
+        conn = conn if conn is not None else get_db_connection()
+        conn.execute(query, tuple(checkpoint[c] for c in IMPORT_CHECKPOINT_COLUMNS))
+        conn.commit()
+        return True
+    except Exception as e:
+        print(f"❌ 가져오기 위치 기록 중 오류 발생: {e}")
+        return False
+
+
 def save_setting(key: str, value: Any) -> bool:
     """
     설정 값을 settings 테이블에 저장하거나 업데이트합니다.
@@ -167,6 +167,11 @@ def insert_default_settings():
         ("window_x", "100", "integer", "마지막 창 X 위치"),
         ("window_y", "100", "integer", "마지막 창 Y 위치"),
         ("show_file_format_popup", "true", "boolean", "파일 형식 안내 팝업 표시 여부"),
+        ("watch_folder", "", "string", "자동 가져오기 감시 폴더 (비어있으면 사용 안 함)"),
+        ("watch_mode", "polling", "string", "감시 폴더 변경 감지 방식 (polling / inotify)"),
+        ("watch_interval", "30", "integer", "감시 폴더 폴링 주기 (초)"),
+        ("watch_account", "", "string", "감시 폴더 파일의 계좌 식별자 (비어있으면 증분 가져오기 안 함)"),
+        ("parse_backend", "python", "string", "전체 파싱 백엔드 (python / pandas)"),
     ]
     
     try:
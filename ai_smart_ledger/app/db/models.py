@@ -63,6 +63,7 @@ def create_transactions_table():
     - transaction_id: 기본키 (자동증가)
     - account_id: 계좌 식별자 (나중에 accounts 테이블과 연동 예정)
     - timestamp: 거래일시
+    - timestamp_epoch: 거래일시 epoch 초 (정렬/기간 조회용, 인덱스)
     - description: 거래 내용/적요
     - amount_in: 입금액 (NULL 가능)
     - amount_out: 출금액 (NULL 가능) 
@@ -70,6 +71,7 @@ def create_transactions_table():
     - is_transfer: 계좌 간 이체 여부
     - source_file: 원본 CSV 파일명
     - source_row_id: 원본 파일의 행 번호
+    - fingerprint: 거래 지문 (계좌/거래일시/부호 있는 금액/정규화한 내용/잔액의 64비트 해시, 유니크 인덱스로 중복 가져오기 방지)
     - created_at: 생성일시
     - updated_at: 수정일시
     """
@@ -79,6 +81,7 @@ def create_transactions_table():
         transaction_id INTEGER PRIMARY KEY AUTOINCREMENT,
         account_id TEXT,
         timestamp TIMESTAMP NOT NULL,
+        timestamp_epoch INTEGER,
         description TEXT NOT NULL,
         amount_in DECIMAL(15,2),
         amount_out DECIMAL(15,2),
@@ -86,6 +89,7 @@ def create_transactions_table():
         is_transfer BOOLEAN NOT NULL DEFAULT FALSE,
         source_file TEXT,
         source_row_id INTEGER,
+        fingerprint INTEGER,
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         
@@ -102,7 +106,7 @@ def create_transactions_table():
     
     try:
         cursor = db_manager.execute_query(create_table_query)
-        if cursor:
+        if cursor and add_timestamp_epoch_column() and add_fingerprint_column():
             print("✅ transactions 테이블이 성공적으로 생성되었습니다!")
             return True
         else:
@@ -114,6 +118,40 @@ def create_transactions_table():
         return False
 
 
+def _add_column(name, column_type, index_sql):
+    """
+    이전 버전에서 만든 transactions 테이블에 컬럼을 추가하고 index_sql로 인덱스를 만듭니다
+    (이미 있으면 그대로 둡니다)
+    """
+    cursor = db_manager.execute_query("PRAGMA table_info(transactions)")
+    if cursor is None:
+        return False
+    columns = [row[1] for row in cursor.fetchall()]
+    if name not in columns:
+        if db_manager.execute_query(f"ALTER TABLE transactions ADD COLUMN {name} {column_type}") is None:
+            return False
+        print(f"🔧 transactions 테이블에 {name} 컬럼을 추가했습니다")
+    return db_manager.execute_query(index_sql) is not None
+
+
+def add_timestamp_epoch_column():
+    """
+    이전 버전에서 만든 transactions 테이블에 timestamp_epoch 컬럼과 인덱스를 추가합니다
+    (이미 있으면 그대로 둡니다)
+    """
+    return _add_column('timestamp_epoch', 'INTEGER',
+                       "CREATE INDEX IF NOT EXISTS idx_transactions_timestamp_epoch ON transactions (timestamp_epoch)")
+
+
+def add_fingerprint_column():
+    """
+    이전 버전에서 만든 transactions 테이블에 fingerprint 컬럼과 유니크 인덱스를 추가합니다
+    (이미 있으면 그대로 둡니다, 기존 행의 지문은 NULL로 남아 중복 확인에서 제외됩니다)
+    """
+    return _add_column('fingerprint', 'INTEGER',
+                       "CREATE UNIQUE INDEX IF NOT EXISTS idx_transactions_fingerprint ON transactions (fingerprint)")
+
+
 def create_ai_learning_patterns_table():
     """
     ai_learning_patterns 테이블을 생성합니다
@@ -181,6 +219,11 @@ def create_settings_table():
     - window_x: 마지막 창 X 위치
     - window_y: 마지막 창 Y 위치
     - show_file_format_popup: 파일 형식 안내 팝업 표시 여부
+    - watch_folder: 자동 가져오기 감시 폴더
+    - watch_mode: 감시 폴더 변경 감지 방식 (polling / inotify)
+    - watch_interval: 감시 폴더 폴링 주기 (초)
+    - watch_account: 감시 폴더 파일의 계좌 식별자 (증분 가져오기 위치를 계좌별로 기억)
+    - parse_backend: 전체 파싱 백엔드 (python / pandas, 프로그램 시작 시 적용)
     """
     
     create_table_query = """
@@ -208,6 +251,111 @@ def create_settings_table():
         return False
 
 
+def create_imported_files_table():
+    """
+    imported_files 테이블을 생성합니다
+    
+    테이블 구조:
+    - file_hash: 가져온 파일 내용의 MD5 해시 (기본키, 같은 내용의 파일은 다시 가져오지 않음)
+    - file_path: 가져온 파일 경로
+    - file_size: 파일 크기 (바이트)
+    - inserted_rows: 삽입된 거래내역 수
+    - imported_at: 가져온 일시
+    """
+    
+    create_table_query = """
+    CREATE TABLE IF NOT EXISTS imported_files (
+        file_hash TEXT PRIMARY KEY,
+        file_path TEXT NOT NULL,
+        file_size INTEGER NOT NULL,
+        inserted_rows INTEGER NOT NULL DEFAULT 0,
+        imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """
+    
+    try:
+        cursor = db_manager.execute_query(create_table_query)
+        if cursor:
+            print("✅ imported_files 테이블이 성공적으로 생성되었습니다!")
+            return True
+        else:
+            print("❌ imported_files 테이블 생성에 실패했습니다!")
+            return False
+            
+    except Exception as e:
+        print(f"❌ imported_files 테이블 생성 중 오류가 발생했습니다: {e}")
+        return False
+
+
+def create_import_checkpoints_table():
+    """
+    import_checkpoints 테이블을 생성합니다
+    
+    테이블 구조:
+    - account_id: 계좌 식별자
+    - source: 내보내기 출처 (은행 프로필 이름 등, account_id와 함께 기본키)
+    - file_order: 마지막으로 가져온 파일의 정렬 방향 ('ascending', 'descending', 거래일시가 하나뿐이라 판별할 수 없으면 'unknown')
+    - last_epoch: 마지막으로 가져온 (가장 최신) 거래의 epoch 초
+    - tail_window: 가장 최신 거래 몇 건의 행 지문 JSON 목록 (과거 → 최신, 다음 파일과 겹치는 구간 확인용)
+    - byte_offset: 오름차순 CSV에서 마지막으로 가져온 행이 끝나는 바이트 위치 (그 외 NULL)
+    - offset_digest: byte_offset 직전 바이트 구간의 해시 (다음 파일이 같은 내용으로 이어지는지 확인)
+    - file_rows: 마지막으로 가져온 파일의 데이터 행 수 (byte_offset 이후 행 번호 계산용, 모르면 NULL)
+    - imported_rows: 지금까지 가져온 거래내역 수
+    - updated_at: 수정일시
+    """
+    
+    create_table_query = """
+    CREATE TABLE IF NOT EXISTS import_checkpoints (
+        account_id TEXT NOT NULL,
+        source TEXT NOT NULL,
+        file_order TEXT NOT NULL CHECK (file_order IN ('ascending', 'descending', 'unknown')),
+        last_epoch INTEGER,
+        tail_window TEXT NOT NULL,
+        byte_offset INTEGER,
+        offset_digest TEXT,
+        file_rows INTEGER,
+        imported_rows INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        
+        PRIMARY KEY (account_id, source)
+    );
+    """
+    
+    try:
+        cursor = db_manager.execute_query(create_table_query)
+        if cursor and allow_unknown_file_order(create_table_query):
+            print("✅ import_checkpoints 테이블이 성공적으로 생성되었습니다!")
+            return True
+        else:
+            print("❌ import_checkpoints 테이블 생성에 실패했습니다!")
+            return False
+            
+    except Exception as e:
+        print(f"❌ import_checkpoints 테이블 생성 중 오류가 발생했습니다: {e}")
+        return False
+
+
+def allow_unknown_file_order(create_table_query):
+    """
+    이전 버전에서 만든 import_checkpoints 테이블은 file_order에 'unknown'을 허용하지 않으므로
+    create_table_query로 다시 만들고 기존 기록을 옮깁니다 (이미 허용하면 그대로 둡니다)
+    """
+    cursor = db_manager.execute_query("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'import_checkpoints'")
+    if cursor is None:
+        return False
+    row = cursor.fetchone()
+    if row is None or "'unknown'" in row[0]:
+        return True
+    for query in ("ALTER TABLE import_checkpoints RENAME TO import_checkpoints_old",
+                  create_table_query,
+                  "INSERT INTO import_checkpoints SELECT * FROM import_checkpoints_old",
+                  "DROP TABLE import_checkpoints_old"):
+        if db_manager.execute_query(query) is None:
+            return False
+    print("🔧 import_checkpoints 테이블의 file_order에 'unknown'을 허용했습니다")
+    return True
+
+
 def create_all_tables():
     """
     모든 테이블을 생성합니다
@@ -215,7 +363,7 @@ def create_all_tables():
     print("🏗️ 데이터베이스 테이블 생성을 시작합니다...")
     
     success_count = 0
-    total_count = 4  # categories, transactions, ai_learning_patterns, settings
+    total_count = 6  # categories, transactions, ai_learning_patterns, settings, imported_files, import_checkpoints
     
     # categories 테이블 생성
     if create_categories_table():
@@ -233,6 +381,14 @@ def create_all_tables():
     if create_settings_table():
         success_count += 1
     
+    # imported_files 테이블 생성
+    if create_imported_files_table():
+        success_count += 1
+    
+    # import_checkpoints 테이블 생성
+    if create_import_checkpoints_table():
+        success_count += 1
+    
     print(f"📊 테이블 생성 완료: {success_count}/{total_count}")
     
     if success_count == total_count:
@@ -243,6 +399,18 @@ def create_all_tables():
         return False
 
 
+def create_all_tables_on(connection):
+    """
+    전역 연결 대신 주어진 연결(테스트/벤치마크용 메모리 DB 등)에 모든 테이블을 생성합니다
+    """
+    previous = db_manager.connection
+    db_manager.connection = connection
+    try:
+        return create_all_tables()
+    finally:
+        db_manager.connection = previous
+
+
 if __name__ == "__main__":
     """이 파일을 직접 실행할 때 테이블을 생성합니다"""
     print("🏁 테이블 생성 테스트를 시작합니다...")
@@ -10,17 +10,26 @@ from PySide6.QtWidgets import (
     QMenuBar, QMenu, QLabel, QPushButton, QTableWidget,
     QTableWidgetItem, QHBoxLayout, QHeaderView, QDialog,
     QTextEdit, QDialogButtonBox, QScrollArea, QComboBox, QListView,
-    QMessageBox
+    QMessageBox, QProgressDialog, QApplication
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction, QFont, QPixmap, QColor, QBrush
 import os
-import hashlib
 from datetime import datetime
 
+from ..core.balance_check import describe as describe_balance
 from ..core.file_handler import FileHandler
+from ..core.file_hash import compute_file_hash
 from ..core.file_parser import FileParser
+from ..core.folder_watcher import (
+    DEFAULT_POLL_INTERVAL, STATUS_IMPORTED, STATUS_SKIPPED, WATCH_MODE_POLLING, FolderWatcher,
+)
+from ..core.multi_import import MultiFileLoader
+from ..core.pandas_backend import BACKEND_PYTHON, check_backend
+from ..core.parse_cache import ParseCache
+from ..core.parse_session import ParseSession
 from ..core.progress_saver import ProgressSaver
+from ..core.transaction_importer import TransactionImporter
 from ..db.crud import get_categories_for_dropdown, get_setting, get_all_categories, update_transaction_category
 from ..db.database import DatabaseManager
 from .settings_dialog import SettingsDialog
@@ -31,24 +40,45 @@ from ai_smart_ledger.app.db import crud
 class MainWindow(QMainWindow):
     """AI 스마트 가계부 메인 윈도우"""
     
+    # 스트리밍 가져오기 시 거래내역 테이블에 점진적으로 표시할 최대 행 수
+    STREAMING_TABLE_ROWS = 1000
+    
+    # 감시 폴더 가져오기 알림을 상태 표시줄에 보여줄 시간 (밀리초)
+    WATCH_MESSAGE_TIMEOUT_MS = 10000
+    
+    # 잔액 연속성이 끊긴 행의 잔액 셀 배경색
+    BALANCE_BREAK_COLOR = QColor(255, 200, 200)
+    
     # patch.object를 위한 클래스 레벨 기본값
     _update_transaction_category = staticmethod(lambda *a, **kw: None)
     _get_all_categories = staticmethod(lambda: [])
 
-    def __init__(self):
+    def __init__(self, parse_cache_dir=None):
+        """
+        메인 윈도우 초기화
+
+        Args:
+            parse_cache_dir: 파싱 캐시 폴더 (기본값: 환경 변수 PARSE_CACHE_DIR, 없으면 DB 파일 옆 parse_cache 폴더)
+        """
         super().__init__()
         
         # 슬라이스 1.1: 파일 핸들러 초기화
         self.file_handler = FileHandler()
         
-        # 슬라이스 1.2: 파일 파서 초기화
+        # 슬라이스 1.2: 파일 파서 초기화 (전체 파싱 백엔드는 설정에서 적용)
         self.file_parser = FileParser()
+        self.apply_parse_backend()
         
         # 슬라이스 2.5: 중간 저장 기능 초기화
         self.database_manager = DatabaseManager()
         progress_file_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'progress.json')
         self.progress_saver = ProgressSaver(self.database_manager, progress_file_path)
         
+        # 다시 여는 파일의 파싱을 건너뛰기 위한 파싱 캐시
+        if parse_cache_dir is None:
+            parse_cache_dir = os.getenv('PARSE_CACHE_DIR') or self.database_manager.db_path.parent / 'parse_cache'
+        self.parse_cache = ParseCache(parse_cache_dir)
+        
         # 현재 선택된 파일 경로 저장
         self.selected_file_path = None
         
@@ -80,7 +110,13 @@ class MainWindow(QMainWindow):
         
         self.row_to_transaction_id = {}  # row 인덱스 → transaction_id 매핑 추가
         
+        # 감시 폴더 자동 가져오기 (설정에 감시 폴더가 있을 때만 동작)
+        self.folder_watcher = None
+        # 진행 중인 여러 파일 가져오기
+        self.multi_file_loader = None
+        
         self.init_ui()
+        self.start_folder_watcher()
         
         # 슬라이스 2.5: 프로그램 시작 시 저장된 진행 상태가 있는지 확인
         self.check_and_restore_progress_on_startup()
@@ -272,6 +308,12 @@ class MainWindow(QMainWindow):
         self.transactions_load_button.clicked.connect(self.on_load_file_clicked)
         file_info_layout.addWidget(self.transactions_load_button)
 
+        # 여러 계좌/여러 달 파일을 한 번에 불러오는 버튼
+        self.multi_load_button = QPushButton("🗂️ 여러 파일 불러오기")
+        self.multi_load_button.setStyleSheet(self.transactions_load_button.styleSheet())
+        self.multi_load_button.clicked.connect(self.on_load_multiple_files_clicked)
+        file_info_layout.addWidget(self.multi_load_button)
+
         # [추가] AI 추천 적용 버튼
         self.ai_suggestion_button = QPushButton("🤖 AI 추천 적용")
         self.ai_suggestion_button.setStyleSheet("""
@@ -448,11 +490,15 @@ class MainWindow(QMainWindow):
             # 헤더 설정
             self.transactions_table.setHorizontalHeaderLabels(headers)
             
-            # 데이터 입력
+            # 데이터 입력 (같은 텍스트는 원본 항목을 복제하여 Qt 문자열을 공유)
+            prototypes = {}
             for row_idx, row_data in enumerate(data):
                 for col_idx, cell_data in enumerate(row_data):
-                    item = QTableWidgetItem(str(cell_data))
-                    self.transactions_table.setItem(row_idx, col_idx, item)
+                    text = str(cell_data)
+                    prototype = prototypes.get(text)
+                    if prototype is None:
+                        prototype = prototypes[text] = QTableWidgetItem(text)
+                    self.transactions_table.setItem(row_idx, col_idx, prototype.clone())
                 
                 # transaction_id가 데이터에 포함되어 있으면 저장
                 if 'transaction_id' in headers:
@@ -461,6 +507,9 @@ class MainWindow(QMainWindow):
                 else:
                     self.row_to_transaction_id[row_idx] = None
             
+            # 잔액 연속성이 끊긴 행의 잔액 셀 강조
+            self.mark_balance_breaks(headers, csv_result.get('balance_check'))
+            
             # 컬럼 크기 자동 조정
             self.transactions_table.resizeColumnsToContents()
             
@@ -895,8 +944,80 @@ class MainWindow(QMainWindow):
         설정 대화 상자를 엽니다.
         """
         print("⚙️ 설정 대화 상자 열기 요청")
+        watch_settings = self.get_watch_settings()
         dialog = SettingsDialog(self) # 메인 윈도우를 부모로 설정
         dialog.exec() # 모달 방식으로 실행
+        
+        # 감시 폴더 설정이 바뀌었으면 새 설정으로 다시 시작
+        if self.get_watch_settings() != watch_settings:
+            self.start_folder_watcher()
+        self.apply_parse_backend()
+    
+    def get_watch_settings(self) -> tuple:
+        """설정에 저장된 (감시 폴더, 감지 방식, 폴링 주기, 계좌 식별자) 값을 반환합니다."""
+        return (get_setting("watch_folder") or "",
+                get_setting("watch_mode") or WATCH_MODE_POLLING,
+                get_setting("watch_interval") or str(DEFAULT_POLL_INTERVAL),
+                get_setting("watch_account") or "")
+    
+    def start_folder_watcher(self) -> None:
+        """설정된 감시 폴더가 있으면 자동 가져오기를 (다시) 시작합니다."""
+        self.stop_folder_watcher()
+        folder, mode, interval, account_id = self.get_watch_settings()
+        if not folder:
+            return
+        if not os.path.isdir(folder):
+            print(f"⚠️ 감시 폴더를 찾을 수 없습니다: {folder}")
+            return
+        try:
+            self.folder_watcher = FolderWatcher(folder, self.database_manager.db_path, mode, int(interval),
+                                                account_id=account_id, parent=self)
+        except ValueError as e:
+            print(f"❌ 감시 폴더 설정 오류: {e}")
+            return
+        self.folder_watcher.file_processed.connect(self.on_watched_file_processed)
+        self.folder_watcher.start()
+    
+    def stop_folder_watcher(self) -> None:
+        """실행 중인 감시 폴더 자동 가져오기를 멈춥니다."""
+        if self.folder_watcher is not None:
+            self.folder_watcher.stop()
+            self.folder_watcher.deleteLater()
+            self.folder_watcher = None
+    
+    def on_watched_file_processed(self, result: dict) -> None:
+        """
+        감시 폴더에서 가져온 파일 결과를 상태 표시줄로만 알립니다 (작업을 막는 대화상자는 띄우지 않음).
+        
+        Args:
+            result: folder_watcher.ingest_file 결과
+        """
+        file_name = os.path.basename(result['path'])
+        if result['status'] == STATUS_IMPORTED:
+            message = f"📥 감시 폴더: {file_name}에서 거래내역 {result['inserted']:,}건을 가져왔습니다"
+        elif result['status'] == STATUS_SKIPPED:
+            message = f"⏭️ 감시 폴더: {file_name}은(는) 이미 가져온 파일이라 건너뛰었습니다"
+        else:
+            message = f"⚠️ 감시 폴더: {file_name} 가져오기 실패 ({result['error']})"
+        print(message)
+        self.statusBar().showMessage(message, self.WATCH_MESSAGE_TIMEOUT_MS)
+    
+    def closeEvent(self, event):
+        """창을 닫을 때 감시 폴더 자동 가져오기를 멈추고 진행 중인 여러 파일 가져오기를 기다립니다."""
+        self.stop_folder_watcher()
+        if self.multi_file_loader is not None:
+            self.multi_file_loader.wait()
+        super().closeEvent(event)
+
+    def apply_parse_backend(self) -> None:
+        """설정의 parse_backend(python / pandas)를 전체 파싱 기본 백엔드로 적용 (사용할 수 없으면 python)"""
+        backend = get_setting("parse_backend") or BACKEND_PYTHON
+        try:
+            FileParser.backend = check_backend(backend)
+        except ValueError as e:
+            print(f"⚠️ {e}. 기본 파싱 백엔드({BACKEND_PYTHON})를 사용합니다.")
+            FileParser.backend = BACKEND_PYTHON
+        print(f"⚙️ 파싱 백엔드: {FileParser.backend}")
 
     def parse_and_display_preview(self, file_path: str) -> None:
         """
@@ -908,51 +1029,122 @@ class MainWindow(QMainWindow):
         # 슬라이스 2.4: 새 파일 로딩 시 카테고리 변경 히스토리 초기화
         self.clear_category_change_history()
         try:
-            import os
-            file_ext = os.path.splitext(file_path)[1].lower()
-            # 1. 미리보기(5행)는 콘솔 출력용으로만 사용
-            if file_ext == '.csv':
-                print("📄 CSV 파일 파싱(미리보기) 중...")
-                preview_result = self.file_parser.parse_csv_preview(file_path, max_rows=5)
-                file_type = "CSV"
-            elif file_ext in ['.xls', '.xlsx']:
-                print("📊 Excel 파일 파싱(미리보기) 중...")
-                preview_result = self.file_parser.parse_excel_preview(file_path, max_rows=5)
-                file_type = "Excel"
-            else:
-                print(f"❌ 지원하지 않는 파일 형식: {file_ext}")
-                return
-            if preview_result['success']:
-                print(f"✅ {file_type} 미리보기 파싱 성공!")
-                self.file_parser.print_csv_preview(preview_result)
-            else:
-                print(f"❌ {file_type} 미리보기 파싱 실패: {preview_result['error']}")
-            # 2. 전체 데이터 파싱해서 테이블에 표시
-            if file_ext == '.csv':
-                print("📄 CSV 파일 전체 데이터 파싱 중...")
-                result = self.file_parser.parse_csv_all(file_path)
-                file_type = "CSV"
-            elif file_ext in ['.xls', '.xlsx']:
-                # parse_excel_all이 없다면, parse_excel_preview(max_rows=99999)로 대체
-                print("📊 Excel 파일 전체 데이터 파싱 중...")
-                result = self.file_parser.parse_excel_preview(file_path, max_rows=99999)
-                file_type = "Excel"
-            else:
+            # 파일을 한 번만 읽어 미리보기(콘솔 출력)와 전체 데이터(테이블 표시)를 함께 생성
+            session = ParseSession(file_path, preview_rows=5, parser=self.file_parser,
+                                   cache=self.parse_cache)
+            file_type = session.file_type
+            if file_type is None:
+                print(f"❌ 지원하지 않는 파일 형식: {session.file_ext}")
                 return
+            print(f"📄 {file_type} 파일 전체 데이터 파싱 중...")
+            result = session.run()
             if result['success']:
-                print(f"✅ {file_type} 전체 데이터 파싱 성공!")
+                print(f"✅ {file_type} 파싱 성공!")
+                # 1. 미리보기(5행)는 콘솔 출력용으로만 사용
+                self.file_parser.print_csv_preview(session.preview)
+                # 2. 전체 데이터는 테이블에 표시
                 self.selected_file_path = file_path
                 print(f"📝 총 {result['total_rows']}개의 데이터 행 발견")
                 print(f"📊 {len(result['headers'])}개의 컬럼 발견: {', '.join(result['headers'])}")
+                check = result.get('balance_check')
+                if check is not None and not check['ok']:
+                    self.statusBar().showMessage(
+                        f"⚠️ 잔액 연속성이 끊긴 행 {check['break_count']}개 (누락/중복/정렬 오류 가능)")
                 if self.transactions_table is not None:
                     self.display_csv_data_in_table(result)
                     print("🔄 거래내역 화면으로 자동 전환")
                     self.show_transactions_screen()
             else:
-                print(f"❌ {file_type} 전체 데이터 파싱 실패: {result['error']}")
+                print(f"❌ {file_type} 파싱 실패: {result['error']}")
         except Exception as e:
             print(f"❌ 파싱 중 예외 발생: {e}")
 
+    def mark_balance_breaks(self, headers: list, check) -> None:
+        """
+        잔액 연속성 검사에서 끊긴 행의 잔액 셀을 강조하고 원인을 툴팁으로 표시
+        
+        Args:
+            headers: 테이블 헤더 목록
+            check: 파싱 결과의 balance_check (없거나 이상이 없으면 아무것도 하지 않음)
+        """
+        if not check or check['ok'] or "잔액" not in headers:
+            return
+        col = headers.index("잔액")
+        for line, brk in zip(describe_balance(check, limit=len(check['breaks'])), check['breaks']):
+            item = self.transactions_table.item(brk['row'], col)
+            if item is not None:
+                item.setBackground(QBrush(self.BALANCE_BREAK_COLOR))
+                item.setToolTip(line)
+
+    def import_large_file(self, file_path: str) -> dict:
+        """
+        대용량 파일을 스트리밍 모드로 transactions 테이블에 가져오고 테이블에 점진적으로 표시
+        
+        파일 전체를 메모리에 올리지 않고 청크 단위로 파싱/삽입하며,
+        진행률은 읽은 바이트 기준으로 표시합니다.
+        테이블에는 처음 STREAMING_TABLE_ROWS개 행만 도착하는 대로 추가합니다.
+        
+        Args:
+            file_path: 가져올 파일 경로 (CSV 또는 Excel)
+            
+        Returns:
+            dict: TransactionImporter.import_file 결과
+        """
+        print(f"\n📦 스트리밍 모드 가져오기 시작: {file_path}")
+        self.clear_category_change_history()
+        self.selected_file_path = file_path
+        
+        progress_dialog = QProgressDialog("대용량 거래내역 가져오는 중...", None, 0, 1000, self)
+        progress_dialog.setWindowTitle("거래내역 가져오기")
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        
+        table = self.transactions_table
+        loaded = {'rows': 0}
+        
+        def on_chunk(headers, chunk):
+            # 테이블은 화면 확인용 앞부분만 점진적으로 채움 (메모리 사용량 일정)
+            if table is None or loaded['rows'] >= self.STREAMING_TABLE_ROWS:
+                return
+            if loaded['rows'] == 0:
+                table.setColumnCount(len(headers))
+                table.setHorizontalHeaderLabels(headers)
+            rows = chunk[:self.STREAMING_TABLE_ROWS - loaded['rows']]
+            start = loaded['rows']
+            table.setRowCount(start + len(rows))
+            for row_idx, row_data in enumerate(rows, start=start):
+                for col_idx, cell_data in enumerate(row_data):
+                    table.setItem(row_idx, col_idx, QTableWidgetItem(str(cell_data)))
+                self.row_to_transaction_id[row_idx] = None
+            loaded['rows'] += len(rows)
+        
+        def on_progress(done, total):
+            progress_dialog.setValue(int(done * 1000 / total) if total else 1000)
+            progress_dialog.setLabelText(
+                f"대용량 거래내역 가져오는 중... ({done / (1024 * 1024):,.0f}MB / {total / (1024 * 1024):,.0f}MB)"
+            )
+            QApplication.processEvents()
+        
+        result = TransactionImporter().import_file(file_path, progress=on_progress, on_chunk=on_chunk)
+        progress_dialog.close()
+        
+        if not result['success']:
+            print(f"❌ 스트리밍 가져오기 실패: {result['error']}")
+            QMessageBox.critical(self, "가져오기 오류", result['error'])
+            return result
+        
+        if table is not None:
+            table.resizeColumnsToContents()
+            if hasattr(self, 'transactions_file_label'):
+                file_name = os.path.basename(file_path)
+                duplicates = f", 중복 {result['duplicates']:,}건 건너뜀" if result['duplicates'] else ""
+                self.transactions_file_label.setText(
+                    f"📁 가져온 파일: {file_name} ({result['inserted']:,}건 저장{duplicates}, 앞 {loaded['rows']:,}행 표시)"
+                )
+            self.show_transactions_screen()
+        print(f"✅ 스트리밍 가져오기 완료: {result['inserted']:,}건 ({result['rows_per_sec']:,.0f}행/초)")
+        return result
+
     def on_load_file_clicked(self):
         """슬라이스 1.1: 거래내역 파일 불러오기 버튼 클릭 이벤트 처리"""
         print("🔄 파일 선택 시작...")
@@ -979,7 +1171,11 @@ class MainWindow(QMainWindow):
                 print(f"✅ 파일 선택 완료: {file_path}")
                 
                 # 슬라이스 1.2: 파일 선택 완료 후 자동으로 파싱 및 콘솔 출력 실행
-                self.parse_and_display_preview(file_path)
+                # (대용량 파일은 메모리에 올리지 않고 스트리밍 모드로 DB에 가져옴)
+                if self.file_handler.import_mode == FileHandler.IMPORT_MODE_STREAMING:
+                    self.import_large_file(file_path)
+                else:
+                    self.parse_and_display_preview(file_path)
                 
             else:
                 # 오류 시 기본 상태로 되돌리기
@@ -997,6 +1193,67 @@ class MainWindow(QMainWindow):
         else:
             print("📂 파일 선택 취소됨")
     
+    def on_load_multiple_files_clicked(self):
+        """여러 거래내역 파일을 선택하여 백그라운드에서 읽고 거래일시 순으로 병합하여 표시"""
+        file_paths = self.file_handler.select_files(self)
+        valid_paths = []
+        for file_path in file_paths:
+            is_valid, message = self.file_handler.validate_file(file_path)
+            if is_valid:
+                valid_paths.append(file_path)
+            else:
+                print(f"⚠️ 건너뛴 파일 {os.path.basename(file_path)}: {message}")
+        if not valid_paths:
+            return None
+        return self.load_multiple_files(valid_paths)
+
+    def load_multiple_files(self, file_paths: list, account_ids: dict = None) -> MultiFileLoader:
+        """
+        여러 거래내역 파일을 작업 스레드에서 가져오기 시작 (UI 스레드는 진행률만 표시)
+
+        Args:
+            file_paths: 거래내역 파일 경로 목록
+            account_ids: 파일 경로 → 계좌 식별자 (없으면 은행 프로필 이름)
+
+        Returns:
+            MultiFileLoader: 시작된 로더 (완료되면 on_multiple_files_loaded 호출)
+        """
+        print(f"\n🗂️ 여러 파일 가져오기 시작: {len(file_paths)}개")
+        self.clear_category_change_history()
+        progress_dialog = QProgressDialog("여러 거래내역 파일 가져오는 중...", None, 0, len(file_paths), self)
+        progress_dialog.setWindowTitle("거래내역 가져오기")
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setValue(0)
+
+        loader = MultiFileLoader(file_paths, account_ids, parent=self)
+        loader.progress.connect(lambda done, total: progress_dialog.setValue(done))
+        loader.finished.connect(progress_dialog.close)
+        loader.finished.connect(self.on_multiple_files_loaded)
+        self.multi_file_loader = loader
+        loader.start()
+        return loader
+
+    def on_multiple_files_loaded(self, result: dict) -> None:
+        """여러 파일 가져오기 결과를 거래내역 테이블에 표시"""
+        self.multi_file_loader = None
+        if not result['success']:
+            print(f"❌ 여러 파일 가져오기 실패: {result['error']}")
+            QMessageBox.critical(self, "가져오기 오류", result['error'])
+            return
+        self.selected_file_path = None
+        if self.transactions_table is not None:
+            self.display_csv_data_in_table(result)
+            if hasattr(self, 'transactions_file_label'):
+                self.transactions_file_label.setText(
+                    f"📁 {len(result['files'])}개 파일, {len(result['accounts'])}개 계좌 ({result['total_rows']:,}행, 거래일시 순)"
+                )
+            self.show_transactions_screen()
+        broken = [path for path, check in result['balance_checks'].items() if check is not None and not check['ok']]
+        if broken:
+            self.statusBar().showMessage(
+                f"⚠️ 잔액 연속성이 끊긴 파일 {len(broken)}개: {', '.join(os.path.basename(p) for p in broken)}")
+        print(f"✅ 여러 파일 가져오기 완료: {result['total_rows']:,}행")
+
     # 슬라이스 1.6: 파일 형식 안내 팝업 기능
     def show_file_format_guide(self):
         """슬라이스 1.6: 파일 형식 안내 대화상자를 표시합니다"""
@@ -1125,10 +1382,19 @@ class MainWindow(QMainWindow):
             </ul>
         </div>
         
+        <div style="margin-bottom: 20px;">
+            <h4 style="color: #2980b9; margin-bottom: 10px;">🗜️ 압축 파일</h4>
+            <ul style="margin-left: 20px; line-height: 1.6;">
+                <li><strong>확장자:</strong> .zip, .gz (예: 2023_거래내역.csv.gz)</li>
+                <li><strong>내용:</strong> 안의 CSV/Excel 파일을 압축을 풀지 않고 한 번에 모두 가져오기</li>
+                <li><strong>가져오기:</strong> 항상 스트리밍 모드로 바로 저장</li>
+            </ul>
+        </div>
+        
         <div style="margin-bottom: 20px;">
             <h4 style="color: #f39c12; margin-bottom: 10px;">⚠️ 파일 제한사항</h4>
             <ul style="margin-left: 20px; line-height: 1.6;">
-                <li><strong>최대 크기:</strong> 50MB</li>
+                <li><strong>파일 크기:</strong> 제한 없음 (50MB 초과 파일은 스트리밍 모드로 바로 저장)</li>
                 <li><strong>지원하지 않는 형식:</strong> .txt, .doc, .pdf 등</li>
                 <li><strong>특수문자:</strong> 파일명에 특수문자 주의</li>
             </ul>
@@ -1158,8 +1424,7 @@ class MainWindow(QMainWindow):
             <h4 style="color: #e74c3c; margin-bottom: 10px;">🚨 문제 해결</h4>
             <p style="margin-bottom: 8px;"><strong>파일이 열리지 않는 경우:</strong></p>
             <ul style="margin-left: 20px; margin-bottom: 15px;">
-                <li>파일 크기가 50MB 이하인지 확인</li>
-                <li>확장자가 .csv, .xls, .xlsx인지 확인</li>
+                <li>확장자가 .csv, .xls, .xlsx (압축 파일은 .zip, .gz)인지 확인</li>
                 <li>Excel 파일이 열려있지 않은지 확인</li>
             </ul>
             <p style="margin-bottom: 8px;"><strong>데이터가 이상하게 표시되는 경우:</strong></p>
@@ -1330,11 +1595,7 @@ class MainWindow(QMainWindow):
             str: 파일의 MD5 해시값
         """
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            return compute_file_hash(file_path)
         except Exception as e:
             print(f"❌ 파일 해시 계산 중 오류: {e}")
             return ""
@@ -1,6 +1,7 @@
 import sys
 from PySide6.QtWidgets import (QApplication, QDialog, QVBoxLayout, 
-    QHBoxLayout, QLabel, QLineEdit, QPushButton, QWidget, QMessageBox)
+    QHBoxLayout, QLabel, QLineEdit, QPushButton, QWidget, QMessageBox,
+    QComboBox, QSpinBox, QFileDialog)
 from PySide6.QtCore import Qt
 
 # 프로젝트 루트 디렉토리를 기준으로 app 디렉토리를 sys.path에 추가
@@ -9,6 +10,18 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from db.crud import save_setting, get_setting
 
+# 감시 폴더 변경 감지 방식 (설정 값, 표시 이름)
+WATCH_MODE_CHOICES = [
+    ("polling", "주기적 확인 (폴링)"),
+    ("inotify", "즉시 감지 (inotify)"),
+]
+
+# 전체 파싱 백엔드 (설정 값, 표시 이름)
+PARSE_BACKEND_CHOICES = [
+    ("python", "기본 (Python)"),
+    ("pandas", "pandas (설치된 경우)"),
+]
+
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -27,6 +40,52 @@ class SettingsDialog(QDialog):
 
         self.layout.addLayout(api_key_layout)
 
+        # 감시 폴더 자동 가져오기 섹션
+        watch_folder_layout = QHBoxLayout()
+        self.watch_folder_label = QLabel("감시 폴더:")
+        self.watch_folder_input = QLineEdit()
+        self.watch_folder_input.setPlaceholderText("거래내역을 내려받는 폴더 (비워두면 사용 안 함)")
+        self.watch_folder_button = QPushButton("찾아보기")
+        self.watch_folder_button.clicked.connect(self.select_watch_folder)
+        watch_folder_layout.addWidget(self.watch_folder_label)
+        watch_folder_layout.addWidget(self.watch_folder_input)
+        watch_folder_layout.addWidget(self.watch_folder_button)
+        self.layout.addLayout(watch_folder_layout)
+
+        watch_mode_layout = QHBoxLayout()
+        self.watch_mode_label = QLabel("감지 방식:")
+        self.watch_mode_combo = QComboBox()
+        for mode, label in WATCH_MODE_CHOICES:
+            self.watch_mode_combo.addItem(label, mode)
+        self.watch_interval_label = QLabel("확인 주기(초):")
+        self.watch_interval_spin = QSpinBox()
+        self.watch_interval_spin.setRange(5, 3600)
+        self.watch_interval_spin.setValue(30)
+        self.watch_mode_combo.currentIndexChanged.connect(self.update_watch_interval_enabled)
+        watch_mode_layout.addWidget(self.watch_mode_label)
+        watch_mode_layout.addWidget(self.watch_mode_combo)
+        watch_mode_layout.addWidget(self.watch_interval_label)
+        watch_mode_layout.addWidget(self.watch_interval_spin)
+        self.layout.addLayout(watch_mode_layout)
+
+        watch_account_layout = QHBoxLayout()
+        self.watch_account_label = QLabel("계좌:")
+        self.watch_account_input = QLineEdit()
+        self.watch_account_input.setPlaceholderText("감시 폴더 파일의 계좌 (입력하면 새 거래만 이어서 가져오기)")
+        watch_account_layout.addWidget(self.watch_account_label)
+        watch_account_layout.addWidget(self.watch_account_input)
+        self.layout.addLayout(watch_account_layout)
+
+        # 파싱 백엔드 섹션
+        parse_backend_layout = QHBoxLayout()
+        self.parse_backend_label = QLabel("파싱 백엔드:")
+        self.parse_backend_combo = QComboBox()
+        for backend, label in PARSE_BACKEND_CHOICES:
+            self.parse_backend_combo.addItem(label, backend)
+        parse_backend_layout.addWidget(self.parse_backend_label)
+        parse_backend_layout.addWidget(self.parse_backend_combo)
+        self.layout.addLayout(parse_backend_layout)
+
         # 저장 버튼
         self.save_button = QPushButton("저장")
         self.save_button.clicked.connect(self.save_settings)
@@ -43,13 +102,57 @@ class SettingsDialog(QDialog):
         if api_key:
             self.api_key_input.setText(api_key)
 
+        watch_folder = get_setting("watch_folder")
+        if watch_folder:
+            self.watch_folder_input.setText(watch_folder)
+        mode_index = self.watch_mode_combo.findData(get_setting("watch_mode") or "polling")
+        if mode_index >= 0:
+            self.watch_mode_combo.setCurrentIndex(mode_index)
+        watch_account = get_setting("watch_account")
+        if watch_account:
+            self.watch_account_input.setText(watch_account)
+        backend_index = self.parse_backend_combo.findData(get_setting("parse_backend") or "python")
+        if backend_index >= 0:
+            self.parse_backend_combo.setCurrentIndex(backend_index)
+        watch_interval = get_setting("watch_interval")
+        if watch_interval and watch_interval.isdigit():
+            self.watch_interval_spin.setValue(int(watch_interval))
+        self.update_watch_interval_enabled()
+
+    def select_watch_folder(self):
+        """
+        감시 폴더 선택 대화상자를 엽니다.
+        """
+        folder = QFileDialog.getExistingDirectory(self, "감시 폴더 선택", self.watch_folder_input.text())
+        if folder:
+            self.watch_folder_input.setText(folder)
+
+    def update_watch_interval_enabled(self):
+        """
+        확인 주기는 폴링 방식에서만 사용하므로 다른 방식에서는 비활성화합니다.
+        """
+        self.watch_interval_spin.setEnabled(self.watch_mode_combo.currentData() == "polling")
+
     def save_settings(self):
         """
         UI에 입력된 설정 값을 저장합니다.
         """
         api_key = self.api_key_input.text()
+        watch_folder = self.watch_folder_input.text().strip()
+        
+        if watch_folder and not os.path.isdir(watch_folder):
+            QMessageBox.warning(self, "감시 폴더 오류", "감시 폴더가 존재하지 않습니다.")
+            return
         
-        if save_setting("chatgpt_api_key", api_key):
+        saved = all([
+            save_setting("chatgpt_api_key", api_key),
+            save_setting("watch_folder", watch_folder),
+            save_setting("watch_mode", self.watch_mode_combo.currentData()),
+            save_setting("watch_interval", self.watch_interval_spin.value()),
+            save_setting("watch_account", self.watch_account_input.text().strip()),
+            save_setting("parse_backend", self.parse_backend_combo.currentData()),
+        ])
+        if saved:
             QMessageBox.information(self, "성공", "설정 값이 저장되었습니다.")
         else:
             QMessageBox.critical(self, "오류", "설정 값 저장 중 오류가 발생했습니다.")
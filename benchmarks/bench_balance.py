@@ -0,0 +1,56 @@
+"""
+벤치마크: 잔액 연속성 검사 - 파이썬 반복 vs NumPy 벡터 연산(check_balance)
+
+실행: python -m benchmarks.bench_balance [행 수]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from ai_smart_ledger.app.core.balance_check import ORDER_DESCENDING, check_balance
+
+
+def make_arrays(rows: int, seed: int = 42):
+    """최신 거래가 위에 오는 잔액 연속 배열 (중간에 행 하나 누락)"""
+    rng = np.random.default_rng(seed)
+    amounts = rng.integers(1, 500, rows, dtype=np.int64) * 100
+    is_deposit = rng.random(rows) < 0.3
+    deposits = np.where(is_deposit, amounts, 0)
+    withdrawals = np.where(is_deposit, 0, amounts)
+    # 내림차순: balances[i] = balances[i + 1] + net[i] → 아래(과거)부터 누적
+    balances = 10_000_000 + np.cumsum((deposits - withdrawals)[::-1])[::-1]
+    keep = np.ones(rows, dtype=bool)
+    keep[rows // 2] = False
+    return deposits[keep], withdrawals[keep], balances[keep]
+
+
+def python_loop(deposits, withdrawals, balances):
+    """행마다 비교하는 기존 방식"""
+    deposits, withdrawals, balances = deposits.tolist(), withdrawals.tolist(), balances.tolist()
+    return [i for i in range(len(balances) - 1)
+            if balances[i] - balances[i + 1] != deposits[i] - withdrawals[i]]
+
+
+def main(rows: int = 5_000_000) -> None:
+    arrays = make_arrays(rows)
+    print(f"🧮 잔액 연속성 검사 {rows:,}행 (중간 행 1개 누락)")
+
+    start = time.perf_counter()
+    loop_breaks = python_loop(*arrays)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = check_balance(*arrays, order=ORDER_DESCENDING)
+    vector_time = time.perf_counter() - start
+
+    assert result['break_rows'].tolist() == loop_breaks
+    print(f"{'방식':<16}{'시간(초)':>10}{'끊긴 행':>10}")
+    print(f"{'파이썬 반복':<16}{loop_time:>10.3f}{len(loop_breaks):>10}")
+    print(f"{'벡터 연산':<16}{vector_time:>10.3f}{result['break_count']:>10}")
+    print(f"➡️ {loop_time / vector_time:.1f}배 단축")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
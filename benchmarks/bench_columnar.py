@@ -0,0 +1,53 @@
+"""
+벤치마크: 행 리스트 파싱(parse_csv_all) vs 컬럼형 파싱(parse_csv_columnar)
+
+행 리스트 결과는 소비자가 금액/일시를 다시 변환해야 하므로
+'행 리스트 + 타입 변환' 비용도 함께 측정합니다.
+
+실행: python -m benchmarks.bench_columnar [행 수]
+"""
+
+import os
+import sys
+from datetime import datetime
+
+from ai_smart_ledger.app.core.file_parser import FileParser
+from benchmarks.synthetic import measure, write_statement
+
+
+def parse_rows_and_convert(path: str):
+    """parse_csv_all 결과를 소비자 방식(int/strptime)으로 타입 변환"""
+    result = FileParser.parse_csv_all(path)
+    headers = result['headers']
+    amount_idx = [headers.index(h) for h in ("입금", "출금", "잔액")]
+    date_idx, time_idx = headers.index("날짜"), headers.index("시간")
+    typed = []
+    for row in result['data']:
+        amounts = [int(row[i].replace(',', '')) for i in amount_idx]
+        ts = datetime.strptime(f"{row[date_idx]} {row[time_idx]}", "%Y-%m-%d %H:%M:%S")
+        typed.append((ts, *amounts))
+    return result, typed
+
+
+def main(rows: int = 200_000) -> None:
+    path = write_statement(rows)
+    try:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"📄 합성 거래내역 {rows:,}행 ({size_mb:.1f}MB)")
+
+        _, list_time, list_mem = measure(FileParser.parse_csv_all, path)
+        _, typed_time, typed_mem = measure(parse_rows_and_convert, path)
+        _, col_time, col_mem = measure(FileParser.parse_csv_columnar, path)
+
+        print(f"{'모드':<20}{'시간(초)':>10}{'메모리(MB)':>12}")
+        print(f"{'행 리스트':<20}{list_time:>10.2f}{list_mem / 1e6:>12.1f}")
+        print(f"{'행 리스트 + 타입 변환':<20}{typed_time:>10.2f}{typed_mem / 1e6:>12.1f}")
+        print(f"{'컬럼형':<20}{col_time:>10.2f}{col_mem / 1e6:>12.1f}")
+        print(f"➡️ 행 리스트 대비 메모리 {list_mem / max(col_mem, 1):.1f}배 감소")
+        print(f"➡️ 타입 변환 포함 대비 시간 {typed_time / col_time:.1f}배 단축")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,62 @@
+"""
+벤치마크: 같은 거래내역 파일을 두 번 가져오기 - 지문 유니크 인덱스로 중복 건너뛰기
+
+두 번째 가져오기는 행마다 유니크 인덱스를 한 번 조회할 뿐 테이블을 훑지 않으며, 삽입 건수는 0이어야 합니다.
+비교용으로 행마다 기존 거래를 컬럼 값으로 찾는 방식(인덱스 없음)의 조회 시간을 앞부분 표본으로 추정합니다.
+
+실행: python -m benchmarks.bench_dedupe [행 수]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from ai_smart_ledger.app.core.transaction_importer import TransactionImporter
+from benchmarks.synthetic import connect_ledger, write_statement
+
+
+# 인덱스 없는 조회 시간을 추정할 표본 행 수
+SCAN_SAMPLE = 20
+
+
+def main(rows: int = 1_000_000) -> None:
+    path = write_statement(rows)
+    fd, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    try:
+        print(f"📄 합성 거래내역 {rows:,}행 ({os.path.getsize(path) / (1024 * 1024):.1f}MB)을 두 번 가져오기")
+        conn = connect_ledger(db_path)
+        results = []
+        for _ in range(2):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = TransactionImporter("bench", conn=conn).import_file(path)
+            assert result['success'], result['error']
+            results.append((result, time.perf_counter() - start))
+
+        # 지문 없이 행마다 같은 거래를 찾으면 매번 테이블 전체를 훑음
+        sample = conn.execute("SELECT account_id, timestamp, description, amount_in, amount_out FROM transactions "
+                              f"LIMIT {SCAN_SAMPLE}").fetchall()
+        start = time.perf_counter()
+        for row in sample:
+            conn.execute("SELECT 1 FROM transactions WHERE account_id = ? AND timestamp = ? AND description = ? "
+                         "AND amount_in IS ? AND amount_out IS ?", row).fetchone()
+        scan_estimate = (time.perf_counter() - start) / len(sample) * rows
+        conn.close()
+
+        print(f"{'가져오기':<12}{'시간(초)':>10}{'삽입':>12}{'중복':>12}")
+        for label, (result, elapsed) in zip(("첫 번째", "두 번째"), results):
+            print(f"{label:<12}{elapsed:>10.2f}{result['inserted']:>12,}{result['duplicates']:>12,}")
+        print(f"➡️ 두 번째 가져오기 삽입 {results[1][0]['inserted']}건 "
+              f"(인덱스 없이 행마다 테이블을 훑으면 조회만 약 {scan_estimate:,.0f}초)")
+        assert results[1][0]['inserted'] == 0 and results[1][0]['duplicates'] == rows
+    finally:
+        os.unlink(path)
+        os.unlink(db_path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
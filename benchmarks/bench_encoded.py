@@ -0,0 +1,55 @@
+"""
+벤치마크: 행 리스트 결과 vs 사전 인코딩 결과(EncodedRows)
+
+같은 파일을 기존 방식(list(stream))과 parse_csv_all(EncodedRows)로 읽어
+결과가 차지하는 메모리와 가맹점별 건수 집계 시간을 비교합니다.
+
+실행: python -m benchmarks.bench_encoded [행 수]
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+
+from ai_smart_ledger.app.core.csv_stream import open_csv_stream
+from ai_smart_ledger.app.core.file_parser import FileParser
+from benchmarks.synthetic import measure, write_statement
+
+
+def parse_row_list(path: str):
+    """사전 인코딩 이전의 전체 파싱 방식 (행마다 문자열 리스트)"""
+    with open_csv_stream(path) as stream:
+        return {'headers': stream.headers, 'data': list(stream)}
+
+
+def main(rows: int = 200_000) -> None:
+    path = write_statement(rows)
+    try:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"📄 합성 거래내역 {rows:,}행 ({size_mb:.1f}MB)")
+
+        plain, list_time, list_mem = measure(parse_row_list, path)
+        encoded, enc_time, enc_mem = measure(FileParser.parse_csv_all, path)
+        assert encoded['data'] == plain['data']
+
+        idx = plain['headers'].index("내용")
+        start = time.perf_counter()
+        by_string = Counter(row[idx] for row in plain['data'])
+        string_time = time.perf_counter() - start
+        start = time.perf_counter()
+        by_code = encoded['data'].value_counts("내용")
+        code_time = time.perf_counter() - start
+        assert by_code == dict(by_string)
+
+        print(f"{'모드':<20}{'파싱(초)':>10}{'메모리(MB)':>12}{'가맹점 집계(초)':>16}")
+        print(f"{'행 리스트':<20}{list_time:>10.2f}{list_mem / 1e6:>12.1f}{string_time:>16.4f}")
+        print(f"{'사전 인코딩':<20}{enc_time:>10.2f}{enc_mem / 1e6:>12.1f}{code_time:>16.4f}")
+        print(f"➡️ 결과 메모리 {list_mem / max(enc_mem, 1):.1f}배 감소, "
+              f"가맹점 집계 {string_time / max(code_time, 1e-9):.1f}배 단축")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
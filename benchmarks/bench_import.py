@@ -0,0 +1,43 @@
+"""
+벤치마크: 합성 거래내역 파일을 transactions 테이블로 일괄 가져오기 처리량
+
+임시 SQLite 파일에 앱과 같은 테이블을 만들고 TransactionImporter로 가져옵니다.
+
+실행: python -m benchmarks.bench_import [행 수]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from ai_smart_ledger.app.core.transaction_importer import TransactionImporter
+from benchmarks.synthetic import connect_ledger, write_statement
+
+
+def main(rows: int = 1_000_000) -> None:
+    path = write_statement(rows)
+    fd, db_path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    try:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"📄 합성 거래내역 {rows:,}행 ({size_mb:.1f}MB)")
+
+        conn = connect_ledger(db_path)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = TransactionImporter("bench", conn=conn).import_file(path)
+        total = time.perf_counter() - start
+        conn.close()
+
+        assert result['success'], result['error']
+        print(f"➡️ {result['inserted']:,}건 삽입: 전체 {total:.2f}초 ({result['inserted'] / total:,.0f}행/초)")
+    finally:
+        os.unlink(path)
+        os.unlink(db_path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,68 @@
+"""
+벤치마크: 여러 해 치 거래내역의 다음 달 파일 가져오기 - 전체 다시 가져오기 vs 증분 가져오기
+
+이전 파일(과거 거래)을 먼저 가져온 뒤, 새 거래가 추가된 다음 파일을 가져오는 시간을 비교합니다.
+- 내림차순(최신 거래가 위) 파일: 기억한 구간을 만나면 읽기를 멈춤
+- 오름차순 파일을 이어 쓴 경우: 마지막 위치부터만 파싱
+- 오름차순 파일을 기간을 옮겨 다시 내려받은 경우: 레코드 경계만 바이트 스캔하고 끝에서부터 겹치는 구간까지만 파싱
+
+실행: python -m benchmarks.bench_incremental [이전 행 수] [새 행 수]
+"""
+
+import os
+import sys
+import tempfile
+
+from ai_smart_ledger.app.core.incremental_import import import_incremental
+from ai_smart_ledger.app.core.transaction_importer import TransactionImporter
+from benchmarks.synthetic import connect_ledger, timed, write_statement
+
+
+def write_lines(folder: str, name: str, header: str, lines: list) -> str:
+    path = os.path.join(folder, name)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(header)
+        f.writelines(lines)
+    return path
+
+
+def main(history: int = 500_000, new: int = 5_000) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        source = write_statement(history + new, os.path.join(folder, "source.csv"))
+        with open(source, encoding='utf-8', newline='') as f:
+            header, *lines = f.readlines()
+        # 내림차순: 새 거래는 위쪽 new행, 오름차순: 뒤집어서 새 거래가 뒤쪽
+        cases = {
+            "내림차순": (lines[new:], lines),
+            "오름차순(이어 쓰기)": (lines[::-1][:history], lines[::-1]),
+            "오름차순(기간 이동)": (lines[::-1][:history], lines[::-1][new:]),
+        }
+        print(f"📄 이전 파일 {history:,}행 + 새 거래 {new:,}행")
+        print(f"{'파일':<16}{'전체 다시 가져오기':>14}{'증분 가져오기':>12}{'파싱 행':>12}{'배속':>8}")
+        for label, (previous, current) in cases.items():
+            current_path = write_lines(folder, "current.csv", header, current)
+            conn = connect_ledger()
+            full, full_time = timed(TransactionImporter("bench", conn=conn).import_file, current_path)
+            conn.close()
+
+            conn = connect_ledger()
+            previous_path = write_lines(folder, "previous.csv", header, previous)
+            if label == "오름차순(이어 쓰기)":
+                # 같은 파일에 새 거래를 이어 쓴 상황
+                timed(import_incremental, previous_path, "bench", None, conn)
+                with open(previous_path, 'a', encoding='utf-8', newline='') as f:
+                    f.writelines(current[history:])
+                target = previous_path
+            else:
+                timed(import_incremental, previous_path, "bench", None, conn)
+                target = current_path
+            result, incremental_time = timed(import_incremental, target, "bench", None, conn)
+            conn.close()
+
+            assert full['inserted'] == len(current) and result['inserted'] == new, result
+            print(f"{label:<16}{full_time:>14.2f}{incremental_time:>12.3f}{result['parsed_rows']:>12,}"
+                  f"{full_time / incremental_time:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,41 @@
+"""
+벤치마크: 전체 파싱(parse_csv_all) vs 지연 로딩(open_csv_lazy) 열기 시간/메모리
+
+지연 로딩은 오프셋 인덱스만 만들고, 화면 한 페이지(100행) 조회 시간을 따로 측정합니다.
+
+실행: python -m benchmarks.bench_lazy [행 수]
+"""
+
+import os
+import sys
+import time
+
+from ai_smart_ledger.app.core.file_parser import FileParser
+from benchmarks.synthetic import measure, write_statement
+
+
+def main(rows: int = 1_000_000) -> None:
+    path = write_statement(rows)
+    try:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"📄 합성 거래내역 {rows:,}행 ({size_mb:.1f}MB)")
+
+        _, full_time, full_mem = measure(FileParser.parse_csv_all, path)
+        lazy, lazy_time, lazy_mem = measure(FileParser.open_csv_lazy, path)
+
+        start = time.perf_counter()
+        page = lazy[len(lazy) // 2:len(lazy) // 2 + 100]
+        page_time = time.perf_counter() - start
+        lazy.close()
+        assert len(page) == 100
+
+        print(f"{'모드':<20}{'시간(초)':>10}{'메모리(MB)':>12}")
+        print(f"{'전체 파싱':<20}{full_time:>10.2f}{full_mem / 1e6:>12.1f}")
+        print(f"{'지연 로딩 (인덱스)':<20}{lazy_time:>10.2f}{lazy_mem / 1e6:>12.1f}")
+        print(f"➡️ 100행 페이지 조회 {page_time * 1000:.2f}ms")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
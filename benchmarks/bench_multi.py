@@ -0,0 +1,45 @@
+"""
+벤치마크: 월별 거래내역 여러 개 가져오기 - 파일별 순차 파싱 vs load_statements (스레드 읽기 + 프로세스 정규화)
+
+가장 큰 파일 하나를 파싱하는 시간도 함께 출력하여 병렬 가져오기가 그 시간에 얼마나 가까운지 비교합니다.
+(CPU가 하나뿐인 환경에서는 프로세스 병렬화 이득이 없습니다)
+
+실행: python -m benchmarks.bench_multi [가장 큰 파일 행 수] [파일 수]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from ai_smart_ledger.app.core.file_parser import FileParser
+from ai_smart_ledger.app.core.multi_import import load_statements
+from benchmarks.synthetic import timed, write_statement
+
+
+def main(rows: int = 100_000, files: int = 10) -> None:
+    folder = tempfile.mkdtemp()
+    try:
+        # 달마다 거래 수가 다른 월별 거래내역 (마지막 파일이 가장 큼)
+        paths = [write_statement(rows * (m + 1) // files, os.path.join(folder, f"{m + 1:02d}.csv"), seed=m)
+                 for m in range(files)]
+        total_mb = sum(os.path.getsize(p) for p in paths) / (1024 * 1024)
+        print(f"📄 합성 월별 거래내역 {files}개 ({total_mb:.1f}MB, CPU {os.cpu_count()}개)")
+
+        _, largest_time = timed(FileParser.parse_csv_all, paths[-1])
+        _, sequential_time = timed(lambda: [FileParser.parse_csv_all(p) for p in paths])
+        result, multi_time = timed(load_statements, paths)
+
+        print(f"{'방식':<24}{'시간(초)':>10}")
+        print(f"{'가장 큰 파일 1개':<24}{largest_time:>10.2f}")
+        print(f"{'파일별 순차 파싱':<24}{sequential_time:>10.2f}")
+        print(f"{'load_statements':<24}{multi_time:>10.2f}")
+        print(f"➡️ 병합 결과 {result['total_rows']:,}행, 순차 대비 {sequential_time / multi_time:.1f}배, "
+              f"가장 큰 파일 대비 {multi_time / largest_time:.1f}배 시간")
+    finally:
+        shutil.rmtree(folder)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 10)
@@ -0,0 +1,48 @@
+"""
+벤치마크: 전체 파싱 백엔드 비교 - 파이썬 경로 vs pandas 백엔드 (read_csv C 엔진 / read_excel)
+
+같은 파일을 두 백엔드로 파싱하여 결과가 같은지 확인하고 처리량(행/초)을 비교합니다.
+
+실행: python -m benchmarks.bench_pandas [CSV 행 수] [Excel 행 수]
+"""
+
+import os
+import sys
+
+from ai_smart_ledger.app.core.file_parser import FileParser
+from ai_smart_ledger.app.core.pandas_backend import BACKEND_PANDAS, BACKEND_PYTHON
+from benchmarks.bench_sheets import write_workbook
+from benchmarks.synthetic import timed, write_statement
+
+
+def compare(label: str, parse, path: str) -> None:
+    """두 백엔드로 같은 파일을 파싱하여 시간과 처리량 출력"""
+    python, python_time = timed(parse, path, BACKEND_PYTHON)
+    pandas, pandas_time = timed(parse, path, BACKEND_PANDAS)
+    assert python['success'] and pandas['success'], (python['error'], pandas['error'])
+    assert pandas['headers'] == python['headers'] and pandas['data'] == python['data']
+    assert pandas['total_rows'] == python['total_rows']
+
+    rows = len(python['data'])
+    print(f"{label:<8}{rows:>10,}{python_time:>10.2f}{pandas_time:>10.2f}"
+          f"{rows / python_time:>14,.0f}{rows / pandas_time:>14,.0f}{python_time / pandas_time:>7.1f}x")
+
+
+def main(csv_rows: int = 1_000_000, excel_rows: int = 50_000) -> None:
+    csv_path = write_statement(csv_rows)
+    excel_path = write_workbook(excel_rows, 1)
+    try:
+        print(f"📄 합성 CSV {csv_rows:,}행 ({os.path.getsize(csv_path) / (1024 * 1024):.1f}MB), "
+              f"Excel {excel_rows:,}행 ({os.path.getsize(excel_path) / (1024 * 1024):.1f}MB)")
+        print(f"{'파일':<8}{'행 수':>10}{'파이썬(초)':>10}{'pandas(초)':>10}"
+              f"{'파이썬 행/초':>14}{'pandas 행/초':>14}{'배속':>8}")
+        compare("CSV", lambda path, backend: FileParser.parse_csv_all(path, backend=backend), csv_path)
+        compare("Excel", lambda path, backend: FileParser.parse_excel_all(path, backend=backend), excel_path)
+        print("➡️ 두 백엔드의 파싱 결과 동일")
+    finally:
+        os.unlink(csv_path)
+        os.unlink(excel_path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,46 @@
+"""
+벤치마크: 단일 프로세스(parse_csv_all) vs 다중 프로세스(parse_csv_parallel) 처리량
+
+실행: python -m benchmarks.bench_parallel [행 수] [프로세스 수]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+from ai_smart_ledger.app.core.file_parser import FileParser
+from benchmarks.synthetic import write_statement
+
+
+def timed(func, *args) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+    assert result['success'], result['error']
+    return elapsed
+
+
+def main(rows: int = 1_000_000, workers: int = None) -> None:
+    workers = workers or os.cpu_count() or 1
+    path = write_statement(rows)
+    try:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"📄 합성 거래내역 {rows:,}행 ({size_mb:.1f}MB), CPU {os.cpu_count()}개")
+
+        single = timed(FileParser.parse_csv_all, path)
+        parallel = timed(FileParser.parse_csv_parallel, path, workers)
+
+        print(f"{'모드':<16}{'시간(초)':>10}{'처리량(MB/s)':>14}")
+        print(f"{'단일 프로세스':<16}{single:>10.2f}{size_mb / single:>14.1f}")
+        print(f"{f'{workers}개 프로세스':<16}{parallel:>10.2f}{size_mb / parallel:>14.1f}")
+        print(f"➡️ 처리량 {single / parallel:.2f}배")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else None)
@@ -0,0 +1,64 @@
+"""
+벤치마크: 단계별 가져오기 파이프라인 - 단계별 처리량, 병목 단계, 최대 메모리
+
+큐 크기가 제한되어 있으므로 가져오는 동안의 최대 메모리는 파일 크기가 아니라 큐에 머무는 블록/배치 수에 비례해야 합니다.
+
+실행: python -m benchmarks.bench_pipeline [행 수]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+from ai_smart_ledger.app.core.transaction_importer import TransactionImporter
+from benchmarks.synthetic import connect_ledger, write_statement
+
+
+def run_import(path: str, trace: bool) -> tuple:
+    """새 메모리 DB로 가져오기를 실행하여 (결과, 시간, 최대 추적 메모리) 반환"""
+    conn = connect_ledger()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if trace:
+                tracemalloc.start()
+            start = time.perf_counter()
+            result = TransactionImporter("bench", conn=conn).import_file(path)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if trace else 0
+            if trace:
+                tracemalloc.stop()
+        assert result['success'], result['error']
+        return result, elapsed, peak
+    finally:
+        conn.close()
+
+
+def main(rows: int = 1_000_000) -> None:
+    path = write_statement(rows)
+    try:
+        size = os.path.getsize(path)
+        print(f"📄 합성 거래내역 {rows:,}행 ({size / (1024 * 1024):.1f}MB)")
+        result, elapsed, _ = run_import(path, trace=False)
+
+        print(f"{'단계':<14}{'처리량':>14}{'작업(초)':>10}{'입력 대기':>10}{'출력 대기':>10}")
+        for stage in result['stages']:
+            if stage['unit'] == 'bytes':
+                rate = f"{stage['per_sec'] / (1024 * 1024):,.1f}MB/초"
+            else:
+                rate = f"{stage['per_sec']:,.0f}행/초"
+            mark = " ⬅ 병목" if stage['stage'] == result['bottleneck'] else ""
+            print(f"{stage['stage']:<14}{rate:>14}{stage['busy']:>10.2f}{stage['starved']:>10.2f}"
+                  f"{stage['blocked']:>10.2f}{mark}")
+
+        _, _, peak = run_import(path, trace=True)
+        print(f"➡️ 전체 {elapsed:.2f}초 ({result['inserted'] / elapsed:,.0f}행/초), "
+              f"최대 메모리 {peak / (1024 * 1024):.1f}MB (파일 크기의 {peak / size:.0%})")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,56 @@
+"""
+벤치마크: 미리보기 전체 행 수 계산 - 전체 파싱 vs 바이트 스캔 vs 표본 추정
+
+parse_csv_preview는 max_rows개 행만 파싱하고 전체 행 수는 따옴표를 고려한 바이트 스캔으로 셉니다.
+EXACT_COUNT_LIMIT를 넘는 파일은 표본 구간으로 추정합니다.
+
+실행: python -m benchmarks.bench_preview [행 수]
+"""
+
+import os
+import sys
+
+from ai_smart_ledger.app.core.csv_stream import CsvRowStream
+from ai_smart_ledger.app.core.file_parser import FileParser
+from benchmarks.synthetic import measure, write_statement
+
+
+def count_by_parsing(path: str) -> int:
+    """이전 방식: 모든 행을 파싱하여 행 수 계산"""
+    with CsvRowStream(path) as stream:
+        for _ in stream:
+            pass
+        return stream.rows_read
+
+
+def estimate_by_sampling(path: str) -> int:
+    """초대형 파일 방식: 표본 구간으로 행 수 추정"""
+    with CsvRowStream(path) as stream:
+        return stream.estimate_rows()
+
+
+def main(rows: int = 1_000_000) -> None:
+    path = write_statement(rows)
+    try:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"📄 합성 거래내역 {rows:,}행 ({size_mb:.1f}MB)")
+
+        parsed, parse_time, _ = measure(count_by_parsing, path)
+        preview, preview_time, _ = measure(FileParser.parse_csv_preview, path)
+        summary, summary_time, _ = measure(FileParser.get_file_summary, path)
+        estimate, estimate_time, _ = measure(estimate_by_sampling, path)
+        assert parsed == preview['total_rows'] == summary['row_count'] == rows
+
+        print(f"{'방식':<24}{'시간(초)':>10}")
+        print(f"{'전체 파싱으로 행 수 계산':<24}{parse_time:>10.3f}")
+        print(f"{'parse_csv_preview':<24}{preview_time:>10.3f}")
+        print(f"{'get_file_summary':<24}{summary_time:>10.3f}")
+        print(f"{'표본 추정':<24}{estimate_time:>10.3f}")
+        print(f"➡️ 추정 {estimate:,}행 (오차 {abs(estimate - rows) / rows:.2%})")
+        print(f"➡️ 미리보기 {parse_time / preview_time:.1f}배 빠름")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,60 @@
+"""
+벤치마크: 다중 시트 Excel - 시트 순차 파싱 vs 시트별 프로세스 병렬 파싱
+
+시트 수만큼 같은 크기의 신한은행 양식 시트를 만들고 parse_excel_all_sheets로 병합합니다.
+
+실행: python -m benchmarks.bench_sheets [시트당 행 수] [시트 수]
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+
+from openpyxl import Workbook
+
+from ai_smart_ledger.app.core.file_parser import FileParser
+from benchmarks.synthetic import timed
+
+SHINHAN_HEADERS = ["거래일자", "거래시간", "적요", "출금(원)", "입금(원)", "내용", "잔액(원)", "거래점"]
+
+
+def write_workbook(rows: int, sheets: int) -> str:
+    """시트마다 rows개 행을 가진 합성 거래내역 통합 문서 생성 (쓰기 전용 모드)"""
+    wb = Workbook(write_only=True)
+    base = datetime.datetime(2025, 1, 1)
+    for s in range(sheets):
+        ws = wb.create_sheet(f"계좌{s + 1}")
+        ws.append(SHINHAN_HEADERS)
+        for i in range(rows):
+            ts = base + datetime.timedelta(minutes=10 * (i * sheets + s))
+            ws.append([ts.replace(hour=0, minute=0), ts.time(), "체크카드", 1000 + i % 500, None,
+                       "가맹점", 1_000_000, "본점"])
+    fd, path = tempfile.mkstemp(suffix='.xlsx')
+    os.close(fd)
+    wb.save(path)
+    return path
+
+
+def main(rows: int = 20_000, sheets: int = 4) -> None:
+    path = write_workbook(rows, sheets)
+    try:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"📄 합성 통합 문서 {sheets}개 시트 x {rows:,}행 ({size_mb:.1f}MB)")
+
+        sequential, seq_time = timed(FileParser.parse_excel_all_sheets, path, 1)
+        parallel, par_time = timed(FileParser.parse_excel_all_sheets, path)
+        assert sequential['data'] == parallel['data']
+        assert parallel['total_rows'] == rows * sheets
+
+        print(f"{'모드':<20}{'시간(초)':>10}")
+        print(f"{'순차 (1 프로세스)':<20}{seq_time:>10.2f}")
+        print(f"{'시트별 병렬':<20}{par_time:>10.2f}")
+        print(f"➡️ {seq_time / par_time:.1f}배 빠름 (CPU {os.cpu_count()}개)")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 4)
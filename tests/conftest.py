@@ -0,0 +1,28 @@
+"""
+pytest 공통 설정
+
+테스트에서 만드는 MainWindow의 파싱 캐시를 테스트마다 임시 폴더에 두어,
+이전 실행이나 다른 테스트가 남긴 캐시 항목이 결과에 영향을 주지 않게 합니다.
+가져오기 테스트의 DB는 앱과 같은 models 테이블 생성/마이그레이션 함수로 만듭니다.
+"""
+
+import sqlite3
+
+import pytest
+
+from ai_smart_ledger.app.db.models import create_all_tables_on
+
+
+@pytest.fixture(autouse=True)
+def isolated_parse_cache(tmp_path, monkeypatch):
+    """환경 변수 PARSE_CACHE_DIR을 테스트 전용 임시 폴더로 설정"""
+    monkeypatch.setenv('PARSE_CACHE_DIR', str(tmp_path / 'parse_cache'))
+
+
+@pytest.fixture
+def conn():
+    """models의 모든 테이블을 만든 메모리 DB 연결"""
+    connection = sqlite3.connect(":memory:")
+    create_all_tables_on(connection)
+    yield connection
+    connection.close()
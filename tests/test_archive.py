@@ -0,0 +1,129 @@
+"""
+테스트 파일: 압축 파일 가져오기 (archive)
+
+.zip/.gz 안의 CSV/Excel 멤버를 임시 파일 없이 스트리밍으로 읽어 가져오는지 검증합니다.
+"""
+
+import gzip
+import io
+import os
+import tempfile
+import zipfile
+
+import pytest
+from openpyxl import Workbook
+
+from ai_smart_ledger.app.core.archive import list_members
+from ai_smart_ledger.app.core.csv_stream import open_csv_stream
+from ai_smart_ledger.app.core.file_handler import FileHandler
+from ai_smart_ledger.app.core.transaction_importer import TransactionImporter
+
+
+SHINHAN_HEADER = "거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n"
+
+
+def shinhan_csv(days: int, month: int = 1) -> str:
+    rows = [f'2024-{month:02d}-{d + 1:02d},09:00:00,체크카드,"1,000",,가맹점{d},"50,000",본점\n'
+            for d in range(days)]
+    return SHINHAN_HEADER + "".join(rows)
+
+
+def xlsx_bytes() -> bytes:
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["거래일시", "적요", "보낸분/받는분", "출금액(원)", "입금액(원)", "잔액(원)", "처리점"])
+    ws.append(["2024.03.01 12:30:00", "이체", "홍길동", 0, 5000, 9000, "여의도"])
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+class TestArchive:
+    """압축 파일 멤버 스트리밍 테스트 클래스"""
+
+    def test_list_zip_members(self, tmp_dir):
+        """지원하는 확장자의 멤버만 압축을 푼 크기와 함께 반환"""
+        path = os.path.join(tmp_dir, "statements.zip")
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("2024/01.csv", shinhan_csv(3))
+            zf.writestr("readme.txt", "설명")
+            zf.writestr("__MACOSX/2024/._01.csv", "메타")
+
+        members = list_members(path)
+
+        assert [m.name for m in members] == ["2024/01.csv"]
+        assert members[0].size == len(shinhan_csv(3).encode('utf-8'))
+        assert members[0].source_name == "statements.zip/2024/01.csv"
+
+    def test_csv_stream_from_gzip_cp949(self, tmp_dir):
+        """gzip 멤버도 인코딩을 감지하여 정규화된 행으로 읽어야 함"""
+        path = os.path.join(tmp_dir, "statement.csv.gz")
+        with gzip.open(path, 'wb') as f:
+            f.write(shinhan_csv(3).encode('cp949'))
+
+        member = list_members(path)[0]
+        assert member.name == "statement.csv"
+        with open_csv_stream(member.name, opener=member.open) as stream:
+            rows = list(stream)
+            assert stream.encoding == 'cp949'
+            assert stream.count_rows() == 3
+            assert stream.bytes_consumed == member.size
+
+        assert rows[0][:3] == ["2024-01-01", "09:00:00", "체크카드"]
+
+    def test_import_zip_with_multiple_members(self, tmp_dir, conn):
+        """한 번의 가져오기로 CSV/Excel 멤버를 모두 삽입하고 압축을 푼 바이트 기준으로 진행률을 보고"""
+        path = os.path.join(tmp_dir, "statements.zip")
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("01.csv", shinhan_csv(5, month=1))
+            zf.writestr("02.csv", shinhan_csv(4, month=2))
+            zf.writestr("kb.xlsx", xlsx_bytes())
+        calls = []
+
+        result = TransactionImporter("acc-1", conn=conn).import_file(
+            path, progress=lambda done, total: calls.append((done, total)))
+
+        assert result['success'] is True
+        assert result['inserted'] == 10
+        assert result['members'] == {"01.csv": 5, "02.csv": 4, "kb.xlsx": 1}
+        stages = {stage['stage']: stage for stage in result['stages']}
+        assert stages["중복 확인/삽입"]['processed'] == 10
+        assert result['bottleneck'] in stages
+        total = sum(m.size for m in list_members(path))
+        assert calls[-1] == (total, total)
+        assert [done for done, _ in calls] == sorted(done for done, _ in calls)
+        sources = conn.execute("SELECT DISTINCT source_file FROM transactions ORDER BY source_file").fetchall()
+        assert [s[0] for s in sources] == ["statements.zip/01.csv", "statements.zip/02.csv", "statements.zip/kb.xlsx"]
+
+    def test_validate_uses_uncompressed_size(self, tmp_dir):
+        """압축 파일은 멤버가 있으면 유효하고 압축을 푼 크기를 보고하며 스트리밍 모드로 가져옴"""
+        path = os.path.join(tmp_dir, "statement.csv.gz")
+        with gzip.open(path, 'wb') as f:
+            f.write(shinhan_csv(3).encode('utf-8') + b"," * (2 * 1024 * 1024))
+        handler = FileHandler()
+
+        is_valid, message = handler.validate_file(path)
+
+        assert is_valid is True
+        assert "압축 해제 2.0MB" in message
+        assert handler.import_mode == FileHandler.IMPORT_MODE_STREAMING
+        assert handler.get_file_info(path)['uncompressed_bytes'] == list_members(path)[0].size
+
+    def test_archive_without_members_rejected(self, tmp_dir):
+        """CSV/Excel 멤버가 없는 압축 파일은 거부"""
+        path = os.path.join(tmp_dir, "notes.zip")
+        with zipfile.ZipFile(path, 'w') as zf:
+            zf.writestr("readme.txt", "설명")
+
+        is_valid, message = FileHandler().validate_file(path)
+        result = TransactionImporter().import_file(path)
+
+        assert is_valid is False
+        assert "CSV/Excel 파일이 없습니다" in message
+        assert result['success'] is False
@@ -0,0 +1,126 @@
+"""
+테스트 파일: 잔액 연속성 검사 (balance_check)
+
+직전 잔액 + 입금 - 출금 = 현재 잔액 검사가 누락/중복/정렬 오류 행을 정확히 찾는지 검증합니다.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from ai_smart_ledger.app.core.balance_check import (
+    BREAK_DUPLICATE, BREAK_GAP, BREAK_UNSORTED, ORDER_ASCENDING, ORDER_DESCENDING, check_balance, check_rows,
+)
+from ai_smart_ledger.app.core.file_parser import FileParser
+
+
+HEADERS = ["날짜", "시간", "적요", "출금", "입금", "내용", "잔액"]
+
+# 과거 → 최신 순서의 잔액이 이어지는 거래내역
+ASCENDING_ROWS = [
+    ["2024-01-01", "09:00:00", "급여", "0", "100000", "회사", "100000"],
+    ["2024-01-02", "09:00:00", "체크카드", "4500", "0", "스타벅스", "95500"],
+    ["2024-01-03", "09:00:00", "체크카드", "9000", "0", "김밥천국", "86500"],
+    ["2024-01-04", "09:00:00", "체크카드", "4500", "0", "스타벅스", "82000"],
+    ["2024-01-05", "09:00:00", "이체", "0", "50000", "홍길동", "132000"],
+]
+
+
+def write_descending_statement(rows: int) -> str:
+    """최신 거래가 위에 오고 잔액이 이어지는 신한은행 양식 CSV 파일 생성"""
+    lines = []
+    balance = 10_000_000
+    for i in range(rows):
+        amount = (i % 50 + 1) * 100
+        lines.append(f'2024-01-01,{23 - i * 24 // rows:02d}:00:00,체크카드,"{amount:,}",,가맹점{i % 7},"{balance:,}",본점\n')
+        balance += amount
+    with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+        f.write("거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n")
+        f.writelines(lines)
+    return f.name
+
+
+def arrays(rows):
+    return ([int(r[4]) for r in rows], [int(r[3]) for r in rows], [int(r[6]) for r in rows])
+
+
+class TestCheckBalance:
+    """check_balance / check_rows 테스트 클래스"""
+
+    def test_continuous_statement_in_both_orders(self):
+        """잔액이 이어지면 오름차순/내림차순 모두 이상이 없고 방향을 판별해야 함"""
+        ascending = check_rows(HEADERS, ASCENDING_ROWS)
+        descending = check_rows(HEADERS, ASCENDING_ROWS[::-1])
+
+        assert (ascending['ok'], ascending['order']) == (True, ORDER_ASCENDING)
+        assert (descending['ok'], descending['order']) == (True, ORDER_DESCENDING)
+        assert ascending['rows'] == 5
+
+    def test_missing_row_flagged(self):
+        """행이 빠지면 빠진 행 바로 다음 거래를 빠진 금액만큼의 차이와 함께 표시"""
+        rows = ASCENDING_ROWS[:2] + ASCENDING_ROWS[3:]
+        result = check_rows(HEADERS, rows)
+
+        assert result['break_count'] == 1
+        brk = result['breaks'][0]
+        assert (brk['row'], brk['previous_row'], brk['kind']) == (2, 1, BREAK_GAP)
+        assert (brk['expected'], brk['actual'], brk['difference']) == (91000, 82000, -9000)
+
+    def test_duplicate_row_flagged_in_descending_order(self):
+        """내림차순 거래내역에서 중복된 행은 duplicate로 분류"""
+        rows = ASCENDING_ROWS[::-1]
+        rows.insert(2, rows[2])
+        result = check_rows(HEADERS, rows)
+
+        assert result['order'] == ORDER_DESCENDING
+        assert result['break_rows'].tolist() == [2]
+        assert result['breaks'][0]['kind'] == BREAK_DUPLICATE
+
+    def test_swapped_rows_flagged_as_unsorted(self):
+        """거래일시 순서가 뒤바뀐 행은 unsorted로 분류"""
+        rows = list(ASCENDING_ROWS)
+        rows[1], rows[2] = rows[2], rows[1]
+        result = check_rows(HEADERS, rows)
+
+        assert result['order'] == ORDER_ASCENDING
+        kinds = {b['row']: b['kind'] for b in result['breaks']}
+        assert kinds[2] == BREAK_UNSORTED
+        assert set(kinds) == {1, 2, 3}
+
+    def test_order_detected_without_timestamps(self):
+        """거래일시가 없으면 끊긴 행이 적은 방향을 선택"""
+        deposits, withdrawals, balances = arrays(ASCENDING_ROWS[::-1])
+        result = check_balance(deposits, withdrawals, balances)
+
+        assert (result['ok'], result['order']) == (True, ORDER_DESCENDING)
+
+    def test_invalid_input_rejected(self):
+        """지원하지 않는 방향이나 길이가 다른 배열은 ValueError"""
+        with pytest.raises(ValueError):
+            check_balance([0], [0], [0], order="random")
+        with pytest.raises(ValueError):
+            check_balance([0, 1], [0], [0])
+
+    def test_missing_balance_column_skipped(self):
+        """잔액 컬럼이 없으면 검사하지 않음"""
+        assert check_rows(["날짜", "출금", "입금"], [["2024-01-01", "0", "100"]]) is None
+
+
+class TestParseResultBalanceCheck:
+    """파싱 결과의 잔액 연속성 검사 테스트 클래스"""
+
+    def test_large_statement_checked_in_parse(self):
+        """전체 파싱과 컬럼형 파싱 결과 모두 balance_check를 담아야 함"""
+        path = write_descending_statement(50_000)
+        try:
+            rows = FileParser.parse_csv_all(path)
+            columnar = FileParser.parse_csv_columnar(path)
+        finally:
+            os.unlink(path)
+
+        for result in (rows, columnar):
+            check = result['balance_check']
+            assert (check['ok'], check['order'], check['rows']) == (True, ORDER_DESCENDING, 50_000)
+            assert isinstance(check['break_rows'], np.ndarray)
@@ -0,0 +1,126 @@
+"""
+테스트 파일: 은행 프로필 레지스트리 (bank_profiles)
+
+헤더 서명으로 프로필을 감지하고 컬럼별 변환 계획이 기존 정규화 결과와 같은지 검증합니다.
+"""
+
+import os
+import pickle
+import tempfile
+
+import pytest
+
+from ai_smart_ledger.app.core import bank_profiles
+from ai_smart_ledger.app.core.bank_profiles import (
+    GENERIC_PROFILE, KB_PROFILE, SHINHAN_PROFILE, BankProfile, compile_plan, detect_profile,
+    find_header_row, profiles_version, register_profile,
+)
+from ai_smart_ledger.app.core.csv_stream import CsvRowStream
+from ai_smart_ledger.app.core.file_parser import FileParser
+from ai_smart_ledger.app.core.lazy_csv import open_lazy_csv
+from ai_smart_ledger.app.core.parallel_parser import split_byte_ranges
+
+
+SHINHAN_HEADERS = ["거래일자", "거래시간", "적요", "출금(원)", "입금(원)", "내용", "잔액(원)", "거래점"]
+
+
+class TestBankProfiles:
+    """은행 프로필 테스트 클래스"""
+
+    def test_detect_shinhan(self):
+        """신한은행 헤더는 신한은행 프로필로 감지되어야 함"""
+        assert detect_profile(SHINHAN_HEADERS) is SHINHAN_PROFILE
+
+    def test_detect_kb(self):
+        """KB국민은행 헤더는 KB 프로필로 감지되고 표준 헤더로 매핑되어야 함"""
+        raw = ["거래일시", "적요", "보낸분/받는분", "출금액(원)", "입금액(원)", "잔액(원)", "처리점"]
+        plan = compile_plan(raw)
+
+        assert plan.profile_name == KB_PROFILE.name
+        assert plan.headers == ["날짜", "적요", "내용", "출금", "입금", "잔액", "거래처"]
+
+    def test_standard_headers_use_generic(self):
+        """서명이 없는 표준 헤더는 기본 프로필을 사용"""
+        assert detect_profile(["날짜", "시간", "적요", "출금", "입금"]) is GENERIC_PROFILE
+
+    def test_plan_applies_precompiled_transforms(self):
+        """계획은 금액 컬럼만 쉼표 제거/빈 값 0 처리하고, 초과 셀은 공백만 제거"""
+        plan = compile_plan(SHINHAN_HEADERS)
+        row = [" 2025-01-01", "09:00:00", "FB이체", "1,000", "", "홍길동 ", "46,200", "판교금", " 여분 "]
+
+        assert plan.amount_flags == [False, False, False, True, True, False, True, False]
+        assert plan.apply(row) == ["2025-01-01", "09:00:00", "FB이체", "1000", "0", "홍길동",
+                                   "46200", "판교금", "여분"]
+        assert plan.apply(row[:3]) == ["2025-01-01", "09:00:00", "FB이체"]
+
+    def test_plan_is_picklable(self):
+        """병렬 파싱 워커로 보낼 수 있도록 계획은 피클 가능해야 함"""
+        plan = compile_plan(SHINHAN_HEADERS)
+        restored = pickle.loads(pickle.dumps(plan))
+        assert restored.apply(["2025-01-01", "", "", "1,500"]) == ["2025-01-01", "", "", "1500"]
+
+    def test_register_new_bank(self, monkeypatch):
+        """새 은행은 프로필 등록만으로 파서에 반영되고 캐시 버전도 바뀌어야 함"""
+        monkeypatch.setattr(bank_profiles, '_profiles', list(bank_profiles._profiles))
+        before = profiles_version()
+        register_profile(BankProfile("테스트은행", {"이용일": "날짜", "이용금액": "출금"},
+                                     signature=("이용일", "이용금액")))
+        assert profiles_version() != before
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("이용일,이용금액\n2025-01-01,\"12,000\"\n")
+            path = f.name
+        try:
+            result = FileParser.parse_csv_all(path)
+        finally:
+            os.unlink(path)
+
+        assert result['headers'] == ["날짜", "출금"]
+        assert result['data'] == [["2025-01-01", "12000"]]
+
+
+class TestHeaderRowDetection:
+    """머리말 줄이 있는 파일의 헤더 행 감지 테스트 클래스"""
+
+    PREAMBLE = "신한은행 거래내역 조회\n계좌번호,110-123-456789\n조회기간,2025-01-01 ~ 2025-01-31\n\n"
+
+    @pytest.fixture
+    def preamble_csv(self):
+        body = ",".join(SHINHAN_HEADERS) + "\n" + "".join(
+            f'2025-01-{i + 1:02d},09:00:00,체크카드,"1,{i:03d}",,가맹점{i},"50,000",본점\n' for i in range(20))
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            f.write((self.PREAMBLE + body).encode('cp949'))
+            path = f.name
+        yield path
+        os.unlink(path)
+
+    def test_find_header_row_scores_known_headers(self):
+        """알려진 헤더가 가장 많은 행을 고르고, 없으면 첫 번째 비어있지 않은 행"""
+        rows = [["신한은행 거래내역 조회"], ["계좌번호", "110-123"], SHINHAN_HEADERS, ["2025-01-01", "09:00:00"]]
+        assert find_header_row(rows) == 2
+        assert find_header_row([[], ["date", "memo"], ["2025-01-01", "x"]]) == 1
+
+    def test_csv_preamble_skipped(self, preamble_csv):
+        """머리말 줄을 건너뛰고 실제 헤더 다음 행부터 데이터로 파싱"""
+        result = FileParser.parse_csv_all(preamble_csv)
+        preview = FileParser.parse_csv_preview(preamble_csv, max_rows=2)
+
+        assert result['headers'] == ["날짜", "시간", "적요", "출금", "입금", "내용", "잔액", "거래처"]
+        assert result['total_rows'] == 20
+        assert result['data'][0][:4] == ["2025-01-01", "09:00:00", "체크카드", "1000"]
+        assert preview['total_rows'] == 20
+        assert FileParser.get_file_summary(preamble_csv)['row_count'] == 20
+
+    def test_byte_offset_paths_skip_preamble(self, preamble_csv):
+        """지연 로딩과 병렬 파싱 구간도 머리말 줄 다음의 헤더 뒤에서 시작"""
+        with open_lazy_csv(preamble_csv) as lazy:
+            assert len(lazy) == 20
+            assert lazy[0][:3] == ["2025-01-01", "09:00:00", "체크카드"]
+
+        with CsvRowStream(preamble_csv) as stream:
+            assert stream.header_row == 5
+        with open(preamble_csv, 'rb') as f:
+            data = f.read()
+        start = split_byte_ranges(preamble_csv, 2, stream.header_row)[0][0]
+        assert data[start:].startswith("2025-01-01".encode('cp949'))
+
@@ -0,0 +1,73 @@
+"""
+테스트 파일: 컬럼형(NumPy) 파싱 모드
+
+parse_csv_columnar가 행 리스트 결과와 같은 값을 타입이 있는 배열로 제공하는지 검증합니다.
+"""
+
+import os
+
+import numpy as np
+
+from ai_smart_ledger.app.core.columnar import parse_amounts, parse_timestamps, to_columnar
+from ai_smart_ledger.app.core.file_parser import FileParser
+
+
+SAMPLE_FILE = os.path.join(os.path.dirname(__file__), '..', 'sample_transactions.csv')
+
+
+class TestColumnarParse:
+    """컬럼형 파싱 테스트 클래스"""
+
+    def test_matches_row_result(self):
+        """샘플 거래내역의 금액/일시/텍스트가 행 리스트 결과와 일치해야 함"""
+        rows = FileParser.parse_csv_all(SAMPLE_FILE)
+        result = FileParser.parse_csv_columnar(SAMPLE_FILE, chunk_size=10)
+
+        assert result['success'] is True
+        assert result['total_rows'] == rows['total_rows']
+        columns = result['columns']
+        headers = rows['headers']
+
+        for name in ("입금", "출금", "잔액"):
+            idx = headers.index(name)
+            assert columns['amounts'][name].dtype == np.int64
+            assert columns['amounts'][name].tolist() == [int(r[idx]) for r in rows['data']]
+
+        assert columns['timestamps'].dtype == np.dtype('datetime64[s]')
+        first = rows['data'][0]
+        assert str(columns['timestamps'][0]) == f"{first[0]}T{first[1]}"
+
+        counterparty = columns['text']['내용']
+        decoded = [counterparty['values'][c] for c in counterparty['codes']]
+        assert decoded == [r[headers.index('내용')] for r in rows['data']]
+        assert len(counterparty['values']) < len(decoded)
+
+    def test_parse_amounts_fallback(self):
+        """쉼표/공백/빈 값/숫자가 아닌 값 처리"""
+        amounts = parse_amounts(np.array(["1,000", " 20 ", "", "abc", "1500.0"]))
+        assert amounts.tolist() == [1000, 20, 0, 0, 1500]
+
+    def test_parse_timestamps_formats(self):
+        """점/슬래시 날짜, 시간 없음, 잘못된 값(NaT) 처리"""
+        timestamps = parse_timestamps(
+            np.array(["2024.01.31", "2024/02/01", "2024-02-02", "잘못된날짜"]),
+            np.array(["15:31:48", "", "09:00", "10:00:00"]),
+        )
+        assert str(timestamps[0]) == "2024-01-31T15:31:48"
+        assert str(timestamps[1]) == "2024-02-01T00:00:00"
+        assert str(timestamps[2]) == "2024-02-02T09:00:00"
+        assert np.isnat(timestamps[3])
+
+    def test_short_rows_are_padded(self):
+        """컬럼 수가 부족한 행은 빈 값으로 처리"""
+        columns = to_columnar(["날짜", "적요", "출금"], [[["2024-01-01", "커피", "4,500"], ["2024-01-02"]]])
+        assert columns['row_count'] == 2
+        assert columns['amounts']['출금'].tolist() == [4500, 0]
+        assert sorted(columns['text']['적요']['values']) == ["", "커피"]
+
+    def test_missing_file(self):
+        """존재하지 않는 파일은 실패 결과"""
+        result = FileParser.parse_csv_columnar("/nonexistent/file.csv")
+        assert result['success'] is False
+        assert "파일이 존재하지 않습니다" in result['error']
+        assert result['columns'] is None
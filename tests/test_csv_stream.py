@@ -0,0 +1,167 @@
+"""
+테스트 파일: CSV 행 스트리밍 (CsvRowStream)
+
+parse_csv_all과 동일한 정규화 결과를 행/청크 단위 스트림으로 제공하는지 검증합니다.
+"""
+
+import os
+import tempfile
+import tracemalloc
+import types
+from unittest.mock import patch
+
+import pytest
+
+from ai_smart_ledger.app.core.csv_scan import count_records, estimate_records
+from ai_smart_ledger.app.core.csv_stream import CsvRowStream, open_csv_stream
+from ai_smart_ledger.app.core.file_parser import FileParser
+
+
+SHINHAN_HEADER = "거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n"
+
+
+def write_statement(rows: int) -> str:
+    """신한은행 양식의 임시 CSV 파일 생성"""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+        f.write(SHINHAN_HEADER)
+        for i in range(rows):
+            f.write(f'2025-05-{i % 28 + 1:02d},09:{i % 60:02d}:00,FB이체,"1,{i % 1000:03d}",,홍길동,"46,200",판교금\n')
+        return f.name
+
+
+class TestCsvRowStream:
+    """CsvRowStream 테스트 클래스"""
+
+    @pytest.fixture
+    def small_statement(self):
+        path = write_statement(12)
+        yield path
+        os.unlink(path)
+
+    def test_stream_matches_parse_csv_all(self, small_statement):
+        """스트림 결과가 parse_csv_all 결과와 동일해야 함"""
+        expected = FileParser.parse_csv_all(small_statement)
+
+        with open_csv_stream(small_statement) as stream:
+            assert stream.headers == expected['headers']
+            rows = list(stream)
+
+        assert rows == expected['data']
+        assert rows[0] == ['2025-05-01', '09:00:00', 'FB이체', '1000', '0', '홍길동', '46200', '판교금']
+
+    def test_iter_chunks_fixed_size(self, small_statement):
+        """청크 단위 반복 시 마지막 청크를 제외하고 크기가 일정해야 함"""
+        with CsvRowStream(small_statement) as stream:
+            chunks = list(stream.iter_chunks(5))
+
+        assert [len(c) for c in chunks] == [5, 5, 2]
+        assert stream.rows_read == 12
+
+    def test_iter_csv_rows_is_lazy_generator(self, small_statement):
+        """iter_csv_rows는 제너레이터이며 chunk_size 지정 시 청크를 반환해야 함"""
+        rows = FileParser.iter_csv_rows(small_statement)
+        assert isinstance(rows, types.GeneratorType)
+        assert len(list(rows)) == 12
+
+        chunks = list(FileParser.iter_csv_rows(small_statement, chunk_size=10))
+        assert [len(c) for c in chunks] == [10, 2]
+
+    def test_invalid_chunk_size(self, small_statement):
+        """chunk_size가 0 이하이면 ValueError"""
+        with CsvRowStream(small_statement) as stream:
+            with pytest.raises(ValueError):
+                next(stream.iter_chunks(0))
+
+    def test_empty_file_raises_value_error(self):
+        """빈 파일은 헤더가 없으므로 ValueError"""
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            path = f.name
+        try:
+            with pytest.raises(ValueError, match="파일이 비어있습니다"):
+                open_csv_stream(path)
+        finally:
+            os.unlink(path)
+
+    def test_count_rows_skips_quoted_newlines(self):
+        """따옴표 안 줄바꿈은 행으로 세지 않고, 마지막 줄바꿈이 없어도 마지막 행을 세야 함"""
+        content = '날짜,내용,금액\n2025-01-01,"여러\n줄 메모",1000\n2025-01-02,커피,4500'
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            f.write(content.encode('cp949'))
+            path = f.name
+        try:
+            with CsvRowStream(path) as stream:
+                assert stream.encoding == 'cp949'
+                assert stream.count_rows() == 2
+            assert FileParser.get_file_summary(path)['row_count'] == 2
+            assert FileParser.parse_csv_all(path)['total_rows'] == 2
+        finally:
+            os.unlink(path)
+
+    def test_byte_countable_requires_newline(self):
+        """'\n' 줄바꿈 파일만 바이트 스캔 가능하고, '\r'만 쓰는 파일도 행 스트림으로 모든 행을 세야 함"""
+        lines = ["날짜,내용,금액", "2025-01-01,점심,9000", "2025-01-02,커피,4500"]
+        for newline, countable in (("\n", True), ("\r\n", True), ("\r", False)):
+            with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+                f.write((newline.join(lines) + newline).encode('utf-8'))
+                path = f.name
+            try:
+                with CsvRowStream(path) as stream:
+                    assert stream.byte_countable is countable
+                    assert stream.count_rows() == 2
+            finally:
+                os.unlink(path)
+
+    def test_preview_counts_without_parsing_all_rows(self, small_statement):
+        """미리보기는 max_rows개 행만 파싱하고 전체 행 수는 바이트 스캔으로 계산해야 함"""
+        result = FileParser.parse_csv_preview(small_statement, max_rows=3)
+
+        assert result['total_rows'] == 12
+        assert len(result['data']) == 3
+        with CsvRowStream(small_statement) as stream:
+            assert stream.count_rows() == 12
+            assert stream.rows_read == 0
+
+    def test_estimate_records_close_to_exact(self):
+        """표본 구간 추정값은 정확한 레코드 수와 1% 이내로 같아야 함"""
+        path = write_statement(20000)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        finally:
+            os.unlink(path)
+
+        exact = count_records(data)
+        estimate = estimate_records(data, samples=6, sample_size=8192)
+        assert exact == 20001
+        assert abs(estimate - exact) <= exact * 0.01
+
+    def test_large_preview_returns_flagged_estimate(self, small_statement):
+        """EXACT_COUNT_LIMIT를 넘는 파일의 미리보기는 추정값임을 표시해야 함"""
+        exact = FileParser.parse_csv_preview(small_statement, max_rows=2)
+        with patch('ai_smart_ledger.app.core.file_preview.EXACT_COUNT_LIMIT', 0):
+            estimated = FileParser.parse_csv_preview(small_statement, max_rows=2)
+
+        assert exact['total_rows_estimated'] is False
+        assert estimated['total_rows_estimated'] is True
+        assert estimated['total_rows'] == 12
+        assert estimated['data'] == exact['data']
+
+    @pytest.mark.slow
+    def test_streaming_memory_stays_flat(self):
+        """스트리밍 처리 시 최대 메모리가 전체 파싱보다 훨씬 작아야 함"""
+        path = write_statement(50000)
+        try:
+            tracemalloc.start()
+            for _ in FileParser.iter_csv_rows(path, chunk_size=1000):
+                pass
+            _, streaming_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+            result = FileParser.parse_csv_all(path)
+            _, full_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            assert result['total_rows'] == 50000
+            assert streaming_peak * 10 < full_peak
+        finally:
+            os.unlink(path)
@@ -0,0 +1,105 @@
+"""
+테스트 파일: 사전 인코딩 행 (encoded_rows)
+
+전체 파싱 결과가 텍스트 컬럼을 정수 코드 + 고유값 목록으로 보관하면서 행 목록과 같게 동작하는지 검증합니다.
+"""
+
+import os
+import pickle
+import tempfile
+
+import pytest
+
+from ai_smart_ledger.app.core.encoded_rows import EncodedColumn, EncodedRows
+from ai_smart_ledger.app.core.file_parser import FileParser
+
+
+HEADERS = ["날짜", "시간", "적요", "출금", "입금", "내용", "잔액", "거래점"]
+
+ROWS = [
+    ["2024-01-01", "09:00:00", "체크카드", "4500", "0", "스타벅스", "95500", "본점"],
+    ["2024-01-01", "12:10:00", "체크카드", "9000", "0", "김밥천국", "86500", "본점"],
+    ["2024-01-02", "08:55:00", "체크카드", "4500", "0", "스타벅스", "82000", "본점"],
+    ["2024-01-03", "10:00:00", "FB이체", "0", "50000", "홍길동", "132000", "인터넷"],
+]
+
+
+class TestEncodedRows:
+    """EncodedRows 테스트 클래스"""
+
+    def test_behaves_like_row_list(self):
+        """길이/인덱스/슬라이스/반복/비교가 원래 행 목록과 같아야 함"""
+        rows = EncodedRows.from_chunks(HEADERS, [ROWS[:3], ROWS[3:]])
+
+        assert len(rows) == 4
+        assert rows == ROWS
+        assert list(rows) == ROWS
+        assert rows[1] == ROWS[1]
+        assert rows[-1] == ROWS[-1]
+        assert rows[:2] == ROWS[:2]
+        assert rows[::2] == ROWS[::2]
+        with pytest.raises(IndexError):
+            rows[4]
+
+    def test_text_columns_share_unique_values(self):
+        """텍스트 컬럼만 인코딩되고 같은 값의 셀은 고유값 목록의 문자열 객체를 공유"""
+        rows = EncodedRows.from_chunks(HEADERS, [ROWS])
+
+        assert rows.encoded_headers == ["적요", "내용", "거래점"]
+        merchants = rows.column("내용")
+        assert isinstance(merchants, EncodedColumn)
+        assert merchants.values == ["스타벅스", "김밥천국", "홍길동"]
+        assert list(merchants.codes) == [0, 1, 0, 2]
+        assert rows[0][5] is rows[2][5]
+        assert isinstance(rows.column("출금"), list)
+
+    def test_value_counts(self):
+        """가맹점별 건수는 코드 배열로 계산하고 인코딩하지 않은 컬럼도 같은 형식으로 반환"""
+        rows = EncodedRows.from_chunks(HEADERS, [ROWS])
+
+        assert rows.value_counts("내용") == {"스타벅스": 2, "김밥천국": 1, "홍길동": 1}
+        assert rows.value_counts("출금") == {"4500": 2, "9000": 1, "0": 1}
+        assert EncodedRows(HEADERS).value_counts("내용") == {}
+        with pytest.raises(KeyError):
+            rows.value_counts("메모")
+
+    def test_irregular_rows_restored(self):
+        """헤더보다 짧거나 긴 행도 원래 셀 그대로 돌려줘야 함"""
+        irregular = [ROWS[0], ROWS[1][:3], ROWS[2] + ["메모"], ROWS[3]]
+        rows = EncodedRows.from_chunks(HEADERS, [irregular])
+
+        assert rows == irregular
+        assert rows[1] == ROWS[1][:3]
+        assert rows[2] == ROWS[2] + ["메모"]
+
+    def test_pickle_round_trip(self):
+        """파싱 캐시/작업 프로세스 전달을 위한 피클 후에도 내용과 추가 인코딩이 유지"""
+        rows = pickle.loads(pickle.dumps(EncodedRows.from_chunks(HEADERS, [ROWS[:3]])))
+        rows.extend(ROWS[3:])
+
+        assert rows == ROWS
+        assert list(rows.column("내용").codes) == [0, 1, 0, 2]
+
+
+class TestParseResultEncoding:
+    """전체 파싱 결과의 사전 인코딩 테스트 클래스"""
+
+    def test_parse_csv_all_returns_encoded_rows(self):
+        """parse_csv_all 결과는 EncodedRows이고 행 값은 그대로여야 함"""
+        content = "거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n" + "".join(
+            f'2024-01-{d % 28 + 1:02d},09:00:00,체크카드,"1,000",,가맹점{d % 3},"50,000",본점\n'
+            for d in range(30))
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write(content)
+        try:
+            result = FileParser.parse_csv_all(f.name)
+        finally:
+            os.unlink(f.name)
+
+        assert result['success'] is True
+        data = result['data']
+        assert isinstance(data, EncodedRows)
+        assert len(data) == 30
+        assert data[4] == ["2024-01-05", "09:00:00", "체크카드", "1000", "0", "가맹점1", "50000", "본점"]
+        assert data.column("내용").values == ["가맹점0", "가맹점1", "가맹점2"]
+        assert data.value_counts("내용") == {"가맹점0": 10, "가맹점1": 10, "가맹점2": 10}
@@ -0,0 +1,81 @@
+"""
+테스트 파일: 다중 시트 Excel 병합 (excel_sheets)
+
+모든 시트를 병렬로 파싱하여 출처 시트가 표시된 거래일시 순 결과로 병합하는지 검증합니다.
+"""
+
+import datetime
+import os
+import tempfile
+
+import pytest
+from openpyxl import Workbook
+
+from ai_smart_ledger.app.core.excel_sheets import SHEET_HEADER, list_sheets
+from ai_smart_ledger.app.core.file_parser import FileParser
+
+
+SHINHAN_HEADERS = ["거래일자", "거래시간", "적요", "출금(원)", "입금(원)", "내용", "잔액(원)", "거래점"]
+KB_HEADERS = ["거래일시", "적요", "보낸분/받는분", "출금액(원)", "입금액(원)", "잔액(원)", "처리점"]
+
+
+@pytest.fixture
+def multi_sheet_workbook():
+    wb = Workbook()
+    shinhan = wb.active
+    shinhan.title = "신한-110"
+    shinhan.append(SHINHAN_HEADERS)
+    # 은행 내보내기처럼 최신 거래가 위에 오는 내림차순
+    for day in (5, 3, 1):
+        shinhan.append([datetime.datetime(2025, 5, day), datetime.time(9, 0), "체크카드", 1000 * day, None,
+                        f"가맹점{day}", 50000, "본점"])
+    kb = wb.create_sheet("KB-220")
+    kb.append(["KB국민은행 거래내역"])
+    kb.append(KB_HEADERS)
+    for day in (4, 2):
+        kb.append([datetime.datetime(2025, 5, day, 12, 30), "이체", f"보낸분{day}", None, 500 * day, 9000, "여의도"])
+    wb.create_sheet("메모")
+
+    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
+        path = f.name
+    wb.save(path)
+    wb.close()
+    yield path
+    os.unlink(path)
+
+
+class TestExcelSheets:
+    """다중 시트 병합 테스트 클래스"""
+
+    def test_list_sheets(self, multi_sheet_workbook):
+        """시트 이름을 통합 문서 순서대로 반환"""
+        assert list_sheets(multi_sheet_workbook) == ["신한-110", "KB-220", "메모"]
+
+    def test_merged_in_timestamp_order_with_sheet_tag(self, multi_sheet_workbook):
+        """두 은행 시트를 공통 헤더로 맞추고 거래일시 오름차순으로 병합해야 함"""
+        result = FileParser.parse_excel_all_sheets(multi_sheet_workbook, workers=1)
+
+        assert result['success'] is True
+        assert result['headers'] == ["날짜", "시간", "적요", "출금", "입금", "내용", "잔액", "거래처", SHEET_HEADER]
+        assert result['total_rows'] == 5
+        assert [row[0] for row in result['data']] == [
+            "2025-05-01", "2025-05-02 12:30:00", "2025-05-03", "2025-05-04 12:30:00", "2025-05-05"]
+        assert result['data'][1] == ["2025-05-02 12:30:00", "", "이체", "0", "1000", "보낸분2", "9000", "여의도",
+                                     "KB-220"]
+        assert result['data'][0][-1] == "신한-110"
+        assert result['sheets'] == {"신한-110": 3, "KB-220": 2, "메모": "파일이 비어있습니다"}
+
+    def test_parallel_matches_sequential(self, multi_sheet_workbook):
+        """프로세스 병렬 파싱 결과는 순차 파싱 결과와 같아야 함"""
+        sequential = FileParser.parse_excel_all_sheets(multi_sheet_workbook, workers=1)
+        parallel = FileParser.parse_excel_all_sheets(multi_sheet_workbook, workers=3)
+
+        assert parallel['data'] == sequential['data']
+        assert parallel['headers'] == sequential['headers']
+
+    def test_missing_file(self):
+        """없는 파일은 실패 결과를 반환"""
+        result = FileParser.parse_excel_all_sheets("/nonexistent/file.xlsx")
+
+        assert result['success'] is False
+        assert "존재하지 않습니다" in result['error']
@@ -0,0 +1,137 @@
+"""
+테스트 파일: Excel 스트리밍 전체 파싱 (parse_excel_all)
+
+읽기 전용 스트리밍으로 행 수 제한 없이 파싱하고,
+CSV와 같은 헤더 매핑과 타입별 셀 변환을 적용하는지 검증합니다.
+"""
+
+import datetime
+import os
+import tempfile
+
+import pytest
+from openpyxl import Workbook
+
+from ai_smart_ledger.app.core.excel_stream import ExcelRowStream, cell_to_text, open_excel_stream
+from ai_smart_ledger.app.core.file_parser import FileParser
+
+
+def save_workbook(rows) -> str:
+    wb = Workbook()
+    ws = wb.active
+    for row in rows:
+        ws.append(row)
+    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
+        temp_path = f.name
+    wb.save(temp_path)
+    wb.close()
+    return temp_path
+
+
+class TestExcelStream:
+    """Excel 스트리밍 파싱 테스트 클래스"""
+
+    @pytest.fixture
+    def shinhan_excel(self):
+        rows = [["거래일자", "거래시간", "적요", "출금(원)", "입금(원)", "내용", "잔액(원)", "거래점"]]
+        for i in range(120):
+            rows.append([datetime.datetime(2025, 5, 1), datetime.time(10, i % 60, 0), "FB이체",
+                         1500.0 + i, None, "카카오페이", 100000, "판교금"])
+        path = save_workbook(rows)
+        yield path
+        os.unlink(path)
+
+    def test_headers_mapped_like_csv(self, shinhan_excel):
+        """은행 헤더가 CSV와 같은 표준 헤더로 매핑되어야 함"""
+        result = FileParser.parse_excel_all(shinhan_excel)
+
+        assert result['success'] is True
+        assert result['headers'] == ['날짜', '시간', '적요', '출금', '입금', '내용', '잔액', '거래처']
+
+    def test_typed_cells_converted(self, shinhan_excel):
+        """날짜/시간/숫자 셀이 str() 표현 대신 CSV와 같은 형태로 변환되어야 함"""
+        result = FileParser.parse_excel_all(shinhan_excel)
+
+        first = result['data'][0]
+        assert first == ['2025-05-01', '10:00:00', 'FB이체', '1500', '0', '카카오페이', '100000', '판교금']
+        assert result['total_rows'] == 120
+        assert len(result['data']) == 120
+
+    def test_blank_rows_skipped(self):
+        """앞쪽/중간의 빈 행은 건너뛰고 첫 번째 비어있지 않은 행을 헤더로 사용"""
+        path = save_workbook([[None, None], ["날짜", "출금"], ["2025-01-01", "1,000"], [None, None], ["2025-01-02", 2000]])
+        try:
+            result = FileParser.parse_excel_all(path)
+        finally:
+            os.unlink(path)
+
+        assert result['headers'] == ['날짜', '출금']
+        assert result['data'] == [['2025-01-01', '1000'], ['2025-01-02', '2000']]
+
+    def test_rows_are_streamed(self, shinhan_excel):
+        """스트림은 행을 순차적으로 내보내며 중간에 멈출 수 있어야 함"""
+        with open_excel_stream(shinhan_excel) as stream:
+            first_chunk = next(stream.iter_chunks(50))
+            assert len(first_chunk) == 50
+            assert stream.rows_read == 50
+
+    def test_preview_reads_only_requested_rows(self, shinhan_excel, monkeypatch):
+        """미리보기는 요청한 행 수(+1)만 읽고 전체 행 수는 시트 크기로 추정해야 함"""
+        read = []
+        original = ExcelRowStream.iter_raw_chunks
+
+        def counting(stream, chunk_size):
+            for chunk in original(stream, chunk_size):
+                read.append(len(chunk))
+                yield chunk
+
+        monkeypatch.setattr(ExcelRowStream, "iter_raw_chunks", counting)
+        result = FileParser.parse_excel_preview(shinhan_excel, max_rows=5)
+
+        assert read == [6]
+        assert result['headers'][0] == "거래일자"
+        assert result['data'][0] == ['2025-05-01', '10:00:00', 'FB이체', '1500', '', '카카오페이', '100000', '판교금']
+        assert (result['total_rows'], result['total_rows_estimated']) == (120, True)
+
+    def test_preamble_rows_skipped(self):
+        """제목/조회기간 행이 있으면 알려진 헤더가 있는 행을 헤더로 사용"""
+        path = save_workbook([
+            ["거래내역 조회"],
+            ["조회기간", "2025-05-01 ~ 2025-05-31"],
+            [None],
+            ["거래일자", "거래시간", "적요", "출금(원)", "입금(원)", "내용", "잔액(원)", "거래점"],
+            [datetime.datetime(2025, 5, 1), datetime.time(10, 0, 0), "FB이체", 1500, None, "카카오페이", 100000, "판교금"],
+        ])
+        try:
+            with open_excel_stream(path) as stream:
+                rows = list(stream)
+                assert stream.header_row == 4
+            result = FileParser.parse_excel_preview(path)
+        finally:
+            os.unlink(path)
+
+        assert stream.headers[:2] == ["날짜", "시간"]
+        assert rows == [["2025-05-01", "10:00:00", "FB이체", "1500", "0", "카카오페이", "100000", "판교금"]]
+        assert result['headers'][0] == "거래일자"
+        assert result['total_rows'] == 1
+
+    def test_cell_to_text(self):
+        assert cell_to_text(None) == ''
+        assert cell_to_text(datetime.datetime(2025, 1, 2, 13, 5, 9)) == '2025-01-02 13:05:09'
+        assert cell_to_text(datetime.date(2025, 1, 2)) == '2025-01-02'
+        assert cell_to_text(12.5) == '12.5'
+        assert cell_to_text(3) == '3'
+
+    def test_empty_workbook(self):
+        path = save_workbook([])
+        try:
+            result = FileParser.parse_excel_all(path)
+        finally:
+            os.unlink(path)
+        assert result['success'] is False
+        assert "비어있습니다" in result['error']
+
+    def test_missing_file(self):
+        result = FileParser.parse_excel_all("/nonexistent/file.xlsx")
+        assert result['success'] is False
+        assert "파일이 존재하지 않습니다" in result['error']
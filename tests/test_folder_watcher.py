@@ -0,0 +1,176 @@
+"""
+테스트 파일: 감시 폴더 자동 가져오기 (folder_watcher)
+
+감시 폴더의 새 파일/바뀐 파일만 찾아 가져오고, 이미 가져온 내용은 해시로 건너뛰는지 검증합니다.
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from ai_smart_ledger.app.core.folder_watcher import (
+    STATUS_FAILED, STATUS_IMPORTED, STATUS_SKIPPED, WATCH_MODE_POLLING, FolderScanner, FolderWatcher, ingest_file,
+)
+from ai_smart_ledger.app.db.models import create_all_tables_on
+
+STATEMENT = (
+    "거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n"
+    '2024-01-30,12:04:41,FB이체,"10,000",,카카오페이,"404,523",판교금\n'
+    '2024-01-31,15:31:48,FB이체,,"46,200",,"450,723",여중대\n'
+)
+
+
+def write_file(folder: str, name: str, content: str, age: float = 60.0) -> str:
+    """파일을 쓰고 수정 시각을 age초 전으로 설정 (내려받기가 끝난 파일)"""
+    path = os.path.join(folder, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def folder():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path)
+
+
+@pytest.fixture
+def db_path(folder):
+    path = os.path.join(tempfile.mkdtemp(), "ledger.db")
+    conn = sqlite3.connect(path)
+    create_all_tables_on(conn)
+    conn.close()
+    yield path
+    shutil.rmtree(os.path.dirname(path))
+
+
+class TestFolderScanner:
+    """FolderScanner 테스트 클래스"""
+
+    def test_reports_new_and_changed_files_once(self, folder):
+        """새 파일과 내용이 바뀐 파일만 한 번씩 반환하고 지원하지 않는 파일은 무시"""
+        scanner = FolderScanner(folder)
+        first = write_file(folder, "2024-01.csv", STATEMENT)
+        write_file(folder, "memo.txt", "메모")
+
+        assert scanner.scan() == ([first], [])
+        assert scanner.scan() == ([], [])
+
+        write_file(folder, "2024-01.csv", STATEMENT + STATEMENT.splitlines()[1] + "\n", age=30)
+        assert scanner.scan() == ([first], [])
+
+    def test_recently_modified_file_is_pending(self, folder):
+        """방금 수정된 파일은 내려받는 중일 수 있으므로 대기 시간이 지난 뒤에 반환"""
+        scanner = FolderScanner(folder, settle_seconds=5)
+        path = write_file(folder, "2024-02.csv", STATEMENT, age=0)
+
+        assert scanner.scan() == ([], [path])
+        assert scanner.scan(now=time.time() + 10) == ([path], [])
+
+
+class TestIngestFile:
+    """ingest_file 테스트 클래스"""
+
+    def test_same_content_is_skipped(self, folder, db_path):
+        """같은 내용의 파일은 이름이 달라도 한 번만 가져와야 함"""
+        first = write_file(folder, "2024-01.csv", STATEMENT)
+        copy = write_file(folder, "2024-01 (1).csv", STATEMENT)
+        conn = sqlite3.connect(db_path)
+        try:
+            imported = ingest_file(first, conn)
+            skipped = ingest_file(copy, conn)
+            count = conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+            recorded = conn.execute("SELECT file_path, inserted_rows FROM imported_files").fetchall()
+        finally:
+            conn.close()
+
+        assert (imported['status'], imported['inserted']) == (STATUS_IMPORTED, 2)
+        assert skipped['status'] == STATUS_SKIPPED
+        assert count == 2
+        assert recorded == [(first, 2)]
+
+    def test_account_file_imports_only_new_rows(self, folder, db_path):
+        """계좌가 지정되면 같은 계좌의 이전 파일과 겹치는 거래는 다시 삽입하지 않아야 함"""
+        first = write_file(folder, "2024-01.csv", STATEMENT)
+        second = write_file(folder, "2024-02.csv", STATEMENT + '2024-02-01,09:00:00,체크카드,"723",,편의점,"450,000",본점\n')
+        conn = sqlite3.connect(db_path)
+        try:
+            ingest_file(first, conn, account_id="신한-110")
+            result = ingest_file(second, conn, account_id="신한-110")
+            accounts = conn.execute("SELECT DISTINCT account_id FROM transactions").fetchall()
+        finally:
+            conn.close()
+
+        assert (result['status'], result['inserted']) == (STATUS_IMPORTED, 1)
+        assert accounts == [("신한-110",)]
+
+    def test_failed_import_is_not_recorded(self, folder, db_path):
+        """가져오기에 실패한 파일은 기록하지 않아 고친 뒤 다시 가져올 수 있어야 함"""
+        path = write_file(folder, "broken.csv", "적요,메모\n커피,아침\n")
+        conn = sqlite3.connect(db_path)
+        try:
+            result = ingest_file(path, conn)
+            recorded = conn.execute("SELECT COUNT(*) FROM imported_files").fetchone()[0]
+        finally:
+            conn.close()
+
+        assert result['status'] == STATUS_FAILED
+        assert "날짜 컬럼" in result['error']
+        assert recorded == 0
+
+
+class TestFolderWatcher:
+    """FolderWatcher 테스트 클래스"""
+
+    @pytest.fixture(autouse=True)
+    def app(self):
+        return QApplication.instance() or QApplication(sys.argv)
+
+    def test_background_import_notifies_by_signal(self, app, folder, db_path):
+        """시작하면 작업 스레드에서 폴더를 확인하고 결과를 시그널로 알려야 함"""
+        write_file(folder, "2024-01.csv", STATEMENT)
+        watcher = FolderWatcher(folder, db_path, WATCH_MODE_POLLING, interval=60)
+        results = []
+        watcher.file_processed.connect(results.append)
+
+        watcher.start()
+        deadline = time.time() + 10
+        while not results and time.time() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+        watcher.stop()
+
+        assert [r['status'] for r in results] == [STATUS_IMPORTED]
+        assert watcher.run_once() == []
+
+    def test_account_uses_incremental_import(self, folder, db_path):
+        """계좌가 설정된 감시 폴더는 다시 내려받은 파일에서 새 거래만 가져와야 함"""
+        watcher = FolderWatcher(folder, db_path, WATCH_MODE_POLLING, interval=60, account_id="신한-110")
+        write_file(folder, "2024-01.csv", STATEMENT)
+        first = watcher.run_once()
+        write_file(folder, "2024-02.csv",
+                   STATEMENT + '2024-02-01,09:00:00,체크카드,"5,000",,편의점,"445,723",본점\n')
+
+        second = watcher.run_once()
+
+        assert [r['inserted'] for r in first + second] == [2, 1]
+        conn = sqlite3.connect(db_path)
+        try:
+            checkpoint = conn.execute("SELECT account_id, imported_rows FROM import_checkpoints").fetchall()
+        finally:
+            conn.close()
+        assert checkpoint == [("신한-110", 3)]
+
+    def test_invalid_mode_rejected(self, folder, db_path):
+        """지원하지 않는 감시 방식은 ValueError"""
+        with pytest.raises(ValueError):
+            FolderWatcher(folder, db_path, mode="fanotify")
@@ -0,0 +1,166 @@
+"""
+테스트 파일: 가져오기 파이프라인 (ImportPipeline)
+
+단계 스레드들이 크기가 제한된 큐로 순서를 지켜 항목을 넘기고, 역압으로 앞 단계가 기다리며,
+오류가 마지막 단계로 전달되고, 단계별 처리량이 가져오기 결과에 담기는지 검증합니다.
+"""
+
+import os
+import tempfile
+import threading
+
+import pytest
+
+from ai_smart_ledger.app.core.csv_stream import CsvRowStream
+from ai_smart_ledger.app.core.csv_blocks import CsvBlockStages, read_record_blocks
+from ai_smart_ledger.app.core.import_pipeline import UNIT_BYTES, ImportPipeline
+from ai_smart_ledger.app.core.transaction_importer import TransactionImporter
+
+
+class TestImportPipeline:
+    """ImportPipeline 테스트 클래스"""
+
+    def test_stages_keep_order_and_record_stats(self):
+        """모든 항목이 순서대로 각 단계를 거치고 단계별 항목 수/처리량이 기록되어야 함"""
+        pipeline = (ImportPipeline(depth=2)
+                    .source("읽기", range(50), measure=lambda item: 1)
+                    .stage("두 배", lambda item: [item * 2] * 3, measure=len))
+
+        results = list(pipeline.run("합계", measure=len))
+
+        assert results == [[i * 2] * 3 for i in range(50)]
+        assert [(s.name, s.items, s.processed) for s in pipeline.stats] == [
+            ("읽기", 50, 50), ("두 배", 50, 150), ("합계", 50, 150)]
+        assert pipeline.bottleneck() in pipeline.stats
+
+    def test_backpressure_bounds_items_in_flight(self):
+        """마지막 단계가 멈춰 있으면 앞 단계는 큐 크기만큼만 앞서 읽어야 함"""
+        produced = []
+
+        def numbers():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        pipeline = ImportPipeline(depth=1).source("읽기", numbers(), measure=lambda item: 1).stage(
+            "통과", lambda item: item, measure=lambda item: 1)
+        items = pipeline.run("소비", measure=lambda item: 1)
+
+        assert next(items) == 0
+        threading.Event().wait(0.3)
+        # 소비 중인 항목 1 + 큐 2개 × 1 + 단계마다 넘기려고 들고 있는 항목 2
+        assert len(produced) <= 5
+        items.close()
+        assert len(produced) < 100
+
+    def test_stage_error_reaches_sink(self):
+        """중간 단계에서 난 예외가 마지막 단계에서 다시 발생하고 스레드는 모두 멈춰야 함"""
+        def fail_on_three(item):
+            if item == 3:
+                raise ValueError("잘못된 블록")
+            return item
+
+        before = threading.active_count()
+        pipeline = ImportPipeline().source("읽기", range(1000), measure=lambda item: 1).stage(
+            "검사", fail_on_three, measure=lambda item: 1)
+
+        seen = []
+        with pytest.raises(ValueError, match="잘못된 블록"):
+            for item in pipeline.run("소비", measure=lambda item: 1):
+                seen.append(item)
+
+        assert seen == [0, 1, 2][:len(seen)]
+        assert threading.active_count() == before
+
+    def test_invalid_depth(self):
+        """큐 크기는 1 이상이어야 함"""
+        with pytest.raises(ValueError):
+            ImportPipeline(depth=0)
+
+
+class TestReadRecordBlocks:
+    """레코드 경계 블록 읽기 테스트 클래스"""
+
+    def test_blocks_end_on_record_boundaries(self):
+        """작은 블록으로 읽어도 따옴표 안 줄바꿈에서 자르지 않고 이어 붙이면 원본과 같아야 함"""
+        data = b'header\n1,"a\nb",2\n3,c,4\n5,"d\r\ne",6\n7,f,8'
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            f.write(data)
+            path = f.name
+
+        try:
+            for block_size in (1, 3, 8, 64):
+                blocks = list(read_record_blocks(path, 7, block_size))
+                assert b"".join(block for block, _ in blocks) == data[7:]
+                assert [end for _, end in blocks][-1] == len(data)
+                for block, _ in blocks[:-1]:
+                    assert block.endswith(b"\n") and block.count(b'"') % 2 == 0
+        finally:
+            os.unlink(path)
+
+
+class TestPipelineImport:
+    """파이프라인 가져오기 결과 테스트 클래스"""
+
+    def test_import_reports_stage_throughput(self, conn, capsys):
+        """CSV 가져오기는 읽기/디코딩/정규화/지문/삽입 단계의 처리량과 병목 단계를 결과에 담아야 함"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='cp949') as f:
+            f.write("거래일자,거래시간,적요,출금(원),입금(원),잔액(원),거래점\n")
+            for i in range(40):
+                f.write(f'2024-01-{i % 28 + 1:02d},09:{i % 60:02d}:00,"체크\n카드{i}","1,000",,"50,000",본점\n')
+            path = f.name
+
+        try:
+            result = TransactionImporter("acc-1", batch_size=7, conn=conn).import_file(path)
+        finally:
+            os.unlink(path)
+
+        assert result['success'] is True
+        assert result['inserted'] == 40
+        stages = {stage['stage']: stage for stage in result['stages']}
+        assert list(stages) == ["읽기", "디코딩", "정규화", "지문", "중복 확인/삽입"]
+        assert stages["읽기"]['unit'] == UNIT_BYTES
+        assert stages["정규화"]['processed'] == 40 and stages["중복 확인/삽입"]['processed'] == 40
+        assert result['bottleneck'] in stages
+        assert "병목" in capsys.readouterr().out
+        description = conn.execute("SELECT description FROM transactions ORDER BY source_row_id").fetchone()[0]
+        assert description.startswith("체크\n카드0")
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_line_endings(self, conn, newline):
+        """'\r'만 쓰는 파일도 행 스트림 경로로 모든 행을 가져와야 함"""
+        lines = ["거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점",
+                 '2024-01-30,12:04:41,FB이체,"10,000",0,카카오페이,"404,523",판교금',
+                 '2024-01-31,15:31:48,FB이체,0,"46,200",,"450,723",여중대']
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            f.write((newline.join(lines) + newline).encode('utf-8'))
+            path = f.name
+
+        try:
+            result = TransactionImporter("acct", conn=conn).import_file(path)
+        finally:
+            os.unlink(path)
+
+        assert result['success'] is True
+        assert result['inserted'] == 2
+        if newline == "\r":
+            assert [stage['stage'] for stage in result['stages']][0] == "읽기/정규화"
+
+
+class TestCsvBlockStages:
+    """CSV 바이트 블록 단계 테스트 클래스"""
+
+    def test_start_offset_requires_header_records(self, tmp_path):
+        """헤더 행 번호까지의 레코드가 없으면 파일 끝 대신 오류를 내야 함"""
+        path = tmp_path / "statement.csv"
+        path.write_bytes(b"title\nheader,a\n1,2\n")
+        stream = CsvRowStream(str(path)).open()
+        stages = CsvBlockStages(stream)
+        try:
+            stream.header_row = 2
+            assert stages.start_offset() == len(b"title\nheader,a\n")
+            stream.header_row = 4
+            with pytest.raises(ValueError):
+                stages.start_offset()
+        finally:
+            stream.close()
@@ -0,0 +1,206 @@
+"""
+테스트 파일: 증분 가져오기 (incremental_import)
+
+같은 계좌의 다음 거래내역 파일에서 이전에 가져온 기간은 건너뛰고 새 거래만 삽입하는지 검증합니다.
+"""
+
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from ai_smart_ledger.app.core import incremental_select
+from ai_smart_ledger.app.db import models
+from ai_smart_ledger.app.core.incremental_import import (
+    MODE_AFTER_LAST, MODE_BYTE_OFFSET, MODE_FULL, MODE_OVERLAP, ORDER_UNKNOWN, TAIL_WINDOW, import_incremental,
+)
+
+
+# 'unknown' 정렬 방향을 허용하기 전의 import_checkpoints 테이블
+OLD_IMPORT_CHECKPOINTS_DDL = """
+CREATE TABLE import_checkpoints (
+    account_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    file_order TEXT NOT NULL CHECK (file_order IN ('ascending', 'descending')),
+    last_epoch INTEGER,
+    tail_window TEXT NOT NULL,
+    byte_offset INTEGER,
+    offset_digest TEXT,
+    file_rows INTEGER,
+    imported_rows INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (account_id, source)
+);
+"""
+
+SHINHAN_HEADER = "거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n"
+
+
+def make_lines(days: int) -> list:
+    """2024-01-01부터 하루 한 건씩 잔액이 이어지는 거래 줄 목록 (과거 → 최신)"""
+    lines = []
+    balance = 1_000_000
+    for day in range(days):
+        amount = 1000 + day
+        if day % 3 == 0:
+            balance += amount
+            withdraw, deposit = "", f"{amount:,}"
+        else:
+            balance -= amount
+            withdraw, deposit = f"{amount:,}", ""
+        date = f"2024-{1 + day // 28:02d}-{1 + day % 28:02d}"
+        lines.append(f'{date},09:00:00,체크카드,"{withdraw}","{deposit}",가맹점{day % 5},"{balance:,}",본점\n')
+    return lines
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+def write_csv(folder: str, name: str, lines: list) -> str:
+    path = os.path.join(folder, name)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(SHINHAN_HEADER)
+        f.writelines(lines)
+    return path
+
+
+def stored_dates(conn) -> list:
+    return [row[0][:10] for row in conn.execute("SELECT timestamp FROM transactions ORDER BY timestamp_epoch")]
+
+
+class TestImportIncremental:
+    """import_incremental 테스트 클래스"""
+
+    def test_descending_stops_at_previous_window(self, conn, tmp_dir):
+        """내림차순 파일은 이전에 가져온 최신 거래 구간을 만나면 나머지를 읽지 않고 새 거래만 삽입"""
+        lines = make_lines(60)
+        first = write_csv(tmp_dir, "jan.csv", lines[:50][::-1])
+        second = write_csv(tmp_dir, "feb.csv", lines[::-1])
+
+        full = import_incremental(first, "신한-110", conn=conn)
+        result = import_incremental(second, "신한-110", conn=conn)
+
+        assert (full['mode'], full['inserted']) == (MODE_FULL, 50)
+        assert (result['mode'], result['inserted']) == (MODE_OVERLAP, 10)
+        assert result['parsed_rows'] == 10 + TAIL_WINDOW
+        assert stored_dates(conn) == [line[:10] for line in lines]
+
+    def test_appended_ascending_csv_parses_only_tail(self, conn, tmp_dir):
+        """오름차순 CSV 뒤에 이어 쓴 파일은 마지막 위치부터만 파싱하고 원본 행 번호를 이어서 기록"""
+        lines = make_lines(40)
+        path = write_csv(tmp_dir, "statement.csv", lines[:30])
+        import_incremental(path, "신한-110", conn=conn)
+        with open(path, 'a', encoding='utf-8', newline='') as f:
+            f.writelines(lines[30:])
+
+        result = import_incremental(path, "신한-110", conn=conn)
+
+        assert (result['mode'], result['inserted'], result['parsed_rows']) == (MODE_BYTE_OFFSET, 10, 10)
+        row_ids = [r[0] for r in conn.execute("SELECT source_row_id FROM transactions ORDER BY timestamp_epoch")]
+        assert row_ids == list(range(2, 42))
+        assert import_incremental(path, "신한-110", conn=conn)['inserted'] == 0
+
+    def test_ascending_rolling_export_skips_overlap(self, conn, tmp_dir):
+        """앞부분이 잘린 다음 기간 오름차순 파일은 겹치는 구간 뒤의 행만 삽입"""
+        lines = make_lines(60)
+        import_incremental(write_csv(tmp_dir, "q1.csv", lines[:40]), "신한-110", conn=conn)
+
+        result = import_incremental(write_csv(tmp_dir, "q2.csv", lines[20:]), "신한-110", conn=conn)
+
+        assert (result['mode'], result['inserted']) == (MODE_OVERLAP, 20)
+        row_ids = [r[0] for r in conn.execute("SELECT source_row_id FROM transactions WHERE source_file = 'q2.csv'")]
+        assert row_ids == list(range(22, 42))
+        assert stored_dates(conn) == [line[:10] for line in lines]
+
+    def test_ascending_redownload_parses_only_new_rows(self, conn, tmp_dir):
+        """기간을 늘려 다시 내려받은 오름차순 파일은 끝에서부터 새 거래와 겹치는 구간만 파싱"""
+        lines = make_lines(300)
+        import_incremental(write_csv(tmp_dir, "jan.csv", lines[:200]), "신한-110", conn=conn)
+        # 조회기간 머리말이 바뀌어 이어 쓴 파일로는 볼 수 없는 다시 내려받은 파일
+        path = os.path.join(tmp_dir, "feb.csv")
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write("조회기간,2024-01-01 ~ 2024-11-20\n" + SHINHAN_HEADER)
+            f.writelines(lines)
+
+        result = import_incremental(path, "신한-110", conn=conn)
+
+        assert (result['mode'], result['inserted']) == (MODE_OVERLAP, 100)
+        assert result['parsed_rows'] == 100 + TAIL_WINDOW
+        row_ids = [r[0] for r in conn.execute("SELECT source_row_id FROM transactions WHERE source_file = 'feb.csv'")]
+        assert row_ids == list(range(203, 303))
+        assert stored_dates(conn) == [line[:10] for line in lines]
+
+    def test_ascending_tail_scan_widens_until_overlap(self, conn, tmp_dir, monkeypatch):
+        """앞부분이 잘려 행 수로 겹치는 위치를 짐작할 수 없으면 끝에서부터 두 배씩 넓혀 찾음"""
+        monkeypatch.setattr(incremental_select, "TAIL_SCAN_ROWS", 8)
+        lines = make_lines(330)
+        import_incremental(write_csv(tmp_dir, "old.csv", lines[:300]), "신한-110", conn=conn)
+
+        result = import_incremental(write_csv(tmp_dir, "new.csv", lines[200:]), "신한-110", conn=conn)
+
+        assert (result['mode'], result['inserted']) == (MODE_OVERLAP, 30)
+        assert result['parsed_rows'] == 64
+        assert stored_dates(conn) == [line[:10] for line in lines]
+
+    def test_without_overlap_imports_after_last_timestamp(self, conn, tmp_dir):
+        """겹치는 구간이 없으면 마지막 거래일시 이후의 거래만 삽입"""
+        lines = make_lines(60)
+        import_incremental(write_csv(tmp_dir, "old.csv", lines[:30]), "신한-110", conn=conn)
+
+        # 이전 파일의 최신 거래 구간이 빠진 파일 (과거 거래 일부 + 새 거래)
+        result = import_incremental(write_csv(tmp_dir, "gap.csv", lines[:10] + lines[40:]), "신한-110", conn=conn)
+
+        assert (result['mode'], result['inserted']) == (MODE_AFTER_LAST, 20)
+        assert len(stored_dates(conn)) == 50
+
+    def test_single_row_file_leaves_order_unknown(self, conn, tmp_dir):
+        """거래가 한 건뿐인 첫 파일은 정렬 방향을 'unknown'으로 기억하고 다음 내림차순 파일의 방향을 따로 판별"""
+        lines = make_lines(4)
+        import_incremental(write_csv(tmp_dir, "first.csv", lines[:1]), "신한-110", conn=conn)
+        assert conn.execute("SELECT file_order FROM import_checkpoints").fetchone()[0] == ORDER_UNKNOWN
+
+        result = import_incremental(write_csv(tmp_dir, "second.csv", lines[::-1]), "신한-110", conn=conn)
+
+        assert (result['mode'], result['inserted']) == (MODE_OVERLAP, 3)
+        assert stored_dates(conn) == [line[:10] for line in lines]
+        assert conn.execute("SELECT file_order FROM import_checkpoints").fetchone()[0] == "descending"
+
+    def test_order_switch_between_files(self, conn, tmp_dir):
+        """출처의 정렬 방향이 오름차순 ↔ 내림차순으로 바뀌어도 파일마다 방향을 판별해 새 거래만 삽입"""
+        lines = make_lines(50)
+        import_incremental(write_csv(tmp_dir, "q1.csv", lines[:30]), "신한-110", conn=conn)
+
+        descending = import_incremental(write_csv(tmp_dir, "q2.csv", lines[:40][::-1]), "신한-110", conn=conn)
+        ascending = import_incremental(write_csv(tmp_dir, "q3.csv", lines[10:]), "신한-110", conn=conn)
+
+        assert (descending['mode'], descending['inserted']) == (MODE_OVERLAP, 10)
+        assert (ascending['mode'], ascending['inserted']) == (MODE_OVERLAP, 10)
+        assert stored_dates(conn) == [line[:10] for line in lines]
+
+    def test_checkpoints_are_per_account(self, conn, tmp_dir):
+        """가져오기 위치는 계좌별로 따로 기억하며 계좌 식별자가 없으면 실패"""
+        path = write_csv(tmp_dir, "statement.csv", make_lines(20))
+
+        assert import_incremental(path, "계좌-A", conn=conn)['inserted'] == 20
+        assert import_incremental(path, "계좌-B", conn=conn)['inserted'] == 20
+        assert import_incremental(path, "계좌-A", conn=conn)['inserted'] == 0
+        assert import_incremental(path, "", conn=conn)['success'] is False
+
+    def test_existing_checkpoints_table_allows_unknown_order(self, monkeypatch):
+        """이전 버전의 import_checkpoints 테이블은 기록을 유지한 채 'unknown' 정렬 방향을 허용하도록 다시 만듦"""
+        old = sqlite3.connect(":memory:")
+        old.execute(OLD_IMPORT_CHECKPOINTS_DDL)
+        old.execute("INSERT INTO import_checkpoints (account_id, source, file_order, tail_window) "
+                    "VALUES ('신한-110', '신한', 'ascending', '[]')")
+        monkeypatch.setattr(models.db_manager, "connection", old)
+
+        assert models.create_import_checkpoints_table() is True
+        old.execute("INSERT INTO import_checkpoints (account_id, source, file_order, tail_window) "
+                    "VALUES ('국민-220', '국민', 'unknown', '[]')")
+        assert old.execute("SELECT account_id FROM import_checkpoints ORDER BY account_id").fetchall() == [
+            ('국민-220',), ('신한-110',)]
+        old.close()
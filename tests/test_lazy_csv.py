@@ -0,0 +1,79 @@
+"""
+테스트 파일: 메모리 맵 기반 지연 로딩 CSV (LazyCsvFile)
+
+오프셋 인덱스로 필요한 행만 디코딩한 결과가 parse_csv_all과 같은지 검증합니다.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from ai_smart_ledger.app.core.file_parser import FileParser
+
+
+def write_csv(text: str, encoding: str = 'utf-8') -> str:
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding=encoding, newline='') as f:
+        f.write(text)
+        return f.name
+
+
+class TestLazyCsv:
+    """LazyCsvFile 테스트 클래스"""
+
+    @pytest.fixture
+    def statement(self):
+        lines = ["거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n"]
+        for i in range(300):
+            memo = f'"여러 줄\n적요 {i}"' if i % 50 == 0 else "FB이체"
+            lines.append(f'2025-01-01,10:00:00,{memo},"{i:,}",,카카오페이,"5,000",판교금\n')
+        path = write_csv("".join(lines))
+        yield path
+        os.unlink(path)
+
+    def test_rows_match_full_parse(self, statement):
+        """인덱스/슬라이스 접근 결과가 전체 파싱 결과와 같아야 함"""
+        expected = FileParser.parse_csv_all(statement)
+        with FileParser.open_csv_lazy(statement) as lazy:
+            assert lazy.headers == expected['headers']
+            assert len(lazy) == expected['total_rows'] == 300
+            assert lazy[0] == expected['data'][0]
+            assert lazy[50] == expected['data'][50]
+            assert lazy[-1] == expected['data'][-1]
+            assert lazy[100:140] == expected['data'][100:140]
+            assert lazy[::100] == expected['data'][::100]
+
+    def test_index_out_of_range(self, statement):
+        with FileParser.open_csv_lazy(statement) as lazy:
+            with pytest.raises(IndexError):
+                lazy[300]
+
+    def test_no_trailing_newline_and_bom(self):
+        """BOM이 있고 마지막 줄에 줄바꿈이 없어도 마지막 행을 포함해야 함"""
+        path = write_csv("날짜,적요,출금\n2025-01-01,커피,\"4,500\"\n2025-01-02,점심,9000", encoding='utf-8-sig')
+        try:
+            with FileParser.open_csv_lazy(path) as lazy:
+                assert lazy.headers == ['날짜', '적요', '출금']
+                assert len(lazy) == 2
+                assert lazy[1] == ['2025-01-02', '점심', '9000']
+                assert lazy[0][2] == '4500'
+        finally:
+            os.unlink(path)
+
+    def test_header_only(self):
+        path = write_csv("날짜,적요,출금\n")
+        try:
+            with FileParser.open_csv_lazy(path) as lazy:
+                assert len(lazy) == 0
+                assert lazy[0:10] == []
+        finally:
+            os.unlink(path)
+
+    def test_cr_only_line_endings_rejected(self):
+        """'\r'만 쓰는 파일은 오프셋 인덱스를 만들 수 없으므로 빈 인덱스 대신 ValueError"""
+        path = write_csv("날짜,적요,출금\r2025-01-01,커피,4500\r2025-01-02,점심,9000\r")
+        try:
+            with pytest.raises(ValueError, match="줄바꿈"):
+                FileParser.open_csv_lazy(path)
+        finally:
+            os.unlink(path)
@@ -11,6 +11,9 @@ from PySide6.QtWidgets import QApplication, QStackedWidget
 from PySide6.QtTest import QTest
 from PySide6.QtCore import Qt
 
+from ai_smart_ledger.app.core.file_parser import FileParser
+from ai_smart_ledger.app.core.pandas_backend import BACKEND_PANDAS, BACKEND_PYTHON
+from ai_smart_ledger.app.ui import main_window as main_window_module
 from ai_smart_ledger.app.ui.main_window import MainWindow
 
 
@@ -145,6 +148,32 @@ class TestMainWindow:
         central_widget = main_window.centralWidget()
         assert central_widget.count() >= 1
         assert central_widget.widget(0) == main_window.welcome_widget
+    
+    def test_parse_cache_dir(self, app, main_window, tmp_path, monkeypatch):
+        """파싱 캐시 폴더는 인자 > 환경 변수 PARSE_CACHE_DIR > DB 파일 옆 순으로 정해짐"""
+        assert main_window.parse_cache.cache_dir == tmp_path / 'parse_cache'
+        
+        window = MainWindow(parse_cache_dir=tmp_path / 'custom')
+        assert window.parse_cache.cache_dir == tmp_path / 'custom'
+        window.close()
+        
+        monkeypatch.delenv('PARSE_CACHE_DIR')
+        window = MainWindow()
+        assert window.parse_cache.cache_dir == window.database_manager.db_path.parent / 'parse_cache'
+        window.close()
+    
+    def test_parse_backend_setting(self, main_window, monkeypatch):
+        """설정의 parse_backend를 전체 파싱 백엔드로 적용하고, 알 수 없는 값이면 python으로 되돌림"""
+        monkeypatch.setattr(FileParser, "backend", BACKEND_PYTHON)
+        settings = {"parse_backend": BACKEND_PANDAS}
+        monkeypatch.setattr(main_window_module, "get_setting", settings.get)
+        
+        main_window.apply_parse_backend()
+        assert FileParser.backend == BACKEND_PANDAS
+        
+        settings["parse_backend"] = "polars"
+        main_window.apply_parse_backend()
+        assert FileParser.backend == BACKEND_PYTHON
 
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+"""
+테스트 파일: 다중 파일 가져오기 (multi_import)
+
+여러 계좌의 거래내역 파일을 동시에 읽어 계좌 컬럼이 붙은 하나의 거래일시 순 타임라인으로 병합하는지 검증합니다.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pytest
+from openpyxl import Workbook
+from PySide6.QtWidgets import QApplication
+
+from ai_smart_ledger.app.core.encoded_rows import EncodedRows
+from ai_smart_ledger.app.core.file_handler import FileHandler
+from ai_smart_ledger.app.core.multi_import import ACCOUNT_HEADER, MultiFileLoader, load_statements
+
+
+SHINHAN_HEADER = "거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n"
+
+# 신한은행 계좌: 최신 거래가 위 (내림차순)
+SHINHAN_ROWS = (
+    '2024-01-20,10:00:00,체크카드,"5,000",,스타벅스,"95,000",본점\n'
+    '2024-01-05,09:00:00,FB이체,,"100,000",회사,"100,000",본점\n'
+)
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+def write_csv(folder: str, name: str, content: str, encoding: str = 'utf-8') -> str:
+    path = os.path.join(folder, name)
+    with open(path, 'w', encoding=encoding, newline='') as f:
+        f.write(content)
+    return path
+
+
+def write_kb_xlsx(folder: str) -> str:
+    """국민은행 양식 계좌: 과거 거래가 위 (오름차순)"""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["거래일시", "적요", "보낸분/받는분", "출금액(원)", "입금액(원)", "잔액(원)", "처리점"])
+    ws.append(["2024.01.10 12:00:00", "이체", "홍길동", 0, 30000, 30000, "여의도"])
+    ws.append(["2024.01.20 10:00:00", "이체", "홍길동", 0, 20000, 50000, "여의도"])
+    path = os.path.join(folder, "kb.xlsx")
+    wb.save(path)
+    return path
+
+
+class TestLoadStatements:
+    """load_statements 테스트 클래스"""
+
+    def test_accounts_merged_by_timestamp(self, tmp_dir):
+        """CSV/Excel 계좌를 거래일시 순으로 병합 (같은 시각은 파일 순서, 계좌 식별자가 없으면 은행 프로필 이름)"""
+        shinhan = write_csv(tmp_dir, "shinhan.csv", SHINHAN_HEADER + SHINHAN_ROWS, encoding='cp949')
+        kb = write_kb_xlsx(tmp_dir)
+
+        result = load_statements([shinhan, kb], account_ids={shinhan: "신한-급여"}, workers=1)
+
+        assert result['success'] is True
+        data = result['data']
+        assert isinstance(data, EncodedRows)
+        assert result['headers'][-1] == ACCOUNT_HEADER
+        date_idx = result['headers'].index("날짜")
+        assert [(row[date_idx][:10].replace('.', '-'), row[-1]) for row in data] == [
+            ("2024-01-05", "신한-급여"),
+            ("2024-01-10", "KB국민은행"),
+            ("2024-01-20", "신한-급여"),
+            ("2024-01-20", "KB국민은행"),
+        ]
+        assert result['accounts'] == ["신한-급여", "KB국민은행"]
+        assert result['files'] == {shinhan: 2, kb: 2}
+        assert all(check['ok'] for check in result['balance_checks'].values())
+
+    def test_process_pool_matches_sequential(self, tmp_dir):
+        """프로세스 풀로 정규화한 결과는 현재 프로세스에서 정규화한 결과와 같아야 함"""
+        paths = [write_csv(tmp_dir, f"2024-{m:02d}.csv",
+                           SHINHAN_HEADER + SHINHAN_ROWS.replace("2024-01", f"2024-{m:02d}"))
+                 for m in range(1, 4)]
+
+        sequential = load_statements(paths, workers=1)
+        parallel = load_statements(paths, workers=2)
+
+        assert parallel['data'] == sequential['data']
+        assert len(parallel['data']) == 6
+
+    def test_large_files_streamed_from_disk(self, tmp_dir, monkeypatch):
+        """스트리밍 기준보다 큰 파일은 메모리로 읽지 않고 파일에서 스트리밍해도 같은 결과여야 함"""
+        shinhan = write_csv(tmp_dir, "shinhan.csv", SHINHAN_HEADER + SHINHAN_ROWS, encoding='cp949')
+        kb = write_kb_xlsx(tmp_dir)
+        in_memory = load_statements([shinhan, kb], workers=1)
+
+        monkeypatch.setattr(FileHandler, "MAX_FILE_SIZE", 0)
+        streamed = load_statements([shinhan, kb], workers=1)
+
+        assert streamed['data'] == in_memory['data']
+        assert streamed['files'] == {shinhan: 2, kb: 2}
+
+    def test_failed_file_skipped(self, tmp_dir):
+        """헤더가 없거나 읽을 수 없는 파일은 건너뛰고 나머지 파일은 병합"""
+        good = write_csv(tmp_dir, "good.csv", SHINHAN_HEADER + SHINHAN_ROWS)
+        empty = write_csv(tmp_dir, "empty.csv", "")
+        missing = os.path.join(tmp_dir, "missing.csv")
+
+        result = load_statements([good, empty, missing], workers=1)
+
+        assert result['success'] is True
+        assert result['files'][good] == 2
+        assert isinstance(result['files'][empty], str)
+        assert "파일 읽기 오류" in result['files'][missing]
+
+    def test_no_loadable_file(self, tmp_dir):
+        """가져올 수 있는 파일이 없으면 실패"""
+        empty = write_csv(tmp_dir, "empty.csv", "")
+
+        assert load_statements([])['success'] is False
+        assert load_statements([empty], workers=1)['error'] == "가져올 수 있는 거래내역 파일이 없습니다"
+
+
+class TestMultiFileLoader:
+    """MultiFileLoader 테스트 클래스"""
+
+    @pytest.fixture(autouse=True)
+    def app(self):
+        return QApplication.instance() or QApplication(sys.argv)
+
+    def test_loads_in_background_and_signals(self, app, tmp_dir):
+        """작업 스레드에서 가져오고 진행률과 결과를 시그널로 알려야 함"""
+        paths = [write_csv(tmp_dir, f"{m}.csv", SHINHAN_HEADER + SHINHAN_ROWS) for m in range(2)]
+        loader = MultiFileLoader(paths, workers=1)
+        progress, results = [], []
+        loader.progress.connect(lambda done, total: progress.append((done, total)))
+        loader.finished.connect(results.append)
+
+        loader.start()
+        deadline = time.time() + 10
+        while not results and time.time() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+        loader.wait()
+
+        assert progress[-1] == (2, 2)
+        assert results[0]['success'] is True
+        assert results[0]['total_rows'] == 4
@@ -0,0 +1,216 @@
+"""
+테스트 파일: pandas 파싱 백엔드 (pandas_backend)
+
+같은 파일을 파이썬 경로와 pandas 백엔드로 전체 파싱했을 때 헤더/데이터 행/행 수/잔액 검사 결과가
+모두 같은지 검증합니다 (인코딩, 머리말 줄, 은행 양식, 컬럼 수 불일치 행, Excel 셀 타입).
+"""
+
+import datetime
+import os
+import tempfile
+
+import pytest
+from openpyxl import Workbook
+
+from ai_smart_ledger.app.core.csv_scan import records_have_fields
+from ai_smart_ledger.app.core.encoded_rows import EncodedRows
+from ai_smart_ledger.app.core.file_parser import FileParser
+from ai_smart_ledger.app.core.pandas_backend import BACKEND_PANDAS, BACKEND_PYTHON
+
+pytest.importorskip("pandas")
+
+SHINHAN_HEADER = "거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n"
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+def write_file(folder: str, name: str, text: str, encoding: str = 'utf-8') -> str:
+    path = os.path.join(folder, name)
+    with open(path, 'w', encoding=encoding, newline='') as f:
+        f.write(text)
+    return path
+
+
+def shinhan_lines(count: int) -> str:
+    """잔액이 이어지는 내림차순 신한은행 양식 데이터 줄 (앞뒤 공백, 빈 금액 포함)"""
+    lines = []
+    balance = 5_000_000
+    for i in range(count):
+        amount = 1000 + i * 7
+        withdraw, deposit = (f"{amount:,}", "") if i % 4 else ("", f"{amount:,}")
+        lines.append(f'2024-03-{28 - i // 12:02d},{23 - i % 12:02d}:15:00, 체크카드 ,"{withdraw}","{deposit}",'
+                     f'가맹점{i % 6} ,"{balance:,}",본점\n')
+        balance += amount if i % 4 else -amount
+    return "".join(lines)
+
+
+def assert_same_result(parse, path: str) -> dict:
+    """두 백엔드의 파싱 결과가 같은지 확인하고 pandas 백엔드 결과를 반환"""
+    python = parse(path, backend=BACKEND_PYTHON)
+    pandas = parse(path, backend=BACKEND_PANDAS)
+
+    assert python['success'] is True and pandas['success'] is True
+    assert pandas['headers'] == python['headers']
+    assert isinstance(pandas['data'], EncodedRows)
+    assert pandas['data'] == python['data']
+    assert pandas['data'].encoded_headers == python['data'].encoded_headers
+    assert pandas['total_rows'] == python['total_rows']
+    check, expected = pandas['balance_check'], python['balance_check']
+    assert (check is None) == (expected is None)
+    if check is not None:
+        assert (check['ok'], check['order'], check['break_count']) == (
+            expected['ok'], expected['order'], expected['break_count'])
+    return pandas
+
+
+def parse_csv(path: str, backend: str) -> dict:
+    return FileParser.parse_csv_all(path, backend=backend)
+
+
+def parse_excel(path: str, backend: str) -> dict:
+    return FileParser.parse_excel_all(path, backend=backend)
+
+
+class TestCsvParity:
+    """CSV 백엔드 동등성 테스트 클래스"""
+
+    def test_shinhan_statement(self, tmp_dir, capsys):
+        """공백/쉼표/빈 금액이 있는 신한은행 양식이 pandas 경로로 같은 결과를 내야 함"""
+        path = write_file(tmp_dir, "shinhan.csv", SHINHAN_HEADER + shinhan_lines(300))
+
+        result = assert_same_result(parse_csv, path)
+
+        assert result['data'][1] == ['2024-03-28', '22:15:00', '체크카드', '1007', '0', '가맹점1', '4999000', '본점']
+        assert result['balance_check']['ok'] is True
+        assert "기본 파서로" not in capsys.readouterr().out
+
+    def test_cp949_with_preamble(self, tmp_dir):
+        """cp949 인코딩과 머리말 줄이 있는 파일도 헤더 다음 바이트부터 같은 행을 읽어야 함"""
+        preamble = "신한은행 거래내역 조회\n조회기간,2024-03-01 ~ 2024-03-31\n\n"
+        path = write_file(tmp_dir, "cp949.csv", preamble + SHINHAN_HEADER + shinhan_lines(50), encoding='cp949')
+
+        result = assert_same_result(parse_csv, path)
+
+        assert result['total_rows'] == 50
+
+    def test_kb_statement_with_quoted_newline(self, tmp_dir):
+        """KB국민은행 양식과 따옴표 안 줄바꿈이 있는 셀도 같은 결과여야 함"""
+        text = ("거래일시,적요,보낸분/받는분,출금액(원),입금액(원),잔액(원),처리점\n"
+                '2024.03.01 10:00:00,이체,"홍길동\n(메모)",0,"50,000","150,000",본점\n'
+                "2024.03.02 11:00:00,카드,스타벅스,\"4,500\",0,\"145,500\",강남\n")
+        path = write_file(tmp_dir, "kb.csv", text)
+
+        result = assert_same_result(parse_csv, path)
+
+        assert result['data'][0][2] == "홍길동\n(메모)"
+
+    def test_malformed_rows_use_python_path(self, tmp_dir, capsys):
+        """컬럼 수가 다른 행이나 빈 줄이 있으면 기본 파서로 읽어 원래 셀 그대로 보존"""
+        lines = shinhan_lines(10).splitlines(keepends=True)
+        lines[3] = "2024-03-04,03:15:00,체크카드\n"
+        lines[6] = lines[6].rstrip("\n") + ",추가\n"
+        path = write_file(tmp_dir, "malformed.csv", SHINHAN_HEADER + "".join(lines) + "\n")
+
+        result = assert_same_result(parse_csv, path)
+
+        assert "기본 파서로" in capsys.readouterr().out
+        assert result['data'][3] == ['2024-03-04', '03:15:00', '체크카드']
+        assert result['data'][6][-1] == '추가'
+        assert result['data'][-1] == []
+
+    def test_cr_only_file_uses_python_path(self, tmp_dir, capsys):
+        """'\r'만 쓰는 파일은 바이트 위치로 읽을 수 없으므로 기본 파서로 모든 행을 읽어야 함"""
+        text = (SHINHAN_HEADER + shinhan_lines(20)).replace("\n", "\r")
+        path = write_file(tmp_dir, "cr.csv", text)
+
+        result = assert_same_result(parse_csv, path)
+
+        assert result['total_rows'] == 20
+        assert "기본 파서로" in capsys.readouterr().out
+
+    def test_header_only_file(self, tmp_dir):
+        """헤더만 있는 파일은 두 백엔드 모두 빈 결과"""
+        path = write_file(tmp_dir, "empty.csv", SHINHAN_HEADER)
+
+        result = assert_same_result(parse_csv, path)
+
+        assert len(result['data']) == 0
+
+    def test_unknown_backend_is_error(self, tmp_dir):
+        """지원하지 않는 백엔드 이름은 실패 결과로 반환"""
+        path = write_file(tmp_dir, "shinhan.csv", SHINHAN_HEADER + shinhan_lines(3))
+
+        result = FileParser.parse_csv_all(path, backend="polars")
+
+        assert result['success'] is False
+        assert "polars" in result['error']
+
+    def test_class_default_backend(self, tmp_dir, monkeypatch, capsys):
+        """FileParser.backend를 바꾸면 backend 인자 없이도 해당 백엔드를 사용"""
+        path = write_file(tmp_dir, "malformed.csv", SHINHAN_HEADER + "2024-03-01,10:00:00\n")
+        monkeypatch.setattr(FileParser, "backend", BACKEND_PANDAS)
+
+        assert FileParser.parse_csv_all(path)['success'] is True
+        assert "기본 파서로" in capsys.readouterr().out
+
+
+class TestRecordsHaveFields:
+    """따옴표 밖 구분자 수 검사 테스트 클래스"""
+
+    def test_block_boundaries(self):
+        """블록 경계에 걸친 레코드와 따옴표 안 구분자/줄바꿈도 올바르게 셈"""
+        data = b'a,b,c\n"1,2",x,"y\nz"\n3,4,5'
+
+        assert all(records_have_fields(data, 3, 0, ',', block_size) for block_size in (1, 2, 5, 64))
+        assert not records_have_fields(data + b',6', 3)
+        assert not records_have_fields(b'a,b,c\n\n1,2,3\n', 3)
+        assert not records_have_fields(b'a,"b,c\n', 2)
+
+
+class TestExcelParity:
+    """Excel 백엔드 동등성 테스트 클래스"""
+
+    def save_workbook(self, folder: str, rows) -> str:
+        wb = Workbook()
+        ws = wb.active
+        for row in rows:
+            ws.append(row)
+        path = os.path.join(folder, "statement.xlsx")
+        wb.save(path)
+        wb.close()
+        return path
+
+    def test_typed_cells_with_preamble(self, tmp_dir):
+        """머리말 행, 빈 행, 날짜/시간/숫자 셀이 섞인 시트도 같은 결과여야 함"""
+        rows = [["KB국민은행 거래내역"], [], ["거래일시", "적요", "보낸분/받는분", "출금액(원)", "입금액(원)", "잔액(원)", "처리점"]]
+        balance = 100_000
+        for i in range(40):
+            balance -= 1500 + i
+            rows.append([datetime.datetime(2024, 3, 1 + i % 28, 9, i % 60), " 카드 ", f"가맹점{i % 3}",
+                         1500.0 + i, None, balance, "본점"])
+            if i == 20:
+                rows.append([])
+        rows.append([datetime.datetime(2024, 4, 1), "이자", None, None, "1,200", balance + 1200, None])
+        path = self.save_workbook(tmp_dir, rows)
+
+        result = assert_same_result(parse_excel, path)
+
+        assert result['total_rows'] == 41
+        assert result['data'][0][:4] == ['2024-03-01 09:00:00', '카드', '가맹점0', '1500']
+        assert result['data'][-1] == ['2024-04-01', '이자', '', '0', '1200', str(balance + 1200), '']
+
+    def test_error_cells_use_python_path(self, tmp_dir, capsys):
+        """read_excel이 NaN으로 바꾸는 오류 셀(#N/A)이 있으면 기본 파서로 읽어 원래 값을 보존"""
+        rows = [["거래일자", "거래시간", "적요", "출금(원)", "입금(원)", "내용", "잔액(원)", "거래점"],
+                ["2024-03-01", "10:00:00", "체크카드", 1000, None, "가맹점", 9000, "본점"],
+                ["2024-03-02", "11:00:00", "체크카드", 2000, None, "#N/A", 7000, "본점"]]
+        path = self.save_workbook(tmp_dir, rows)
+
+        result = assert_same_result(parse_excel, path)
+
+        assert "기본 파서로" in capsys.readouterr().out
+        assert result['data'][1][5] == "#N/A"
@@ -0,0 +1,116 @@
+"""
+테스트 파일: 병렬 CSV 파싱 및 레코드 경계 스캔
+
+바이트 구간 분할이 따옴표 안 줄바꿈을 자르지 않고,
+병렬 결과가 parse_csv_all과 같은 순서/내용인지 검증합니다.
+"""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from ai_smart_ledger.app.core import parallel_parser
+from ai_smart_ledger.app.core.csv_scan import find_record_boundaries, is_byte_scannable, iter_record_ends
+from ai_smart_ledger.app.core.file_parser import FileParser
+
+
+def write_csv(lines, encoding='utf-8') -> str:
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding=encoding, newline='') as f:
+        f.write("거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n")
+        f.writelines(lines)
+        return f.name
+
+
+class TestCsvScan:
+    """레코드 경계 스캔 테스트"""
+
+    def test_newline_inside_quotes_is_not_boundary(self):
+        data = b'a,b\n"x\ny",1\nz,2\n'
+        ends = [int(e) for block in iter_record_ends(data, block_size=3) for e in block]
+        assert ends == [4, 12, 16]
+
+    def test_find_record_boundaries(self):
+        data = b'h\n"1\n2"\n3\n4\n'
+        assert find_record_boundaries(data, [0, 3, 9, 100]) == [2, 8, 10, len(data)]
+
+    def test_byte_scannable_encodings(self):
+        assert is_byte_scannable('UTF-8')
+        assert is_byte_scannable('cp949')
+        assert is_byte_scannable('EUC-KR')
+        assert not is_byte_scannable('utf-16')
+        assert not is_byte_scannable('unknown-encoding')
+
+
+class TestParallelParser:
+    """parse_csv_parallel 테스트"""
+
+    @pytest.fixture
+    def statement(self):
+        lines = []
+        for i in range(2000):
+            if i % 97 == 0:
+                lines.append(f'2025-01-01,10:00:00,"여러 줄\n적요 {i}","1,{i % 1000:03d}",,카카오페이,"5,000",판교금\n')
+            else:
+                lines.append(f'2025-01-01,10:00:00,FB이체,"{i:,}",,카카오페이,"5,000",판교금\n')
+        lines.append("2025-01-02,짧은행\n")
+        path = write_csv(lines)
+        yield path
+        os.unlink(path)
+
+    def test_ranges_cover_data_without_gaps(self, statement):
+        """구간들은 헤더 뒤부터 파일 끝까지 빈틈없이 이어져야 함"""
+        ranges = parallel_parser.split_byte_ranges(statement, 7)
+        assert ranges[-1][1] == os.path.getsize(statement)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+
+    @patch.object(parallel_parser, 'PARALLEL_MIN_SIZE', 0)
+    def test_parallel_matches_single_process(self, statement):
+        """병렬 결과가 단일 프로세스 결과와 동일해야 함"""
+        expected = FileParser.parse_csv_all(statement)
+        result = FileParser.parse_csv_parallel(statement, workers=3)
+
+        assert result['success'] is True
+        assert result['headers'] == expected['headers']
+        assert result['total_rows'] == expected['total_rows'] == 2001
+        assert result['data'] == expected['data']
+
+    @patch.object(parallel_parser, 'PARALLEL_MIN_SIZE', 0)
+    def test_malformed_row_number_is_absolute(self, statement, capsys):
+        """컬럼 수 불일치 경고는 원본 파일 기준 행 번호로 출력되어야 함"""
+        FileParser.parse_csv_parallel(statement, workers=3)
+        assert "2002행: 컬럼 수 불일치" in capsys.readouterr().out
+
+    @patch.object(parallel_parser, 'PARALLEL_MIN_SIZE', 0)
+    def test_cr_only_file_uses_single_process(self):
+        """'\r'만 쓰는 파일은 바이트 구간으로 나눌 수 없으므로 스트림으로 모든 행을 읽어야 함"""
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            f.write("거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\r".encode('utf-8'))
+            for i in range(50):
+                f.write(f'2025-01-01,10:00:00,FB이체,"{i:,}",,카카오페이,"5,000",판교금\r'.encode('utf-8'))
+            path = f.name
+
+        try:
+            with patch.object(parallel_parser, 'ProcessPoolExecutor') as pool:
+                result = FileParser.parse_csv_parallel(path, workers=3)
+        finally:
+            os.unlink(path)
+
+        pool.assert_not_called()
+        assert result['success'] is True
+        assert result['total_rows'] == 50
+        assert result['data'][49][3] == '49'
+
+    def test_small_file_uses_single_process(self, statement):
+        """작은 파일은 프로세스 풀 없이 파싱"""
+        with patch.object(parallel_parser, 'ProcessPoolExecutor') as pool:
+            result = FileParser.parse_csv_parallel(statement, workers=4)
+        pool.assert_not_called()
+        assert result['total_rows'] == 2001
+
+    def test_missing_file(self):
+        result = FileParser.parse_csv_parallel("/nonexistent/file.csv")
+        assert result['success'] is False
+        assert "파일이 존재하지 않습니다" in result['error']
@@ -0,0 +1,120 @@
+"""
+테스트 파일: 내용 해시 기반 파싱 캐시 (ParseCache)
+
+같은 내용의 파일을 다시 열 때 파싱을 건너뛰고,
+크기 상한(LRU)과 버전 변경 시 무효화가 동작하는지 검증합니다.
+"""
+
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ai_smart_ledger.app.core import parse_cache
+from ai_smart_ledger.app.core.file_parser import FileParser
+from ai_smart_ledger.app.core.parse_cache import ParseCache
+from ai_smart_ledger.app.core.parse_session import ParseSession
+
+
+class TestParseCache:
+    """ParseCache 테스트 클래스"""
+
+    @pytest.fixture
+    def cache_dir(self):
+        with tempfile.TemporaryDirectory() as d:
+            yield d
+
+    @pytest.fixture
+    def temp_csv(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("거래일자,거래시간,적요,출금(원),입금(원)\n")
+            for i in range(20):
+                f.write(f'2025-05-01,10:00:{i:02d},카카오페이,"{i + 1},000",\n')
+            temp_path = f.name
+        yield temp_path
+        os.unlink(temp_path)
+
+    def test_hit_skips_parsing(self, cache_dir, temp_csv):
+        """두 번째 세션은 파서를 호출하지 않고 같은 결과를 반환해야 함"""
+        cache = ParseCache(cache_dir)
+        first = ParseSession(temp_csv, cache=cache)
+        expected = first.run()
+        assert first.from_cache is False
+
+        with patch.object(FileParser, 'parse_csv_all') as parse:
+            second = ParseSession(temp_csv, cache=cache)
+            result = second.run()
+        parse.assert_not_called()
+        assert second.from_cache is True
+        assert result == expected
+        assert second.preview['data'] == expected['data'][:5]
+
+    def test_key_is_content_hash(self, cache_dir, temp_csv):
+        """내용이 같으면 경로가 달라도 캐시를 사용하고, 내용이 바뀌면 다시 파싱"""
+        cache = ParseCache(cache_dir)
+        ParseSession(temp_csv, cache=cache).run()
+
+        copy_path = temp_csv + ".copy.csv"
+        with open(temp_csv, 'rb') as src, open(copy_path, 'wb') as dst:
+            dst.write(src.read())
+        try:
+            session = ParseSession(copy_path, cache=cache)
+            session.run()
+            assert session.from_cache is True
+
+            with open(copy_path, 'a', encoding='utf-8') as f:
+                f.write('2025-05-02,11:00:00,스타벅스,"5,000",\n')
+            session = ParseSession(copy_path, cache=cache)
+            result = session.run()
+            assert session.from_cache is False
+            assert result['total_rows'] == 21
+        finally:
+            os.unlink(copy_path)
+
+    def test_failed_result_not_cached(self, cache_dir):
+        cache = ParseCache(cache_dir)
+        assert cache.put("abc", "CSV", {'success': False, 'error': "오류"}) is False
+        assert cache.get("abc", "CSV") is None
+
+    def test_lru_eviction(self, cache_dir):
+        """크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        cache = ParseCache(cache_dir)
+        result = {'success': True, 'headers': ['적요'], 'data': [[os.urandom(8).hex()] for _ in range(200)],
+                  'total_rows': 200, 'error': None}
+        cache.put("a", "CSV", result)
+        entry_size = cache.total_size()
+        cache.max_bytes = entry_size * 2
+
+        cache.put("b", "CSV", result)
+        past = time.time() - 100
+        for name in os.listdir(cache_dir):
+            os.utime(os.path.join(cache_dir, name), (past, past))
+        assert cache.get("a", "CSV") is not None  # a를 최근 사용으로 갱신
+        cache.put("c", "CSV", result)
+
+        assert cache.get("a", "CSV") is not None
+        assert cache.get("b", "CSV") is None
+        assert cache.get("c", "CSV") is not None
+
+    def test_version_change_invalidates(self, cache_dir, temp_csv):
+        """파서 버전이 바뀌면 기존 캐시 항목을 사용하지 않아야 함"""
+        ParseSession(temp_csv, cache=ParseCache(cache_dir)).run()
+
+        with patch.object(parse_cache, 'PARSER_VERSION', parse_cache.PARSER_VERSION + 1):
+            session = ParseSession(temp_csv, cache=ParseCache(cache_dir))
+            session.run()
+        assert session.from_cache is False
+        assert len(os.listdir(cache_dir)) == 1
+
+    def test_corrupted_entry_is_removed(self, cache_dir, temp_csv):
+        cache = ParseCache(cache_dir)
+        ParseSession(temp_csv, cache=cache).run()
+        (entry,) = os.listdir(cache_dir)
+        with open(os.path.join(cache_dir, entry), 'wb') as f:
+            f.write(b"broken")
+
+        session = ParseSession(temp_csv, cache=cache)
+        assert session.run()['success'] is True
+        assert session.from_cache is False
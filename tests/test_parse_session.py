@@ -0,0 +1,99 @@
+"""
+테스트 파일: 단일 패스 파싱 세션 (ParseSession)
+
+미리보기와 전체 데이터를 한 번의 파일 읽기로 만드는지 검증합니다.
+"""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from ai_smart_ledger.app.core import csv_stream
+from ai_smart_ledger.app.core.excel_sheets import SHEET_HEADER
+from ai_smart_ledger.app.core.parse_session import ParseSession
+
+
+class TestParseSession:
+    """ParseSession 테스트 클래스"""
+
+    @pytest.fixture
+    def temp_csv(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("거래일자,거래시간,적요,출금(원),입금(원)\n")
+            for i in range(8):
+                f.write(f'2025-05-0{i + 1},10:00:00,카카오페이,"{i + 1},000",\n')
+            temp_path = f.name
+        yield temp_path
+        os.unlink(temp_path)
+
+    @pytest.fixture
+    def temp_excel(self):
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["날짜", "적요", "출금"])
+        for i in range(7):
+            ws.append([f"2025-05-0{i + 1}", "FB이체", 1000 * (i + 1)])
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
+            temp_path = f.name
+        wb.save(temp_path)
+        wb.close()
+        yield temp_path
+        os.unlink(temp_path)
+
+    def test_csv_preview_comes_from_full_result(self, temp_csv):
+        """미리보기는 전체 결과의 첫 N행이어야 함"""
+        session = ParseSession(temp_csv, preview_rows=5)
+        result = session.run()
+
+        assert result['success'] is True
+        assert result['total_rows'] == 8
+        assert len(result['data']) == 8
+        assert session.preview['data'] == result['data'][:5]
+        assert session.preview['headers'] == ['날짜', '시간', '적요', '출금', '입금']
+        assert session.preview['total_rows'] == 8
+
+    def test_csv_detection_runs_once(self, temp_csv):
+        """인코딩 감지는 세션당 한 번만 수행되어야 함"""
+        with patch.object(csv_stream, 'detect_encoding', wraps=csv_stream.detect_encoding) as detect:
+            ParseSession(temp_csv).run()
+        assert detect.call_count == 1
+
+    def test_excel_session(self, temp_excel):
+        """Excel 파일도 같은 방식으로 미리보기와 전체 데이터를 제공"""
+        session = ParseSession(temp_excel, preview_rows=3)
+        result = session.run()
+
+        assert session.file_type == 'Excel'
+        assert result['total_rows'] == 7
+        assert len(session.preview['data']) == 3
+
+    def test_multi_sheet_excel_merges_all_sheets(self, temp_excel):
+        """시트가 여러 개인 통합 문서는 모든 시트를 병합하고 출처 시트 컬럼을 붙여야 함"""
+        wb = load_workbook(temp_excel)
+        wb.active.title = "5월"
+        june = wb.create_sheet("6월")
+        june.append(["날짜", "적요", "출금"])
+        june.append(["2025-06-01", "카카오페이", 500])
+        wb.save(temp_excel)
+        wb.close()
+
+        result = ParseSession(temp_excel, preview_rows=3).run()
+
+        assert result['success'] is True
+        assert result['total_rows'] == 8
+        assert result['headers'][-1] == SHEET_HEADER
+        assert result['sheets'] == {"5월": 7, "6월": 1}
+        assert result['data'][-1][-1] == "6월"
+
+    def test_unsupported_extension(self):
+        """지원하지 않는 확장자는 실패 결과를 반환"""
+        session = ParseSession("statement.txt")
+        result = session.run()
+
+        assert session.file_type is None
+        assert result['success'] is False
+        assert "지원하지 않는 파일 형식" in result['error']
+        assert session.preview['data'] == []
@@ -137,7 +137,7 @@ class TestSlice13TableWidget:
         """파싱과 테이블 표시의 통합 기능을 테스트"""
         # Given: 모의 파싱 결과 설정
         mock_parser_instance = mock_file_parser.return_value
-        mock_parser_instance.parse_csv_preview.return_value = {
+        mock_parser_instance.parse_csv_all.return_value = {
             'success': True,
             'headers': ['날짜', '내용', '금액'],
             'data': [
@@ -154,8 +154,9 @@ class TestSlice13TableWidget:
         test_file_path = "test.csv"
         window.parse_and_display_preview(test_file_path)
         
-        # Then: 파서가 호출되었는지 확인
-        mock_parser_instance.parse_csv_preview.assert_called_once_with(test_file_path, max_rows=5)
+        # Then: 파일을 한 번만 파싱하고 미리보기는 같은 결과에서 생성되었는지 확인
+        mock_parser_instance.parse_csv_all.assert_called_once_with(test_file_path)
+        mock_parser_instance.parse_csv_preview.assert_not_called()
         
         # display_csv_data_in_table 메서드가 호출되었는지 확인 (구현 후)
         # 이 부분은 실제 구현 후에 활성화
@@ -102,21 +102,20 @@ class TestSlice15Integration:
             assert main_window.selected_file_path == valid_small_csv
     
     def test_file_size_validation_in_ui(self, main_window, large_csv_file):
-        """UI에서 파일 크기 검증 테스트"""
+        """UI에서 50MB 초과 파일은 미리보기 대신 스트리밍 가져오기로 처리되는지 테스트"""
         with patch('PySide6.QtWidgets.QFileDialog.getOpenFileName') as mock_dialog:
             mock_dialog.return_value = (large_csv_file, "")
             
-            # QMessageBox.critical이 호출되는지 확인
-            with patch('PySide6.QtWidgets.QMessageBox.critical') as mock_msg:
+            with patch('PySide6.QtWidgets.QMessageBox.critical') as mock_msg, \
+                 patch.object(main_window, 'import_large_file') as mock_import, \
+                 patch.object(main_window, 'parse_and_display_preview') as mock_preview:
                 main_window.on_load_file_clicked()
                 
-                # 오류 메시지가 표시되었는지 확인
-                mock_msg.assert_called_once()
-                args = mock_msg.call_args[0]
-                assert "파일 크기" in args[2]
-                
-                # 파일 경로가 업데이트되지 않았는지 확인
-                assert main_window.selected_file_path != large_csv_file
+                # 오류 없이 스트리밍 모드로 가져와야 함
+                mock_msg.assert_not_called()
+                mock_import.assert_called_once_with(large_csv_file)
+                mock_preview.assert_not_called()
+                assert large_csv_file in main_window.file_path_label.text()
     
     def test_unsupported_file_format_in_ui(self, main_window, unsupported_file):
         """UI에서 지원하지 않는 파일 형식 테스트"""
@@ -227,15 +226,15 @@ class TestSlice15Integration:
     
     def test_error_recovery(self, main_window, large_csv_file, valid_small_csv):
         """오류 발생 후 복구 테스트"""
-        # 1. 먼저 큰 파일로 오류 발생
+        # 1. 먼저 큰 파일을 스트리밍 모드로 가져오다 오류 발생
         with patch('PySide6.QtWidgets.QFileDialog.getOpenFileName') as mock_dialog:
             mock_dialog.return_value = (large_csv_file, "")
             
-            with patch('PySide6.QtWidgets.QMessageBox.critical'):
+            with patch('PySide6.QtWidgets.QMessageBox.critical'), \
+                 patch.object(main_window, 'import_large_file',
+                              return_value={'success': False, 'error': '저장 오류'}) as mock_import:
                 main_window.on_load_file_clicked()
-                
-                # 오류 후 상태 확인
-                assert main_window.selected_file_path != large_csv_file
+                mock_import.assert_called_once_with(large_csv_file)
         
         # 2. 이후 유효한 파일로 정상 처리
         with patch('PySide6.QtWidgets.QFileDialog.getOpenFileName') as mock_dialog:
@@ -5,7 +5,7 @@ Author: leehansol
 Created: 2025-05-25
 
 테스트 목표:
-1. 파일 크기 검증 (50MB 제한)
+1. 파일 크기 검증 (50MB 초과 시 스트리밍 모드)
 2. 지원하지 않는 파일 형식 처리
 3. CSV/Excel 파싱 중 발생하는 예외 처리
 4. 사용자에게 명확한 오류 메시지 표시
@@ -121,15 +121,14 @@ class TestSlice15Validation:
         assert is_valid is True
         assert "파일이 유효합니다" in message
     
-    def test_file_size_validation_fail(self, file_handler, large_csv_file, mock_parent_widget):
-        """파일 크기 검증 실패 테스트 (50MB 초과)"""
+    def test_file_size_validation_streaming(self, file_handler, large_csv_file, mock_parent_widget):
+        """50MB 초과 파일은 거부하지 않고 스트리밍 모드로 가져와야 함"""
         with patch('PySide6.QtWidgets.QMessageBox.critical') as mock_msg:
             is_valid, message = file_handler.validate_file(large_csv_file, mock_parent_widget)
-            assert is_valid is False
-            assert "파일 크기가 너무 큽니다" in message
-            assert "50" in message  # 50MB 제한 언급
-            # QMessageBox가 호출되었는지 확인
-            mock_msg.assert_called_once()
+            assert is_valid is True
+            assert "스트리밍 모드" in message
+            assert file_handler.import_mode == file_handler.IMPORT_MODE_STREAMING
+            mock_msg.assert_not_called()
     
     # 2. 파일 형식 검증 테스트
     def test_supported_file_extensions(self, file_handler):
@@ -0,0 +1,111 @@
+"""
+테스트 파일: 인코딩 감지 및 대체 인코딩 이어 디코딩 (text_encoding)
+
+cp949 은행 내보내기 파일을 수동 재가져오기 없이 한 번에 파싱하는지 검증합니다.
+"""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from ai_smart_ledger.app.core import text_encoding
+from ai_smart_ledger.app.core.file_parser import FileParser
+from ai_smart_ledger.app.core.text_encoding import (
+    clear_detection_cache, decode_with_fallback, detect_encoding,
+)
+
+
+HEADER = "거래일자,적요,출금(원),잔액(원)\n"
+
+
+def write_bytes(data: bytes) -> str:
+    with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+        f.write(data)
+        return f.name
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_detection_cache()
+    yield
+    clear_detection_cache()
+
+
+class TestDetectEncoding:
+    """detect_encoding 테스트 클래스"""
+
+    def test_cp949_statement_parses(self):
+        """cp949 파일은 오류 없이 한글 그대로 파싱되어야 함"""
+        path = write_bytes((HEADER + "2025-01-01,스타벅스,\"4,500\",\"10,000\"\n").encode('cp949'))
+        try:
+            result = FileParser.parse_csv_all(path)
+        finally:
+            os.unlink(path)
+
+        assert result['success'] is True
+        assert result['headers'] == ['날짜', '적요', '출금', '잔액']
+        assert result['data'] == [['2025-01-01', '스타벅스', '4500', '10000']]
+
+    def test_non_ascii_only_in_tail_is_detected(self):
+        """앞부분이 ASCII뿐이어도 뒤쪽 표본으로 cp949를 감지해야 함"""
+        body = "".join(f"2025-01-01,ATM,{i},{i}\n" for i in range(20000))
+        path = write_bytes(("date,memo,out,balance\n" + body + "2025-01-02,똠방각하,1,1\n").encode('cp949'))
+        try:
+            assert detect_encoding(path) == 'cp949'
+        finally:
+            os.unlink(path)
+
+    def test_bom_wins(self):
+        """BOM이 있으면 표본 검사 없이 해당 인코딩을 사용"""
+        path = write_bytes(HEADER.encode('utf-16'))
+        try:
+            with patch.object(text_encoding, 'read_samples') as read_samples:
+                assert detect_encoding(path) == 'utf-16'
+            read_samples.assert_not_called()
+            assert FileParser.parse_csv_all(path)['headers'] == ['날짜', '적요', '출금', '잔액']
+        finally:
+            os.unlink(path)
+
+    def test_detection_cached_per_hash(self):
+        """같은 파일 해시로는 표본을 다시 읽지 않아야 함"""
+        path = write_bytes((HEADER + "2025-01-01,커피,1,1\n").encode('cp949'))
+        try:
+            assert detect_encoding(path, file_hash="abc") == 'cp949'
+            with patch.object(text_encoding, 'read_samples') as read_samples:
+                assert detect_encoding(path, file_hash="abc") == 'cp949'
+            read_samples.assert_not_called()
+        finally:
+            os.unlink(path)
+
+
+class TestDecodeWithFallback:
+    """decode_with_fallback 테스트 클래스"""
+
+    def test_switches_at_failing_line(self):
+        """utf-8 디코딩 실패 시 앞부분은 유지하고 실패한 줄부터 cp949로 이어야 함"""
+        data = "첫째 줄\n".encode('utf-8') + "둘째 줄\n".encode('cp949')
+        text, encoding = decode_with_fallback(data, 'utf-8')
+
+        assert text == "첫째 줄\n둘째 줄\n"
+        assert encoding == 'cp949'
+
+    def test_mid_stream_switch_in_csv(self):
+        """감지 표본 밖에서 인코딩이 바뀌어도 파일을 다시 읽지 않고 끝까지 파싱해야 함"""
+        head = (HEADER + "".join(f"2025-01-01,가맹점{i},1,1\n" for i in range(200))).encode('utf-8')
+        path = write_bytes(head + "2025-01-02,편의점,2,2\n".encode('cp949'))
+        try:
+            with patch.object(text_encoding, 'read_samples', return_value=[head]):
+                result = FileParser.parse_csv_all(path)
+        finally:
+            os.unlink(path)
+
+        assert result['success'] is True
+        assert result['total_rows'] == 201
+        assert result['data'][-1] == ['2025-01-02', '편의점', '2', '2']
+
+    def test_undecodable_raises(self):
+        """모든 대체 인코딩으로도 실패하면 UnicodeDecodeError가 발생해야 함"""
+        with pytest.raises(UnicodeDecodeError):
+            decode_with_fallback(b"ok\n\xff\xff\xff\n", 'utf-8')
@@ -0,0 +1,100 @@
+"""
+테스트 파일: 거래일시 epoch 변환 (timestamps)
+
+파일별로 감지한 날짜/시간 형식으로 거래일시를 정수 epoch 초로 변환하는지 검증합니다.
+"""
+
+import calendar
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from ai_smart_ledger.app.core.timestamps import (
+    TimestampParser, detect_format, epoch_column, parse_timestamp_general, DATE_FORMATS,
+)
+from ai_smart_ledger.app.db import models
+from ai_smart_ledger.app.db.crud import get_transactions_between
+
+
+def epoch(*args) -> int:
+    return calendar.timegm(datetime(*args).timetuple())
+
+
+class TestTimestampParser:
+    """TimestampParser 테스트 클래스"""
+
+    def test_detects_separate_date_and_time(self):
+        """신한은행처럼 날짜와 시간이 나뉜 파일은 두 형식을 각각 감지해야 함"""
+        parser = TimestampParser.detect(["2024-01-30", "2024-01-31"], ["12:04:41", "15:31:48"])
+
+        assert (parser.date_format, parser.time_format) == ("%Y-%m-%d", "%H:%M:%S")
+        assert parser.to_epoch("2024-01-30", "12:04:41") == epoch(2024, 1, 30, 12, 4, 41)
+        assert parser.to_epoch("2024-01-31", "") == epoch(2024, 1, 31)
+        assert parser.fallback_count == 0
+
+    def test_detects_combined_datetime(self):
+        """KB국민은행 거래일시처럼 날짜와 시간이 한 컬럼이면 시간 컬럼 없이 변환"""
+        parser = TimestampParser.detect(["2024.01.30 12:04:41"])
+
+        assert parser.date_format == "%Y.%m.%d %H:%M:%S"
+        assert parser.time_format is None
+        assert parser.to_epoch("2024.01.30 12:04:41") == epoch(2024, 1, 30, 12, 4, 41)
+
+    def test_outliers_use_general_parser(self):
+        """감지된 형식과 다른 값만 일반 변환으로 처리하고, 해석할 수 없으면 None"""
+        parser = TimestampParser.detect(["2024-01-30"], ["12:04:41"])
+
+        assert parser.to_epoch("2024/1/5", "9:00") == epoch(2024, 1, 5, 9, 0)
+        assert parser.to_epoch("2024-02-30", "") is None
+        assert parser.to_epoch("2024-01-30", "25:00:00") is None
+        assert parser.fallback_count == 3
+
+    def test_undetected_time_format_uses_general_parser(self):
+        """표본 시간 값이 비어 시간 형식을 감지하지 못해도 나중 행의 시간 값을 자정으로 버리지 않아야 함"""
+        parser = TimestampParser.detect(["2024-01-01"] * 5, [""] * 5)
+
+        assert parser.time_format is None
+        assert parser.to_epoch("2024-01-01", "13:45:00") == parse_timestamp_general("2024-01-01", "13:45:00")
+        assert parser.to_epoch("2024-01-01", "13:45:00") == epoch(2024, 1, 1, 13, 45)
+        assert parser.to_epoch("2024-01-02", "") == epoch(2024, 1, 2)
+        assert parser.fallback_count == 2
+
+    def test_detect_format_none_when_no_match(self):
+        """맞는 후보 형식이 없으면 None"""
+        assert detect_format(["어제"], DATE_FORMATS) is None
+        assert parse_timestamp_general("어제") is None
+
+    def test_epoch_column(self):
+        """정규화된 행 목록을 행별 epoch 초 목록으로 변환"""
+        rows = [["20240130", "120441", "커피"], ["20240131", "", "점심"]]
+
+        assert epoch_column(["날짜", "시간", "적요"], rows) == [epoch(2024, 1, 30, 12, 4, 41), epoch(2024, 1, 31)]
+        assert epoch_column(["적요"], rows) == [None, None]
+
+
+class TestTransactionsBetween:
+    """timestamp_epoch 기간 조회 테스트 클래스"""
+
+    def test_range_query_sorted_by_epoch(self, conn):
+        """[시작, 끝) 구간의 거래내역만 시간순으로 반환"""
+        rows = [("2024-02-01", epoch(2024, 2, 1)), ("2024-01-15", epoch(2024, 1, 15)),
+                ("2024-01-01", epoch(2024, 1, 1))]
+        conn.executemany("INSERT INTO transactions (timestamp, timestamp_epoch, description, amount_out) "
+                         "VALUES (?, ?, '커피', 4500)", rows)
+
+        result = get_transactions_between(epoch(2024, 1, 1), epoch(2024, 2, 1), conn)
+
+        assert [r['timestamp'] for r in result] == ["2024-01-01", "2024-01-15"]
+
+    def test_epoch_column_added_to_existing_table(self, monkeypatch):
+        """timestamp_epoch 컬럼이 없던 이전 버전 테이블에는 컬럼과 인덱스를 추가 (다시 실행해도 그대로)"""
+        old = sqlite3.connect(":memory:")
+        old.execute("CREATE TABLE transactions (transaction_id INTEGER PRIMARY KEY, timestamp TIMESTAMP NOT NULL)")
+        monkeypatch.setattr(models.db_manager, "connection", old)
+
+        assert models.add_timestamp_epoch_column() is True
+        assert models.add_timestamp_epoch_column() is True
+        assert "timestamp_epoch" in [row[1] for row in old.execute("PRAGMA table_info(transactions)")]
+        assert "idx_transactions_timestamp_epoch" in [row[1] for row in old.execute("PRAGMA index_list(transactions)")]
+        old.close()
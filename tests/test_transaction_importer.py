@@ -0,0 +1,156 @@
+"""
+테스트 파일: 거래내역 일괄 가져오기 (TransactionImporter)
+
+파싱된 행이 transactions 컬럼으로 변환되어 한 트랜잭션 안에서 일괄 삽입되는지 검증합니다.
+"""
+
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from ai_smart_ledger.app.core.transaction_importer import TransactionImporter
+from ai_smart_ledger.app.core.transaction_mapper import TransactionRowMapper
+from ai_smart_ledger.app.db import models
+
+
+HEADERS = ["날짜", "시간", "적요", "출금", "입금", "내용", "잔액", "거래처"]
+
+
+class TestTransactionImporter:
+    """TransactionImporter 테스트 클래스"""
+
+    def test_mapper_builds_records(self):
+        """입금/출금 중 하나만 채우고 적요와 내용을 설명으로 합쳐야 함"""
+        mapper = TransactionRowMapper(HEADERS, "신한-110", "statement.csv")
+        out_row = ["2024-01-30", "12:04:41", "FB이체", "10000", "0", "카카오페이", "404523", "판교금"]
+        in_row = ["2024-01-31", "15:31:48", "FB이체", "0", "46200", "", "450723", "여중대"]
+
+        mapper.detect_formats([out_row, in_row])
+        assert mapper.map_row(out_row, 2)[:-1] == ("신한-110", "2024-01-30 12:04:41", 1706616281, "FB이체 카카오페이",
+                                                   None, 10000, "statement.csv", 2)
+        assert mapper.map_row(in_row, 3)[4:6] == (46200, None)
+        assert mapper.timestamps.fallback_count == 0
+        assert mapper.map_row(out_row[:3], 4) is None
+
+    def test_import_file_bulk_inserts(self, conn):
+        """CSV 파일 전체를 여러 배치로 나눠도 모든 행이 원본 행 번호와 함께 삽입되어야 함"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("거래일자,거래시간,적요,출금(원),입금(원),내용,잔액(원),거래점\n")
+            for i in range(25):
+                f.write(f'2024-01-{i + 1:02d},09:00:00,체크카드,"1,{i:03d}",,가맹점{i},"50,000",본점\n')
+            f.write('2024-02-01,09:00:00,오류,"1,000","2,000",양방향,"50,000",본점\n')
+            path = f.name
+
+        try:
+            result = TransactionImporter("acc-1", batch_size=10, conn=conn).import_file(path)
+        finally:
+            os.unlink(path)
+
+        assert result['success'] is True
+        assert result['inserted'] == 25
+        assert result['skipped'] == 1
+        assert result['rows_per_sec'] > 0
+
+        rows = conn.execute(
+            "SELECT account_id, amount_out, source_file, source_row_id FROM transactions ORDER BY transaction_id"
+        ).fetchall()
+        assert len(rows) == 25
+        assert rows[0][0] == "acc-1" and rows[0][1] == 1000
+        assert rows[-1][3] == 26
+        assert rows[0][2] == os.path.basename(path)
+
+    def test_failure_rolls_back_everything(self, conn):
+        """삽입 도중 오류가 나면 앞선 배치까지 모두 롤백되어야 함"""
+        conn.execute("CREATE TRIGGER fail_after_five BEFORE INSERT ON transactions "
+                     "WHEN (SELECT COUNT(*) FROM transactions) >= 5 BEGIN SELECT RAISE(ABORT, 'boom'); END")
+        chunks = [[["2024-01-01", f"09:0{i}:00", "커피", "4500", "0"] for i in range(5)],
+                  [["2024-01-02", "", "점심", "9000", "0"]]]
+
+        importer = TransactionImporter(batch_size=5, conn=conn)
+        result = importer.import_rows(["날짜", "시간", "적요", "출금", "입금"], chunks, "s.csv")
+
+        assert result['success'] is False
+        assert "boom" in result['error']
+        assert conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0] == 0
+
+    def test_missing_columns_rejected(self, conn):
+        """날짜나 금액 컬럼이 없으면 삽입하지 않고 실패 결과를 반환"""
+        result = TransactionImporter(conn=conn).import_rows(["적요", "잔액"], [], "s.csv")
+
+        assert result['success'] is False
+        assert "날짜" in result['error']
+
+    def test_streaming_progress_and_chunks(self, conn):
+        """스트리밍 가져오기는 청크마다 행을 넘겨주고 읽은 바이트 기준으로 진행률을 보고해야 함"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("거래일자,거래시간,적요,출금(원),입금(원),잔액(원),거래점\n")
+            for i in range(30):
+                f.write(f'2024-01-01,09:00:00,체크카드{i},"1,000",,"50,000",본점\n')
+            path = f.name
+
+        progress_calls = []
+        chunk_sizes = []
+        try:
+            total = os.path.getsize(path)
+            result = TransactionImporter(batch_size=10, conn=conn).import_file(
+                path,
+                progress=lambda done, size: progress_calls.append((done, size)),
+                on_chunk=lambda headers, chunk: chunk_sizes.append((headers[0], len(chunk))),
+            )
+        finally:
+            os.unlink(path)
+
+        assert result['success'] is True
+        assert result['inserted'] == 30
+        assert chunk_sizes == [("날짜", 10)] * 3
+        done = [d for d, _ in progress_calls]
+        assert done == sorted(done)
+        assert progress_calls[-1] == (total, total)
+        assert all(size == total for _, size in progress_calls)
+
+    def test_reimport_skips_duplicates(self, conn):
+        """같은 거래는 다시 가져와도 삽입하지 않고 중복 건수로 보고해야 함"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("거래일자,거래시간,적요,출금(원),입금(원),잔액(원),거래점\n")
+            # 시각/금액/내용이 같아도 잔액이 다르면 별개의 거래
+            f.write('2024-01-01,09:00:00,체크카드,"1,000",,"50,000",본점\n')
+            f.write('2024-01-01,09:00:00,체크카드,"1,000",,"49,000",본점\n')
+            path = f.name
+
+        try:
+            first = TransactionImporter("acc-1", conn=conn).import_file(path)
+            second = TransactionImporter("acc-1", conn=conn).import_file(path)
+            other_account = TransactionImporter("acc-2", conn=conn).import_file(path)
+        finally:
+            os.unlink(path)
+
+        assert (first['inserted'], first['duplicates']) == (2, 0)
+        assert (second['success'], second['inserted'], second['duplicates']) == (True, 0, 2)
+        assert other_account['inserted'] == 2
+        assert conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0] == 4
+
+    def test_fingerprint_ignores_formatting(self):
+        """날짜 표기와 내용의 공백/전각 문자가 달라도 같은 거래는 같은 지문이어야 함"""
+        dashed = TransactionRowMapper(HEADERS, "acc-1", "a.csv")
+        dotted = TransactionRowMapper(HEADERS, "acc-1", "b.csv")
+        row = ["2024-01-30", "12:04:41", "FB이체", "10000", "0", "카카오페이", "404523", "판교금"]
+        reformatted = ["2024.01.30", "12:04:41", "FB이체 ", "10000", "0", "카카오페이", "404523", "판교금"]
+        dashed.detect_formats([row])
+        dotted.detect_formats([reformatted])
+
+        assert dashed.map_row(row, 2)[-1] == dotted.map_row(reformatted, 9)[-1]
+        assert dashed.map_row(row, 2)[-1] != dashed.map_row(row[:6] + ["394523", "판교금"], 3)[-1]
+
+    def test_fingerprint_column_added_to_existing_table(self, monkeypatch):
+        """fingerprint 컬럼이 없던 이전 버전 테이블에는 컬럼과 유니크 인덱스를 추가 (다시 실행해도 그대로)"""
+        old = sqlite3.connect(":memory:")
+        old.execute("CREATE TABLE transactions (transaction_id INTEGER PRIMARY KEY, timestamp TIMESTAMP NOT NULL)")
+        monkeypatch.setattr(models.db_manager, "connection", old)
+
+        assert models.add_fingerprint_column() is True
+        assert models.add_fingerprint_column() is True
+        assert "fingerprint" in [row[1] for row in old.execute("PRAGMA table_info(transactions)")]
+        assert ("idx_transactions_fingerprint", 1) in [row[1:3] for row in old.execute("PRAGMA index_list(transactions)")]
+        old.close()